@@ -168,7 +168,7 @@ class BalanceCommand:
     async def celo_balances_df(self,  # type: HummingbotApplication
                                ):
         rows = []
-        bals = CeloCLI.balances()
+        bals = await CeloCLI.balances_async()
         for token, bal in bals.items():
             rows.append({"Asset": token.upper(), "Amount": round(bal.total, 4)})
         df = pd.DataFrame(data=rows, columns=["Asset", "Amount"])
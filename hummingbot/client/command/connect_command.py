@@ -212,8 +212,8 @@ class ConnectCommand:
             return "Celo address and/or password have not been added."
         if CeloCLI.unlocked and not to_reconnect:
             return None
-        err_msg = CeloCLI.validate_node_synced()
+        err_msg = await CeloCLI.validate_node_synced_async()
         if err_msg is not None:
             return err_msg
-        err_msg = CeloCLI.unlock_account(celo_address, celo_password)
+        err_msg = await CeloCLI.unlock_account_async(celo_address, celo_password)
         return err_msg
@@ -9,6 +9,7 @@ from typing import (
     TYPE_CHECKING,
     List,
     Optional,
+    Union,
 )
 from datetime import datetime
 from hummingbot.client.config.global_config_map import global_config_map
@@ -21,7 +22,10 @@ from hummingbot.client.settings import (
 from hummingbot.model.trade_fill import TradeFill
 from hummingbot.user.user_balances import UserBalances
 from hummingbot.core.utils.async_utils import safe_ensure_future
-from hummingbot.client.performance import PerformanceMetrics
+from hummingbot.client.performance import (
+    PerformanceMetrics,
+    PerformanceTracker,
+)
 
 s_float_0 = float(0)
 s_decimal_0 = Decimal("0")
@@ -51,27 +55,70 @@ class HistoryCommand:
         if global_config_map.get("paper_trade_enabled").value:
             self._notify("\n  Paper Trading ON: All orders are simulated, and no real orders are placed.")
         start_time = get_timestamp(days) if days > 0 else self.init_time
-        trades: List[TradeFill] = self._get_trades_from_session(int(start_time * 1e3),
-                                                                config_file_path=self.strategy_file_name)
-        if not trades:
+        # The performance since the bot started is tracked as trades are filled, older periods are computed again.
+        performance_tracker: Optional[PerformanceTracker] = self._session_performance_tracker() if days <= 0 else None
+        if performance_tracker is not None:
+            trades: pd.DataFrame = TradeFill.to_performance_dataframe([])
+            no_trades: bool = performance_tracker.num_trades == 0
+        else:
+            trades: pd.DataFrame = self._get_trades_dataframe_from_session(int(start_time * 1e3),
+                                                                           config_file_path=self.strategy_file_name)
+            no_trades: bool = trades.empty
+        if no_trades:
             self._notify("\n  No past trades to report.")
             return
         if verbose:
             self.list_trades(start_time)
         if self.strategy_name != "celo_arb":
-            safe_ensure_future(self.history_report(start_time, trades, precision))
+            safe_ensure_future(self.history_report(start_time, trades, precision,
+                                                   performance_tracker=performance_tracker))
+
+    def _get_trades_dataframe_from_session(self,  # type: HummingbotApplication
+                                           start_timestamp: int,
+                                           config_file_path: Optional[str] = None) -> pd.DataFrame:
+        if self.markets_recorder is not None:
+            self.markets_recorder.flush()
+        return TradeFill.get_performance_dataframe(self.trade_fill_db.get_shared_session(),
+                                                   start_timestamp,
+                                                   config_file_path)
+
+    def _session_performance_tracker(self,  # type: HummingbotApplication
+                                     ) -> Optional[PerformanceTracker]:
+        """
+        Returns the performance of the trades since the bot started, kept up to date by the markets recorder. It is
+        only loaded from the database the first time.
+        """
+        if self.markets_recorder is None:
+            return None
+        performance_tracker: PerformanceTracker = self.markets_recorder.performance_tracker
+        start_timestamp: int = int(self.init_time * 1e3)
+        if performance_tracker.start_timestamp != start_timestamp:
+            performance_tracker.reset(start_timestamp,
+                                      self._get_trades_from_session(start_timestamp,
+                                                                    config_file_path=self.strategy_file_name))
+        return performance_tracker
 
     async def history_report(self,  # type: HummingbotApplication
                              start_time: float,
-                             trades: List[TradeFill],
+                             trades: Union[List[TradeFill], pd.DataFrame],
                              precision: Optional[int] = None,
-                             display_report: bool = True) -> Decimal:
-        market_info: Set[Tuple[str, str]] = set((t.market, t.symbol) for t in trades)
+                             display_report: bool = True,
+                             performance_tracker: Optional[PerformanceTracker] = None) -> Decimal:
+        """
+        Reports the performance of the trades by market, taken from the performance tracker when given (the trades are
+        then ignored).
+        :param trades: the trade fills, or their columns (see TradeFill.get_performance_dataframe)
+        """
+        if isinstance(trades, list):
+            trades = TradeFill.to_performance_dataframe(trades)
+        if performance_tracker is not None:
+            market_info: Set[Tuple[str, str]] = set(performance_tracker.market_trading_pairs)
+        else:
+            market_info: Set[Tuple[str, str]] = set(zip(trades["market"], trades["symbol"]))
         if display_report:
             self.report_header(start_time)
         return_pcts = []
         for market, symbol in market_info:
-            cur_trades = [t for t in trades if t.market == market and t.symbol == symbol]
             network_timeout = float(global_config_map["other_commands_timeout"].value)
             try:
                 cur_balances = await asyncio.wait_for(self.get_current_balances(market), network_timeout)
@@ -80,7 +127,11 @@ class HistoryCommand:
                     "\nA network error prevented the balances retrieval to complete. See logs for more details."
                 )
                 raise
-            perf = await PerformanceMetrics.create(market, symbol, cur_trades, cur_balances)
+            if performance_tracker is not None:
+                perf = await performance_tracker.performance_metrics(market, symbol, cur_balances)
+            else:
+                cur_trades: pd.DataFrame = trades[(trades["market"] == market) & (trades["symbol"] == symbol)]
+                perf = await PerformanceMetrics.create_from_dataframe(market, symbol, cur_trades, cur_balances)
             if display_report:
                 self.report_performance_by_market(market, symbol, perf, precision)
             return_pcts.append(perf.return_pct)
@@ -205,10 +256,8 @@ class HistoryCommand:
         if any(not market.ready for market in self.markets.values()):
             return s_decimal_0
 
-        start_time = self.init_time
-        trades: List[TradeFill] = self._get_trades_from_session(int(start_time * 1e3),
-                                                                config_file_path=self.strategy_file_name)
-        avg_return = await self.history_report(start_time, trades, display_report=False)
+        avg_return = await self.history_report(self.init_time, [], display_report=False,
+                                               performance_tracker=self._session_performance_tracker())
         return avg_return
 
     def list_trades(self,  # type: HummingbotApplication
@@ -42,9 +42,10 @@ class OrderBookCommand:
             trading_pair, order_book = next(iter(market_connector.order_books.items()))
 
         def get_order_book(lines):
-            bids = order_book.snapshot[0][['price', 'amount']].head(lines)
+            bids, asks = order_book.snapshot_top(lines)
+            bids = bids[['price', 'amount']]
             bids.rename(columns={'price': 'bid_price', 'amount': 'bid_volume'}, inplace=True)
-            asks = order_book.snapshot[1][['price', 'amount']].head(lines)
+            asks = asks[['price', 'amount']]
             asks.rename(columns={'price': 'ask_price', 'amount': 'ask_volume'}, inplace=True)
             joined_df = pd.concat([bids, asks], axis=1)
             text_lines = ["    " + line for line in joined_df.to_string(index=False).split("\n")]
@@ -54,8 +55,10 @@ class OrderBookCommand:
         if live:
             await self.stop_live_update()
             self.app.live_updates = True
-            while self.app.live_updates:
-                await self.cls_display_delay(get_order_book(min(lines, 35)) + "\n\n Press escape key to stop update.", 0.5)
+            await self.cls_display_live(
+                lambda: get_order_book(min(lines, 35)) + "\n\n Press escape key to stop update.",
+                lambda: order_book.version,
+                0.5)
             self._notify("Stopped live orderbook display update.")
         else:
             self._notify(get_order_book(lines))
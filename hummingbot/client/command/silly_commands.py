@@ -1,6 +1,13 @@
 import asyncio
+import inspect
+import time
 from typing import (
     TYPE_CHECKING,
+    Any,
+    Awaitable,
+    Callable,
+    Optional,
+    Union,
 )
 from hummingbot.core.utils.async_utils import safe_ensure_future
 
@@ -193,6 +200,37 @@ class SillyCommands:
         await asyncio.sleep(delay)
         self.app.output_field.buffer.undo()
 
+    async def cls_display_live(self,  # type: HummingbotApplication
+                               get_lines: Callable[[], Union[str, Awaitable[str]]],
+                               get_version: Callable[[], Any],
+                               delay: float = 0.5,
+                               max_refresh_interval: Optional[float] = None,
+                               condition: Callable[[], bool] = lambda: True):
+        """
+        Displays the lines until live updates are stopped, or the condition is no longer met. They are only generated
+        and displayed again once the version of what they show changed, or after max_refresh_interval seconds for
+        things not covered by the version (e.g. times). The version is checked every delay seconds.
+        """
+        self.app.output_field.buffer.save_to_undo_stack()
+        last_version: Any = None
+        last_refresh: float = 0
+        try:
+            while self.app.live_updates and condition():
+                version: Any = get_version()
+                if last_refresh == 0 or version != last_version or \
+                        (max_refresh_interval is not None and time.time() - last_refresh >= max_refresh_interval):
+                    lines = get_lines()
+                    if inspect.isawaitable(lines):
+                        lines = await lines
+                    # The lines may have been generated while live updates were being stopped.
+                    if not (self.app.live_updates and condition()):
+                        break
+                    self.app.log("".join(lines), save_log=False)
+                    last_version, last_refresh = version, time.time()
+                await asyncio.sleep(delay)
+        finally:
+            self.app.output_field.buffer.undo()
+
     async def stop_live_update(self):
         if self.app.live_updates is True:
             self.app.live_updates = False
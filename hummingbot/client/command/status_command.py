@@ -7,10 +7,12 @@ from collections import (
     OrderedDict
 )
 import inspect
-from typing import List, Dict
+from typing import Any, List, Dict, Tuple
 from hummingbot import check_dev_mode
 from hummingbot.logger.application_warning import ApplicationWarning
 from hummingbot.connector.connector_base import ConnectorBase
+from hummingbot.core.data_type.limit_order import LimitOrder
+from hummingbot.core.data_type.order_book import OrderBook
 from hummingbot.core.network_iterator import NetworkStatus
 from hummingbot.client.config.global_config_map import global_config_map
 from hummingbot.core.utils.ethereum import check_web3
@@ -84,6 +86,22 @@ class StatusCommand:
             self._script_iterator.request_status()
         return status
 
+    def _strategy_state_version(self,  # type: HummingbotApplication
+                                ) -> Tuple[Any, ...]:
+        """
+        Changes whenever the state shown by the strategy status may have changed, i.e. the order books, balances and
+        orders of the markets, or the application warnings. Connectors without order books (e.g. the AMM connectors)
+        only contribute their balances.
+        """
+        state: List[Any] = [len(self._app_warnings)]
+        for market in self.markets.values():
+            order_books: Dict[str, OrderBook] = getattr(market, "order_books", {})
+            limit_orders: List[LimitOrder] = getattr(market, "limit_orders", [])
+            state.append(tuple(order_book.version for order_book in order_books.values()))
+            state.append(tuple(market.get_all_balances().items()))
+            state.append(tuple((order.client_order_id, order.filled_quantity) for order in limit_orders))
+        return tuple(state)
+
     def application_warning(self):
         # Application warnings.
         self._expire_old_application_warnings()
@@ -126,12 +144,17 @@ class StatusCommand:
             if live:
                 await self.stop_live_update()
                 self.app.live_updates = True
-                while self.app.live_updates and self.strategy:
-                    script_status = '\n Status from script would not appear here. ' \
-                                    'Simply run the status command without "--live" to see script status.'
-                    await self.cls_display_delay(
-                        await self.strategy_status(live=True) + script_status + "\n\n Press escape key to stop update.", 1
-                    )
+                script_status = '\n Status from script would not appear here. ' \
+                                'Simply run the status command without "--live" to see script status.'
+
+                async def get_status() -> str:
+                    return await self.strategy_status(live=True) + script_status + "\n\n Press escape key to stop update."
+
+                await self.cls_display_live(get_status,
+                                            self._strategy_state_version,
+                                            1,
+                                            max_refresh_interval=self.LIVE_STATUS_MAX_REFRESH_INTERVAL,
+                                            condition=lambda: self.strategy is not None)
                 self._notify("Stopped live status display update.")
             else:
                 self._notify(await self.strategy_status())
@@ -55,8 +55,9 @@ class TickerCommand:
         if live:
             await self.stop_live_update()
             self.app.live_updates = True
-            while self.app.live_updates:
-                await self.cls_display_delay(get_ticker() + "\n\n Press escape key to stop update.", 1)
+            await self.cls_display_live(lambda: get_ticker() + "\n\n Press escape key to stop update.",
+                                        lambda: order_book.version,
+                                        1)
             self._notify("Stopped live ticker display update.")
         else:
             self._notify(get_ticker())
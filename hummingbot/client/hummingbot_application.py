@@ -44,6 +44,7 @@ class HummingbotApplication(*commands):
     KILL_TIMEOUT = 10.0
     APP_WARNING_EXPIRY_DURATION = 3600.0
     APP_WARNING_STATUS_LIMIT = 6
+    LIVE_STATUS_MAX_REFRESH_INTERVAL = 5.0
 
     _main_app: Optional["HummingbotApplication"] = None
 
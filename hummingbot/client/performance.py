@@ -1,5 +1,8 @@
 from decimal import Decimal
 from dataclasses import dataclass
+
+import numpy as np
+import pandas as pd
 from typing import (
     Dict,
     Optional,
@@ -63,6 +66,20 @@ class PerformanceMetrics:
         await performance._initialize_metrics(exchange, trading_pair, trades, current_balances)
         return performance
 
+    @classmethod
+    async def create_from_dataframe(cls,
+                                    exchange: str,
+                                    trading_pair: str,
+                                    trades: pd.DataFrame,
+                                    current_balances: Dict[str, Decimal]) -> 'PerformanceMetrics':
+        """
+        Same as create, for trade fills loaded as columns (see TradeFill.get_performance_dataframe). The metrics are
+        computed with vectorized operations on the columns, and only converted to Decimal once computed.
+        """
+        performance = PerformanceMetrics()
+        await performance._initialize_metrics_from_dataframe(exchange, trading_pair, trades, current_balances)
+        return performance
+
     @staticmethod
     def position_order(open: list, close: list) -> Tuple[Any, Any]:
         """
@@ -155,6 +172,10 @@ class PerformanceMetrics:
             step = Decimal("0.00000001")
         return (value // step) * step
 
+    @staticmethod
+    def to_decimal(value: Any) -> Decimal:
+        return Decimal(str(value))
+
     @staticmethod
     def divide(value, divisor):
         value = Decimal(str(value))
@@ -182,6 +203,10 @@ class PerformanceMetrics:
                 self.s_vol_base += Decimal(str(trade.amount)) * Decimal("-1")
                 self.s_vol_quote += Decimal(str(trade.amount * trade.price))
 
+        self._calculate_totals_and_averages()
+        return buys, sells
+
+    def _calculate_totals_and_averages(self):
         self.tot_vol_base = self.b_vol_base + self.s_vol_base
         self.tot_vol_quote = self.b_vol_quote + self.s_vol_quote
 
@@ -192,8 +217,6 @@ class PerformanceMetrics:
         self.avg_b_price = abs(self.avg_b_price)
         self.avg_s_price = abs(self.avg_s_price)
 
-        return buys, sells
-
     async def _calculate_fees(self, exchange: str, quote: str, trades: List[Any]):
         for trade in trades:
             if self._is_trade_fill(trade):
@@ -215,6 +238,9 @@ class PerformanceMetrics:
                         self.fees[flat_fee[0]] = s_decimal_0
                     self.fees[flat_fee[0]] += flat_fee[1]
 
+        await self._calculate_fee_in_quote(exchange, quote)
+
+    async def _calculate_fee_in_quote(self, exchange: str, quote: str):
         for fee_token, fee_amount in self.fees.items():
             if fee_token == quote:
                 self.fee_in_quote += fee_amount
@@ -229,19 +255,12 @@ class PerformanceMetrics:
         # Handle trade_pnl differently for derivatives
         if self._are_derivatives(buys) or self._are_derivatives(sells):
             buys_copy, sells_copy = self.aggregate_position_order(buys.copy(), sells.copy())
-            long = []
-            short = []
-
-            while True:
-                lng = self.position_order(buys_copy, sells_copy)
-                if lng is not None:
-                    long.append(lng)
-
-                sht = self.position_order(sells_copy, buys_copy)
-                if sht is not None:
-                    short.append(sht)
-                if lng is None and sht is None:
-                    break
+            # The n-th order opening a long (short) position is paired with the n-th order closing one, which is what
+            # repeatedly calling position_order gives, in a single pass.
+            long = list(zip([order for order in buys_copy if order.position == "OPEN"],
+                            [order for order in sells_copy if order.position == "CLOSE"]))
+            short = list(zip([order for order in sells_copy if order.position == "OPEN"],
+                             [order for order in buys_copy if order.position == "CLOSE"]))
 
             self.trade_pnl = Decimal(str(sum(self.derivative_pnl(long, short))))
 
@@ -265,15 +284,110 @@ class PerformanceMetrics:
         self.num_sells = len(sells)
         self.num_trades = self.num_buys + self.num_sells
 
+        await self._calculate_balances_and_value(exchange, trading_pair, current_balances,
+                                                 trades[0].price, trades[-1].price)
+        self._calculate_trade_pnl(buys, sells)
+
+        await self._calculate_fees(exchange, quote, trades)
+
+        self._calculate_return()
+
+    async def _initialize_metrics_from_dataframe(self,
+                                                 exchange: str,
+                                                 trading_pair: str,
+                                                 trades: pd.DataFrame,
+                                                 current_balances: Dict[str, Decimal]):
+        base, quote = trading_pair.split("-")
+        sides: np.ndarray = trades["trade_type"].str.upper().to_numpy()
+        prices: np.ndarray = trades["price"].to_numpy(dtype=np.float64)
+        amounts: np.ndarray = trades["amount"].to_numpy(dtype=np.float64)
+        is_buy: np.ndarray = sides == TradeType.BUY.name.upper()
+        is_sell: np.ndarray = sides == TradeType.SELL.name.upper()
+
+        self.num_buys = int(np.count_nonzero(is_buy))
+        self.num_sells = int(np.count_nonzero(is_sell))
+        self.num_trades = self.num_buys + self.num_sells
+        self.b_vol_base = self.to_decimal(amounts[is_buy].sum())
+        self.b_vol_quote = self.to_decimal((amounts[is_buy] * prices[is_buy]).sum()) * Decimal("-1")
+        self.s_vol_base = self.to_decimal(amounts[is_sell].sum()) * Decimal("-1")
+        self.s_vol_quote = self.to_decimal((amounts[is_sell] * prices[is_sell]).sum())
+        self._calculate_totals_and_averages()
+
+        await self._calculate_balances_and_value(exchange, trading_pair, current_balances, prices[0], prices[-1])
+        self.trade_pnl = self.cur_value - self.hold_value
+        positions: np.ndarray = trades["position"].to_numpy()
+        if ((self.num_buys > 0 and not np.any(positions[is_buy] == "NILL")) or
+                (self.num_sells > 0 and not np.any(positions[is_sell] == "NILL"))):
+            self.trade_pnl = self.to_decimal(self._derivative_pnl_from_dataframe(trades[is_buy], trades[is_sell]))
+
+        self._calculate_fees_from_dataframe(quote, prices, amounts, trades["trade_fee"].tolist())
+        await self._calculate_fee_in_quote(exchange, quote)
+
+        self._calculate_return()
+
+    @staticmethod
+    def _derivative_pnl_from_dataframe(buys: pd.DataFrame, sells: pd.DataFrame) -> float:
+        """
+        Vectorized equivalent of pairing the aggregated orders with position_order and summing their derivative_pnl.
+        """
+        def aggregate(fills: pd.DataFrame, position: str) -> pd.DataFrame:
+            orders: pd.DataFrame = fills.groupby("order_id", sort=False).agg(price=("price", "mean"),
+                                                                             amount=("amount", "sum"),
+                                                                             position=("position", "first"))
+            return orders[orders["position"] == position]
+
+        pnl: float = 0.0
+        # Long positions are opened by buys and closed by sells, short positions the other way around.
+        for open_fills, close_fills, direction in ((buys, sells, 1), (sells, buys, -1)):
+            opens: pd.DataFrame = aggregate(open_fills, "OPEN")
+            closes: pd.DataFrame = aggregate(close_fills, "CLOSE")
+            pairs: int = min(len(opens), len(closes))
+            open_prices: np.ndarray = opens["price"].to_numpy(dtype=np.float64)[:pairs]
+            close_prices: np.ndarray = closes["price"].to_numpy(dtype=np.float64)[:pairs]
+            close_amounts: np.ndarray = closes["amount"].to_numpy(dtype=np.float64)[:pairs]
+            pnl += float((direction * (close_prices - open_prices) * close_amounts).sum())
+        return pnl
+
+    def _calculate_fees_from_dataframe(self,
+                                       quote: str,
+                                       prices: np.ndarray,
+                                       amounts: np.ndarray,
+                                       trade_fees: List[Dict[str, Any]]):
+        percents: np.ndarray = np.fromiter((trade_fee.get("percent") or 0 for trade_fee in trade_fees),
+                                           dtype=np.float64,
+                                           count=len(trade_fees))
+        # Fee tokens are listed in the order they were first paid in, percent fees (paid in quote) first for a trade.
+        fee_amounts: Dict[str, List[float]] = {}
+        first_fee_index: Dict[str, Tuple[int, int]] = {}
+        percent_fee_indices: np.ndarray = np.flatnonzero(percents > 0)
+        if len(percent_fee_indices) > 0:
+            first_fee_index[quote] = (int(percent_fee_indices[0]), 0)
+            fee_amounts[quote] = [float((prices * amounts * percents)[percent_fee_indices].sum())]
+        for index, trade_fee in enumerate(trade_fees):
+            for flat_fee in trade_fee.get("flat_fees", []):
+                if flat_fee["asset"] not in fee_amounts:
+                    fee_amounts[flat_fee["asset"]] = []
+                first_fee_index[flat_fee["asset"]] = min(first_fee_index.get(flat_fee["asset"], (index, 1)), (index, 1))
+                fee_amounts[flat_fee["asset"]].append(flat_fee["amount"])
+        for fee_token in sorted(fee_amounts.keys(), key=lambda token: first_fee_index[token]):
+            self.fees[fee_token] = self.to_decimal(np.sum(fee_amounts[fee_token]))
+
+    async def _calculate_balances_and_value(self,
+                                            exchange: str,
+                                            trading_pair: str,
+                                            current_balances: Dict[str, Decimal],
+                                            first_trade_price: Any,
+                                            last_trade_price: Any):
+        base, quote = trading_pair.split("-")
         self.cur_base_bal = current_balances.get(base, 0)
         self.cur_quote_bal = current_balances.get(quote, 0)
         self.start_base_bal = self.cur_base_bal - self.tot_vol_base
         self.start_quote_bal = self.cur_quote_bal - self.tot_vol_quote
 
-        self.start_price = Decimal(str(trades[0].price))
+        self.start_price = Decimal(str(first_trade_price))
         self.cur_price = await get_last_price(exchange.replace("_PaperTrade", ""), trading_pair)
         if self.cur_price is None:
-            self.cur_price = Decimal(str(trades[-1].price))
+            self.cur_price = Decimal(str(last_trade_price))
         self.start_base_ratio_pct = self.divide(self.start_base_bal * self.start_price,
                                                 (self.start_base_bal * self.start_price) + self.start_quote_bal)
         self.cur_base_ratio_pct = self.divide(self.cur_base_bal * self.cur_price,
@@ -281,9 +395,237 @@ class PerformanceMetrics:
 
         self.hold_value = (self.start_base_bal * self.cur_price) + self.start_quote_bal
         self.cur_value = (self.cur_base_bal * self.cur_price) + self.cur_quote_bal
-        self._calculate_trade_pnl(buys, sells)
-
-        await self._calculate_fees(exchange, quote, trades)
 
+    def _calculate_return(self):
         self.total_pnl = self.trade_pnl - self.fee_in_quote
         self.return_pct = self.divide(self.total_pnl, self.hold_value)
+
+
+class PositionOrder:
+    """
+    The fills of a derivative order aggregated the way PerformanceMetrics.aggregate_orders does.
+    """
+
+    def __init__(self, position: str, index: int):
+        self.position: str = position
+        # Index of the order among the orders of the same side opening or closing positions.
+        self.index: int = index
+        self.price_sum = 0
+        self.fills: int = 0
+        self.amount = 0
+
+    @property
+    def price(self) -> float:
+        return self.price_sum / self.fills
+
+
+class MarketPerformance:
+    """
+    Running totals of the trade fills of a market and trading pair, kept up to date on every fill so the performance
+    metrics can be created without going through all the fills again. The totals are accumulated with the same
+    arithmetic as PerformanceMetrics uses on the trade fill records, so both give the same results.
+    """
+
+    def __init__(self):
+        self.num_buys: int = 0
+        self.num_sells: int = 0
+        self.b_vol_base: Decimal = s_decimal_0
+        self.s_vol_base: Decimal = s_decimal_0
+        self.b_vol_quote: Decimal = s_decimal_0
+        self.s_vol_quote: Decimal = s_decimal_0
+        self.first_price: Optional[float] = None
+        self.last_price: Optional[float] = None
+        # fees is a dictionary of token and total fee amount paid in that token.
+        self.fees: Dict[str, Decimal] = {}
+        self._spot_buys: int = 0
+        self._spot_sells: int = 0
+        # Derivative orders by side and order id, the ones opening and closing positions by side and position in the
+        # order of their first fill, and the PnL of the long and short positions they close.
+        self._position_orders: Dict[Tuple[str, str], PositionOrder] = {}
+        self._position_queues: Dict[Tuple[str, str], List[PositionOrder]] = {}
+        self._long_pnls: List[float] = []
+        self._short_pnls: List[float] = []
+
+    @property
+    def num_trades(self) -> int:
+        return self.num_buys + self.num_sells
+
+    @property
+    def are_derivatives(self) -> bool:
+        return (self.num_buys > 0 and self._spot_buys == 0) or (self.num_sells > 0 and self._spot_sells == 0)
+
+    def add_fill(self,
+                 quote: str,
+                 trade_type: str,
+                 price: float,
+                 amount: float,
+                 order_id: str,
+                 position: str,
+                 trade_fee: Dict[str, Any]):
+        if self.first_price is None:
+            self.first_price = price
+        self.last_price = price
+
+        side: str = trade_type.upper()
+        if side == TradeType.BUY.name.upper():
+            self.num_buys += 1
+            self.b_vol_base += Decimal(str(amount))
+            self.b_vol_quote += Decimal(str(amount * price)) * Decimal("-1")
+            self._spot_buys += 1 if position == "NILL" else 0
+            self._add_position_fill(side, price, amount, order_id, position)
+        elif side == TradeType.SELL.name.upper():
+            self.num_sells += 1
+            self.s_vol_base += Decimal(str(amount)) * Decimal("-1")
+            self.s_vol_quote += Decimal(str(amount * price))
+            self._spot_sells += 1 if position == "NILL" else 0
+            self._add_position_fill(side, price, amount, order_id, position)
+
+        if trade_fee.get("percent") is not None and trade_fee["percent"] > 0:
+            if quote not in self.fees:
+                self.fees[quote] = s_decimal_0
+            self.fees[quote] += Decimal(price * amount * trade_fee["percent"])
+        for flat_fee in trade_fee.get("flat_fees", []):
+            if flat_fee["asset"] not in self.fees:
+                self.fees[flat_fee["asset"]] = s_decimal_0
+            self.fees[flat_fee["asset"]] += Decimal(flat_fee["amount"])
+
+    def _add_position_fill(self, side: str, price: float, amount: float, order_id: str, position: str):
+        order: Optional[PositionOrder] = self._position_orders.get((side, order_id))
+        if order is None:
+            queue: List[PositionOrder] = self._position_queues.setdefault((side, position), [])
+            order = PositionOrder(position, len(queue))
+            queue.append(order)
+            self._position_orders[(side, order_id)] = order
+        order.price_sum += price
+        order.fills += 1
+        order.amount += amount
+        self._update_position_pnl(side, order)
+
+    def _update_position_pnl(self, side: str, order: PositionOrder):
+        # The n-th order opening a long (short) position is paired with the n-th order closing one, as
+        # PerformanceMetrics.position_order does.
+        buy, sell = TradeType.BUY.name.upper(), TradeType.SELL.name.upper()
+        if order.position == "OPEN":
+            long: bool = side == buy
+            open_order: PositionOrder = order
+            close_queue: List[PositionOrder] = self._position_queues.get((sell if long else buy, "CLOSE"), [])
+            if order.index >= len(close_queue):
+                return
+            close_order: PositionOrder = close_queue[order.index]
+        elif order.position == "CLOSE":
+            long: bool = side == sell
+            close_order: PositionOrder = order
+            open_queue: List[PositionOrder] = self._position_queues.get((buy if long else sell, "OPEN"), [])
+            if order.index >= len(open_queue):
+                return
+            open_order: PositionOrder = open_queue[order.index]
+        else:
+            return
+        if long:
+            pnls: List[float] = self._long_pnls
+            pnl: float = (close_order.price - open_order.price) * close_order.amount
+        else:
+            pnls: List[float] = self._short_pnls
+            pnl: float = (open_order.price - close_order.price) * close_order.amount
+        if order.index == len(pnls):
+            pnls.append(pnl)
+        else:
+            pnls[order.index] = pnl
+
+    async def create_metrics(self,
+                             exchange: str,
+                             trading_pair: str,
+                             current_balances: Dict[str, Decimal]) -> PerformanceMetrics:
+        quote: str = trading_pair.split("-")[1]
+        perf: PerformanceMetrics = PerformanceMetrics()
+        perf.num_buys = self.num_buys
+        perf.num_sells = self.num_sells
+        perf.num_trades = self.num_trades
+        perf.b_vol_base = self.b_vol_base
+        perf.s_vol_base = self.s_vol_base
+        perf.b_vol_quote = self.b_vol_quote
+        perf.s_vol_quote = self.s_vol_quote
+        perf._calculate_totals_and_averages()
+
+        await perf._calculate_balances_and_value(exchange, trading_pair, current_balances,
+                                                 self.first_price, self.last_price)
+        if self.are_derivatives:
+            perf.trade_pnl = Decimal(str(sum(self._long_pnls + self._short_pnls)))
+        else:
+            perf.trade_pnl = perf.cur_value - perf.hold_value
+
+        perf.fees = dict(self.fees)
+        await perf._calculate_fee_in_quote(exchange, quote)
+
+        perf._calculate_return()
+        return perf
+
+
+class PerformanceTracker:
+    """
+    Performance of the trade fills since a start time, by market and trading pair. It is updated on every fill, so
+    reading the metrics doesn't require loading and going through all the fills again.
+    """
+
+    def __init__(self):
+        self._start_timestamp: Optional[int] = None
+        self._market_performances: Dict[Tuple[str, str], MarketPerformance] = {}
+
+    @property
+    def start_timestamp(self) -> Optional[int]:
+        """
+        Timestamp (in milliseconds) of the fills the tracker was last loaded from, None if it never was.
+        """
+        return self._start_timestamp
+
+    @property
+    def market_trading_pairs(self) -> List[Tuple[str, str]]:
+        return list(self._market_performances.keys())
+
+    @property
+    def num_trades(self) -> int:
+        return sum(performance.num_trades for performance in self._market_performances.values())
+
+    @property
+    def market_num_trades(self) -> Dict[Tuple[str, str], int]:
+        """
+        Number of fills by market and trading pair, which tells the markets whose performance changed.
+        """
+        return {market_pair: performance.num_trades for market_pair, performance in self._market_performances.items()}
+
+    def reset(self, start_timestamp: Optional[int] = None, trades: Optional[List[TradeFill]] = None):
+        """
+        Recomputes the tracker from the given trade fills.
+        """
+        self._start_timestamp = start_timestamp
+        self._market_performances.clear()
+        for trade in trades or []:
+            self.add_trade_fill(trade)
+
+    def add_trade_fill(self, trade: TradeFill):
+        self.add_fill(trade.market, trade.symbol, trade.trade_type, trade.price, trade.amount, trade.order_id,
+                      trade.position, trade.trade_fee)
+
+    def add_fill(self,
+                 market: str,
+                 trading_pair: str,
+                 trade_type: str,
+                 price: float,
+                 amount: float,
+                 order_id: str,
+                 position: str,
+                 trade_fee: Dict[str, Any]):
+        """
+        Adds a fill, with the values of its trade fill record.
+        """
+        performance: Optional[MarketPerformance] = self._market_performances.get((market, trading_pair))
+        if performance is None:
+            performance = self._market_performances[(market, trading_pair)] = MarketPerformance()
+        performance.add_fill(trading_pair.split("-")[1], trade_type, price, amount, order_id, position, trade_fee)
+
+    async def performance_metrics(self,
+                                  market: str,
+                                  trading_pair: str,
+                                  current_balances: Dict[str, Decimal]) -> PerformanceMetrics:
+        performance: MarketPerformance = self._market_performances[(market, trading_pair)]
+        return await performance.create_metrics(market, trading_pair, current_balances)
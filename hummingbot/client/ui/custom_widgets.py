@@ -1,9 +1,13 @@
 from __future__ import unicode_literals
+import asyncio
 import six
+import threading
+import time
 from collections import deque
 from typing import (
     List,
     Deque,
+    Optional,
 )
 
 from prompt_toolkit.auto_suggest import DynamicAutoSuggest
@@ -46,6 +50,9 @@ class CustomBuffer(Buffer):
 
 
 class CustomTextArea:
+    # Logged lines are rendered at most once per interval, a burst of logs is rendered all at once.
+    LOG_REFRESH_INTERVAL = 0.05
+
     def __init__(self, text='', multiline=True, password=False,
                  lexer=None, auto_suggest=None, completer=None,
                  complete_while_typing=True, accept_handler=None, history=None,
@@ -132,7 +139,17 @@ class CustomTextArea:
             get_line_prefix=get_line_prefix,
             align=align)
 
-        self.log_lines: Deque[str] = deque()
+        # The logs are kept in a ring buffer, the oldest lines are dropped as new ones are added.
+        self.log_lines: Deque[str] = deque(maxlen=max_line_count)
+        # The lines logged since the last refresh, appended to the rendered log text by the next one.
+        self._unrendered_log_lines: List[str] = []
+        # The rendered log text and its line count, None when the logs are to be rendered again in full.
+        self._log_text: Optional[str] = None
+        self._log_text_line_count: int = 0
+        self._ev_loop = asyncio.get_event_loop()
+        self._log_refresh_lock = threading.Lock()
+        self._log_refresh_pending: bool = False
+        self._last_log_refresh: float = 0
         self.log(initial_text)
 
     @property
@@ -172,33 +189,72 @@ class CustomTextArea:
         return self.window
 
     def log(self, text: str, save_log: bool = True, silent: bool = False):
-        # Getting the max width of the window area
-        if self.window.render_info is None:
-            max_width = 100
-        else:
-            max_width = self.window.render_info.window_width - 2
-
+        """
+        Appends the text to the logs, or replaces the displayed text with it if it is not to be saved. Long lines are
+        wrapped by the window when they are displayed.
+        Logs may come from other threads (e.g. the stdout redirection), they are rendered on the event loop.
+        """
         # remove simple formatting tags used by telegram
         repls = (('<b>', ''), ('</b>', ''), ('<pre>', ''), ('</pre>', ''))
         for r in repls:
             text = text.replace(*r)
 
-        # Split the string into multiple lines if there is a "\n" or if the string exceeds max window width
-        # This operation should not be too expensive because only the newly added lines are processed
-        new_lines_raw: List[str] = str(text).split('\n')
-        new_lines = []
-        for line in new_lines_raw:
-            while len(line) > max_width:
-                new_lines.append(line[0:max_width])
-                line = line[max_width:]
-            new_lines.append(line)
-
+        new_lines: List[str] = str(text).split('\n')
         if save_log:
-            self.log_lines.extend(new_lines)
-            while len(self.log_lines) > self.max_line_count:
-                self.log_lines.popleft()
-            new_text: str = "\n".join(self.log_lines)
-        else:
+            with self._log_refresh_lock:
+                self.log_lines.extend(new_lines)
+                self._unrendered_log_lines.extend(new_lines)
+            if not silent:
+                self._schedule_log_refresh()
+        elif not silent:
+            with self._log_refresh_lock:
+                # The text replaces the logs, which are not to be rendered over it, and are rendered in full again
+                # once new logs come in.
+                self._log_refresh_pending = False
+                self._log_text = None
             new_text: str = "\n".join(new_lines)
-        if not silent:
             self.buffer.document = Document(text=new_text, cursor_position=len(new_text))
+
+    def _schedule_log_refresh(self):
+        with self._log_refresh_lock:
+            if self._log_refresh_pending:
+                return
+            self._log_refresh_pending = True
+        delay: float = self._last_log_refresh + self.LOG_REFRESH_INTERVAL - time.monotonic()
+        if delay <= 0 and threading.current_thread() is threading.main_thread():
+            self._refresh_log()
+        else:
+            self._ev_loop.call_soon_threadsafe(self._ev_loop.call_later, max(delay, 0), self._refresh_log)
+
+    def _refresh_log(self):
+        """
+        Appends the lines logged since the last refresh to the rendered text, dropping its oldest lines once the ring
+        buffer is full, rather than joining the whole ring buffer again.
+        """
+        with self._log_refresh_lock:
+            if not self._log_refresh_pending:
+                return
+            self._log_refresh_pending = False
+            new_lines: List[str] = self._unrendered_log_lines
+            self._unrendered_log_lines = []
+            all_lines: Optional[List[str]] = None
+            if self._log_text is None or len(new_lines) >= self.max_line_count:
+                all_lines = list(self.log_lines)
+            elif len(new_lines) == 0:
+                return
+        self._last_log_refresh = time.monotonic()
+        if all_lines is not None:
+            new_text: str = "\n".join(all_lines)
+            self._log_text_line_count = len(all_lines)
+        else:
+            new_text: str = self._log_text + "\n" + "\n".join(new_lines)
+            self._log_text_line_count += len(new_lines)
+            dropped_line_count: int = self._log_text_line_count - self.max_line_count
+            if dropped_line_count > 0:
+                head_end: int = -1
+                for _ in range(dropped_line_count):
+                    head_end = new_text.index("\n", head_end + 1)
+                new_text = new_text[head_end + 1:]
+                self._log_text_line_count = self.max_line_count
+        self._log_text = new_text
+        self.buffer.document = Document(text=new_text, cursor_position=len(new_text))
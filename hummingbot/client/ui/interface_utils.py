@@ -1,14 +1,13 @@
 from decimal import Decimal
 from typing import (
-    Set,
-    Tuple,
-    List
+    Dict,
+    Optional,
+    Tuple
 )
 import psutil
 import datetime
 import asyncio
-from hummingbot.model.trade_fill import TradeFill
-from hummingbot.client.performance import PerformanceMetrics
+from hummingbot.client.performance import PerformanceMetrics, PerformanceTracker
 
 
 s_decimal_0 = Decimal("0")
@@ -48,29 +47,33 @@ async def start_trade_monitor(trade_monitor):
     from hummingbot.client.hummingbot_application import HummingbotApplication
     hb = HummingbotApplication.main_application()
     trade_monitor.log("Trades: 0, Total P&L: 0.00, Return %: 0.00%")
-    total_trades = 0
-    return_pcts = []
-    pnls = []
-    quote_asset = ""
+    # The performance since the bot started is kept up to date by the markets recorder as trades are filled, the
+    # metrics of a market are only computed again once it got new trades.
+    start_timestamp: Optional[int] = None
+    market_results: Dict[Tuple[str, str], Tuple[int, Decimal, Decimal]] = {}
 
     while True:
         if hb.strategy_task is not None and not hb.strategy_task.done():
             if all(market.ready for market in hb.markets.values()):
-                trades: List[TradeFill] = hb._get_trades_from_session(int(hb.init_time * 1e3),
-                                                                      config_file_path=hb.strategy_file_name)
-                if len(trades) > total_trades:
-                    total_trades = len(trades)
-                    market_info: Set[Tuple[str, str]] = set((t.market, t.symbol) for t in trades)
-                    for market, symbol in market_info:
-                        quote_asset = symbol.split("-")[1]  # Note that the qiote asset of the last pair is assumed to be the quote asset of P&L for simplicity
-                        cur_trades = [t for t in trades if t.market == market and t.symbol == symbol]
+                performance_tracker: Optional[PerformanceTracker] = hb._session_performance_tracker()
+                if performance_tracker is not None:
+                    if performance_tracker.start_timestamp != start_timestamp:
+                        start_timestamp = performance_tracker.start_timestamp
+                        market_results.clear()
+                    updated: bool = False
+                    for (market, symbol), num_trades in performance_tracker.market_num_trades.items():
+                        if (market, symbol) in market_results and market_results[(market, symbol)][0] == num_trades:
+                            continue
                         cur_balances = await hb.get_current_balances(market)
-                        perf = await PerformanceMetrics.create(market, symbol, cur_trades, cur_balances)
-                        return_pcts.append(perf.return_pct)
-                        pnls.append(perf.total_pnl)
-                    avg_return = sum(return_pcts) / len(return_pcts) if len(return_pcts) > 0 else s_decimal_0
-                    total_pnls = sum(pnls)  # Note that this sum doesn't handles cases with different multiple pairs for simplisity
-                    trade_monitor.log(f"Trades: {total_trades}, Total P&L: {PerformanceMetrics.smart_round(total_pnls)} {quote_asset}, Return %: {avg_return:.2%}")
-                    return_pcts.clear()
-                    pnls.clear()
+                        perf = await performance_tracker.performance_metrics(market, symbol, cur_balances)
+                        market_results[(market, symbol)] = (num_trades, perf.total_pnl, perf.return_pct)
+                        updated = True
+                    if updated:
+                        total_trades = sum(num_trades for num_trades, _, _ in market_results.values())
+                        # Note that the quote asset of the last pair is assumed to be the quote asset of P&L for simplicity
+                        quote_asset = list(market_results.keys())[-1][1].split("-")[1]
+                        # Note that this sum doesn't handles cases with different multiple pairs for simplisity
+                        total_pnls = sum(pnl for _, pnl, _ in market_results.values())
+                        avg_return = sum(return_pct for _, _, return_pct in market_results.values()) / len(market_results)
+                        trade_monitor.log(f"Trades: {total_trades}, Total P&L: {PerformanceMetrics.smart_round(total_pnls)} {quote_asset}, Return %: {avg_return:.2%}")
         await asyncio.sleep(2)  # sleeping for longer to manage resources
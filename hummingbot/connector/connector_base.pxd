@@ -14,6 +14,12 @@ cdef class ConnectorBase(NetworkIterator):
         public double _in_flight_orders_snapshot_timestamp
         public set _current_trade_fills
         public dict _exchange_order_ids
+        public object _order_fill_journal
+        object _order_filled_forwarder
+        public object _in_flight_locked_balances
+        object _order_update_forwarder
+        dict _snapshot_locked_balances
+        object _snapshot_locked_balances_source
 
     cdef str c_buy(self, str trading_pair, object amount, object order_type=*, object price=*, dict kwargs=*)
     cdef str c_sell(self, str trading_pair, object amount, object order_type=*, object price=*, dict kwargs=*)
@@ -2,6 +2,7 @@ from decimal import Decimal
 from typing import (
     Dict,
     List,
+    Optional,
     Tuple,
     Set,
 )
@@ -11,9 +12,15 @@ from hummingbot.core.event.events import (
     OrderType,
     TradeType
 )
+from hummingbot.core.event.event_forwarder import EventForwarder
 from hummingbot.core.event.event_logger import EventLogger
 from hummingbot.core.network_iterator import NetworkIterator
+from hummingbot.connector.in_flight_locked_balances import (
+    InFlightLockedBalances,
+    LockedBalance,
+)
 from hummingbot.connector.in_flight_order_base import InFlightOrderBase
+from hummingbot.connector.order_fill_journal import OrderFillJournal
 from hummingbot.connector.utils import TradeFillOrderDetails
 from hummingbot.core.event.events import OrderFilledEvent
 from hummingbot.client.config.global_config_map import global_config_map
@@ -44,15 +51,39 @@ cdef class ConnectorBase(NetworkIterator):
         MarketEvent.RangePositionFailure,
         MarketEvent.RangePositionInitiated,
     ]
+    # Events changing the balance locked in an in-flight order.
+    ORDER_UPDATE_EVENTS = [
+        MarketEvent.BuyOrderCreated,
+        MarketEvent.SellOrderCreated,
+        MarketEvent.OrderFilled,
+        MarketEvent.OrderCancelled,
+        MarketEvent.BuyOrderCompleted,
+        MarketEvent.SellOrderCompleted,
+        MarketEvent.OrderFailure,
+        MarketEvent.OrderExpired,
+    ]
+    # Maximum number of events kept in the event logs, the oldest ones are dropped past it. None keeps all of them.
+    EVENT_LOG_MAX_EVENTS: Optional[int] = None
 
     def __init__(self):
         super().__init__()
 
         self._event_reporter = EventReporter(event_source=self.display_name)
-        self._event_logger = EventLogger(event_source=self.display_name)
+        self._event_logger = EventLogger(event_source=self.display_name, max_events=self.EVENT_LOG_MAX_EVENTS)
         for event_tag in self.MARKET_EVENTS:
             self.c_add_listener(event_tag.value, self._event_reporter)
             self.c_add_listener(event_tag.value, self._event_logger)
+        # Balance changes of the filled orders, used to adjust the available balances.
+        self._order_fill_journal = OrderFillJournal()
+        self._order_filled_forwarder = EventForwarder(self._journal_order_fill)
+        self.c_add_listener(MarketEvent.OrderFilled.value, self._order_filled_forwarder)
+        # Balances locked in the in-flight orders, and in the orders of the last snapshot.
+        self._in_flight_locked_balances = InFlightLockedBalances(self._in_flight_order_locked_balance)
+        self._order_update_forwarder = EventForwarder(self._did_update_order)
+        for event_tag in self.ORDER_UPDATE_EVENTS:
+            self.c_add_listener(event_tag.value, self._order_update_forwarder)
+        self._snapshot_locked_balances = {}
+        self._snapshot_locked_balances_source = None
 
         self._account_balances = {}  # Dict[asset_name:str, Decimal]
         self._account_available_balances = {}  # Dict[asset_name:str, Decimal]
@@ -102,6 +133,23 @@ cdef class ConnectorBase(NetworkIterator):
     def split_trading_pair(trading_pair: str) -> Tuple[str, str]:
         return tuple(trading_pair.split('-'))
 
+    def _in_flight_order_locked_balance(self, order: InFlightOrderBase) -> LockedBalance:
+        """
+        Calculates the asset balance locked in an in-flight order including fee (estimated)
+        :param order: an in-flight order
+        :return The asset and its balance locked in the order, None if the order is no longer active
+        """
+        if order.is_done or order.is_failure or order.is_cancelled:
+            return None
+        if order.trade_type is TradeType.BUY:
+            order_value = Decimal(order.amount * order.price)
+            outstanding_value = order_value - order.executed_amount_quote
+            fee = self.estimate_fee_pct(True)
+            outstanding_value *= (Decimal(1) + fee)
+            return order.quote_asset, outstanding_value
+        outstanding_value = order.amount - order.executed_amount_base
+        return order.base_asset, outstanding_value
+
     def in_flight_asset_balances(self, in_flight_orders: Dict[str, InFlightOrderBase]) -> Dict[str, Decimal]:
         """
         Calculates total asset balances locked in in_flight_orders including fee (estimated)
@@ -113,22 +161,42 @@ cdef class ConnectorBase(NetworkIterator):
         asset_balances = {}
         if in_flight_orders is None:
             return asset_balances
-        for order in [o for o in in_flight_orders.values() if not (o.is_done or o.is_failure or o.is_cancelled)]:
-            if order.trade_type is TradeType.BUY:
-                order_value = Decimal(order.amount * order.price)
-                outstanding_value = order_value - order.executed_amount_quote
-                if order.quote_asset not in asset_balances:
-                    asset_balances[order.quote_asset] = s_decimal_0
-                fee = self.estimate_fee_pct(True)
-                outstanding_value *= (Decimal(1) + fee)
-                asset_balances[order.quote_asset] += outstanding_value
-            else:
-                outstanding_value = order.amount - order.executed_amount_base
-                if order.base_asset not in asset_balances:
-                    asset_balances[order.base_asset] = s_decimal_0
-                asset_balances[order.base_asset] += outstanding_value
+        for order in in_flight_orders.values():
+            locked_balance = self._in_flight_order_locked_balance(order)
+            if locked_balance is not None:
+                asset, outstanding_value = locked_balance
+                asset_balances[asset] = asset_balances.get(asset, s_decimal_0) + outstanding_value
         return asset_balances
 
+    def _did_update_order(self, event: any):
+        self._in_flight_locked_balances.mark_stale(event.order_id)
+
+    def in_flight_locked_balances(self) -> Dict[str, Decimal]:
+        """
+        Returns the total asset balances locked in the connector in-flight orders, as in_flight_asset_balances would
+        calculate them, but updated incrementally.
+        """
+        return self._in_flight_locked_balances.balances(self.in_flight_orders)
+
+    def in_flight_orders_snapshot_locked_balances(self) -> Dict[str, Decimal]:
+        """
+        Returns the total asset balances locked in the in-flight orders of the last snapshot. The snapshot orders are
+        copies, so their balances are calculated once per snapshot.
+        """
+        if self._in_flight_orders_snapshot is not self._snapshot_locked_balances_source:
+            self._snapshot_locked_balances = self.in_flight_asset_balances(self._in_flight_orders_snapshot)
+            self._snapshot_locked_balances_source = self._in_flight_orders_snapshot
+        return self._snapshot_locked_balances
+
+    def _journal_order_fill(self, event: OrderFilledEvent):
+        self._order_fill_journal.add_fill(event)
+        # The fills since the last balance snapshot are needed to adjust the available balances, older ones are only
+        # accounted for in the total balance changes.
+        if self._real_time_balance_update:
+            self._order_fill_journal.prune(event.timestamp)
+        else:
+            self._order_fill_journal.prune(self._in_flight_orders_snapshot_timestamp)
+
     def order_filled_balances(self, starting_timestamp = 0) -> Dict[str, Decimal]:
         """
         Calculates total asset balance changes from filled orders since the timestamp
@@ -137,6 +205,15 @@ cdef class ConnectorBase(NetworkIterator):
         :param starting_timestamp: The starting timestamp to include filter order filled events
         :returns A dictionary of tokens and their balance
         """
+        if not self._real_time_balance_update:
+            self._order_fill_journal.prune(self._in_flight_orders_snapshot_timestamp)
+        try:
+            return self._order_fill_journal.balances_since(starting_timestamp)
+        except ValueError:
+            # The fills since that timestamp were pruned from the journal, fall back to the event logs.
+            return self._order_filled_balances_from_event_logs(starting_timestamp)
+
+    def _order_filled_balances_from_event_logs(self, starting_timestamp: float) -> Dict[str, Decimal]:
         order_filled_events = list(filter(lambda e: isinstance(e, OrderFilledEvent), self.event_logs))
         order_filled_events = [o for o in order_filled_events if o.timestamp > starting_timestamp]
         balances = {}
@@ -305,7 +382,7 @@ cdef class ConnectorBase(NetworkIterator):
         :param limit: The balance limit for the token
         :returns An available balance after the limit has been applied
         """
-        in_flight_balance = self.in_flight_asset_balances(self.in_flight_orders).get(currency, s_decimal_0)
+        in_flight_balance = self.in_flight_locked_balances().get(currency, s_decimal_0)
         limit -= in_flight_balance
         filled_balance = self.order_filled_balances().get(currency, s_decimal_0)
         limit += filled_balance
@@ -320,8 +397,8 @@ cdef class ConnectorBase(NetworkIterator):
         _update_balances()
         :returns the real available that accounts for changes in in flight orders and filled orders
         """
-        snapshot_bal = self.in_flight_asset_balances(self._in_flight_orders_snapshot).get(currency, s_decimal_0)
-        in_flight_bal = self.in_flight_asset_balances(self.in_flight_orders).get(currency, s_decimal_0)
+        snapshot_bal = self.in_flight_orders_snapshot_locked_balances().get(currency, s_decimal_0)
+        in_flight_bal = self.in_flight_locked_balances().get(currency, s_decimal_0)
         orders_filled_bal = self.order_filled_balances(self._in_flight_orders_snapshot_timestamp).get(currency,
                                                                                                       s_decimal_0)
         actual_available = available_balance + snapshot_bal - in_flight_bal + orders_filled_bal
@@ -43,6 +43,10 @@ class BinancePerpetualAPIOrderBookDataSource(OrderBookTrackerDataSource):
             cls._bpobds_logger = logging.getLogger(__name__)
         return cls._bpobds_logger
 
+    @property
+    def throttler(self) -> AsyncThrottler:
+        return self._throttler
+
     @classmethod
     async def get_last_traded_prices(cls, trading_pairs: List[str], domain: str = CONSTANTS.DOMAIN) -> Dict[str, float]:
         tasks = [cls.get_last_traded_price(t_pair, domain) for t_pair in trading_pairs]
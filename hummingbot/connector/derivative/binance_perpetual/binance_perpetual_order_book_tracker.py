@@ -123,7 +123,7 @@ class BinancePerpetualOrderBookTracker(OrderBookTracker):
                 else:
                     message = await message_queue.get()
                 if message.type is OrderBookMessageType.DIFF:
-                    order_book.apply_diffs(message.bids, message.asks, message.update_id)
+                    order_book.apply_numpy_diffs(message.bids_array, message.asks_array, message.update_id)
                     past_diffs_window.append(message)
                     while len(past_diffs_window) > self.PAST_DIFF_WINDOW_SIZE:
                         past_diffs_window.popleft()
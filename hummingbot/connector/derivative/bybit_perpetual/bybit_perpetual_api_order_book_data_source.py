@@ -53,6 +53,10 @@ class BybitPerpetualAPIOrderBookDataSource(OrderBookTrackerDataSource):
 
         self._funding_info_async_lock: asyncio.Lock = asyncio.Lock()
 
+    @property
+    def throttler(self) -> AsyncThrottler:
+        return self._throttler
+
     @property
     def funding_info(self) -> Dict[str, FundingInfo]:
         return copy.deepcopy(self._funding_info)
@@ -41,6 +41,10 @@ class AscendExAPIOrderBookDataSource(OrderBookTrackerDataSource):
         self._trading_pairs: List[str] = trading_pairs
         self._snapshot_msg: Dict[str, any] = {}
 
+    @property
+    def throttler(self) -> AsyncThrottler:
+        return self._throttler
+
     @classmethod
     def _get_throttler_instance(cls) -> AsyncThrottler:
         throttler = AsyncThrottler(CONSTANTS.RATE_LIMITS)
@@ -6,22 +6,23 @@ import logging
 import pandas as pd
 import time
 import ujson
-import websockets
 
 import hummingbot.connector.exchange.binance.binance_constants as CONSTANTS
 
 from typing import (
     Any,
-    AsyncIterable,
     Dict,
     List,
-    Optional
+    Optional,
+    Tuple
 )
 from decimal import Decimal
 
 from hummingbot.core.api_throttler.async_throttler import AsyncThrottler
 from hummingbot.core.utils import async_ttl_cache
 from hummingbot.core.utils.async_utils import safe_gather
+from hummingbot.core.utils.http_session_pool import HTTPSessionPool
+from hummingbot.core.utils.websocket_stream_multiplexer import WebSocketStreamMultiplexer
 from hummingbot.core.data_type.order_book_tracker_data_source import OrderBookTrackerDataSource
 from hummingbot.core.data_type.order_book_message import OrderBookMessage
 from hummingbot.core.data_type.order_book import OrderBook
@@ -29,13 +30,29 @@ from hummingbot.logger import HummingbotLogger
 from hummingbot.connector.exchange.binance.binance_order_book import BinanceOrderBook
 from hummingbot.connector.exchange.binance import binance_utils
 
-from websockets.exceptions import ConnectionClosed
 
+class BinanceStreamMultiplexer(WebSocketStreamMultiplexer):
+    """
+    Multiplexes the public streams of all trading pairs over Binance combined stream connections. Streams are encoded
+    in the connection URL, so reconnecting resubscribes to them.
+    """
 
-class BinanceAPIOrderBookDataSource(OrderBookTrackerDataSource):
+    def __init__(self, domain: str = "com"):
+        super().__init__(max_streams_per_connection=CONSTANTS.MAX_STREAMS_PER_CONNECTION,
+                         max_url_length=CONSTANTS.MAX_WS_URL_LENGTH)
+        self._domain = domain
+
+    def connection_url(self, streams: List[str]) -> str:
+        return f"{CONSTANTS.WSS_COMBINED_STREAM_URL.format(self._domain)}?streams={'/'.join(streams)}"
 
-    MESSAGE_TIMEOUT = 30.0
-    PING_TIMEOUT = 10.0
+    def parse_message(self, raw_msg: str) -> Optional[Tuple[str, Any]]:
+        msg: Dict[str, Any] = ujson.loads(raw_msg)
+        if "stream" not in msg:
+            return None
+        return msg["stream"], msg["data"]
+
+
+class BinanceAPIOrderBookDataSource(OrderBookTrackerDataSource):
 
     _baobds_logger: Optional[HummingbotLogger] = None
 
@@ -50,6 +67,11 @@ class BinanceAPIOrderBookDataSource(OrderBookTrackerDataSource):
         self._order_book_create_function = lambda: OrderBook()
         self._domain = domain
         self._throttler = throttler or self._get_throttler_instance()
+        self._stream_multiplexer: BinanceStreamMultiplexer = BinanceStreamMultiplexer(domain)
+
+    @property
+    def throttler(self) -> AsyncThrottler:
+        return self._throttler
 
     @classmethod
     async def get_last_traded_prices(cls,
@@ -64,49 +86,49 @@ class BinanceAPIOrderBookDataSource(OrderBookTrackerDataSource):
     @classmethod
     async def get_last_traded_price(cls, trading_pair: str, domain: str = "com", throttler: Optional[AsyncThrottler] = None) -> float:
         throttler = throttler or cls._get_throttler_instance()
-        async with aiohttp.ClientSession() as client:
-            async with throttler.execute_task(limit_id=CONSTANTS.TICKER_PRICE_CHANGE_PATH_URL):
-                url = binance_utils.public_rest_url(path_url=CONSTANTS.TICKER_PRICE_CHANGE_PATH_URL, domain=domain)
-                resp = await client.get(f"{url}?symbol={binance_utils.convert_to_exchange_trading_pair(trading_pair)}")
-                resp_json = await resp.json()
-                return float(resp_json["lastPrice"])
+        url = binance_utils.public_rest_url(path_url=CONSTANTS.TICKER_PRICE_CHANGE_PATH_URL, domain=domain)
+        client = HTTPSessionPool.get_instance().get_session(url)
+        async with throttler.execute_task(limit_id=CONSTANTS.TICKER_PRICE_CHANGE_PATH_URL):
+            resp = await client.get(f"{url}?symbol={binance_utils.convert_to_exchange_trading_pair(trading_pair)}")
+            resp_json = await resp.json()
+            return float(resp_json["lastPrice"])
 
     @staticmethod
     @async_ttl_cache(ttl=2, maxsize=1)
     async def get_all_mid_prices(domain="com") -> Optional[Decimal]:
         throttler = BinanceAPIOrderBookDataSource._get_throttler_instance()
-        async with aiohttp.ClientSession() as client:
-            async with throttler.execute_task(limit_id=CONSTANTS.TICKER_PRICE_CHANGE_PATH_URL):
-                url = binance_utils.public_rest_url(path_url=CONSTANTS.TICKER_PRICE_CHANGE_PATH_URL, domain=domain)
-                resp = await client.get(url)
-                resp_json = await resp.json()
-                ret_val = {}
-                for record in resp_json:
-                    pair = binance_utils.convert_from_exchange_trading_pair(record["symbol"])
-                    ret_val[pair] = (Decimal(record.get("bidPrice", "0")) + Decimal(record.get("askPrice", "0"))) / Decimal("2")
-                return ret_val
+        url = binance_utils.public_rest_url(path_url=CONSTANTS.TICKER_PRICE_CHANGE_PATH_URL, domain=domain)
+        client = HTTPSessionPool.get_instance().get_session(url)
+        async with throttler.execute_task(limit_id=CONSTANTS.TICKER_PRICE_CHANGE_PATH_URL):
+            resp = await client.get(url)
+            resp_json = await resp.json()
+            ret_val = {}
+            for record in resp_json:
+                pair = binance_utils.convert_from_exchange_trading_pair(record["symbol"])
+                ret_val[pair] = (Decimal(record.get("bidPrice", "0")) + Decimal(record.get("askPrice", "0"))) / Decimal("2")
+            return ret_val
 
     @staticmethod
     async def fetch_trading_pairs(domain="com") -> List[str]:
         try:
             throttler = BinanceAPIOrderBookDataSource._get_throttler_instance()
-            async with aiohttp.ClientSession() as client:
-                async with throttler.execute_task(limit_id=CONSTANTS.EXCHANGE_INFO_PATH_URL):
-                    url = binance_utils.public_rest_url(path_url=CONSTANTS.EXCHANGE_INFO_PATH_URL, domain=domain)
-                    async with client.get(url, timeout=10) as response:
-                        if response.status == 200:
-                            data = await response.json()
-                            # fetch d["symbol"] for binance us/com
-                            raw_trading_pairs = [d["symbol"] for d in data["symbols"] if d["status"] == "TRADING"]
-                            trading_pair_targets = [
-                                f"{d['baseAsset']}-{d['quoteAsset']}" for d in data["symbols"] if d["status"] == "TRADING"
-                            ]
-                            trading_pair_list: List[str] = []
-                            for raw_trading_pair, pair_target in zip(raw_trading_pairs, trading_pair_targets):
-                                trading_pair: Optional[str] = binance_utils.convert_from_exchange_trading_pair(raw_trading_pair)
-                                if trading_pair is not None and trading_pair == pair_target:
-                                    trading_pair_list.append(trading_pair)
-                            return trading_pair_list
+            url = binance_utils.public_rest_url(path_url=CONSTANTS.EXCHANGE_INFO_PATH_URL, domain=domain)
+            client = HTTPSessionPool.get_instance().get_session(url)
+            async with throttler.execute_task(limit_id=CONSTANTS.EXCHANGE_INFO_PATH_URL):
+                async with client.get(url, timeout=10) as response:
+                    if response.status == 200:
+                        data = await response.json()
+                        # fetch d["symbol"] for binance us/com
+                        raw_trading_pairs = [d["symbol"] for d in data["symbols"] if d["status"] == "TRADING"]
+                        trading_pair_targets = [
+                            f"{d['baseAsset']}-{d['quoteAsset']}" for d in data["symbols"] if d["status"] == "TRADING"
+                        ]
+                        trading_pair_list: List[str] = []
+                        for raw_trading_pair, pair_target in zip(raw_trading_pairs, trading_pair_targets):
+                            trading_pair: Optional[str] = binance_utils.convert_from_exchange_trading_pair(raw_trading_pair)
+                            if trading_pair is not None and trading_pair == pair_target:
+                                trading_pair_list.append(trading_pair)
+                        return trading_pair_list
 
         except Exception:
             # Do nothing if the request fails -- there will be no autocomplete for binance trading pairs
@@ -124,21 +146,21 @@ class BinanceAPIOrderBookDataSource(OrderBookTrackerDataSource):
         throttler = throttler or BinanceAPIOrderBookDataSource._get_throttler_instance()
         params: Dict = {"limit": str(limit), "symbol": binance_utils.convert_to_exchange_trading_pair(trading_pair)} if limit != 0 \
             else {"symbol": binance_utils.convert_to_exchange_trading_pair(trading_pair)}
-        async with aiohttp.ClientSession() as client:
-            async with throttler.execute_task(limit_id=CONSTANTS.SNAPSHOT_PATH_URL):
-                url = binance_utils.public_rest_url(path_url=CONSTANTS.SNAPSHOT_PATH_URL, domain=domain)
-                async with client.get(url, params=params) as response:
-                    response: aiohttp.ClientResponse = response
-                    if response.status != 200:
-                        raise IOError(f"Error fetching market snapshot for {trading_pair}. "
-                                      f"Response: {response}.")
-                    data: Dict[str, Any] = await response.json()
-
-                    # Need to add the symbol into the snapshot message for the Kafka message queue.
-                    # Because otherwise, there'd be no way for the receiver to know which market the
-                    # snapshot belongs to.
-
-                    return data
+        url = binance_utils.public_rest_url(path_url=CONSTANTS.SNAPSHOT_PATH_URL, domain=domain)
+        client = HTTPSessionPool.get_instance().get_session(url)
+        async with throttler.execute_task(limit_id=CONSTANTS.SNAPSHOT_PATH_URL):
+            async with client.get(url, params=params) as response:
+                response: aiohttp.ClientResponse = response
+                if response.status != 200:
+                    raise IOError(f"Error fetching market snapshot for {trading_pair}. "
+                                  f"Response: {response}.")
+                data: Dict[str, Any] = await response.json()
+
+                # Need to add the symbol into the snapshot message for the Kafka message queue.
+                # Because otherwise, there'd be no way for the receiver to know which market the
+                # snapshot belongs to.
+
+                return data
 
     async def get_new_order_book(self, trading_pair: str) -> OrderBook:
         snapshot: Dict[str, Any] = await self.get_snapshot(trading_pair, 1000, self._domain, self._throttler)
@@ -152,80 +174,60 @@ class BinanceAPIOrderBookDataSource(OrderBookTrackerDataSource):
         order_book.apply_snapshot(snapshot_msg.bids, snapshot_msg.asks, snapshot_msg.update_id)
         return order_book
 
-    async def _inner_messages(self,
-                              ws: websockets.WebSocketClientProtocol) -> AsyncIterable[str]:
-        # Terminate the recv() loop as soon as the next message timed out, so the outer loop can reconnect.
+    async def get_snapshot_message(self, trading_pair: str) -> OrderBookMessage:
+        snapshot: Dict[str, Any] = await self.get_snapshot(trading_pair=trading_pair,
+                                                           domain=self._domain,
+                                                           throttler=self._throttler)
+        snapshot_timestamp: float = time.time()
+        return BinanceOrderBook.snapshot_message_from_exchange(
+            snapshot,
+            snapshot_timestamp,
+            metadata={"trading_pair": trading_pair}
+        )
+
+    def _streams(self, stream_type: str) -> List[str]:
+        return [f"{binance_utils.convert_to_exchange_trading_pair(trading_pair).lower()}@{stream_type}"
+                for trading_pair in self._trading_pairs]
+
+    async def listen_for_trades(self, ev_loop: asyncio.BaseEventLoop, output: asyncio.Queue):
+        messages: asyncio.Queue = self._stream_multiplexer.subscribe("trade", self._streams("trade"))
         try:
             while True:
                 try:
-                    msg: str = await asyncio.wait_for(ws.recv(), timeout=self.MESSAGE_TIMEOUT)
-                    yield msg
-                except asyncio.TimeoutError:
-                    pong_waiter = await ws.ping()
-                    await asyncio.wait_for(pong_waiter, timeout=self.PING_TIMEOUT)
-        except asyncio.TimeoutError:
-            self.logger().warning("WebSocket ping timed out. Going to reconnect...")
-            return
-        except ConnectionClosed:
-            return
-        finally:
-            await ws.close()
-
-    async def listen_for_trades(self, ev_loop: asyncio.BaseEventLoop, output: asyncio.Queue):
-        while True:
-            try:
-                ws_path: str = "/".join([f"{binance_utils.convert_to_exchange_trading_pair(trading_pair).lower()}@trade"
-                                         for trading_pair in self._trading_pairs])
-                url = CONSTANTS.WSS_URL.format(self._domain)
-                stream_url: str = f"{url}/{ws_path}"
-
-                ws = await websockets.connect(stream_url)
-                async for raw_msg in self._inner_messages(ws):
-                    msg = ujson.loads(raw_msg)
+                    msg: Dict[str, Any] = await messages.get()
                     trade_msg: OrderBookMessage = BinanceOrderBook.trade_message_from_exchange(msg)
                     output.put_nowait(trade_msg)
-            except asyncio.CancelledError:
-                raise
-            except Exception:
-                self.logger().error("Unexpected error with WebSocket connection. Retrying after 30 seconds...",
-                                    exc_info=True)
-                await asyncio.sleep(30.0)
+                except asyncio.CancelledError:
+                    raise
+                except Exception:
+                    self.logger().error("Unexpected error when processing public trade updates from exchange.",
+                                        exc_info=True)
+        finally:
+            self._stream_multiplexer.unsubscribe("trade")
 
     async def listen_for_order_book_diffs(self, ev_loop: asyncio.BaseEventLoop, output: asyncio.Queue):
-        while True:
-            try:
-                ws_path: str = "/".join([f"{binance_utils.convert_to_exchange_trading_pair(trading_pair).lower()}@depth"
-                                         for trading_pair in self._trading_pairs])
-                url = CONSTANTS.WSS_URL.format(self._domain)
-                stream_url: str = f"{url}/{ws_path}"
-
-                ws = await websockets.connect(stream_url)
-                async for raw_msg in self._inner_messages(ws):
-                    msg = ujson.loads(raw_msg)
+        messages: asyncio.Queue = self._stream_multiplexer.subscribe("depth", self._streams("depth"))
+        try:
+            while True:
+                try:
+                    msg: Dict[str, Any] = await messages.get()
                     order_book_message: OrderBookMessage = BinanceOrderBook.diff_message_from_exchange(
                         msg, time.time())
                     output.put_nowait(order_book_message)
-            except asyncio.CancelledError:
-                raise
-            except Exception:
-                self.logger().error("Unexpected error with WebSocket connection. Retrying after 30 seconds...",
-                                    exc_info=True)
-                await asyncio.sleep(30.0)
+                except asyncio.CancelledError:
+                    raise
+                except Exception:
+                    self.logger().error("Unexpected error when processing public order book updates from exchange.",
+                                        exc_info=True)
+        finally:
+            self._stream_multiplexer.unsubscribe("depth")
 
     async def listen_for_order_book_snapshots(self, ev_loop: asyncio.BaseEventLoop, output: asyncio.Queue):
         while True:
             try:
                 for trading_pair in self._trading_pairs:
                     try:
-                        snapshot: Dict[str, Any] = await self.get_snapshot(trading_pair=trading_pair,
-                                                                           domain=self._domain,
-                                                                           throttler=self._throttler)
-                        snapshot_timestamp: float = time.time()
-                        snapshot_msg: OrderBookMessage = BinanceOrderBook.snapshot_message_from_exchange(
-                            snapshot,
-                            snapshot_timestamp,
-                            metadata={"trading_pair": trading_pair}
-                        )
+                        snapshot_msg: OrderBookMessage = await self.get_snapshot_message(trading_pair)
                         output.put_nowait(snapshot_msg)
                         self.logger().debug(f"Saved order book snapshot for {trading_pair}")
                     except asyncio.CancelledError:
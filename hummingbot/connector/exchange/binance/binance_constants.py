@@ -5,6 +5,11 @@ from hummingbot.core.api_throttler.data_types import LinkedLimitWeightPair, Rate
 # Base URL
 REST_URL = "https://api.binance.{}/api/"
 WSS_URL = "wss://stream.binance.{}:9443/ws"
+WSS_COMBINED_STREAM_URL = "wss://stream.binance.{}:9443/stream"
+
+# Websocket connection limits
+MAX_STREAMS_PER_CONNECTION = 1024
+MAX_WS_URL_LENGTH = 4096
 
 PUBLIC_API_VERSION = "v1"
 PRIVATE_API_VERSION = "v3"
@@ -27,6 +32,8 @@ BINANCE_CREATE_ORDER = BinanceClient.create_order.__name__
 BINANCE_CANCEL_ORDER = BinanceClient.cancel_order.__name__
 BINANCE_GET_OPEN_ORDERS = BinanceClient.get_open_orders.__name__
 
+# Fetching the open orders of all the trading pairs weighs as much as fetching 20 orders one by one
+OPEN_ORDERS_MIN_ORDERS = 21
 
 # Rate Limit Type
 REQUEST_WEIGHT = "REQUEST_WEIGHT"
@@ -13,6 +13,8 @@ cdef class BinanceExchange(ExchangeBase):
         double _last_poll_timestamp
         dict _in_flight_orders
         dict _order_not_found_records
+        object _order_status_poller
+        object _http_session_pool
         TransactionTracker _tx_tracker
         dict _trading_rules
         dict _trade_fees
@@ -1,7 +1,6 @@
 from traceback import format_exc
 from collections import defaultdict
 from libc.stdint cimport int64_t
-import aiohttp
 from aiokafka import (
     AIOKafkaConsumer,
     ConsumerRecord
@@ -51,6 +50,7 @@ from hummingbot.core.event.events import (
     TradeFee
 )
 from hummingbot.connector.exchange_base import ExchangeBase
+from hummingbot.connector.order_status_poller import OrderStatusPoller
 from hummingbot.core.network_iterator import NetworkStatus
 from hummingbot.core.data_type.order_book cimport OrderBook
 from hummingbot.core.data_type.cancellation_result import CancellationResult
@@ -58,6 +58,7 @@ from hummingbot.core.data_type.transaction_tracker import TransactionTracker
 from hummingbot.connector.trading_rule cimport TradingRule
 from hummingbot.core.utils.tracking_nonce import get_tracking_nonce
 from hummingbot.core.utils.estimate_fee import estimate_fee
+from hummingbot.core.utils.http_session_pool import HTTPSessionPool
 from .binance_order_book_tracker import BinanceOrderBookTracker
 from .binance_user_stream_tracker import BinanceUserStreamTracker
 from .binance_time import BinanceTime
@@ -68,6 +69,7 @@ from .binance_utils import (
 from hummingbot.core.data_type.common import OpenOrder
 from hummingbot.core.data_type.trade import Trade
 from hummingbot.core.api_throttler.async_throttler import AsyncThrottler
+from hummingbot.core.api_throttler.data_types import DEFAULT_PRIORITY, HIGH_PRIORITY
 import hummingbot.connector.exchange.binance.binance_constants as CONSTANTS
 
 s_logger = None
@@ -154,6 +156,13 @@ cdef class BinanceExchange(ExchangeBase):
         self._trading_rules_polling_task = None
         self._async_scheduler = AsyncCallScheduler(call_interval=0.5)
         self._last_poll_timestamp = 0
+        self._order_status_poller = OrderStatusPoller(
+            fetch_open_orders=partial(self.query_api, self._binance_client.get_open_orders),
+            fetch_order=self._fetch_order_status,
+            client_order_id=lambda order_update: order_update["clientOrderId"],
+            order_fingerprint=lambda order_update: (order_update["status"], order_update["executedQty"]),
+            min_orders_for_open_orders=CONSTANTS.OPEN_ORDERS_MIN_ORDERS)
+        self._http_session_pool = HTTPSessionPool()
 
     @property
     def name(self) -> str:
@@ -227,8 +236,9 @@ cdef class BinanceExchange(ExchangeBase):
             *args,
             app_warning_msg: str = "Binance API call failed. Check API key and network connection.",
             request_weight: int = 1,
+            priority: int = DEFAULT_PRIORITY,
             **kwargs) -> Dict[str, any]:
-        async with self._throttler.execute_task(limit_id=func.__name__):
+        async with self._throttler.execute_task(limit_id=func.__name__, priority=priority):
             try:
                 return await self._async_scheduler.call_async(partial(func, *args, **kwargs),
                                                               timeout_seconds=self.API_CALL_TIMEOUT,
@@ -243,13 +253,13 @@ cdef class BinanceExchange(ExchangeBase):
                 raise ex
 
     async def query_url(self, url, request_weight: int = 1) -> any:
+        client = self._http_session_pool.get_session(url)
         async with self._throttler.execute_task(limit_id=url):
-            async with aiohttp.ClientSession() as client:
-                async with client.get(url, timeout=self.API_CALL_TIMEOUT) as response:
-                    if response.status != 200:
-                        raise IOError(f"Error fetching data from {url}. HTTP status is {response.status}.")
-                    data = await response.json()
-                    return data
+            async with client.get(url, timeout=self.API_CALL_TIMEOUT) as response:
+                if response.status != 200:
+                    raise IOError(f"Error fetching data from {url}. HTTP status is {response.status}.")
+                data = await response.json()
+                return data
 
     async def _update_balances(self):
         cdef:
@@ -483,6 +493,11 @@ cdef class BinanceExchange(ExchangeBase):
                                                  ))
                             self.logger().info(f"Recreating missing trade in TradeFill: {trade}")
 
+    async def _fetch_order_status(self, tracked_order: BinanceInFlightOrder) -> Dict[str, Any]:
+        return await self.query_api(self._binance_client.get_order,
+                                    symbol=convert_to_exchange_trading_pair(tracked_order.trading_pair),
+                                    origClientOrderId=tracked_order.client_order_id)
+
     async def _update_order_status(self):
         cdef:
             # This is intended to be a backup measure to close straggler orders, in case Binance's user stream events
@@ -493,12 +508,8 @@ cdef class BinanceExchange(ExchangeBase):
 
         if current_tick > last_tick and len(self._in_flight_orders) > 0:
             tracked_orders = list(self._in_flight_orders.values())
-            tasks = [self.query_api(self._binance_client.get_order,
-                                    symbol=convert_to_exchange_trading_pair(o.trading_pair), origClientOrderId=o.client_order_id)
-                     for o in tracked_orders]
-            self.logger().debug(f"Polling for order status updates of {len(tasks)} orders.")
-            results = await safe_gather(*tasks, return_exceptions=True)
-            for order_update, tracked_order in zip(results, tracked_orders):
+            results = await self._order_status_poller.poll(tracked_orders)
+            for tracked_order, order_update in results:
                 client_order_id = tracked_order.client_order_id
 
                 # If the order has already been cancelled or has failed do nothing
@@ -805,6 +816,7 @@ cdef class BinanceExchange(ExchangeBase):
 
     async def stop_network(self):
         self._stop_network()
+        await self._http_session_pool.close()
 
     async def check_network(self) -> NetworkStatus:
         try:
@@ -892,7 +904,7 @@ cdef class BinanceExchange(ExchangeBase):
                                     order_type
                                     )
         try:
-            order_result = await self.query_api(self._binance_client.create_order, **api_params)
+            order_result = await self.query_api(self._binance_client.create_order, priority=HIGH_PRIORITY, **api_params)
             exchange_order_id = str(order_result["orderId"])
             tracked_order = self._in_flight_orders.get(order_id)
             if tracked_order is not None:
@@ -946,7 +958,8 @@ cdef class BinanceExchange(ExchangeBase):
         try:
             cancel_result = await self.query_api(self._binance_client.cancel_order,
                                                  symbol=convert_to_exchange_trading_pair(trading_pair),
-                                                 origClientOrderId=order_id)
+                                                 origClientOrderId=order_id,
+                                                 priority=HIGH_PRIORITY)
         except BinanceAPIException as e:
             if "Unknown order sent" in e.message or e.code == 2011:
                 # The order was never there to begin with. So cancelling it is a no-op but semantically successful.
@@ -40,6 +40,10 @@ class CoinzoomAPIOrderBookDataSource(OrderBookTrackerDataSource):
         self._trading_pairs: List[str] = trading_pairs
         self._snapshot_msg: Dict[str, any] = {}
 
+    @property
+    def throttler(self) -> AsyncThrottler:
+        return self._throttler
+
     def _time(self):
         """ Function created to enable patching during unit tests execution.
         :return: current time
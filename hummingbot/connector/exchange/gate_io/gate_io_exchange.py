@@ -39,6 +39,7 @@ from hummingbot.core.event.events import (
     TradeFee
 )
 from hummingbot.connector.exchange_base import ExchangeBase
+from hummingbot.connector.order_status_poller import OrderStatusPoller
 from hummingbot.connector.exchange.gate_io.gate_io_order_book_tracker import GateIoOrderBookTracker
 from hummingbot.connector.exchange.gate_io.gate_io_user_stream_tracker import GateIoUserStreamTracker
 from hummingbot.connector.exchange.gate_io.gate_io_auth import GateIoAuth
@@ -106,6 +107,11 @@ class GateIoExchange(ExchangeBase):
         self._update_balances_fetching = False
         self._update_balances_queued = False
         self._update_balances_finished = asyncio.Event()
+        self._order_status_poller = OrderStatusPoller(
+            fetch_open_orders=self._fetch_open_order_updates,
+            fetch_order=self._fetch_order_status,
+            client_order_id=lambda order_msg: order_msg["text"],
+            order_fingerprint=lambda order_msg: (order_msg["status"], order_msg["left"]))
 
     @property
     def name(self) -> str:
@@ -653,6 +659,19 @@ class GateIoExchange(ExchangeBase):
             self.logger().network(f"Unexpected error while fetching balance update - {str(e)}", exc_info=True,
                                   app_warning_msg=warn_msg)
 
+    async def _fetch_open_order_updates(self) -> List[Dict[str, Any]]:
+        result = await self._api_request("GET", CONSTANTS.USER_ORDERS_PATH_URL, is_auth_required=True)
+        return [order for pair_orders in result for order in pair_orders["orders"]]
+
+    async def _fetch_order_status(self, tracked_order: GateIoInFlightOrder) -> Dict[str, Any]:
+        exchange_order_id = await tracked_order.get_exchange_order_id()
+        trading_pair = convert_to_exchange_trading_pair(tracked_order.trading_pair)
+        return await self._api_request("GET",
+                                       CONSTANTS.ORDER_STATUS_PATH_URL.format(id=exchange_order_id),
+                                       params={'currency_pair': trading_pair},
+                                       is_auth_required=True,
+                                       limit_id=CONSTANTS.ORDER_STATUS_LIMIT_ID)
+
     async def _update_order_status(self):
         """
         Calls REST API to get status update for each in-flight order.
@@ -663,24 +682,13 @@ class GateIoExchange(ExchangeBase):
 
         if current_tick > last_tick and len(self._in_flight_orders) > 0:
             tracked_orders = list(self._in_flight_orders.values())
-            tasks = []
-            for tracked_order in tracked_orders:
-                try:
-                    exchange_order_id = await tracked_order.get_exchange_order_id()
-                except asyncio.TimeoutError:
-                    self.logger().network(f"Skipped order status update for {tracked_order.client_order_id} "
+            responses = await self._order_status_poller.poll(tracked_orders)
+            for tracked_order, response in responses:
+                client_order_id = tracked_order.client_order_id
+                if isinstance(response, asyncio.TimeoutError):
+                    self.logger().network(f"Skipped order status update for {client_order_id} "
                                           "- waiting for exchange order id.")
                     continue
-                trading_pair = convert_to_exchange_trading_pair(tracked_order.trading_pair)
-                tasks.append(self._api_request("GET",
-                                               CONSTANTS.ORDER_STATUS_PATH_URL.format(id=exchange_order_id),
-                                               params={'currency_pair': trading_pair},
-                                               is_auth_required=True,
-                                               limit_id=CONSTANTS.ORDER_STATUS_LIMIT_ID))
-            self.logger().debug(f"Polling for order status updates of {len(tasks)} orders.")
-            responses = await safe_gather(*tasks, return_exceptions=True)
-            for response, tracked_order in zip(responses, tracked_orders):
-                client_order_id = tracked_order.client_order_id
                 if isinstance(response, GateIoAPIError):
                     if response.error_label == 'ORDER_NOT_FOUND':
                         self._order_not_found_records[client_order_id] = \
@@ -695,6 +703,9 @@ class GateIoExchange(ExchangeBase):
                         self.stop_tracking_order(client_order_id)
                     else:
                         continue
+                elif isinstance(response, Exception):
+                    self.logger().network(f"Error fetching status update for the order {client_order_id}: {response}.")
+                    continue
                 elif "id" not in response:
                     self.logger().info(f"_update_order_status id not in resp: {response}")
                     continue
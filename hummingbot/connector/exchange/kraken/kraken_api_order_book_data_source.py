@@ -48,6 +48,10 @@ class KrakenAPIOrderBookDataSource(OrderBookTrackerDataSource):
         self._order_book_create_function = lambda: OrderBook()
         self._throttler = throttler or self._get_throttler_instance()
 
+    @property
+    def throttler(self) -> AsyncThrottler:
+        return self._throttler
+
     @classmethod
     def _get_throttler_instance(cls) -> AsyncThrottler:
         throttler = AsyncThrottler(CONSTANTS.RATE_LIMITS)
@@ -323,6 +323,10 @@ class KucoinAPIOrderBookDataSource(OrderBookTrackerDataSource):
         self._order_book_create_function = lambda: OrderBook()
         self._tasks: DefaultDict[StreamType, Dict[int, KucoinAPIOrderBookDataSource.TaskEntry]] = defaultdict(dict)
 
+    @property
+    def throttler(self) -> AsyncThrottler:
+        return self._throttler
+
     @classmethod
     async def get_last_traded_prices(
         cls, trading_pairs: List[str], throttler: Optional[AsyncThrottler] = None
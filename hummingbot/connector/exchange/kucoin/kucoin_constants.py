@@ -14,6 +14,7 @@ ACCOUNTS_PATH_URL = "/api/v1/accounts?type=trade"
 SERVER_TIME_PATH_URL = "/api/v1/timestamp"
 SYMBOLS_PATH_URL = "/api/v1/symbols"
 ORDERS_PATH_URL = "/api/v1/orders"
+ACTIVE_ORDERS_PAGE_SIZE = 500
 
 WS_CONNECTION_LIMIT_ID = "WSConnection"
 WS_CONNECTION_LIMIT = 30
@@ -11,6 +11,7 @@ cdef class KucoinExchange(ExchangeBase):
         object _ev_loop
         object _kucoin_auth
         dict _in_flight_orders
+        object _order_status_poller
         double _last_poll_timestamp
         double _last_timestamp
         object _throttler
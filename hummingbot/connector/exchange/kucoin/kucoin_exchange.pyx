@@ -54,6 +54,7 @@ from hummingbot.connector.exchange.kucoin.kucoin_utils import (
 )
 from hummingbot.connector.trading_rule cimport TradingRule
 from hummingbot.connector.exchange_base import ExchangeBase
+from hummingbot.connector.order_status_poller import OrderStatusPoller
 from hummingbot.core.utils.tracking_nonce import get_tracking_nonce
 from hummingbot.core.utils.estimate_fee import estimate_fee
 from hummingbot.connector.exchange.kucoin import kucoin_constants as CONSTANTS
@@ -131,6 +132,12 @@ cdef class KucoinExchange(ExchangeBase):
         self._trading_rules_polling_task = None
         self._tx_tracker = KucoinExchangeTransactionTracker(self)
         self._user_stream_tracker = KucoinUserStreamTracker(self._throttler, self._kucoin_auth)
+        self._order_status_poller = OrderStatusPoller(
+            fetch_open_orders=self.get_active_orders,
+            fetch_order=self._fetch_order_status,
+            client_order_id=lambda order_update: order_update["data"]["clientOid"],
+            order_fingerprint=lambda order_update: (order_update["data"]["isActive"],
+                                                    order_update["data"]["dealSize"]))
 
     @property
     def name(self) -> str:
@@ -487,6 +494,20 @@ cdef class KucoinExchange(ExchangeBase):
             "get", path_url=path_url, is_auth_required=True, limit_id=CONSTANTS.GET_ORDER_LIMIT_ID
         )
 
+    async def get_active_orders(self) -> List[Dict[str, Any]]:
+        """
+        Fetches the active orders, in the same format as the order status responses.
+        """
+        path_url = f"{CONSTANTS.ORDERS_PATH_URL}?status=active&pageSize={CONSTANTS.ACTIVE_ORDERS_PAGE_SIZE}"
+        response = await self._api_request(
+            "get", path_url=path_url, is_auth_required=True, limit_id=CONSTANTS.GET_ORDER_LIMIT_ID
+        )
+        return [{"data": order} for order in response["data"]["items"]]
+
+    async def _fetch_order_status(self, tracked_order: KucoinInFlightOrder) -> Dict[str, Any]:
+        exchange_order_id = await tracked_order.get_exchange_order_id()
+        return await self.get_order_status(exchange_order_id)
+
     async def _update_order_status(self):
         cdef:
             # The poll interval for order status is 10 seconds.
@@ -495,10 +516,9 @@ cdef class KucoinExchange(ExchangeBase):
 
         if current_tick > last_tick and len(self._in_flight_orders) > 0:
             tracked_orders = list(self._in_flight_orders.values())
-            for tracked_order in tracked_orders:
-                exchange_order_id = await tracked_order.get_exchange_order_id()
-                order_update = await self.get_order_status(exchange_order_id)
-                if order_update is None:
+            results = await self._order_status_poller.poll(tracked_orders)
+            for tracked_order, order_update in results:
+                if order_update is None or isinstance(order_update, Exception):
                     self.logger().network(
                         f"Error fetching status update for the order {tracked_order.client_order_id}: "
                         f"{order_update}.",
@@ -510,6 +530,7 @@ cdef class KucoinExchange(ExchangeBase):
                 order_state = order_update["data"]["isActive"]
                 if order_state:
                     continue
+                exchange_order_id = order_update["data"]["id"]
 
                 # Calculate the newly executed amount for this update.
                 if order_update["data"]["opType"] == "DEAL":
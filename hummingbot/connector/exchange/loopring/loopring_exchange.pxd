@@ -14,7 +14,7 @@ cdef class LoopringExchange(ExchangeBase):
         int _loopring_accountid
         str _loopring_exchangeid
         str _loopring_private_key
-        object _order_sign_param
+        object _signing_executor
 
         object _user_stream_tracker
         object _user_stream_tracker_task
@@ -29,6 +29,7 @@ from hummingbot.connector.exchange.loopring.loopring_order_book_tracker import L
 from hummingbot.connector.exchange.loopring.loopring_api_order_book_data_source import LoopringAPIOrderBookDataSource
 from hummingbot.connector.exchange.loopring.loopring_api_token_configuration_data_source import LoopringAPITokenConfigurationDataSource
 from hummingbot.connector.exchange.loopring.loopring_user_stream_tracker import LoopringUserStreamTracker
+from hummingbot.connector.exchange.loopring.loopring_signing import init_signing_worker, sign_order, sign_request
 from hummingbot.core.utils.async_utils import (
     safe_ensure_future,
 )
@@ -50,11 +51,10 @@ from hummingbot.logger import HummingbotLogger
 from hummingbot.connector.exchange.loopring.loopring_in_flight_order cimport LoopringInFlightOrder
 from hummingbot.connector.trading_rule cimport TradingRule
 from hummingbot.core.utils.estimate_fee import estimate_fee
+from hummingbot.core.utils.signing_executor import SigningExecutor
 from hummingbot.core.utils.tracking_nonce import get_tracking_nonce
 
-from ethsnarks_loopring import PoseidonEdDSA
-from ethsnarks_loopring import FQ, SNARK_SCALAR_FIELD
-from ethsnarks_loopring import poseidon_params, poseidon
+from ethsnarks_loopring import SNARK_SCALAR_FIELD
 
 s_logger = None
 s_decimal_0 = Decimal(0)
@@ -192,7 +192,8 @@ cdef class LoopringExchange(ExchangeBase):
         self._in_flight_orders = {}
         self._next_order_id = {}
         self._trading_pairs = trading_pairs
-        self._order_sign_param = poseidon_params(SNARK_SCALAR_FIELD, 12, 6, 53, b'poseidon', 5, security_target=128)
+        # The order hashes and signatures are computed by worker processes, off the event loop.
+        self._signing_executor = SigningExecutor(initializer=init_signing_worker)
 
         self._order_id_lock = asyncio.Lock()
 
@@ -325,17 +326,11 @@ cdef class LoopringExchange(ExchangeBase):
         if order_type is OrderType.LIMIT_MAKER:
             order["orderType"] = "MAKER_ONLY"
         serialized_message = await self._serialize_order(order)
-        msgHash = poseidon(serialized_message, self._order_sign_param)
-        fq_obj = FQ(int(self._loopring_private_key, 16))
-        signed_message = PoseidonEdDSA.sign(msgHash, fq_obj)
+        msgHash, eddsa = await self._signing_executor.submit(sign_order, serialized_message, self._loopring_private_key)
         # Update with signature
 
-        eddsa = "0x" + "".join([hex(int(signed_message.sig.R.x))[2:].zfill(64),
-                                hex(int(signed_message.sig.R.y))[2:].zfill(64),
-                                hex(int(signed_message.sig.s))[2:].zfill(64)])
-
         order.update({
-            "hash": str(msgHash),
+            "hash": msgHash,
             "eddsaSignature": eddsa
         })
 
@@ -541,6 +536,7 @@ cdef class LoopringExchange(ExchangeBase):
         self._order_book_tracker.start()
 
         if self._trading_required:
+            await self._signing_executor.start()
             exchange_info = await self.api_request("GET", EXCHANGE_INFO_ROUTE)
 
             tokens = set()
@@ -566,6 +562,7 @@ cdef class LoopringExchange(ExchangeBase):
             self._user_stream_event_listener_task.cancel()
         self._user_stream_tracker_task = None
         self._user_stream_event_listener_task = None
+        self._signing_executor.shutdown()
 
     async def check_network(self) -> NetworkStatus:
         try:
@@ -929,10 +926,7 @@ cdef class LoopringExchange(ExchangeBase):
             hasher = hashlib.sha256()
             hasher.update(ordered_data.encode('utf-8'))
             msgHash = int(hasher.hexdigest(), 16) % SNARK_SCALAR_FIELD
-            signed = PoseidonEdDSA.sign(msgHash, FQ(int(self._loopring_private_key, 16)))
-            signature = "0x" + "".join([hex(int(signed.sig.R.x))[2:].zfill(64),
-                                        hex(int(signed.sig.R.y))[2:].zfill(64),
-                                        hex(int(signed.sig.s))[2:].zfill(64)])
+            signature = await self._signing_executor.submit(sign_request, msgHash, self._loopring_private_key)
             headers.update({"X-API-SIG": signature})
         async with self._shared_client.request(http_method, url=full_url,
                                                timeout=API_CALL_TIMEOUT,
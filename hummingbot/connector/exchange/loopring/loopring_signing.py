@@ -0,0 +1,51 @@
+from typing import (
+    List,
+    Tuple
+)
+
+from ethsnarks_loopring import PoseidonEdDSA
+from ethsnarks_loopring import FQ, SNARK_SCALAR_FIELD
+from ethsnarks_loopring import poseidon_params, poseidon
+
+# The parameters of the order hashes, computed once per (worker) process.
+_order_sign_param = None
+
+
+def init_signing_worker():
+    """
+    Precomputes the Poseidon parameters of the order hashes, run once in each signing worker process when it is spawned.
+    """
+    get_order_sign_param()
+
+
+def get_order_sign_param():
+    global _order_sign_param
+    if _order_sign_param is None:
+        _order_sign_param = poseidon_params(SNARK_SCALAR_FIELD, 12, 6, 53, b'poseidon', 5, security_target=128)
+    return _order_sign_param
+
+
+def _eddsa_signature(msg_hash: int, private_key: str) -> str:
+    signed_message = PoseidonEdDSA.sign(msg_hash, FQ(int(private_key, 16)))
+    return "0x" + "".join([hex(int(signed_message.sig.R.x))[2:].zfill(64),
+                           hex(int(signed_message.sig.R.y))[2:].zfill(64),
+                           hex(int(signed_message.sig.s))[2:].zfill(64)])
+
+
+def sign_order(serialized_order: List[int], private_key: str) -> Tuple[str, str]:
+    """
+    :param serialized_order: the order fields to hash, in the order the exchange hashes them
+    :param private_key: the hex encoded Loopring account private key
+    :return: the order hash and its EdDSA signature, as sent in the order
+    """
+    msg_hash = poseidon(serialized_order, get_order_sign_param())
+    return str(msg_hash), _eddsa_signature(msg_hash, private_key)
+
+
+def sign_request(msg_hash: int, private_key: str) -> str:
+    """
+    :param msg_hash: the hash of the request, modulo the SNARK scalar field
+    :param private_key: the hex encoded Loopring account private key
+    :return: the EdDSA signature of the request, as sent in the X-API-SIG header
+    """
+    return _eddsa_signature(msg_hash, private_key)
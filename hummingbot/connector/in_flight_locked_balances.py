@@ -0,0 +1,70 @@
+from decimal import Decimal
+from typing import (
+    Callable,
+    Dict,
+    Optional,
+    Set,
+    Tuple,
+)
+
+from hummingbot.connector.in_flight_order_base import InFlightOrderBase
+
+s_decimal_0 = Decimal(0)
+
+# The asset and the balance locked in an in-flight order, None if the order doesn't lock any balance anymore.
+LockedBalance = Optional[Tuple[str, Decimal]]
+
+
+class InFlightLockedBalances:
+    """
+    Total asset balances locked in the in-flight orders of a connector, kept up to date incrementally.
+
+    The balance locked in an order is only calculated again once the order is marked as stale (when it is created,
+    filled, cancelled or completed) or when it starts or stops being tracked, so getting the balances doesn't iterate
+    through every in-flight order.
+    """
+
+    def __init__(self, locked_balance_fn: Callable[[InFlightOrderBase], LockedBalance]):
+        self._locked_balance_fn: Callable[[InFlightOrderBase], LockedBalance] = locked_balance_fn
+        self._order_balances: Dict[str, LockedBalance] = {}
+        self._balances: Dict[str, Decimal] = {}
+        self._orders_count: Dict[str, int] = {}
+        self._stale_order_ids: Set[str] = set()
+
+    def mark_stale(self, order_id: str):
+        self._stale_order_ids.add(order_id)
+
+    def balances(self, in_flight_orders: Dict[str, InFlightOrderBase]) -> Dict[str, Decimal]:
+        """
+        :param in_flight_orders: the in-flight orders of the connector
+        :return: A dictionary of tokens and their balance locked in the orders, not to be modified
+        """
+        if self._order_balances.keys() != in_flight_orders.keys():
+            for order_id in [o for o in self._order_balances if o not in in_flight_orders]:
+                self._set_order_balance(order_id, None)
+                del self._order_balances[order_id]
+            self._stale_order_ids.update(o for o in in_flight_orders if o not in self._order_balances)
+        if len(self._stale_order_ids) > 0:
+            for order_id in self._stale_order_ids:
+                order: Optional[InFlightOrderBase] = in_flight_orders.get(order_id)
+                if order is not None:
+                    self._set_order_balance(order_id, self._locked_balance_fn(order))
+            self._stale_order_ids.clear()
+        return self._balances
+
+    def _set_order_balance(self, order_id: str, locked_balance: LockedBalance):
+        previous_balance: LockedBalance = self._order_balances.get(order_id)
+        if previous_balance is not None:
+            asset, amount = previous_balance
+            self._orders_count[asset] -= 1
+            if self._orders_count[asset] == 0:
+                # Resets the total rather than subtracting, so no rounding error builds up.
+                del self._orders_count[asset]
+                del self._balances[asset]
+            else:
+                self._balances[asset] -= amount
+        if locked_balance is not None:
+            asset, amount = locked_balance
+            self._orders_count[asset] = self._orders_count.get(asset, 0) + 1
+            self._balances[asset] = self._balances.get(asset, s_decimal_0) + amount
+        self._order_balances[order_id] = locked_balance
@@ -1,8 +1,10 @@
 #!/usr/bin/env python
+import csv
 import os.path
 import pandas as pd
 from shutil import move
 import asyncio
+from sqlalchemy import inspect
 from sqlalchemy.orm import (
     Session,
     Query
@@ -10,14 +12,18 @@ from sqlalchemy.orm import (
 import time
 import threading
 from typing import (
+    Any,
+    Callable,
     Dict,
     List,
     Optional,
+    TextIO,
     Tuple,
     Union,
 )
 
 from hummingbot import data_path
+from hummingbot.client.performance import PerformanceTracker
 from hummingbot.core.event.events import (
     BuyOrderCreatedEvent,
     SellOrderCreatedEvent,
@@ -42,6 +48,11 @@ from hummingbot.model.order_status import OrderStatus
 from hummingbot.model.range_position import RangePosition
 from hummingbot.model.range_position_update import RangePositionUpdate
 from hummingbot.model.sql_connection_manager import SQLConnectionManager
+from hummingbot.model.sql_write_queue import (
+    SQLWriteJob,
+    SQLWriteQueue,
+    SQLWriteQueueMetrics,
+)
 from hummingbot.model.trade_fill import TradeFill
 from hummingbot.model.funding_payment import FundingPayment
 
@@ -51,12 +62,25 @@ class MarketsRecorder:
         event_obj.value: event_obj
         for event_obj in MarketEvent.__members__.values()
     }
+    _csv_field_names_by_class: Dict[type, Tuple[str, ...]] = {}
 
     def __init__(self,
                  sql: SQLConnectionManager,
                  markets: List[ConnectorBase],
                  config_file_path: str,
-                 strategy_name: str):
+                 strategy_name: str,
+                 write_behind: bool = True,
+                 flush_interval: float = 0.5,
+                 batch_size: int = 100,
+                 market_states_save_interval: float = 1.0):
+        """
+        :param write_behind: When True, the database writes of the market events are queued and committed in batches by
+        a dedicated thread instead of the event loop. Reads through the recorder wait for the queued writes first.
+        :param flush_interval: Maximum time a queued write waits for others to be committed with, in seconds
+        :param batch_size: Maximum number of writes committed in one transaction
+        :param market_states_save_interval: Minimum time between two saves of the tracking states of a market, in
+        seconds. The states changed by the order events within that time are saved once, at the end of it.
+        """
         if threading.current_thread() != threading.main_thread():
             raise EnvironmentError("MarketsRecorded can only be initialized from the main thread.")
 
@@ -65,6 +89,18 @@ class MarketsRecorder:
         self._markets: List[ConnectorBase] = markets
         self._config_file_path: str = config_file_path
         self._strategy_name: str = strategy_name
+        # In-memory SQLite databases are per connection, the writer thread wouldn't see the same database.
+        self._write_queue: Optional[SQLWriteQueue] = (
+            SQLWriteQueue(sql, flush_interval=flush_interval, batch_size=batch_size)
+            if write_behind and sql.engine.url.database not in (None, "", ":memory:") else None
+        )
+        self._market_states_save_interval: float = market_states_save_interval
+        # Pending tracking states saves and last saved tracking states, by config file path and market name.
+        self._market_states_save_handles: Dict[Tuple[str, str], Tuple[asyncio.TimerHandle, ConnectorBase]] = {}
+        self._saved_market_states: Dict[Tuple[str, str], Dict[str, Any]] = {}
+        self._performance_tracker: PerformanceTracker = PerformanceTracker()
+        # Trades CSV exports open for appending, with their writer and header, by file path.
+        self._csv_files: Dict[str, Tuple[TextIO, Any, Tuple[str, ...]]] = {}
         # Internal collection of trade fills in connector will be used for remote/local history reconciliation
         for market in self._markets:
             trade_fills = self.get_trades_for_config(self._config_file_path, 2000)
@@ -122,7 +158,23 @@ class MarketsRecorder:
     def db_timestamp(self) -> int:
         return int(time.time() * 1e3)
 
+    @property
+    def performance_tracker(self) -> PerformanceTracker:
+        """
+        Performance of the fills recorded since the tracker was last loaded from the database.
+        """
+        return self._performance_tracker
+
+    @property
+    def write_metrics(self) -> Optional[SQLWriteQueueMetrics]:
+        """
+        Queue depth and commit latency of the write-behind queue, None if writes are committed synchronously.
+        """
+        return self._write_queue.metrics if self._write_queue is not None else None
+
     def start(self):
+        if self._write_queue is not None:
+            self._write_queue.start()
         for market in self._markets:
             for event_pair in self._event_pairs:
                 market.add_listener(event_pair[0], event_pair[1])
@@ -131,10 +183,41 @@ class MarketsRecorder:
         for market in self._markets:
             for event_pair in self._event_pairs:
                 market.remove_listener(event_pair[0], event_pair[1])
+        self.save_pending_market_states()
+        if self._write_queue is not None:
+            self._write_queue.stop()
+        self.close_csv_files()
+
+    def flush(self):
+        """
+        Waits for the queued database writes to be committed.
+        """
+        if self._write_queue is not None and self._write_queue.started:
+            self._write_queue.flush()
+            # Records loaded before the writes were committed by the writer thread are stale.
+            self.session.expire_all()
+
+    def _write(self, job: SQLWriteJob):
+        """
+        Queues the write job, or applies and commits it right away when write-behind is disabled or not running.
+        """
+        if self._write_queue is not None and self._write_queue.started:
+            self._write_queue.put(job)
+            return
+        session: Session = self.session
+        try:
+            after_commit: Optional[Callable[[], None]] = job(session)
+            session.commit()
+        except Exception:
+            session.rollback()
+            raise
+        if after_commit is not None:
+            after_commit()
 
     def get_orders_for_config_and_market(self, config_file_path: str, market: ConnectorBase,
                                          with_exchange_order_id_present: Optional[bool] = False,
                                          number_of_rows: Optional[int] = None) -> List[Order]:
+        self.flush()
         session: Session = self.session
         filters = [Order.config_file_path == config_file_path,
                    Order.market == market.display_name]
@@ -150,6 +233,7 @@ class MarketsRecorder:
             return query.limit(number_of_rows).all()
 
     def get_trades_for_config(self, config_file_path: str, number_of_rows: Optional[int] = None) -> List[TradeFill]:
+        self.flush()
         session: Session = self.session
         query: Query = (session
                         .query(TradeFill)
@@ -161,23 +245,79 @@ class MarketsRecorder:
             return query.limit(number_of_rows).all()
 
     def save_market_states(self, config_file_path: str, market: ConnectorBase, no_commit: bool = False):
-        session: Session = self.session
-        market_states: Optional[MarketState] = self.get_market_states(config_file_path, market)
+        market_name: str = market.display_name
+        tracking_states: Dict[str, Any] = market.tracking_states
+        self._cancel_market_states_save(config_file_path, market_name)
+        self._saved_market_states[(config_file_path, market_name)] = tracking_states
+        if no_commit:
+            self._save_market_states(self.session, config_file_path, market_name, tracking_states, self.db_timestamp)
+            return
+        self._write(self._market_states_job(config_file_path, market_name, tracking_states))
+
+    def save_pending_market_states(self):
+        """
+        Saves right away the tracking states whose save is waiting for the end of the save interval.
+        """
+        for (config_file_path, _), (handle, market) in list(self._market_states_save_handles.items()):
+            handle.cancel()
+            self._save_changed_market_states(config_file_path, market)
+
+    def _schedule_market_states_save(self, config_file_path: str, market: ConnectorBase):
+        # The states are read when the save is due, so every event until then is covered by a single save.
+        key: Tuple[str, str] = (config_file_path, market.display_name)
+        if key in self._market_states_save_handles:
+            return
+        if self._market_states_save_interval <= 0:
+            self._save_changed_market_states(config_file_path, market)
+            return
+        handle: asyncio.TimerHandle = self._ev_loop.call_later(self._market_states_save_interval,
+                                                               self._save_changed_market_states,
+                                                               config_file_path,
+                                                               market)
+        self._market_states_save_handles[key] = (handle, market)
+
+    def _cancel_market_states_save(self, config_file_path: str, market_name: str):
+        pending_save: Optional[Tuple[asyncio.TimerHandle, ConnectorBase]] = self._market_states_save_handles.pop(
+            (config_file_path, market_name), None)
+        if pending_save is not None:
+            pending_save[0].cancel()
+
+    def _save_changed_market_states(self, config_file_path: str, market: ConnectorBase):
+        key: Tuple[str, str] = (config_file_path, market.display_name)
+        self._market_states_save_handles.pop(key, None)
+        tracking_states: Dict[str, Any] = market.tracking_states
+        if self._saved_market_states.get(key) == tracking_states:
+            return
+        self._saved_market_states[key] = tracking_states
+        self._write(self._market_states_job(config_file_path, market.display_name, tracking_states))
+
+    def _market_states_job(self,
+                           config_file_path: str,
+                           market_name: str,
+                           tracking_states: Dict[str, Any]) -> SQLWriteJob:
+        # The tracking states are captured by the caller, the connector must only be accessed from the event loop.
         timestamp: int = self.db_timestamp
+        return lambda session: self._save_market_states(session, config_file_path, market_name, tracking_states,
+                                                        timestamp)
+
+    def _save_market_states(self,
+                            session: Session,
+                            config_file_path: str,
+                            market_name: str,
+                            tracking_states: Dict[str, Any],
+                            timestamp: int):
+        market_states: Optional[MarketState] = self._query_market_states(session, config_file_path, market_name)
 
         if market_states is not None:
-            market_states.saved_state = market.tracking_states
+            market_states.saved_state = tracking_states
             market_states.timestamp = timestamp
         else:
             market_states = MarketState(config_file_path=config_file_path,
-                                        market=market.display_name,
+                                        market=market_name,
                                         timestamp=timestamp,
-                                        saved_state=market.tracking_states)
+                                        saved_state=tracking_states)
             session.add(market_states)
 
-        if not no_commit:
-            session.commit()
-
     def restore_market_states(self, config_file_path: str, market: ConnectorBase):
         market_states: Optional[MarketState] = self.get_market_states(config_file_path, market)
 
@@ -185,11 +325,16 @@ class MarketsRecorder:
             market.restore_tracking_states(market_states.saved_state)
 
     def get_market_states(self, config_file_path: str, market: ConnectorBase) -> Optional[MarketState]:
-        session: Session = self.session
+        self.save_pending_market_states()
+        self.flush()
+        return self._query_market_states(self.session, config_file_path, market.display_name)
+
+    @staticmethod
+    def _query_market_states(session: Session, config_file_path: str, market_name: str) -> Optional[MarketState]:
         query: Query = (session
                         .query(MarketState)
                         .filter(MarketState.config_file_path == config_file_path,
-                                MarketState.market == market.display_name))
+                                MarketState.market == market_name))
         market_states: Optional[MarketState] = query.one_or_none()
         return market_states
 
@@ -201,34 +346,37 @@ class MarketsRecorder:
             self._ev_loop.call_soon_threadsafe(self._did_create_order, event_tag, market, evt)
             return
 
-        session: Session = self.session
         base_asset, quote_asset = evt.trading_pair.split("-")
         timestamp: int = self.db_timestamp
         event_type: MarketEvent = self.market_event_tag_map[event_tag]
-        order_record: Order = Order(id=evt.order_id,
-                                    config_file_path=self._config_file_path,
-                                    strategy=self._strategy_name,
-                                    market=market.display_name,
-                                    symbol=evt.trading_pair,
-                                    base_asset=base_asset,
-                                    quote_asset=quote_asset,
-                                    creation_timestamp=timestamp,
-                                    order_type=evt.type.name,
-                                    amount=float(evt.amount),
-                                    leverage=evt.leverage if evt.leverage else 1,
-                                    price=float(evt.price) if evt.price == evt.price else 0,
-                                    position=evt.position if evt.position else "NILL",
-                                    last_status=event_type.name,
-                                    last_update_timestamp=timestamp,
-                                    exchange_order_id=evt.exchange_order_id)
-        order_status: OrderStatus = OrderStatus(order=order_record,
-                                                timestamp=timestamp,
-                                                status=event_type.name)
-        session.add(order_record)
-        session.add(order_status)
+        market_name: str = market.display_name
         market.add_exchange_order_ids_from_market_recorder({evt.exchange_order_id: evt.order_id})
-        self.save_market_states(self._config_file_path, market, no_commit=True)
-        session.commit()
+
+        def record_order(session: Session):
+            order_record: Order = Order(id=evt.order_id,
+                                        config_file_path=self._config_file_path,
+                                        strategy=self._strategy_name,
+                                        market=market_name,
+                                        symbol=evt.trading_pair,
+                                        base_asset=base_asset,
+                                        quote_asset=quote_asset,
+                                        creation_timestamp=timestamp,
+                                        order_type=evt.type.name,
+                                        amount=float(evt.amount),
+                                        leverage=evt.leverage if evt.leverage else 1,
+                                        price=float(evt.price) if evt.price == evt.price else 0,
+                                        position=evt.position if evt.position else "NILL",
+                                        last_status=event_type.name,
+                                        last_update_timestamp=timestamp,
+                                        exchange_order_id=evt.exchange_order_id)
+            order_status: OrderStatus = OrderStatus(order=order_record,
+                                                    timestamp=timestamp,
+                                                    status=event_type.name)
+            session.add(order_record)
+            session.add(order_status)
+
+        self._write(record_order)
+        self._schedule_market_states_save(self._config_file_path, market)
 
     def _did_fill_order(self,
                         event_tag: int,
@@ -238,47 +386,56 @@ class MarketsRecorder:
             self._ev_loop.call_soon_threadsafe(self._did_fill_order, event_tag, market, evt)
             return
 
-        session: Session = self.session
         base_asset, quote_asset = evt.trading_pair.split("-")
         timestamp: int = self.db_timestamp
         event_type: MarketEvent = self.market_event_tag_map[event_tag]
         order_id: str = evt.order_id
+        market_name: str = market.display_name
+        price: float = float(evt.price) if evt.price == evt.price else 0
+        amount: float = float(evt.amount)
+        position: str = evt.position if evt.position else "NILL"
+        trade_fee: Dict[str, Any] = TradeFee.to_json(evt.trade_fee)
+        market.add_trade_fills_from_market_recorder({TradeFillOrderDetails(market_name,
+                                                                           evt.exchange_trade_id,
+                                                                           evt.trading_pair)})
+        self._performance_tracker.add_fill(market_name, evt.trading_pair, evt.trade_type.name, price, amount,
+                                           order_id, position, trade_fee)
+
+        def record_fill(session: Session) -> Callable[[], None]:
+            # Try to find the order record, and update it if necessary.
+            order_record: Optional[Order] = session.query(Order).filter(Order.id == order_id).one_or_none()
+            if order_record is not None:
+                order_record.last_status = event_type.name
+                order_record.last_update_timestamp = timestamp
+
+            # Order status and trade fill record should be added even if the order record is not found, because it's
+            # possible for fill event to come in before the order created event for market orders.
+            order_status: OrderStatus = OrderStatus(order_id=order_id,
+                                                    timestamp=timestamp,
+                                                    status=event_type.name)
+            trade_fill_record: TradeFill = TradeFill(config_file_path=self.config_file_path,
+                                                     strategy=self.strategy_name,
+                                                     market=market_name,
+                                                     symbol=evt.trading_pair,
+                                                     base_asset=base_asset,
+                                                     quote_asset=quote_asset,
+                                                     timestamp=timestamp,
+                                                     order_id=order_id,
+                                                     trade_type=evt.trade_type.name,
+                                                     order_type=evt.order_type.name,
+                                                     price=price,
+                                                     amount=amount,
+                                                     leverage=evt.leverage if evt.leverage else 1,
+                                                     trade_fee=trade_fee,
+                                                     exchange_trade_id=evt.exchange_trade_id,
+                                                     position=position, )
+            session.add(order_status)
+            session.add(trade_fill_record)
+            # The trade id is only known once the record is committed.
+            return lambda: self.append_to_csv(trade_fill_record)
 
-        # Try to find the order record, and update it if necessary.
-        order_record: Optional[Order] = session.query(Order).filter(Order.id == order_id).one_or_none()
-        if order_record is not None:
-            order_record.last_status = event_type.name
-            order_record.last_update_timestamp = timestamp
-
-        # Order status and trade fill record should be added even if the order record is not found, because it's
-        # possible for fill event to come in before the order created event for market orders.
-        order_status: OrderStatus = OrderStatus(order_id=order_id,
-                                                timestamp=timestamp,
-                                                status=event_type.name)
-        trade_fill_record: TradeFill = TradeFill(config_file_path=self.config_file_path,
-                                                 strategy=self.strategy_name,
-                                                 market=market.display_name,
-                                                 symbol=evt.trading_pair,
-                                                 base_asset=base_asset,
-                                                 quote_asset=quote_asset,
-                                                 timestamp=timestamp,
-                                                 order_id=order_id,
-                                                 trade_type=evt.trade_type.name,
-                                                 order_type=evt.order_type.name,
-                                                 price=float(evt.price) if evt.price == evt.price else 0,
-                                                 amount=float(evt.amount),
-                                                 leverage=evt.leverage if evt.leverage else 1,
-                                                 trade_fee=TradeFee.to_json(evt.trade_fee),
-                                                 exchange_trade_id=evt.exchange_trade_id,
-                                                 position=evt.position if evt.position else "NILL", )
-        session.add(order_status)
-        session.add(trade_fill_record)
-        self.save_market_states(self._config_file_path, market, no_commit=True)
-        session.commit()
-        market.add_trade_fills_from_market_recorder({TradeFillOrderDetails(trade_fill_record.market,
-                                                                           trade_fill_record.exchange_trade_id,
-                                                                           trade_fill_record.symbol)})
-        self.append_to_csv(trade_fill_record)
+        self._write(record_fill)
+        self._schedule_market_states_save(self._config_file_path, market)
 
     def _did_complete_funding_payment(self,
                                       event_tag: int,
@@ -288,61 +445,85 @@ class MarketsRecorder:
             self._ev_loop.call_soon_threadsafe(self._did_complete_funding_payment, event_tag, market, evt)
             return
 
-        session: Session = self.session
         timestamp: float = evt.timestamp
-
-        # Try to find the funding payment has been recorded already.
-        payment_record: Optional[FundingPayment] = session.query(FundingPayment).filter(
-            FundingPayment.timestamp == timestamp).one_or_none()
-        if payment_record is None:
-            funding_payment_record: FundingPayment = FundingPayment(timestamp=timestamp,
-                                                                    config_file_path=self.config_file_path,
-                                                                    market=market.display_name,
-                                                                    rate=evt.funding_rate,
-                                                                    symbol=evt.trading_pair,
-                                                                    amount=float(evt.amount))
-            session.add(funding_payment_record)
-            session.commit()
-            # self.append_to_csv(funding_payment_record)
-
-    @staticmethod
-    def _is_primitive_type(obj: object) -> bool:
-        return not hasattr(obj, '__dict__')
+        market_name: str = market.display_name
+
+        def record_funding_payment(session: Session):
+            # Try to find the funding payment has been recorded already.
+            payment_record: Optional[FundingPayment] = session.query(FundingPayment).filter(
+                FundingPayment.timestamp == timestamp).one_or_none()
+            if payment_record is None:
+                funding_payment_record: FundingPayment = FundingPayment(timestamp=timestamp,
+                                                                        config_file_path=self.config_file_path,
+                                                                        market=market_name,
+                                                                        rate=evt.funding_rate,
+                                                                        symbol=evt.trading_pair,
+                                                                        amount=float(evt.amount))
+                session.add(funding_payment_record)
+                # self.append_to_csv(funding_payment_record)
+
+        self._write(record_funding_payment)
+
+    @classmethod
+    def _csv_field_names(cls, trade: TradeFill) -> Tuple[str, ...]:
+        # The exported fields are the mapped columns of the record, in alphabetical order after the id. They only
+        # depend on the record class, so they are only looked up once.
+        trade_class: type = type(trade)
+        if trade_class not in cls._csv_field_names_by_class:
+            columns: List[str] = sorted(column.key for column in inspect(trade_class).column_attrs)
+            cls._csv_field_names_by_class[trade_class] = (("id",) +
+                                                          tuple(column for column in columns if column != "id") +
+                                                          ("age",))
+        return cls._csv_field_names_by_class[trade_class]
 
     @staticmethod
-    def _is_protected_method(method_name: str) -> bool:
-        return method_name.startswith('_')
-
-    @staticmethod
-    def _csv_matches_header(file_path: str, header: tuple) -> bool:
-        df = pd.read_csv(file_path, header=None)
-        return tuple(df.iloc[0].values) == header
+    def _read_csv_header(file_path: str) -> Optional[Tuple[str, ...]]:
+        with open(file_path, newline="") as csv_file:
+            header: Optional[List[str]] = next(csv.reader(csv_file), None)
+        return tuple(header) if header is not None else None
+
+    def _csv_writer(self, csv_path: str, field_names: Tuple[str, ...]) -> Any:
+        """
+        Returns the writer appending to the CSV file, opening it on first use. An existing file with another header is
+        moved aside first.
+        """
+        if csv_path in self._csv_files:
+            csv_file, writer, header = self._csv_files[csv_path]
+            if header == field_names:
+                return writer
+            csv_file.close()
+            del self._csv_files[csv_path]
+        if os.path.exists(csv_path) and os.path.getsize(csv_path) > 0:
+            if self._read_csv_header(csv_path) != field_names:
+                move(csv_path, csv_path[:-4] + '_old_' + pd.Timestamp.utcnow().strftime("%Y%m%d-%H%M%S") + ".csv")
+        write_header: bool = not os.path.exists(csv_path) or os.path.getsize(csv_path) == 0
+        csv_file: TextIO = open(csv_path, mode="a", newline="")
+        writer = csv.writer(csv_file)
+        if write_header:
+            writer.writerow(field_names)
+        self._csv_files[csv_path] = (csv_file, writer, field_names)
+        return writer
+
+    def close_csv_files(self):
+        """
+        Flushes the buffered rows of the trades CSV exports and closes their files.
+        """
+        for csv_file, _, _ in self._csv_files.values():
+            csv_file.close()
+        self._csv_files.clear()
 
     def append_to_csv(self, trade: TradeFill):
         csv_filename = "trades_" + trade.config_file_path[:-4] + ".csv"
         csv_path = os.path.join(data_path(), csv_filename)
 
-        field_names = ("id",)  # id field should be first
-        field_names += tuple(attr for attr in dir(trade) if (not self._is_protected_method(attr) and
-                                                             self._is_primitive_type(getattr(trade, attr)) and
-                                                             (attr not in field_names)))
-        field_data = tuple(getattr(trade, attr) for attr in field_names)
-
+        field_names: Tuple[str, ...] = self._csv_field_names(trade)
         # adding extra field "age"
         # // indicates order is a paper order so 'n/a'. For real orders, calculate age.
         age = pd.Timestamp(int(trade.timestamp / 1e3 - int(trade.order_id[-16:]) / 1e6), unit='s').strftime(
             '%H:%M:%S') if "//" not in trade.order_id else "n/a"
-        field_names += ("age",)
-        field_data += (age,)
-
-        if (os.path.exists(csv_path) and (not self._csv_matches_header(csv_path, field_names))):
-            move(csv_path, csv_path[:-4] + '_old_' + pd.Timestamp.utcnow().strftime("%Y%m%d-%H%M%S") + ".csv")
+        field_data = tuple(getattr(trade, attr) for attr in field_names[:-1]) + (age,)
 
-        if not os.path.exists(csv_path):
-            df_header = pd.DataFrame([field_names])
-            df_header.to_csv(csv_path, mode='a', header=False, index=False)
-        df = pd.DataFrame([field_data])
-        df.to_csv(csv_path, mode='a', header=False, index=False)
+        self._csv_writer(csv_path, field_names).writerow(field_data)
 
     def _update_order_status(self,
                              event_tag: int,
@@ -356,23 +537,23 @@ class MarketsRecorder:
             self._ev_loop.call_soon_threadsafe(self._update_order_status, event_tag, market, evt)
             return
 
-        session: Session = self.session
         timestamp: int = self.db_timestamp
         event_type: MarketEvent = self.market_event_tag_map[event_tag]
         order_id: str = evt.order_id
-        order_record: Optional[Order] = session.query(Order).filter(Order.id == order_id).one_or_none()
 
-        if order_record is not None:
-            order_record.last_status = event_type.name
-            order_record.last_update_timestamp = timestamp
-            order_status: OrderStatus = OrderStatus(order_id=order_id,
-                                                    timestamp=timestamp,
-                                                    status=event_type.name)
-            session.add(order_status)
-            self.save_market_states(self._config_file_path, market, no_commit=True)
-            session.commit()
-        else:
-            session.rollback()
+        def record_order_status(session: Session):
+            order_record: Optional[Order] = session.query(Order).filter(Order.id == order_id).one_or_none()
+
+            if order_record is not None:
+                order_record.last_status = event_type.name
+                order_record.last_update_timestamp = timestamp
+                order_status: OrderStatus = OrderStatus(order_id=order_id,
+                                                        timestamp=timestamp,
+                                                        status=event_type.name)
+                session.add(order_status)
+
+        self._write(record_order_status)
+        self._schedule_market_states_save(self._config_file_path, market)
 
     def _did_cancel_order(self,
                           event_tag: int,
@@ -406,25 +587,28 @@ class MarketsRecorder:
             self._ev_loop.call_soon_threadsafe(self._did_initiate_range_position, event_tag, connector, evt)
             return
 
-        session: Session = self.session
         timestamp: int = self.db_timestamp
-        r_pos: RangePosition = RangePosition(hb_id=evt.hb_id,
-                                             config_file_path=self._config_file_path,
-                                             strategy=self._strategy_name,
-                                             tx_hash=evt.tx_hash,
-                                             connector=connector.display_name,
-                                             trading_pair=evt.trading_pair,
-                                             fee_tier=str(evt.fee_tier),
-                                             lower_price=float(evt.lower_price),
-                                             upper_price=float(evt.upper_price),
-                                             base_amount=float(evt.base_amount),
-                                             quote_amount=float(evt.quote_amount),
-                                             status=evt.status,
-                                             creation_timestamp=timestamp,
-                                             last_update_timestamp=timestamp)
-        session.add(r_pos)
-        self.save_market_states(self._config_file_path, connector, no_commit=True)
-        session.commit()
+        connector_name: str = connector.display_name
+
+        def record_range_position(session: Session):
+            r_pos: RangePosition = RangePosition(hb_id=evt.hb_id,
+                                                 config_file_path=self._config_file_path,
+                                                 strategy=self._strategy_name,
+                                                 tx_hash=evt.tx_hash,
+                                                 connector=connector_name,
+                                                 trading_pair=evt.trading_pair,
+                                                 fee_tier=str(evt.fee_tier),
+                                                 lower_price=float(evt.lower_price),
+                                                 upper_price=float(evt.upper_price),
+                                                 base_amount=float(evt.base_amount),
+                                                 quote_amount=float(evt.quote_amount),
+                                                 status=evt.status,
+                                                 creation_timestamp=timestamp,
+                                                 last_update_timestamp=timestamp)
+            session.add(r_pos)
+
+        self._write(record_range_position)
+        self._schedule_market_states_save(self._config_file_path, connector)
 
     def _did_update_range_position(self,
                                    event_tag: int,
@@ -434,20 +618,21 @@ class MarketsRecorder:
             self._ev_loop.call_soon_threadsafe(self._did_update_range_position, event_tag, connector, evt)
             return
 
-        session: Session = self.session
         timestamp: int = self.db_timestamp
 
-        rp_record: Optional[RangePosition] = session.query(RangePosition).filter(
-            RangePosition.hb_id == evt.hb_id).one_or_none()
-        if rp_record is not None:
-            rp_update: RangePositionUpdate = RangePositionUpdate(hb_id=evt.hb_id,
-                                                                 timestamp=timestamp,
-                                                                 tx_hash=evt.tx_hash,
-                                                                 token_id=evt.token_id,
-                                                                 base_amount=float(evt.base_amount),
-                                                                 quote_amount=float(evt.quote_amount),
-                                                                 status=evt.status,
-                                                                 )
-            session.add(rp_update)
-            self.save_market_states(self._config_file_path, connector, no_commit=True)
-            session.commit()
+        def record_range_position_update(session: Session):
+            rp_record: Optional[RangePosition] = session.query(RangePosition).filter(
+                RangePosition.hb_id == evt.hb_id).one_or_none()
+            if rp_record is not None:
+                rp_update: RangePositionUpdate = RangePositionUpdate(hb_id=evt.hb_id,
+                                                                     timestamp=timestamp,
+                                                                     tx_hash=evt.tx_hash,
+                                                                     token_id=evt.token_id,
+                                                                     base_amount=float(evt.base_amount),
+                                                                     quote_amount=float(evt.quote_amount),
+                                                                     status=evt.status,
+                                                                     )
+                session.add(rp_update)
+
+        self._write(record_range_position_update)
+        self._schedule_market_states_save(self._config_file_path, connector)
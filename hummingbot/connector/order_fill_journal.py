@@ -0,0 +1,116 @@
+import math
+from collections import deque
+from decimal import Decimal
+from typing import (
+    Deque,
+    Dict,
+    NamedTuple,
+)
+
+from hummingbot.core.event.events import (
+    OrderFilledEvent,
+    TradeType,
+)
+
+s_decimal_0 = Decimal(0)
+
+
+class OrderFillBalanceDelta(NamedTuple):
+    """
+    Balance changes of a filled order. This does not account for fee.
+    """
+    timestamp: float
+    base_asset: str
+    quote_asset: str
+    base_delta: Decimal
+    quote_delta: Decimal
+
+    @classmethod
+    def from_order_filled_event(cls, event: OrderFilledEvent) -> "OrderFillBalanceDelta":
+        base, quote = event.trading_pair.split("-")[0], event.trading_pair.split("-")[1]
+        if event.trade_type is TradeType.BUY:
+            return OrderFillBalanceDelta(event.timestamp, base, quote, event.amount, -event.price * event.amount)
+        return OrderFillBalanceDelta(event.timestamp, base, quote, -event.amount, event.price * event.amount)
+
+
+class OrderFillJournal:
+    """
+    Balance changes of the filled orders, ordered by timestamp.
+
+    The balance changes of all the fills, and of the fills still in the journal, are kept as running sums. Fills at or
+    before the pruning timestamp (usually the one of the last balance snapshot) are dropped from the journal, their
+    balance changes are only kept in the total.
+    """
+
+    def __init__(self):
+        self._fills: Deque[OrderFillBalanceDelta] = deque()
+        self._total_balances: Dict[str, Decimal] = {}
+        self._journal_balances: Dict[str, Decimal] = {}
+        self._pruned_timestamp: float = 0.0
+        self._first_pruned_timestamp: float = float("inf")
+
+    def __len__(self) -> int:
+        return len(self._fills)
+
+    @property
+    def pruned_timestamp(self) -> float:
+        return self._pruned_timestamp
+
+    @staticmethod
+    def _add_to_balances(balances: Dict[str, Decimal], fill: OrderFillBalanceDelta):
+        balances[fill.base_asset] = balances.get(fill.base_asset, s_decimal_0) + fill.base_delta
+        balances[fill.quote_asset] = balances.get(fill.quote_asset, s_decimal_0) + fill.quote_delta
+
+    def add_fill(self, event: OrderFilledEvent):
+        if math.isnan(event.timestamp):
+            # Fills without a timestamp are not since any timestamp.
+            return
+        fill: OrderFillBalanceDelta = OrderFillBalanceDelta.from_order_filled_event(event)
+        self._add_to_balances(self._total_balances, fill)
+        if fill.timestamp <= self._pruned_timestamp:
+            self._first_pruned_timestamp = min(self._first_pruned_timestamp, fill.timestamp)
+            return
+        self._add_to_balances(self._journal_balances, fill)
+        if len(self._fills) == 0 or self._fills[-1].timestamp <= fill.timestamp:
+            self._fills.append(fill)
+        else:
+            # Fills are reported in timestamp order nearly all the time, an older one goes near the end.
+            index: int = len(self._fills) - 1
+            while index > 0 and self._fills[index - 1].timestamp > fill.timestamp:
+                index -= 1
+            self._fills.insert(index, fill)
+
+    def prune(self, timestamp: float):
+        """
+        Drops the fills at or before the timestamp from the journal.
+        """
+        if not timestamp > self._pruned_timestamp:
+            return
+        self._pruned_timestamp = timestamp
+        if len(self._fills) == 0 or self._fills[0].timestamp > timestamp:
+            return
+        self._first_pruned_timestamp = min(self._first_pruned_timestamp, self._fills[0].timestamp)
+        while len(self._fills) > 0 and self._fills[0].timestamp <= timestamp:
+            self._fills.popleft()
+        # Only the fills since the pruning timestamp are left, there are few of them.
+        self._journal_balances = {}
+        for fill in self._fills:
+            self._add_to_balances(self._journal_balances, fill)
+
+    def balances_since(self, timestamp: float) -> Dict[str, Decimal]:
+        """
+        Calculates total asset balance changes from the fills after the timestamp.
+        :raises ValueError: if the fills after the timestamp were partly pruned
+        """
+        if timestamp < self._first_pruned_timestamp and (len(self._fills) == 0 or timestamp < self._fills[0].timestamp):
+            return self._total_balances.copy()
+        if timestamp < self._pruned_timestamp:
+            raise ValueError(f"Fills before {self._pruned_timestamp} were pruned from the journal.")
+        if timestamp == self._pruned_timestamp:
+            return self._journal_balances.copy()
+        balances: Dict[str, Decimal] = {}
+        for fill in reversed(self._fills):
+            if fill.timestamp <= timestamp:
+                break
+            self._add_to_balances(balances, fill)
+        return balances
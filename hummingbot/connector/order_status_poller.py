@@ -0,0 +1,98 @@
+import asyncio
+import logging
+from typing import (
+    Any,
+    Awaitable,
+    Callable,
+    Dict,
+    List,
+    Optional,
+    Tuple,
+)
+
+from hummingbot.connector.in_flight_order_base import InFlightOrderBase
+from hummingbot.core.utils.async_utils import safe_gather
+from hummingbot.logger import HummingbotLogger
+
+
+class OrderStatusPoller:
+    """
+    Polls the status of in-flight orders with as few requests as possible.
+
+    When there are enough orders to make it worth it, all the open orders are fetched at once from the exchange open
+    orders endpoint. An open order is only reported when it changed since the previous poll, and only the in-flight
+    orders which are no longer open (filled, cancelled or failed since the previous poll, or not yet known by the
+    exchange) are fetched one by one. If the open orders can't be fetched, every order is fetched one by one.
+
+    The open order updates and the single order updates are expected to have the same format, so the connector can
+    process both the same way.
+    """
+
+    _osp_logger: Optional[HummingbotLogger] = None
+
+    @classmethod
+    def logger(cls) -> HummingbotLogger:
+        if cls._osp_logger is None:
+            cls._osp_logger = logging.getLogger(__name__)
+        return cls._osp_logger
+
+    def __init__(self,
+                 fetch_open_orders: Callable[[], Awaitable[List[Any]]],
+                 fetch_order: Callable[[InFlightOrderBase], Awaitable[Any]],
+                 client_order_id: Callable[[Any], str],
+                 order_fingerprint: Callable[[Any], Any],
+                 min_orders_for_open_orders: int = 2):
+        """
+        :param fetch_open_orders: fetches the updates of all the open orders
+        :param fetch_order: fetches the update of a single in-flight order
+        :param client_order_id: the client order id of an order update
+        :param order_fingerprint: a value of an order update which changes when the order changes, e.g. its status and
+        executed amount
+        :param min_orders_for_open_orders: the number of in-flight orders from which fetching all the open orders costs
+        less than fetching each order
+        """
+        self._fetch_open_orders: Callable[[], Awaitable[List[Any]]] = fetch_open_orders
+        self._fetch_order: Callable[[InFlightOrderBase], Awaitable[Any]] = fetch_order
+        self._client_order_id: Callable[[Any], str] = client_order_id
+        self._order_fingerprint: Callable[[Any], Any] = order_fingerprint
+        self._min_orders_for_open_orders: int = min_orders_for_open_orders
+        self._last_fingerprints: Dict[str, Any] = {}
+
+    async def poll(self, tracked_orders: List[InFlightOrderBase]) -> List[Tuple[InFlightOrderBase, Any]]:
+        """
+        :param tracked_orders: the in-flight orders to poll
+        :return: the tracked orders which may have changed, each with its update, or with the exception raised while
+        fetching it
+        """
+        tracked_ids = set(o.client_order_id for o in tracked_orders)
+        self._last_fingerprints = {k: v for k, v in self._last_fingerprints.items() if k in tracked_ids}
+
+        open_orders: Optional[Dict[str, Any]] = None
+        if len(tracked_orders) >= self._min_orders_for_open_orders:
+            try:
+                open_orders = {self._client_order_id(o): o for o in await self._fetch_open_orders()}
+            except asyncio.CancelledError:
+                raise
+            except Exception as e:
+                self.logger().network(f"Error fetching open orders: {e}. Fetching the {len(tracked_orders)} orders "
+                                      f"one by one.")
+
+        updates: List[Tuple[InFlightOrderBase, Any]] = []
+        orders_to_fetch: List[InFlightOrderBase] = []
+        for tracked_order in tracked_orders:
+            client_order_id: str = tracked_order.client_order_id
+            if open_orders is None or client_order_id not in open_orders:
+                self._last_fingerprints.pop(client_order_id, None)
+                orders_to_fetch.append(tracked_order)
+                continue
+            order_update: Any = open_orders[client_order_id]
+            fingerprint: Any = self._order_fingerprint(order_update)
+            if self._last_fingerprints.get(client_order_id) != fingerprint:
+                self._last_fingerprints[client_order_id] = fingerprint
+                updates.append((tracked_order, order_update))
+
+        if len(orders_to_fetch) > 0:
+            self.logger().debug(f"Polling for order status updates of {len(orders_to_fetch)} orders.")
+            results = await safe_gather(*[self._fetch_order(o) for o in orders_to_fetch], return_exceptions=True)
+            updates.extend(zip(orders_to_fetch, results))
+        return updates
@@ -3,19 +3,86 @@ import logging
 import time
 
 from abc import ABC, abstractmethod
+from collections import deque
 from typing import (
+    Deque,
+    Dict,
     List,
+    Optional,
     Tuple,
 )
 
 from hummingbot.core.api_throttler.data_types import (
+    DEFAULT_PRIORITY,
     RateLimit,
     TaskLog,
+    TaskLogs,
 )
 from hummingbot.logger.logger import HummingbotLogger
 
 arc_logger = None
 MAX_CAPACITY_REACHED_WARNING_INTERVAL = 30.0
+# Lower bound of the sleep of a request waiting for capacity, in case a task log expires right at the computed time.
+MIN_CAPACITY_WAIT = 0.001
+
+
+class RequestWaiter:
+    """
+    A request waiting for capacity on its rate limits.
+    """
+
+    def __init__(self, limit_ids: List[str], priority: int):
+        self.limit_ids: List[str] = limit_ids
+        self.priority: int = priority
+        self.wakeup: asyncio.Event = asyncio.Event()
+
+
+class RequestWaitQueues:
+    """
+    Queues of the requests waiting for capacity, one per rate limit. Waiters with a higher priority come first, waiters
+    with the same priority in FIFO order. Since every queue follows the same order, the first waiter overall is first in
+    all of its queues, and only waiters first in all their queues may take capacity.
+    """
+
+    def __init__(self):
+        # limit_id -> priority -> waiters, only non empty deques are kept
+        self._queues: Dict[str, Dict[int, Deque[RequestWaiter]]] = {}
+
+    def __len__(self) -> int:
+        return sum(len(waiters) for queue in self._queues.values() for waiters in queue.values())
+
+    def _first(self, limit_id: str) -> Optional[RequestWaiter]:
+        queue: Optional[Dict[int, Deque[RequestWaiter]]] = self._queues.get(limit_id)
+        if not queue:
+            return None
+        return queue[max(queue.keys())][0]
+
+    def add(self, limit_ids: List[str], priority: int = DEFAULT_PRIORITY) -> RequestWaiter:
+        waiter: RequestWaiter = RequestWaiter(limit_ids, priority)
+        for limit_id in limit_ids:
+            self._queues.setdefault(limit_id, {}).setdefault(priority, deque()).append(waiter)
+        return waiter
+
+    def is_first(self, waiter: RequestWaiter) -> bool:
+        return all(self._first(limit_id) is waiter for limit_id in waiter.limit_ids)
+
+    def remove(self, waiter: RequestWaiter):
+        """
+        Removes the waiter and wakes up the waiters that became first in one of its queues.
+        """
+        for limit_id in waiter.limit_ids:
+            queue: Dict[int, Deque[RequestWaiter]] = self._queues[limit_id]
+            waiters: Deque[RequestWaiter] = queue[waiter.priority]
+            if waiters[0] is waiter:
+                waiters.popleft()
+            else:
+                waiters.remove(waiter)
+            if len(waiters) == 0:
+                del queue[waiter.priority]
+            if len(queue) == 0:
+                del self._queues[limit_id]
+            else:
+                self._first(limit_id).wakeup.set()
 
 
 class AsyncRequestContextBase(ABC):
@@ -34,12 +101,14 @@ class AsyncRequestContextBase(ABC):
         return arc_logger
 
     def __init__(self,
-                 task_logs: List[TaskLog],
+                 task_logs: TaskLogs,
                  rate_limit: RateLimit,
                  related_limits: List[Tuple[RateLimit, int]],
                  lock: asyncio.Lock,
                  safety_margin_pct: float,
                  retry_interval: float = 0.1,
+                 wait_queues: Optional[RequestWaitQueues] = None,
+                 priority: int = DEFAULT_PRIORITY,
                  ):
         """
         Asynchronous context associated with each API request.
@@ -47,48 +116,61 @@ class AsyncRequestContextBase(ABC):
         :param rate_limit: The RateLimit associated with this API Request
         :param rate_limits: List of linked rate limits with its corresponding weight associated with this API Request
         :param lock: A shared asyncio.Lock used between all instances of APIRequestContextBase
-        :param retry_interval: Time between each limit check
+        :param retry_interval: Time between each limit check, when the time until capacity frees up is unknown
+        :param wait_queues: Shared queues of the API requests waiting for capacity
+        :param priority: Requests with a higher priority take capacity before the ones already waiting
         """
-        self._task_logs: List[TaskLog] = task_logs
+        self._task_logs: TaskLogs = task_logs
         self._rate_limit: RateLimit = rate_limit
         self._related_limits: List[Tuple[RateLimit, int]] = related_limits
         self._lock: asyncio.Lock = lock
         self._safety_margin_pct: float = safety_margin_pct
         self._retry_interval: float = retry_interval
+        self._wait_queues: RequestWaitQueues = wait_queues if wait_queues is not None else RequestWaitQueues()
+        self._priority: int = priority
 
     def flush(self):
         """
         Remove task logs that have passed rate limit periods
         :return:
         """
-        now: float = time.time()
-        for task in self._task_logs:
-            task_limit: RateLimit = task.rate_limit
-            elapsed: float = now - task.timestamp
-            if elapsed > task_limit.time_interval + (task_limit.time_interval * self._safety_margin_pct):
-                self._task_logs.remove(task)
+        self._task_logs.flush(time.time(), self._safety_margin_pct)
 
     @abstractmethod
     def within_capacity(self) -> bool:
         raise NotImplementedError
 
+    def time_until_capacity(self) -> float:
+        """
+        Seconds until the capacity needed by this request frees up. Defaults to the retry interval.
+        """
+        return self._retry_interval
+
     async def acquire(self):
-        while True:
-            async with self._lock:
-                self.flush()
-
-                if self.within_capacity():
-                    break
-            await asyncio.sleep(self._retry_interval)
-        async with self._lock:
-            now = time.time()
-            # Each related limit is represented as it own individual TaskLog
-            self._task_logs.append(TaskLog(timestamp=now,
-                                           rate_limit=self._rate_limit,
-                                           weight=self._rate_limit.weight))
-            for limit, weight in self._related_limits:
-                task = TaskLog(timestamp=now, rate_limit=limit, weight=weight)
-                self._task_logs.append(task)
+        waiter: RequestWaiter = self._wait_queues.add([limit.limit_id for limit, _ in self._related_limits],
+                                                      self._priority)
+        try:
+            while True:
+                wait_time: Optional[float] = None
+                async with self._lock:
+                    waiter.wakeup.clear()
+                    # Only the first waiter checks the capacity, the others sleep until it is their turn.
+                    if self._wait_queues.is_first(waiter):
+                        if self.within_capacity():
+                            now = time.time()
+                            # Each related limit (the rate limit of the task included) is represented as its own
+                            # individual TaskLog
+                            for limit, weight in self._related_limits:
+                                task = TaskLog(timestamp=now, rate_limit=limit, weight=weight)
+                                self._task_logs.append(task)
+                            return
+                        wait_time = max(self.time_until_capacity(), MIN_CAPACITY_WAIT)
+                try:
+                    await asyncio.wait_for(waiter.wakeup.wait(), timeout=wait_time)
+                except asyncio.TimeoutError:
+                    pass
+        finally:
+            self._wait_queues.remove(waiter)
 
     async def __aenter__(self):
         await self.acquire()
@@ -5,6 +5,7 @@ from hummingbot.core.api_throttler.async_request_context_base import (
     MAX_CAPACITY_REACHED_WARNING_INTERVAL,
 )
 from hummingbot.core.api_throttler.async_throttler_base import AsyncThrottlerBase
+from hummingbot.core.api_throttler.data_types import DEFAULT_PRIORITY
 
 
 class AsyncRequestContext(AsyncRequestContextBase):
@@ -22,10 +23,7 @@ class AsyncRequestContext(AsyncRequestContextBase):
         if len(self._related_limits) > 0:
             now: float = time.time()
             for rate_limit, weight in self._related_limits:
-                capacity_used: int = sum([task.weight
-                                          for task in self._task_logs
-                                          if rate_limit.limit_id == task.rate_limit.limit_id and
-                                          now - task.timestamp - (task.rate_limit.time_interval * self._safety_margin_pct) <= task.rate_limit.time_interval])
+                capacity_used: int = self._task_logs.capacity_used(rate_limit.limit_id, now, self._safety_margin_pct)
 
                 if capacity_used + weight > rate_limit.limit:
                     if self._last_max_cap_warning_ts < now - MAX_CAPACITY_REACHED_WARNING_INTERVAL:
@@ -38,6 +36,16 @@ class AsyncRequestContext(AsyncRequestContextBase):
                     return False
         return True
 
+    def time_until_capacity(self) -> float:
+        """
+        Computes when the oldest task logs expire enough for every related limit to have capacity for this task.
+        :return: The time to wait in seconds, 0 if it is within capacity already
+        """
+        now: float = time.time()
+        return max([self._task_logs.time_until_capacity(rate_limit, weight, now, self._safety_margin_pct)
+                    for rate_limit, weight in self._related_limits],
+                   default=0.0)
+
 
 class AsyncThrottler(AsyncThrottlerBase):
     """
@@ -51,11 +59,13 @@ class AsyncThrottler(AsyncThrottlerBase):
         this (whether it belongs to Pool 0 or Pool 1) will have to wait for new capacity (some of the Task A flushed out).
     """
 
-    def execute_task(self, limit_id: str) -> AsyncRequestContext:
+    def execute_task(self, limit_id: str, priority: int = DEFAULT_PRIORITY) -> AsyncRequestContext:
         """
         Creates an async context where code within the context (a task) can be run only when all rate
         limits have capacity for the new task.
         :param limit_id: the limit_id associated with the APi request
+        :param priority: tasks with a higher priority (e.g. order placement and cancellation) get capacity before the
+        waiting ones with a lower priority (e.g. background polling)
         :return: An async context (used with async with syntax)
         """
         rate_limit, related_rate_limits = self.get_related_limits(limit_id=limit_id)
@@ -66,4 +76,6 @@ class AsyncThrottler(AsyncThrottlerBase):
             lock=self._lock,
             safety_margin_pct=self._safety_margin_pct,
             retry_interval=self._retry_interval,
+            wait_queues=self._wait_queues,
+            priority=priority,
         )
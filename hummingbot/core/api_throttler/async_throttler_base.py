@@ -13,10 +13,14 @@ from typing import (
 )
 
 from hummingbot.client.config.global_config_map import global_config_map
-from hummingbot.core.api_throttler.async_request_context_base import AsyncRequestContextBase
+from hummingbot.core.api_throttler.async_request_context_base import (
+    AsyncRequestContextBase,
+    RequestWaitQueues,
+)
 from hummingbot.core.api_throttler.data_types import (
+    DEFAULT_PRIORITY,
     RateLimit,
-    TaskLog
+    TaskLogs
 )
 from hummingbot.logger.logger import HummingbotLogger
 
@@ -42,7 +46,7 @@ class AsyncThrottlerBase(ABC):
                  ):
         """
         :param rate_limits: List of RateLimit(s).
-        :param retry_interval: Time between every capacity check.
+        :param retry_interval: Time between every capacity check, when the time until capacity frees up is unknown.
         :param safety_margin: Percentage of limit to be added as a safety margin when calculating capacity to ensure calls are within the limit.
         """
 
@@ -62,13 +66,16 @@ class AsyncThrottlerBase(ABC):
             for limit in self._rate_limits
         }
 
-        # List of TaskLog used to determine the API requests within a set time window.
-        self._task_logs: List[TaskLog] = []
+        # TaskLogs used to determine the API requests within a set time window.
+        self._task_logs: TaskLogs = TaskLogs()
 
         # Throttler Parameters
         self._retry_interval: float = retry_interval
         self._safety_margin_pct: float = safety_margin_pct
 
+        # Requests waiting for capacity, woken up in priority and FIFO order
+        self._wait_queues: RequestWaitQueues = RequestWaitQueues()
+
         # Shared asyncio.Lock instance to prevent multiple async ContextManager from accessing the _task_logs variable
         self._lock = asyncio.Lock()
 
@@ -84,5 +91,5 @@ class AsyncThrottlerBase(ABC):
         return rate_limit, related_limits
 
     @abstractmethod
-    def execute_task(self, limit_ids: List[str]) -> AsyncRequestContextBase:
+    def execute_task(self, limit_id: str, priority: int = DEFAULT_PRIORITY) -> AsyncRequestContextBase:
         raise NotImplementedError
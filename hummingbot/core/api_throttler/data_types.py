@@ -1,11 +1,18 @@
+from collections import defaultdict, deque
 from dataclasses import dataclass
 from typing import (
+    Deque,
+    Dict,
+    Iterator,
     List,
     Optional,
 )
 
 DEFAULT_PATH = ""
 DEFAULT_WEIGHT = 1
+# Requests waiting for capacity are served by priority first, then in FIFO order.
+DEFAULT_PRIORITY = 0
+HIGH_PRIORITY = 100
 
 Limit = int             # Integer representing the no. of requests be time interval
 RequestPath = str       # String representing the request path url
@@ -54,3 +61,65 @@ class TaskLog:
     timestamp: float
     rate_limit: RateLimit
     weight: int
+
+
+class TaskLogs:
+    """
+    Task logs of a throttler, kept in one time ordered deque per rate limit along with the running total of their
+    weights, so the capacity used by a rate limit is known without scanning the logs.
+    """
+
+    def __init__(self):
+        self._logs: Dict[str, Deque[TaskLog]] = defaultdict(deque)
+        self._capacity_used: Dict[str, int] = defaultdict(int)
+
+    def __len__(self) -> int:
+        return sum(len(logs) for logs in self._logs.values())
+
+    def __iter__(self) -> Iterator[TaskLog]:
+        for logs in self._logs.values():
+            yield from logs
+
+    def append(self, task: TaskLog):
+        self._logs[task.rate_limit.limit_id].append(task)
+        self._capacity_used[task.rate_limit.limit_id] += task.weight
+
+    def flush_limit(self, limit_id: str, now: float, safety_margin_pct: float):
+        """
+        Removes the task logs of a rate limit that have passed its time interval (plus the safety margin).
+        Amortized O(1), every log is removed once.
+        """
+        logs: Deque[TaskLog] = self._logs.get(limit_id)
+        if not logs:
+            return
+        while len(logs) > 0:
+            task: TaskLog = logs[0]
+            time_interval: float = task.rate_limit.time_interval
+            if now - task.timestamp <= time_interval + time_interval * safety_margin_pct:
+                break
+            logs.popleft()
+            self._capacity_used[limit_id] -= task.weight
+
+    def flush(self, now: float, safety_margin_pct: float):
+        for limit_id in list(self._logs.keys()):
+            self.flush_limit(limit_id, now, safety_margin_pct)
+
+    def capacity_used(self, limit_id: str, now: float, safety_margin_pct: float) -> int:
+        self.flush_limit(limit_id, now, safety_margin_pct)
+        return self._capacity_used.get(limit_id, 0)
+
+    def time_until_capacity(self, rate_limit: RateLimit, weight: int, now: float, safety_margin_pct: float) -> float:
+        """
+        Seconds until enough task logs expire for a task of the given weight to fit within the rate limit.
+        """
+        excess: int = self.capacity_used(rate_limit.limit_id, now, safety_margin_pct) + weight - rate_limit.limit
+        if excess <= 0:
+            return 0.0
+        freed: int = 0
+        for task in self._logs[rate_limit.limit_id]:
+            freed += task.weight
+            if freed >= excess:
+                time_interval: float = task.rate_limit.time_interval
+                return task.timestamp + time_interval + time_interval * safety_margin_pct - now
+        # The weight alone exceeds the limit, it won't fit before a whole time interval passes.
+        return rate_limit.time_interval + rate_limit.time_interval * safety_margin_pct
@@ -0,0 +1,72 @@
+#include "OrderBookDepthCursor.h"
+
+OrderBookDepthCursor::OrderBookDepthCursor() {
+    this->book = NULL;
+    this->ascending = true;
+}
+
+OrderBookDepthCursor::OrderBookDepthCursor(const std::set<OrderBookEntry> &book, bool ascending) {
+    this->book = &book;
+    this->ascending = ascending;
+    this->askIterator = book.begin();
+    this->bidIterator = book.rbegin();
+}
+
+OrderBookDepthCursor::OrderBookDepthCursor(const OrderBookDepthCursor &other) {
+    this->book = other.book;
+    this->ascending = other.ascending;
+    this->askIterator = other.askIterator;
+    this->bidIterator = other.bidIterator;
+}
+
+OrderBookDepthCursor &OrderBookDepthCursor::operator=(const OrderBookDepthCursor &other) {
+    this->book = other.book;
+    this->ascending = other.ascending;
+    this->askIterator = other.askIterator;
+    this->bidIterator = other.bidIterator;
+    return *this;
+}
+
+size_t OrderBookDepthCursor::size() const {
+    if (this->book == NULL) {
+        return 0;
+    }
+    return this->book->size();
+}
+
+bool OrderBookDepthCursor::isValid() const {
+    if (this->book == NULL) {
+        return false;
+    }
+    if (this->ascending) {
+        return this->askIterator != this->book->end();
+    }
+    return this->bidIterator != this->book->rend();
+}
+
+void OrderBookDepthCursor::next() {
+    if (this->ascending) {
+        ++this->askIterator;
+    } else {
+        ++this->bidIterator;
+    }
+}
+
+const OrderBookEntry &OrderBookDepthCursor::getEntry() const {
+    if (this->ascending) {
+        return *this->askIterator;
+    }
+    return *this->bidIterator;
+}
+
+double OrderBookDepthCursor::getPrice() const {
+    return this->getEntry().getPrice();
+}
+
+double OrderBookDepthCursor::getAmount() const {
+    return this->getEntry().getAmount();
+}
+
+int64_t OrderBookDepthCursor::getUpdateId() const {
+    return this->getEntry().getUpdateId();
+}
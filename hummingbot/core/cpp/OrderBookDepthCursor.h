@@ -0,0 +1,32 @@
+#ifndef _ORDER_BOOK_DEPTH_CURSOR_H
+#define _ORDER_BOOK_DEPTH_CURSOR_H
+
+#include <stddef.h>
+#include <stdint.h>
+#include <set>
+#include "OrderBookEntry.h"
+
+// Walks one side of an order book from the top of book outwards, without materializing any rows.
+// Ask books are walked in ascending price order, bid books in descending price order.
+class OrderBookDepthCursor {
+    const std::set<OrderBookEntry> *book;
+    bool ascending;
+    std::set<OrderBookEntry>::const_iterator askIterator;
+    std::set<OrderBookEntry>::const_reverse_iterator bidIterator;
+
+    public:
+        OrderBookDepthCursor();
+        OrderBookDepthCursor(const std::set<OrderBookEntry> &book, bool ascending);
+        OrderBookDepthCursor(const OrderBookDepthCursor &other);
+        OrderBookDepthCursor &operator=(const OrderBookDepthCursor &other);
+
+        size_t size() const;
+        bool isValid() const;
+        void next();
+        const OrderBookEntry &getEntry() const;
+        double getPrice() const;
+        double getAmount() const;
+        int64_t getUpdateId() const;
+};
+
+#endif
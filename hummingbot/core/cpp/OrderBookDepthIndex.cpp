@@ -0,0 +1,95 @@
+#include "OrderBookDepthIndex.h"
+#include <algorithm>
+#include <functional>
+
+OrderBookDepthIndex::OrderBookDepthIndex() {
+    this->ascending = true;
+}
+
+OrderBookDepthIndex::OrderBookDepthIndex(const OrderBookDepthIndex &other) {
+    this->ascending = other.ascending;
+    this->prices = other.prices;
+    this->cumulativeBase = other.cumulativeBase;
+    this->cumulativeQuote = other.cumulativeQuote;
+}
+
+OrderBookDepthIndex &OrderBookDepthIndex::operator=(const OrderBookDepthIndex &other) {
+    this->ascending = other.ascending;
+    this->prices = other.prices;
+    this->cumulativeBase = other.cumulativeBase;
+    this->cumulativeQuote = other.cumulativeQuote;
+    return *this;
+}
+
+void OrderBookDepthIndex::rebuild(const std::set<OrderBookEntry> &book, bool ascending) {
+    double base = 0;
+    double quote = 0;
+
+    this->ascending = ascending;
+    this->prices.clear();
+    this->cumulativeBase.clear();
+    this->cumulativeQuote.clear();
+    this->prices.reserve(book.size());
+    this->cumulativeBase.reserve(book.size());
+    this->cumulativeQuote.reserve(book.size());
+
+    if (ascending) {
+        for (std::set<OrderBookEntry>::const_iterator it = book.begin(); it != book.end(); ++it) {
+            base += it->getAmount();
+            quote += it->getAmount() * it->getPrice();
+            this->prices.push_back(it->getPrice());
+            this->cumulativeBase.push_back(base);
+            this->cumulativeQuote.push_back(quote);
+        }
+    } else {
+        for (std::set<OrderBookEntry>::const_reverse_iterator it = book.rbegin(); it != book.rend(); ++it) {
+            base += it->getAmount();
+            quote += it->getAmount() * it->getPrice();
+            this->prices.push_back(it->getPrice());
+            this->cumulativeBase.push_back(base);
+            this->cumulativeQuote.push_back(quote);
+        }
+    }
+}
+
+size_t OrderBookDepthIndex::size() const {
+    return this->prices.size();
+}
+
+size_t OrderBookDepthIndex::findBaseVolume(double volume) const {
+    return std::lower_bound(this->cumulativeBase.begin(), this->cumulativeBase.end(), volume) -
+        this->cumulativeBase.begin();
+}
+
+size_t OrderBookDepthIndex::findQuoteVolume(double quoteVolume) const {
+    return std::lower_bound(this->cumulativeQuote.begin(), this->cumulativeQuote.end(), quoteVolume) -
+        this->cumulativeQuote.begin();
+}
+
+size_t OrderBookDepthIndex::countLevelsWithinPrice(double price) const {
+    if (this->ascending) {
+        return std::upper_bound(this->prices.begin(), this->prices.end(), price) - this->prices.begin();
+    }
+    return std::upper_bound(this->prices.begin(), this->prices.end(), price, std::greater<double>()) -
+        this->prices.begin();
+}
+
+double OrderBookDepthIndex::getPrice(size_t level) const {
+    return this->prices[level];
+}
+
+double OrderBookDepthIndex::getCumulativeBase(size_t level) const {
+    return this->cumulativeBase[level];
+}
+
+double OrderBookDepthIndex::getCumulativeQuote(size_t level) const {
+    return this->cumulativeQuote[level];
+}
+
+double OrderBookDepthIndex::getBaseBefore(size_t level) const {
+    return level == 0 ? 0 : this->cumulativeBase[level - 1];
+}
+
+double OrderBookDepthIndex::getQuoteBefore(size_t level) const {
+    return level == 0 ? 0 : this->cumulativeQuote[level - 1];
+}
@@ -0,0 +1,40 @@
+#ifndef _ORDER_BOOK_DEPTH_INDEX_H
+#define _ORDER_BOOK_DEPTH_INDEX_H
+
+#include <stddef.h>
+#include <set>
+#include <vector>
+#include "OrderBookEntry.h"
+
+// Prefix sums of base and quote volume over one side of an order book, in top of book order. Levels are stored the
+// way a taker would consume them, i.e. ascending prices for an ask book and descending prices for a bid book.
+class OrderBookDepthIndex {
+    bool ascending;
+    std::vector<double> prices;
+    std::vector<double> cumulativeBase;
+    std::vector<double> cumulativeQuote;
+
+    public:
+        OrderBookDepthIndex();
+        OrderBookDepthIndex(const OrderBookDepthIndex &other);
+        OrderBookDepthIndex &operator=(const OrderBookDepthIndex &other);
+
+        void rebuild(const std::set<OrderBookEntry> &book, bool ascending);
+        size_t size() const;
+
+        // Index of the first level at which the cumulative base (or quote) volume reaches the given volume, or size()
+        // if the book is not deep enough.
+        size_t findBaseVolume(double volume) const;
+        size_t findQuoteVolume(double quoteVolume) const;
+        // Number of levels, from the top of book, whose price is at or better than the given price.
+        size_t countLevelsWithinPrice(double price) const;
+
+        double getPrice(size_t level) const;
+        double getCumulativeBase(size_t level) const;
+        double getCumulativeQuote(size_t level) const;
+        // Cumulative volumes of all levels above the given level, 0 for the top of book.
+        double getBaseBefore(size_t level) const;
+        double getQuoteBefore(size_t level) const;
+};
+
+#endif
@@ -0,0 +1,20 @@
+# distutils: language=c++
+
+from libc.stdint cimport int64_t
+from libcpp cimport bool
+from libcpp.set cimport set
+from hummingbot.core.data_type.OrderBookEntry cimport OrderBookEntry
+
+cdef extern from "../cpp/OrderBookDepthCursor.h":
+    cdef cppclass OrderBookDepthCursor:
+        OrderBookDepthCursor()
+        OrderBookDepthCursor(const set[OrderBookEntry] &book, bool ascending)
+        OrderBookDepthCursor(const OrderBookDepthCursor &other)
+        OrderBookDepthCursor &operator=(const OrderBookDepthCursor &other)
+        size_t size() const
+        bool isValid() const
+        void next()
+        const OrderBookEntry &getEntry() const
+        double getPrice() const
+        double getAmount() const
+        int64_t getUpdateId() const
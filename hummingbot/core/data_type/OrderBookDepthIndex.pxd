@@ -0,0 +1,21 @@
+# distutils: language=c++
+
+from libcpp cimport bool
+from libcpp.set cimport set
+from hummingbot.core.data_type.OrderBookEntry cimport OrderBookEntry
+
+cdef extern from "../cpp/OrderBookDepthIndex.h":
+    cdef cppclass OrderBookDepthIndex:
+        OrderBookDepthIndex()
+        OrderBookDepthIndex(const OrderBookDepthIndex &other)
+        OrderBookDepthIndex &operator=(const OrderBookDepthIndex &other)
+        void rebuild(const set[OrderBookEntry] &book, bool ascending)
+        size_t size() const
+        size_t findBaseVolume(double volume) const
+        size_t findQuoteVolume(double quoteVolume) const
+        size_t countLevelsWithinPrice(double price) const
+        double getPrice(size_t level) const
+        double getCumulativeBase(size_t level) const
+        double getCumulativeQuote(size_t level) const
+        double getBaseBefore(size_t level) const
+        double getQuoteBefore(size_t level) const
@@ -1,5 +1,5 @@
 # distutils: language=c++
-# distutils: sources=hummingbot/core/cpp/OrderBookEntry.cpp
+# distutils: sources=['hummingbot/core/cpp/OrderBookEntry.cpp', 'hummingbot/core/cpp/OrderBookDepthCursor.cpp', 'hummingbot/core/cpp/OrderBookDepthIndex.cpp']
 
 from typing import Iterator
 from libcpp.set cimport set
@@ -13,6 +13,7 @@ from libcpp.vector cimport vector
 from hummingbot.core.event.events import TradeType
 from hummingbot.core.data_type.order_book_row import OrderBookRow
 from hummingbot.core.data_type.OrderBookEntry cimport OrderBookEntry
+from hummingbot.core.data_type.OrderBookDepthCursor cimport OrderBookDepthCursor
 
 
 cdef class CompositeOrderBook(OrderBook):
@@ -29,6 +30,15 @@ cdef class CompositeOrderBook(OrderBook):
     def traded_order_book(self) -> OrderBook:
         return self._traded_order_book
 
+    @property
+    def depth_index_enabled(self) -> bool:
+        return False
+
+    @depth_index_enabled.setter
+    def depth_index_enabled(self, value: bool):
+        if value:
+            raise ValueError("Composite order book entries are computed on every query and cannot be indexed.")
+
     def clear_traded_order_book(self):
         self._traded_order_book._bid_book.clear()
         self._traded_order_book._ask_book.clear()
@@ -179,6 +189,19 @@ cdef class CompositeOrderBook(OrderBook):
 
         self._traded_order_book.c_apply_diffs(cpp_bids_changes, cpp_asks_changes, self._last_diff_uid)
 
+    cdef OrderBookDepthCursor c_depth_cursor(self, bint is_buy):
+        # The composite entries only exist as generator output, so they are materialized into a scratch book first,
+        # so the order book queries see the same consumed levels as bid_entries() and ask_entries().
+        if is_buy:
+            self._composite_ask_book.clear()
+            for row in self.ask_entries():
+                self._composite_ask_book.insert(OrderBookEntry(row.price, row.amount, row.update_id))
+            return OrderBookDepthCursor(self._composite_ask_book, True)
+        self._composite_bid_book.clear()
+        for row in self.bid_entries():
+            self._composite_bid_book.insert(OrderBookEntry(row.price, row.amount, row.update_id))
+        return OrderBookDepthCursor(self._composite_bid_book, False)
+
     cdef double c_get_price(self, bint is_buy) except? -1:
         cdef:
             set[OrderBookEntry] *book = ref(self._ask_book) if is_buy else ref(self._bid_book)
@@ -4,6 +4,8 @@ from libc.stdint cimport int64_t
 from libcpp.set cimport set
 from libcpp.vector cimport vector
 from hummingbot.core.data_type.OrderBookEntry cimport OrderBookEntry
+from hummingbot.core.data_type.OrderBookDepthCursor cimport OrderBookDepthCursor
+from hummingbot.core.data_type.OrderBookDepthIndex cimport OrderBookDepthIndex
 from hummingbot.core.pubsub cimport PubSub
 from .order_book_query_result cimport OrderBookQueryResult
 cimport numpy as np
@@ -14,26 +16,42 @@ cdef class OrderBook(PubSub):
     cdef set[OrderBookEntry] _ask_book
     cdef int64_t _snapshot_uid
     cdef int64_t _last_diff_uid
+    cdef int64_t _version
     cdef double _best_bid
     cdef double _best_ask
     cdef double _last_trade_price
     cdef double _last_applied_trade
     cdef double _last_trade_price_rest_updated
     cdef bint _dex
+    cdef bint _depth_index_enabled
+    cdef bint _bid_depth_index_dirty
+    cdef bint _ask_depth_index_dirty
+    cdef OrderBookDepthIndex _bid_depth_index
+    cdef OrderBookDepthIndex _ask_depth_index
 
     cdef c_apply_diffs(self, vector[OrderBookEntry] bids, vector[OrderBookEntry] asks, int64_t update_id)
     cdef c_apply_snapshot(self, vector[OrderBookEntry] bids, vector[OrderBookEntry] asks, int64_t update_id)
     cdef c_apply_trade(self, object trade_event)
     cdef c_apply_numpy_diffs(self,
                              np.ndarray[np.float64_t, ndim=2] bids_array,
-                             np.ndarray[np.float64_t, ndim=2] asks_array)
+                             np.ndarray[np.float64_t, ndim=2] asks_array,
+                             int64_t update_id=*)
     cdef c_apply_numpy_snapshot(self,
                                 np.ndarray[np.float64_t, ndim=2] bids_array,
-                                np.ndarray[np.float64_t, ndim=2] asks_array)
+                                np.ndarray[np.float64_t, ndim=2] asks_array,
+                                int64_t update_id=*)
+    cdef c_numpy_to_entries(self,
+                            np.ndarray[np.float64_t, ndim=2] array,
+                            vector[OrderBookEntry] &entries,
+                            int64_t *last_update_id)
+    cdef OrderBookDepthCursor c_depth_cursor(self, bint is_buy)
+    cdef np.ndarray c_side_to_numpy(self, bint is_buy, Py_ssize_t depth)
+    cdef OrderBookDepthIndex *c_depth_index(self, bint is_buy)
     cdef double c_get_price(self, bint is_buy) except? -1
     cdef OrderBookQueryResult c_get_price_for_volume(self, bint is_buy, double volume)
     cdef OrderBookQueryResult c_get_price_for_quote_volume(self, bint is_buy, double quote_volume)
     cdef OrderBookQueryResult c_get_volume_for_price(self, bint is_buy, double price)
     cdef OrderBookQueryResult c_get_quote_volume_for_price(self, bint is_buy, double price)
     cdef OrderBookQueryResult c_get_vwap_for_volume(self, bint is_buy, double volume)
+    cdef np.ndarray c_get_vwap_for_volumes(self, bint is_buy, np.ndarray[np.float64_t, ndim=1] volumes)
     cdef OrderBookQueryResult c_get_quote_volume_for_base_amount(self, bint is_buy, double base_amount)
@@ -1,5 +1,5 @@
 # distutils: language=c++
-# distutils: sources=hummingbot/core/cpp/OrderBookEntry.cpp
+# distutils: sources=['hummingbot/core/cpp/OrderBookEntry.cpp', 'hummingbot/core/cpp/OrderBookDepthCursor.cpp', 'hummingbot/core/cpp/OrderBookDepthIndex.cpp']
 from cython.operator cimport(
     postincrement as inc,
     dereference as deref,
@@ -47,11 +47,15 @@ cdef class OrderBook(PubSub):
         super().__init__()
         self._snapshot_uid = 0
         self._last_diff_uid = 0
+        self._version = 0
         self._best_bid = self._best_ask = float("NaN")
         self._last_trade_price = float("NaN")
         self._last_applied_trade = -1000.0
         self._last_trade_price_rest_updated = -1000
         self._dex = dex
+        self._depth_index_enabled = False
+        self._bid_depth_index_dirty = True
+        self._ask_depth_index_dirty = True
 
     cdef c_apply_diffs(self, vector[OrderBookEntry] bids, vector[OrderBookEntry] asks, int64_t update_id):
         cdef:
@@ -92,6 +96,9 @@ cdef class OrderBook(PubSub):
 
         # Remember the last diff update ID.
         self._last_diff_uid = update_id
+        self._version += 1
+        self._bid_depth_index_dirty = True
+        self._ask_depth_index_dirty = True
 
     cdef c_apply_snapshot(self, vector[OrderBookEntry] bids, vector[OrderBookEntry] asks, int64_t update_id):
         cdef:
@@ -132,10 +139,14 @@ cdef class OrderBook(PubSub):
 
         # Remember the last snapshot update ID.
         self._snapshot_uid = update_id
+        self._version += 1
+        self._bid_depth_index_dirty = True
+        self._ask_depth_index_dirty = True
 
     cdef c_apply_trade(self, object trade_event):
         self._last_trade_price = trade_event.price
         self._last_applied_trade = time.perf_counter()
+        self._version += 1
         self.c_trigger_event(self.ORDER_BOOK_TRADE_EVENT_TAG, trade_event)
 
     @property
@@ -145,6 +156,7 @@ cdef class OrderBook(PubSub):
     @last_trade_price.setter
     def last_trade_price(self, value: float):
         self._last_trade_price = value
+        self._version += 1
 
     @property
     def last_applied_trade(self) -> float:
@@ -166,14 +178,70 @@ cdef class OrderBook(PubSub):
     def last_diff_uid(self) -> int:
         return self._last_diff_uid
 
+    @property
+    def version(self) -> int:
+        """
+        Counter incremented whenever the book or its last trade price changes, to tell whether anything read from the
+        book needs to be read again.
+        """
+        return self._version
+
+    @property
+    def depth_index_enabled(self) -> bool:
+        """
+        When enabled, depth queries binary-search a cumulative volume index instead of walking the book. The index is
+        rebuilt lazily on the first query after the book changes, so it pays off when a book is queried several times
+        between updates.
+        """
+        return self._depth_index_enabled
+
+    @depth_index_enabled.setter
+    def depth_index_enabled(self, value: bool):
+        self._depth_index_enabled = value
+        self._bid_depth_index_dirty = True
+        self._ask_depth_index_dirty = True
+
     @property
     def snapshot(self) -> Tuple[pd.DataFrame, pd.DataFrame]:
-        bids_rows = list(self.bid_entries())
-        asks_rows = list(self.ask_entries())
-        bids_df = pd.DataFrame(data=bids_rows, columns=OrderBookRow._fields, dtype="float64")
-        asks_df = pd.DataFrame(data=asks_rows, columns=OrderBookRow._fields, dtype="float64")
+        return self.snapshot_top(None)
+
+    def snapshot_top(self, depth: Optional[int]) -> Tuple[pd.DataFrame, pd.DataFrame]:
+        """
+        Same as snapshot, but only with the top depth levels of each side.
+        """
+        bids_array, asks_array = self.to_numpy(depth)
+        bids_df = pd.DataFrame(data=bids_array, columns=OrderBookRow._fields)
+        asks_df = pd.DataFrame(data=asks_array, columns=OrderBookRow._fields)
         return bids_df, asks_df
 
+    def to_numpy(self, depth: Optional[int] = None) -> Tuple[np.ndarray, np.ndarray]:
+        """
+        Exports the book as two (n, 3) float64 arrays of [price, amount, update_id] rows, best bids and best asks first.
+
+        :param depth: only export the top depth levels of each side, the whole book if None
+        :return: bids array, asks array
+        """
+        cdef Py_ssize_t c_depth = -1 if depth is None else depth
+        return self.c_side_to_numpy(False, c_depth), self.c_side_to_numpy(True, c_depth)
+
+    cdef np.ndarray c_side_to_numpy(self, bint is_buy, Py_ssize_t depth):
+        cdef:
+            OrderBookDepthCursor cursor = self.c_depth_cursor(is_buy)
+            Py_ssize_t rows = cursor.size()
+            Py_ssize_t i = 0
+            np.ndarray[np.float64_t, ndim=2] result
+
+        if 0 <= depth < rows:
+            rows = depth
+        result = np.empty((rows, 3), dtype=np.float64)
+        while i < rows and cursor.isValid():
+            result[i, 0] = cursor.getPrice()
+            result[i, 1] = cursor.getAmount()
+            result[i, 2] = cursor.getUpdateId()
+            i += 1
+            cursor.next()
+        return result if i == rows else result[:i]
+
     def apply_diffs(self, bids: List[OrderBookRow], asks: List[OrderBookRow], update_id: int):
         cdef:
             vector[OrderBookEntry] cpp_bids
@@ -205,16 +273,18 @@ cdef class OrderBook(PubSub):
         """
         self.apply_numpy_diffs(bids_df.values, asks_df.values)
 
-    def apply_numpy_diffs(self, bids_array: np.ndarray, asks_array: np.ndarray):
+    def apply_numpy_diffs(self, bids_array: np.ndarray, asks_array: np.ndarray, update_id: Optional[int] = None):
         """
         The diffs data frame must have 3 columns, [price, amount, update_id].
         All columns are of double type.
+        If update_id is not given, the largest update_id among the rows is used.
         """
-        self.c_apply_numpy_diffs(bids_array, asks_array)
+        self.c_apply_numpy_diffs(bids_array, asks_array, -1 if update_id is None else update_id)
 
     cdef c_apply_numpy_diffs(self,
                              np.ndarray[np.float64_t, ndim=2] bids_array,
-                             np.ndarray[np.float64_t, ndim=2] asks_array):
+                             np.ndarray[np.float64_t, ndim=2] asks_array,
+                             int64_t update_id=-1):
         """
         The diffs data frame must have 3 columns, [price, amount, update_id].
         All columns are of double type.
@@ -224,24 +294,22 @@ cdef class OrderBook(PubSub):
             vector[OrderBookEntry] cpp_asks
             int64_t last_update_id = 0
 
-        for row in bids_array:
-            cpp_bids.push_back(OrderBookEntry(row[0], row[1], <int64_t>(row[2])))
-            last_update_id = max(last_update_id, <int64_t>row[2])
-        for row in asks_array:
-            cpp_asks.push_back(OrderBookEntry(row[0], row[1], <int64_t>(row[2])))
-            last_update_id = max(last_update_id, <int64_t>row[2])
-        self.c_apply_diffs(cpp_bids, cpp_asks, last_update_id)
+        self.c_numpy_to_entries(bids_array, cpp_bids, &last_update_id)
+        self.c_numpy_to_entries(asks_array, cpp_asks, &last_update_id)
+        self.c_apply_diffs(cpp_bids, cpp_asks, last_update_id if update_id < 0 else update_id)
 
-    def apply_numpy_snapshot(self, bids_array: np.ndarray, asks_array: np.ndarray):
+    def apply_numpy_snapshot(self, bids_array: np.ndarray, asks_array: np.ndarray, update_id: Optional[int] = None):
         """
         The diffs data frame must have 3 columns, [price, amount, update_id].
         All columns are of double type.
+        If update_id is not given, the largest update_id among the rows is used.
         """
-        self.c_apply_numpy_snapshot(bids_array, asks_array)
+        self.c_apply_numpy_snapshot(bids_array, asks_array, -1 if update_id is None else update_id)
 
     cdef c_apply_numpy_snapshot(self,
                                 np.ndarray[np.float64_t, ndim=2] bids_array,
-                                np.ndarray[np.float64_t, ndim=2] asks_array):
+                                np.ndarray[np.float64_t, ndim=2] asks_array,
+                                int64_t update_id=-1):
         """
         The diffs data frame must have 3 columns, [price, amount, update_id].
         All columns are of double type.
@@ -251,13 +319,24 @@ cdef class OrderBook(PubSub):
             vector[OrderBookEntry] cpp_asks
             int64_t last_update_id = 0
 
-        for row in bids_array:
-            cpp_bids.push_back(OrderBookEntry(row[0], row[1], <int64_t>(row[2])))
-            last_update_id = max(last_update_id, <int64_t>row[2])
-        for row in asks_array:
-            cpp_asks.push_back(OrderBookEntry(row[0], row[1], <int64_t>(row[2])))
-            last_update_id = max(last_update_id, <int64_t>row[2])
-        self.c_apply_snapshot(cpp_bids, cpp_asks, last_update_id)
+        self.c_numpy_to_entries(bids_array, cpp_bids, &last_update_id)
+        self.c_numpy_to_entries(asks_array, cpp_asks, &last_update_id)
+        self.c_apply_snapshot(cpp_bids, cpp_asks, last_update_id if update_id < 0 else update_id)
+
+    cdef c_numpy_to_entries(self,
+                            np.ndarray[np.float64_t, ndim=2] array,
+                            vector[OrderBookEntry] &entries,
+                            int64_t *last_update_id):
+        cdef:
+            Py_ssize_t i
+            int64_t row_update_id
+
+        entries.reserve(entries.size() + array.shape[0])
+        for i in range(array.shape[0]):
+            row_update_id = <int64_t>array[i, 2]
+            entries.push_back(OrderBookEntry(array[i, 0], array[i, 1], row_update_id))
+            if row_update_id > last_update_id[0]:
+                last_update_id[0] = row_update_id
 
     def bid_entries(self) -> Iterator[OrderBookRow]:
         cdef:
@@ -315,23 +394,53 @@ cdef class OrderBook(PubSub):
     def get_price(self, is_buy: bool) -> float:
         return self.c_get_price(is_buy)
 
+    cdef OrderBookDepthCursor c_depth_cursor(self, bint is_buy):
+        """
+        Returns a cursor walking the side of the book a buy (asks) or a sell (bids) would consume, from the top of
+        book outwards. No Python objects are created while walking the cursor.
+        """
+        if is_buy:
+            return OrderBookDepthCursor(self._ask_book, True)
+        return OrderBookDepthCursor(self._bid_book, False)
+
+    cdef OrderBookDepthIndex *c_depth_index(self, bint is_buy):
+        """
+        Returns the cumulative volume index for the side of the book a buy (asks) or a sell (bids) would consume,
+        rebuilding it first if the book changed since it was last built.
+        """
+        if is_buy:
+            if self._ask_depth_index_dirty:
+                self._ask_depth_index.rebuild(self._ask_book, True)
+                self._ask_depth_index_dirty = False
+            return ref(self._ask_depth_index)
+        if self._bid_depth_index_dirty:
+            self._bid_depth_index.rebuild(self._bid_book, False)
+            self._bid_depth_index_dirty = False
+        return ref(self._bid_depth_index)
+
     cdef OrderBookQueryResult c_get_price_for_volume(self, bint is_buy, double volume):
         cdef:
             double cumulative_volume = 0
             double result_price = NaN
-
-        if is_buy:
-            for order_book_row in self.ask_entries():
-                cumulative_volume += order_book_row.amount
-                if cumulative_volume >= volume:
-                    result_price = order_book_row.price
-                    break
-        else:
-            for order_book_row in self.bid_entries():
-                cumulative_volume += order_book_row.amount
-                if cumulative_volume >= volume:
-                    result_price = order_book_row.price
-                    break
+            OrderBookDepthCursor cursor
+            OrderBookDepthIndex *index
+            size_t level
+
+        if self._depth_index_enabled:
+            index = self.c_depth_index(is_buy)
+            level = index.findBaseVolume(volume)
+            if level < index.size():
+                return OrderBookQueryResult(NaN, volume, index.getPrice(level), volume)
+            return OrderBookQueryResult(NaN, volume, NaN, min(index.getBaseBefore(level), volume))
+
+        cursor = self.c_depth_cursor(is_buy)
+
+        while cursor.isValid():
+            cumulative_volume += cursor.getAmount()
+            if cumulative_volume >= volume:
+                result_price = cursor.getPrice()
+                break
+            cursor.next()
 
         return OrderBookQueryResult(NaN, volume, result_price, min(cumulative_volume, volume))
 
@@ -340,50 +449,107 @@ cdef class OrderBook(PubSub):
             double total_cost = 0
             double total_volume = 0
             double result_vwap = NaN
-        if is_buy:
-            for order_book_row in self.ask_entries():
-                total_cost += order_book_row.amount * order_book_row.price
-                total_volume += order_book_row.amount
-                if total_volume >= volume:
-                    total_cost -= order_book_row.amount * order_book_row.price
-                    total_volume -= order_book_row.amount
-                    incremental_amount = volume - total_volume
-                    total_cost += incremental_amount * order_book_row.price
-                    total_volume += incremental_amount
-                    result_vwap = total_cost / total_volume
-                    break
-        else:
-            for order_book_row in self.bid_entries():
-                total_cost += order_book_row.amount * order_book_row.price
-                total_volume += order_book_row.amount
-                if total_volume >= volume:
-                    total_cost -= order_book_row.amount * order_book_row.price
-                    total_volume -= order_book_row.amount
-                    incremental_amount = volume - total_volume
-                    total_cost += incremental_amount * order_book_row.price
-                    total_volume += incremental_amount
-                    result_vwap = total_cost / total_volume
-                    break
+            double price
+            double amount
+            OrderBookDepthCursor cursor
+            OrderBookDepthIndex *index
+            size_t level
+
+        if self._depth_index_enabled:
+            index = self.c_depth_index(is_buy)
+            level = index.findBaseVolume(volume)
+            if level < index.size():
+                result_vwap = (index.getQuoteBefore(level) +
+                               (volume - index.getBaseBefore(level)) * index.getPrice(level)) / volume
+                return OrderBookQueryResult(NaN, volume, result_vwap, volume)
+            return OrderBookQueryResult(NaN, volume, NaN, min(index.getBaseBefore(level), volume))
+
+        cursor = self.c_depth_cursor(is_buy)
+        while cursor.isValid():
+            price = cursor.getPrice()
+            amount = cursor.getAmount()
+            if total_volume + amount >= volume:
+                total_cost += (volume - total_volume) * price
+                total_volume = volume
+                result_vwap = total_cost / total_volume
+                break
+            total_cost += amount * price
+            total_volume += amount
+            cursor.next()
 
         return OrderBookQueryResult(NaN, volume, result_vwap, min(total_volume, volume))
 
+    cdef np.ndarray c_get_vwap_for_volumes(self, bint is_buy, np.ndarray[np.float64_t, ndim=1] volumes):
+        cdef:
+            Py_ssize_t volumes_count = volumes.shape[0]
+            np.ndarray[np.intp_t, ndim=1] volume_order = np.argsort(volumes, kind="mergesort")
+            np.ndarray[np.float64_t, ndim=1] result = np.full(volumes_count, NaN, dtype=np.float64)
+            Py_ssize_t i = 0
+            Py_ssize_t volume_index
+            double target_volume
+            double total_cost = 0
+            double total_volume = 0
+            double price
+            double amount
+            OrderBookDepthCursor cursor
+            OrderBookDepthIndex *index
+            size_t level
+
+        if self._depth_index_enabled:
+            index = self.c_depth_index(is_buy)
+            for i in range(volumes_count):
+                target_volume = volumes[i]
+                if target_volume <= 0:
+                    continue
+                level = index.findBaseVolume(target_volume)
+                if level < index.size():
+                    result[i] = (index.getQuoteBefore(level) +
+                                 (target_volume - index.getBaseBefore(level)) * index.getPrice(level)) / target_volume
+            return result
+
+        cursor = self.c_depth_cursor(is_buy)
+        # Volumes are answered in ascending order, so the book only has to be walked once for all of them.
+        while i < volumes_count and cursor.isValid():
+            volume_index = volume_order[i]
+            target_volume = volumes[volume_index]
+            if target_volume <= 0:
+                i += 1
+                continue
+            price = cursor.getPrice()
+            amount = cursor.getAmount()
+            if total_volume + amount >= target_volume:
+                result[volume_index] = (total_cost + (target_volume - total_volume) * price) / target_volume
+                i += 1
+                continue
+            total_cost += amount * price
+            total_volume += amount
+            cursor.next()
+
+        return result
+
     cdef OrderBookQueryResult c_get_price_for_quote_volume(self, bint is_buy, double quote_volume):
         cdef:
             double cumulative_volume = 0
             double result_price = NaN
-
-        if is_buy:
-            for order_book_row in self.ask_entries():
-                cumulative_volume += order_book_row.amount * order_book_row.price
-                if cumulative_volume >= quote_volume:
-                    result_price = order_book_row.price
-                    break
-        else:
-            for order_book_row in self.bid_entries():
-                cumulative_volume += order_book_row.amount * order_book_row.price
-                if cumulative_volume >= quote_volume:
-                    result_price = order_book_row.price
-                    break
+            OrderBookDepthCursor cursor
+            OrderBookDepthIndex *index
+            size_t level
+
+        if self._depth_index_enabled:
+            index = self.c_depth_index(is_buy)
+            level = index.findQuoteVolume(quote_volume)
+            if level < index.size():
+                return OrderBookQueryResult(NaN, quote_volume, index.getPrice(level), quote_volume)
+            return OrderBookQueryResult(NaN, quote_volume, NaN, min(index.getQuoteBefore(level), quote_volume))
+
+        cursor = self.c_depth_cursor(is_buy)
+
+        while cursor.isValid():
+            cumulative_volume += cursor.getAmount() * cursor.getPrice()
+            if cumulative_volume >= quote_volume:
+                result_price = cursor.getPrice()
+                break
+            cursor.next()
 
         return OrderBookQueryResult(NaN, quote_volume, result_price, min(cumulative_volume, quote_volume))
 
@@ -392,25 +558,29 @@ cdef class OrderBook(PubSub):
             double cumulative_volume = 0
             double cumulative_base_amount = 0
             double row_amount = 0
-
-        if is_buy:
-            for order_book_row in self.ask_entries():
-                row_amount = order_book_row.amount
-                if row_amount + cumulative_base_amount >= base_amount:
-                    row_amount = base_amount - cumulative_base_amount
-                cumulative_base_amount += row_amount
-                cumulative_volume += row_amount * order_book_row.price
-                if cumulative_base_amount >= base_amount:
-                    break
-        else:
-            for order_book_row in self.bid_entries():
-                row_amount = order_book_row.amount
-                if row_amount + cumulative_base_amount >= base_amount:
-                    row_amount = base_amount - cumulative_base_amount
-                cumulative_base_amount += row_amount
-                cumulative_volume += row_amount * order_book_row.price
-                if cumulative_base_amount >= base_amount:
-                    break
+            OrderBookDepthCursor cursor
+            OrderBookDepthIndex *index
+            size_t level
+
+        if self._depth_index_enabled:
+            index = self.c_depth_index(is_buy)
+            level = index.findBaseVolume(base_amount)
+            cumulative_volume = index.getQuoteBefore(level)
+            if level < index.size():
+                cumulative_volume += (base_amount - index.getBaseBefore(level)) * index.getPrice(level)
+            return OrderBookQueryResult(NaN, base_amount, NaN, cumulative_volume)
+
+        cursor = self.c_depth_cursor(is_buy)
+
+        while cursor.isValid():
+            row_amount = cursor.getAmount()
+            if row_amount + cumulative_base_amount >= base_amount:
+                row_amount = base_amount - cumulative_base_amount
+            cumulative_base_amount += row_amount
+            cumulative_volume += row_amount * cursor.getPrice()
+            if cumulative_base_amount >= base_amount:
+                break
+            cursor.next()
 
         return OrderBookQueryResult(NaN, base_amount, NaN, cumulative_volume)
 
@@ -418,19 +588,26 @@ cdef class OrderBook(PubSub):
         cdef:
             double cumulative_volume = 0
             double result_price = NaN
-
-        if is_buy:
-            for order_book_row in self.ask_entries():
-                if order_book_row.price > price:
-                    break
-                cumulative_volume += order_book_row.amount
-                result_price = order_book_row.price
-        else:
-            for order_book_row in self.bid_entries():
-                if order_book_row.price < price:
-                    break
-                cumulative_volume += order_book_row.amount
-                result_price = order_book_row.price
+            OrderBookDepthCursor cursor
+            OrderBookDepthIndex *index
+            size_t level_count
+
+        if self._depth_index_enabled:
+            index = self.c_depth_index(is_buy)
+            level_count = index.countLevelsWithinPrice(price)
+            if level_count > 0:
+                cumulative_volume = index.getCumulativeBase(level_count - 1)
+                result_price = index.getPrice(level_count - 1)
+            return OrderBookQueryResult(price, NaN, result_price, cumulative_volume)
+
+        cursor = self.c_depth_cursor(is_buy)
+
+        while cursor.isValid():
+            if (is_buy and cursor.getPrice() > price) or (not is_buy and cursor.getPrice() < price):
+                break
+            cumulative_volume += cursor.getAmount()
+            result_price = cursor.getPrice()
+            cursor.next()
 
         return OrderBookQueryResult(price, NaN, result_price, cumulative_volume)
 
@@ -438,19 +615,26 @@ cdef class OrderBook(PubSub):
         cdef:
             double cumulative_volume = 0
             double result_price = NaN
-
-        if is_buy:
-            for order_book_row in self.ask_entries():
-                if order_book_row.price > price:
-                    break
-                cumulative_volume += order_book_row.amount * order_book_row.price
-                result_price = order_book_row.price
-        else:
-            for order_book_row in self.bid_entries():
-                if order_book_row.price < price:
-                    break
-                cumulative_volume += order_book_row.amount * order_book_row.price
-                result_price = order_book_row.price
+            OrderBookDepthCursor cursor
+            OrderBookDepthIndex *index
+            size_t level_count
+
+        if self._depth_index_enabled:
+            index = self.c_depth_index(is_buy)
+            level_count = index.countLevelsWithinPrice(price)
+            if level_count > 0:
+                cumulative_volume = index.getCumulativeQuote(level_count - 1)
+                result_price = index.getPrice(level_count - 1)
+            return OrderBookQueryResult(price, NaN, result_price, cumulative_volume)
+
+        cursor = self.c_depth_cursor(is_buy)
+
+        while cursor.isValid():
+            if (is_buy and cursor.getPrice() > price) or (not is_buy and cursor.getPrice() < price):
+                break
+            cumulative_volume += cursor.getAmount() * cursor.getPrice()
+            result_price = cursor.getPrice()
+            cursor.next()
 
         return OrderBookQueryResult(price, NaN, result_price, cumulative_volume)
 
@@ -460,6 +644,16 @@ cdef class OrderBook(PubSub):
     def get_vwap_for_volume(self, is_buy: bool, volume: float) -> OrderBookQueryResult:
         return self.c_get_vwap_for_volume(is_buy, volume)
 
+    def get_vwap_for_volumes(self, is_buy: bool, volumes: np.ndarray) -> np.ndarray:
+        """
+        Answers many VWAP queries in a single walk of the book.
+
+        :param is_buy: True to walk the asks, False to walk the bids
+        :param volumes: 1-D array of base asset volumes, in any order
+        :return: array of VWAPs aligned with volumes, NaN where the book is not deep enough
+        """
+        return self.c_get_vwap_for_volumes(is_buy, np.ascontiguousarray(volumes, dtype=np.float64))
+
     def get_price_for_quote_volume(self, is_buy: bool, quote_volume: float) -> OrderBookQueryResult:
         return self.c_get_price_for_quote_volume(is_buy, quote_volume)
 
@@ -495,6 +689,6 @@ cdef class OrderBook(PubSub):
     def restore_from_snapshot_and_diffs(self, snapshot: OrderBookMessage, diffs: List[OrderBookMessage]):
         replay_position = bisect.bisect_right(diffs, snapshot)
         replay_diffs = diffs[replay_position:]
-        self.apply_snapshot(snapshot.bids, snapshot.asks, snapshot.update_id)
+        self.apply_numpy_snapshot(snapshot.bids_array, snapshot.asks_array, snapshot.update_id)
         for diff in replay_diffs:
-            self.apply_diffs(diff.bids, diff.asks, diff.update_id)
+            self.apply_numpy_diffs(diff.bids_array, diff.asks_array, diff.update_id)
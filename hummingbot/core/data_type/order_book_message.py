@@ -3,12 +3,15 @@
 from collections import namedtuple
 from enum import Enum
 from functools import total_ordering
+from numbers import Real
 from typing import (
     Dict,
     List,
     Optional,
 )
 
+import numpy as np
+
 from hummingbot.core.data_type.order_book_row import OrderBookRow
 
 
@@ -60,15 +63,77 @@ class OrderBookMessage(namedtuple("_OrderBookMessage", "type, content, timestamp
 
     @property
     def asks(self) -> List[OrderBookRow]:
-        return [
-            OrderBookRow(float(price), float(amount), self.update_id) for price, amount, *trash in self.content["asks"]
-        ]
+        if "_asks" not in self.__dict__:
+            self.__dict__["_asks"] = self._rows_from_price_levels(self._price_levels("asks"))
+        return self.__dict__["_asks"]
 
     @property
     def bids(self) -> List[OrderBookRow]:
-        return [
-            OrderBookRow(float(price), float(amount), self.update_id) for price, amount, *trash in self.content["bids"]
-        ]
+        if "_bids" not in self.__dict__:
+            self.__dict__["_bids"] = self._rows_from_price_levels(self._price_levels("bids"))
+        return self.__dict__["_bids"]
+
+    @property
+    def asks_array(self) -> np.ndarray:
+        """
+        The asks as a (n, 3) float64 array of [price, amount, update_id] rows, parsed once and cached, in the format
+        expected by OrderBook.apply_numpy_diffs and OrderBook.apply_numpy_snapshot. Non-numeric update ids are stored
+        as -1.
+        """
+        if "_asks_array" not in self.__dict__:
+            if type(self).asks is OrderBookMessage.asks:
+                self.__dict__["_asks_array"] = self._array_from_price_levels(self._price_levels("asks"))
+            else:
+                # Subclasses with their own asks parsing are the reference for their array as well.
+                self.__dict__["_asks_array"] = self._rows_to_array(self.asks)
+        return self.__dict__["_asks_array"]
+
+    @property
+    def bids_array(self) -> np.ndarray:
+        """
+        The bids as a (n, 3) float64 array of [price, amount, update_id] rows, parsed once and cached, in the format
+        expected by OrderBook.apply_numpy_diffs and OrderBook.apply_numpy_snapshot. Non-numeric update ids are stored
+        as -1.
+        """
+        if "_bids_array" not in self.__dict__:
+            if type(self).bids is OrderBookMessage.bids:
+                self.__dict__["_bids_array"] = self._array_from_price_levels(self._price_levels("bids"))
+            else:
+                # Subclasses with their own bids parsing are the reference for their array as well.
+                self.__dict__["_bids_array"] = self._rows_to_array(self.bids)
+        return self.__dict__["_bids_array"]
+
+    def _price_levels(self, side: str) -> np.ndarray:
+        """
+        Parses the [price, amount, ...] entries of one side of the content into a (n, 2) float64 array, only once.
+        """
+        key: str = f"_{side}_price_levels"
+        if key not in self.__dict__:
+            entries: List[any] = self.content[side]
+            price_levels: np.ndarray = np.empty((len(entries), 2), dtype=np.float64)
+            if len(entries) > 0:
+                price_levels[:] = [entry[:2] for entry in entries]
+            self.__dict__[key] = price_levels
+        return self.__dict__[key]
+
+    def _rows_from_price_levels(self, price_levels: np.ndarray) -> List[OrderBookRow]:
+        update_id = self.update_id
+        return [OrderBookRow(price, amount, update_id) for price, amount in price_levels.tolist()]
+
+    def _array_from_price_levels(self, price_levels: np.ndarray) -> np.ndarray:
+        array: np.ndarray = np.empty((price_levels.shape[0], 3), dtype=np.float64)
+        array[:, :2] = price_levels
+        array[:, 2] = OrderBookMessage._array_update_id(self.update_id)
+        return array
+
+    @staticmethod
+    def _rows_to_array(rows: List[OrderBookRow]) -> np.ndarray:
+        return np.array([(row.price, row.amount, OrderBookMessage._array_update_id(row.update_id)) for row in rows],
+                        dtype=np.float64).reshape(-1, 3)
+
+    @staticmethod
+    def _array_update_id(update_id: any) -> float:
+        return update_id if isinstance(update_id, Real) else -1
 
     @property
     def has_update_id(self) -> bool:
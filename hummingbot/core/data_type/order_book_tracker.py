@@ -1,9 +1,10 @@
 #!/usr/bin/env python
 import asyncio
 from abc import ABC
-from collections import deque
+from collections import OrderedDict, defaultdict, deque
 from enum import Enum
 import logging
+import numpy as np
 import pandas as pd
 import re
 from typing import (
@@ -16,7 +17,10 @@ import time
 from hummingbot.core.event.events import OrderBookTradeEvent, TradeType
 from hummingbot.logger import HummingbotLogger
 from hummingbot.core.data_type.order_book import OrderBook
-from hummingbot.core.utils.async_utils import safe_ensure_future
+from hummingbot.core.utils.async_utils import (
+    safe_ensure_future,
+    safe_gather,
+)
 from .order_book_message import (
     OrderBookMessageType,
     OrderBookMessage,
@@ -32,8 +36,41 @@ class OrderBookTrackerDataSourceType(Enum):
     EXCHANGE_API = 3
 
 
+class DiffQueueMetrics:
+    """
+    Statistics of the diff messages waiting to be applied to one order book.
+    """
+
+    def __init__(self):
+        self.queue_depth: int = 0
+        self.max_queue_depth: int = 0
+        self.lag: float = 0.0
+        self.max_lag: float = 0.0
+        self.diffs_applied: int = 0
+        self.batches_applied: int = 0
+
+    def record_batch(self, queue_depth: int, diff_messages: List[OrderBookMessage]):
+        self.queue_depth = queue_depth
+        self.max_queue_depth = max(self.max_queue_depth, queue_depth)
+        latest_timestamp: Optional[float] = diff_messages[-1].timestamp
+        if latest_timestamp is not None:
+            self.lag = max(0.0, time.time() - latest_timestamp)
+            self.max_lag = max(self.max_lag, self.lag)
+        self.diffs_applied += len(diff_messages)
+        self.batches_applied += 1
+
+    def __repr__(self) -> str:
+        return (f"DiffQueueMetrics(queue_depth={self.queue_depth}, max_queue_depth={self.max_queue_depth}, "
+                f"lag={self.lag:.3f}, max_lag={self.max_lag:.3f}, diffs_applied={self.diffs_applied}, "
+                f"batches_applied={self.batches_applied})")
+
+
 class OrderBookTracker(ABC):
     PAST_DIFF_WINDOW_SIZE: int = 32
+    # Delay between two order book initializations when the data source requests are not throttled.
+    UNTHROTTLED_INIT_INTERVAL: float = 1.0
+    # Minimum delay between two snapshot refreshes in gap detection mode, so fetches are spread out over time.
+    SNAPSHOT_REFRESH_INTERVAL: float = 1.0
     _obt_logger: Optional[HummingbotLogger] = None
 
     @classmethod
@@ -42,8 +79,22 @@ class OrderBookTracker(ABC):
             cls._obt_logger = logging.getLogger(__name__)
         return cls._obt_logger
 
-    def __init__(self, data_source: OrderBookTrackerDataSource, trading_pairs: List[str], domain: Optional[str] = None):
+    def __init__(self,
+                 data_source: OrderBookTrackerDataSource,
+                 trading_pairs: List[str],
+                 domain: Optional[str] = None,
+                 coalesce_diffs: bool = False,
+                 gap_detection: bool = False,
+                 snapshot_staleness_window: float = 3600.0):
         self._domain: Optional[str] = domain
+        self._coalesce_diffs: bool = coalesce_diffs
+        self._diff_metrics: Dict[str, DiffQueueMetrics] = {}
+        self._gap_detection: bool = gap_detection
+        self._snapshot_staleness_window: float = snapshot_staleness_window
+        self._sequence_gap_counts: Dict[str, int] = defaultdict(int)
+        self._last_snapshot_timestamps: Dict[str, float] = {}
+        self._snapshot_refresh_requests: Dict[str, None] = OrderedDict()
+        self._snapshot_refresh_requested: asyncio.Event = asyncio.Event()
         self._data_source: OrderBookTrackerDataSource = data_source
         self._trading_pairs: List[str] = trading_pairs
         self._order_books_initialized: asyncio.Event = asyncio.Event()
@@ -51,6 +102,8 @@ class OrderBookTracker(ABC):
         self._order_books: Dict[str, OrderBook] = {}
         self._tracking_message_queues: Dict[str, asyncio.Queue] = {}
         self._past_diffs_windows: Dict[str, Deque] = {}
+        self._saved_message_queues: Dict[str, Deque[OrderBookMessage]] = defaultdict(lambda: deque(maxlen=1000))
+        self._order_book_init_timings: Dict[str, float] = {}
         self._order_book_diff_stream: asyncio.Queue = asyncio.Queue()
         self._order_book_snapshot_stream: asyncio.Queue = asyncio.Queue()
         self._order_book_trade_stream: asyncio.Queue = asyncio.Queue()
@@ -61,6 +114,7 @@ class OrderBookTracker(ABC):
         self._order_book_diff_listener_task: Optional[asyncio.Task] = None
         self._order_book_trade_listener_task: Optional[asyncio.Task] = None
         self._order_book_snapshot_listener_task: Optional[asyncio.Task] = None
+        self._snapshot_refresh_task: Optional[asyncio.Task] = None
         self._order_book_diff_router_task: Optional[asyncio.Task] = None
         self._order_book_snapshot_router_task: Optional[asyncio.Task] = None
         self._update_last_trade_prices_task: Optional[asyncio.Task] = None
@@ -77,6 +131,68 @@ class OrderBookTracker(ABC):
     def ready(self) -> bool:
         return self._order_books_initialized.is_set()
 
+    @property
+    def ready_trading_pairs(self) -> List[str]:
+        """
+        The trading pairs whose order books are initialized and tracked, available before all of them are.
+        """
+        return [trading_pair for trading_pair in self._trading_pairs if self.is_order_book_ready(trading_pair)]
+
+    def is_order_book_ready(self, trading_pair: str) -> bool:
+        return trading_pair in self._tracking_tasks
+
+    @property
+    def order_book_init_timings(self) -> Dict[str, float]:
+        """
+        Seconds spent initializing each order book, including the time waiting for the throttler.
+        """
+        return self._order_book_init_timings
+
+    @property
+    def coalesce_diffs(self) -> bool:
+        """
+        When enabled, all the diffs queued for a trading pair are merged into a single change set, keeping the last
+        write per price level, and applied to the order book at once.
+        """
+        return self._coalesce_diffs
+
+    @coalesce_diffs.setter
+    def coalesce_diffs(self, value: bool):
+        self._coalesce_diffs = value
+
+    @property
+    def diff_metrics(self) -> Dict[str, DiffQueueMetrics]:
+        return self._diff_metrics
+
+    @property
+    def gap_detection(self) -> bool:
+        """
+        When enabled, the periodic snapshots of the data source are not used. Instead the continuity of the diff
+        update ids is checked, and a snapshot is only fetched for order books with a sequence gap or whose last
+        snapshot is older than the staleness window. Takes effect the next time the tracker is started.
+        """
+        return self._gap_detection
+
+    @gap_detection.setter
+    def gap_detection(self, value: bool):
+        self._gap_detection = value
+
+    @property
+    def snapshot_staleness_window(self) -> float:
+        return self._snapshot_staleness_window
+
+    @snapshot_staleness_window.setter
+    def snapshot_staleness_window(self, value: float):
+        self._snapshot_staleness_window = value
+        self._snapshot_refresh_requested.set()
+
+    @property
+    def sequence_gap_counts(self) -> Dict[str, int]:
+        """
+        Number of sequence gaps detected in the diff messages of each trading pair.
+        """
+        return dict(self._sequence_gap_counts)
+
     @property
     def snapshot(self) -> Dict[str, Tuple[pd.DataFrame, pd.DataFrame]]:
         return {
@@ -84,6 +200,13 @@ class OrderBookTracker(ABC):
             for trading_pair, order_book in self._order_books.items()
         }
 
+    @property
+    def numpy_snapshot(self) -> Dict[str, Tuple[np.ndarray, np.ndarray]]:
+        return {
+            trading_pair: order_book.to_numpy()
+            for trading_pair, order_book in self._order_books.items()
+        }
+
     def start(self):
         self.stop()
         self._init_order_books_task = safe_ensure_future(
@@ -98,9 +221,14 @@ class OrderBookTracker(ABC):
         self._order_book_trade_listener_task = safe_ensure_future(
             self._data_source.listen_for_trades(self._ev_loop, self._order_book_trade_stream)
         )
-        self._order_book_snapshot_listener_task = safe_ensure_future(
-            self._data_source.listen_for_order_book_snapshots(self._ev_loop, self._order_book_snapshot_stream)
-        )
+        if self._gap_detection:
+            self._snapshot_refresh_task = safe_ensure_future(
+                self._snapshot_refresh_loop()
+            )
+        else:
+            self._order_book_snapshot_listener_task = safe_ensure_future(
+                self._data_source.listen_for_order_book_snapshots(self._ev_loop, self._order_book_snapshot_stream)
+            )
         self._order_book_diff_router_task = safe_ensure_future(
             self._order_book_diff_router()
         )
@@ -124,6 +252,9 @@ class OrderBookTracker(ABC):
         if self._order_book_snapshot_listener_task is not None:
             self._order_book_snapshot_listener_task.cancel()
             self._order_book_snapshot_listener_task = None
+        if self._snapshot_refresh_task is not None:
+            self._snapshot_refresh_task.cancel()
+            self._snapshot_refresh_task = None
         if self._order_book_trade_listener_task is not None:
             self._order_book_trade_listener_task.cancel()
             self._order_book_trade_listener_task = None
@@ -175,32 +306,51 @@ class OrderBookTracker(ABC):
 
     async def _init_order_books(self):
         """
-        Initialize order books
+        Initialize order books concurrently. Requests are paced by the data source throttler when it has one,
+        otherwise the order books are initialized one at a time.
+        Each order book starts being tracked as soon as it is initialized.
         """
-        for index, trading_pair in enumerate(self._trading_pairs):
+        throttled: bool = self._data_source.throttler is not None
+        max_concurrency: int = max(1, len(self._trading_pairs)) if throttled else 1
+        semaphore: asyncio.Semaphore = asyncio.Semaphore(max_concurrency)
+        await safe_gather(*[self._init_order_book(trading_pair, semaphore, throttled)
+                            for trading_pair in self._trading_pairs])
+        self._order_books_initialized.set()
+
+    async def _init_order_book(self, trading_pair: str, semaphore: asyncio.Semaphore, throttled: bool):
+        async with semaphore:
+            start_time: float = time.perf_counter()
             self._order_books[trading_pair] = await self._initial_order_book_for_trading_pair(trading_pair)
+            self._last_snapshot_timestamps[trading_pair] = time.time()
             self._tracking_message_queues[trading_pair] = asyncio.Queue()
             self._tracking_tasks[trading_pair] = safe_ensure_future(self._track_single_book(trading_pair))
-            self.logger().info(f"Initialized order book for {trading_pair}. "
-                               f"{index + 1}/{len(self._trading_pairs)} completed.")
-            await asyncio.sleep(1)
-        self._order_books_initialized.set()
+            self._order_book_init_timings[trading_pair] = time.perf_counter() - start_time
+            self.logger().info(f"Initialized order book for {trading_pair} in "
+                               f"{self._order_book_init_timings[trading_pair]:.2f}s. "
+                               f"{len(self._order_book_init_timings)}/{len(self._trading_pairs)} completed.")
+            if not throttled:
+                await asyncio.sleep(self.UNTHROTTLED_INIT_INTERVAL)
 
     async def _order_book_diff_router(self):
         """
         Route the real-time order book diff messages to the correct order book.
         """
         last_message_timestamp: float = time.time()
+        messages_queued: int = 0
         messages_accepted: int = 0
         messages_rejected: int = 0
-        await self._order_books_initialized.wait()
         while True:
             try:
                 ob_message: OrderBookMessage = await self._order_book_diff_stream.get()
                 trading_pair: str = ob_message.trading_pair
 
                 if trading_pair not in self._tracking_message_queues:
-                    messages_rejected += 1
+                    if trading_pair in self._trading_pairs:
+                        # Save diff messages received while the order book is being initialized
+                        self._saved_message_queues[trading_pair].append(ob_message)
+                        messages_queued += 1
+                    else:
+                        messages_rejected += 1
                     continue
                 message_queue: asyncio.Queue = self._tracking_message_queues[trading_pair]
                 # Check the order book's initial update ID. If it's larger, don't bother.
@@ -215,9 +365,11 @@ class OrderBookTracker(ABC):
                 # Log some statistics.
                 now: float = time.time()
                 if int(now / 60.0) > int(last_message_timestamp / 60.0):
-                    self.logger().debug(f"Diff messages processed: {messages_accepted}, rejected: {messages_rejected}")
+                    self.logger().debug(f"Diff messages processed: {messages_accepted}, "
+                                        f"rejected: {messages_rejected}, queued: {messages_queued}")
                     messages_accepted = 0
                     messages_rejected = 0
+                    messages_queued = 0
 
                 last_message_timestamp = now
             except asyncio.CancelledError:
@@ -230,7 +382,6 @@ class OrderBookTracker(ABC):
         """
         Route the real-time order book snapshot messages to the correct order book.
         """
-        await self._order_books_initialized.wait()
         while True:
             try:
                 ob_message: OrderBookMessage = await self._order_book_snapshot_stream.get()
@@ -253,26 +404,44 @@ class OrderBookTracker(ABC):
         order_book: OrderBook = self._order_books[trading_pair]
         last_message_timestamp: float = time.time()
         diff_messages_accepted: int = 0
+        pending_message: Optional[OrderBookMessage] = None
 
         while True:
             try:
-                message: OrderBookMessage = await message_queue.get()
+                saved_messages: Deque[OrderBookMessage] = self._saved_message_queues[trading_pair]
+                diff_messages: List[OrderBookMessage] = []
+
+                # Process the messages saved during initialization first, skipping those older than the snapshot
+                if len(saved_messages) > 0:
+                    message: OrderBookMessage = saved_messages.popleft()
+                    if message.update_id < order_book.snapshot_uid:
+                        continue
+                    diff_messages = [message]
+                else:
+                    message: OrderBookMessage = pending_message or await message_queue.get()
+                    pending_message = None
+                    if message.type is OrderBookMessageType.DIFF:
+                        diff_messages, pending_message = self._drain_diff_messages(message, message_queue)
+
                 if message.type is OrderBookMessageType.DIFF:
-                    order_book.apply_diffs(message.bids, message.asks, message.update_id)
-                    past_diffs_window.append(message)
-                    while len(past_diffs_window) > self.PAST_DIFF_WINDOW_SIZE:
-                        past_diffs_window.popleft()
-                    diff_messages_accepted += 1
+                    if self._gap_detection:
+                        self._check_sequence_gaps(trading_pair, order_book, diff_messages)
+                    self._apply_diff_messages(trading_pair, order_book, diff_messages, past_diffs_window,
+                                              message_queue.qsize() + len(saved_messages) + len(diff_messages))
+                    diff_messages_accepted += len(diff_messages)
 
                     # Output some statistics periodically.
                     now: float = time.time()
                     if int(now / 60.0) > int(last_message_timestamp / 60.0):
-                        self.logger().debug(f"Processed {diff_messages_accepted} order book diffs for {trading_pair}.")
+                        self.logger().debug(f"Processed {diff_messages_accepted} order book diffs for {trading_pair}. "
+                                            f"{self._diff_metrics[trading_pair]}")
                         diff_messages_accepted = 0
                     last_message_timestamp = now
                 elif message.type is OrderBookMessageType.SNAPSHOT:
                     past_diffs: List[OrderBookMessage] = list(past_diffs_window)
                     order_book.restore_from_snapshot_and_diffs(message, past_diffs)
+                    self._last_snapshot_timestamps[trading_pair] = time.time()
+                    self._snapshot_refresh_requests.pop(trading_pair, None)
                     self.logger().debug(f"Processed order book snapshot for {trading_pair}.")
             except asyncio.CancelledError:
                 raise
@@ -280,11 +449,127 @@ class OrderBookTracker(ABC):
                 self.logger().error("Unknown error. Retrying after 5 seconds.", exc_info=True)
                 await asyncio.sleep(5.0)
 
+    def _check_sequence_gaps(self, trading_pair: str, order_book: OrderBook, diff_messages: List[OrderBookMessage]):
+        """
+        Requests a snapshot refresh when the diffs do not continue from the last update applied to the order book.
+        Diff messages without a first update id can't be checked.
+        """
+        last_update_id: int = max(order_book.snapshot_uid, order_book.last_diff_uid)
+        for message in diff_messages:
+            if "first_update_id" in message.content and message.first_update_id > last_update_id + 1:
+                self._sequence_gap_counts[trading_pair] += 1
+                self.logger().warning(f"Sequence gap detected in the order book diffs for {trading_pair} "
+                                      f"(expected update {last_update_id + 1}, received {message.first_update_id}). "
+                                      f"Requesting a new snapshot.")
+                self.request_snapshot_refresh(trading_pair)
+            last_update_id = max(last_update_id, message.update_id)
+
+    def request_snapshot_refresh(self, trading_pair: str):
+        """
+        Schedules a snapshot refresh of the order book ahead of the stale ones. Only used in gap detection mode.
+        """
+        self._snapshot_refresh_requests[trading_pair] = None
+        self._snapshot_refresh_requested.set()
+
+    async def _next_snapshot_refresh(self) -> str:
+        """
+        Waits for the next trading pair needing a snapshot: the ones with a sequence gap first, in the order they were
+        detected, then the one whose last snapshot is the oldest, once it is older than the staleness window.
+        """
+        while True:
+            if len(self._snapshot_refresh_requests) > 0:
+                return self._snapshot_refresh_requests.popitem(last=False)[0]
+            timeout: float = self._snapshot_staleness_window
+            if len(self._last_snapshot_timestamps) > 0:
+                trading_pair, last_snapshot_timestamp = min(self._last_snapshot_timestamps.items(),
+                                                            key=lambda item: item[1])
+                timeout = last_snapshot_timestamp + self._snapshot_staleness_window - time.time()
+                if timeout <= 0:
+                    return trading_pair
+            self._snapshot_refresh_requested.clear()
+            try:
+                await asyncio.wait_for(self._snapshot_refresh_requested.wait(), timeout=timeout)
+            except asyncio.TimeoutError:
+                pass
+
+    async def _snapshot_refresh_loop(self):
+        while True:
+            trading_pair: str = await self._next_snapshot_refresh()
+            try:
+                snapshot_message: OrderBookMessage = await self._data_source.get_snapshot_message(trading_pair)
+                # The stream only reaches the order book later; don't pick the same pair again in the meantime.
+                self._last_snapshot_timestamps[trading_pair] = time.time()
+                self._order_book_snapshot_stream.put_nowait(snapshot_message)
+                self.logger().debug(f"Requested order book snapshot refresh for {trading_pair}.")
+            except asyncio.CancelledError:
+                raise
+            except Exception:
+                self.logger().network(f"Unexpected error fetching order book snapshot for {trading_pair}.",
+                                      exc_info=True,
+                                      app_warning_msg="Could not refresh order book snapshot. "
+                                                      "Check network connection.")
+                self.request_snapshot_refresh(trading_pair)
+            await asyncio.sleep(self.SNAPSHOT_REFRESH_INTERVAL)
+
+    def _drain_diff_messages(self,
+                             message: OrderBookMessage,
+                             message_queue: asyncio.Queue) -> Tuple[List[OrderBookMessage], Optional[OrderBookMessage]]:
+        """
+        Collects the diff messages to apply together with the given one. In coalescing mode that is every diff already
+        waiting in the queue, up to the first message that is not a diff, which is returned to be processed next.
+        """
+        diff_messages: List[OrderBookMessage] = [message]
+        if self._coalesce_diffs:
+            while not message_queue.empty():
+                next_message: OrderBookMessage = message_queue.get_nowait()
+                if next_message.type is not OrderBookMessageType.DIFF:
+                    return diff_messages, next_message
+                diff_messages.append(next_message)
+        return diff_messages, None
+
+    def _apply_diff_messages(self,
+                             trading_pair: str,
+                             order_book: OrderBook,
+                             diff_messages: List[OrderBookMessage],
+                             past_diffs_window: Deque[OrderBookMessage],
+                             queue_depth: int):
+        if len(diff_messages) == 1:
+            message: OrderBookMessage = diff_messages[0]
+            order_book.apply_numpy_diffs(message.bids_array, message.asks_array, message.update_id)
+        else:
+            bids, asks = self.merge_diff_messages(diff_messages)
+            order_book.apply_numpy_diffs(bids, asks, max(message.update_id for message in diff_messages))
+
+        # The window keeps the individual messages, so snapshots are replayed exactly as before.
+        past_diffs_window.extend(diff_messages)
+        while len(past_diffs_window) > self.PAST_DIFF_WINDOW_SIZE:
+            past_diffs_window.popleft()
+
+        if trading_pair not in self._diff_metrics:
+            self._diff_metrics[trading_pair] = DiffQueueMetrics()
+        self._diff_metrics[trading_pair].record_batch(queue_depth, diff_messages)
+
+    @staticmethod
+    def merge_diff_messages(diff_messages: List[OrderBookMessage]) -> Tuple[np.ndarray, np.ndarray]:
+        """
+        Merges consecutive diff messages into one net change set, keeping the last write per price on each side.
+
+        :return: bids array, asks array, in the format of OrderBook.apply_numpy_diffs
+        """
+        return (OrderBookTracker._last_write_per_price([message.bids_array for message in diff_messages]),
+                OrderBookTracker._last_write_per_price([message.asks_array for message in diff_messages]))
+
+    @staticmethod
+    def _last_write_per_price(arrays: List[np.ndarray]) -> np.ndarray:
+        rows: np.ndarray = np.concatenate(arrays)
+        # np.unique returns the first occurrence, so search the reversed rows to find the last write of every price.
+        _, reversed_indices = np.unique(rows[::-1, 0], return_index=True)
+        return rows[len(rows) - 1 - reversed_indices]
+
     async def _emit_trade_event_loop(self):
         last_message_timestamp: float = time.time()
         messages_accepted: int = 0
         messages_rejected: int = 0
-        await self._order_books_initialized.wait()
         while True:
             try:
                 trade_message: OrderBookMessage = await self._order_book_trade_stream.get()
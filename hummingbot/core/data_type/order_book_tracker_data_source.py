@@ -9,9 +9,15 @@ from typing import (
     Callable,
     Dict,
     List,
+    Optional,
+    TYPE_CHECKING,
 )
 from hummingbot.core.data_type.order_book import OrderBook
 
+if TYPE_CHECKING:
+    from hummingbot.core.api_throttler.async_throttler_base import AsyncThrottlerBase
+    from hummingbot.core.data_type.order_book_message import OrderBookMessage
+
 
 class OrderBookTrackerDataSource(metaclass=ABCMeta):
 
@@ -36,6 +42,14 @@ class OrderBookTrackerDataSource(metaclass=ABCMeta):
     def order_book_create_function(self, func: Callable[[], OrderBook]):
         self._order_book_create_function = func
 
+    @property
+    def throttler(self) -> Optional["AsyncThrottlerBase"]:
+        """
+        The throttler the order book snapshot requests go through, or None if they are not throttled. Data sources
+        whose get_new_order_book requests are paced by their throttler override this to return it.
+        """
+        return None
+
     @classmethod
     async def get_last_traded_prices(cls, trading_pairs: List[str]) -> Dict[str, float]:
         raise NotImplementedError
@@ -51,6 +65,13 @@ class OrderBookTrackerDataSource(metaclass=ABCMeta):
     async def get_new_order_book(self, trading_pair: str) -> OrderBook:
         raise NotImplementedError
 
+    async def get_snapshot_message(self, trading_pair: str) -> "OrderBookMessage":
+        """
+        Fetches a full order book snapshot message. Used by the order book tracker to refresh single order books on
+        demand in gap detection mode.
+        """
+        raise NotImplementedError
+
     @abstractmethod
     async def listen_for_order_book_diffs(self, ev_loop: asyncio.BaseEventLoop, output: asyncio.Queue):
         """
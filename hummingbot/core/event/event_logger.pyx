@@ -1,6 +1,7 @@
 #!/usr/bin/env python
 
 import asyncio
+from collections import deque
 from async_timeout import timeout
 from typing import (
     List,
@@ -11,16 +12,24 @@ from hummingbot.core.event.event_listener cimport EventListener
 
 
 cdef class EventLogger(EventListener):
-    def __init__(self, event_source: Optional[str] = None):
+    def __init__(self, event_source: Optional[str] = None, max_events: Optional[int] = None):
+        """
+        :param event_source: The name of the source of the logged events
+        :param max_events: The maximum number of events kept, the oldest ones are dropped past it. None keeps all
+        """
         super().__init__()
         self._event_source = event_source
-        self._logged_events = []
+        self._logged_events = deque(maxlen=max_events)
         self._waiting = {}
         self._wait_returns = {}
 
     @property
     def event_log(self) -> List[any]:
-        return self._logged_events.copy()
+        return list(self._logged_events)
+
+    @property
+    def max_events(self) -> Optional[int]:
+        return self._logged_events.maxlen
 
     @property
     def event_source(self) -> str:
@@ -0,0 +1,83 @@
+from collections import deque
+from decimal import Decimal
+from typing import (
+    Deque,
+    Dict,
+    List,
+    Optional
+)
+
+s_decimal_1 = Decimal("1")
+
+
+class RateGraph:
+    """
+    Conversion rates between tokens, found through the shortest chains of prices linking them.
+
+    Every price of a trading pair is an edge between its base and quote tokens, which can be followed both ways (with
+    the inverted price in the quote to base direction, unless the inverted pair has its own price). The rates from a
+    token to every token it is linked to are all calculated at once, with a breadth first search, the first time a rate
+    from that token is requested, and kept in a lookup table until the prices change (a new graph is built then).
+
+    For example, given prices of {"HBOT-USDT": Decimal("100"), "AAVE-USDT": Decimal("50"), "USDT-GBP": Decimal("0.75")}
+    A rate for USDT-HBOT will be 1 / 100
+    A rate for HBOT-AAVE will be 100 / 50
+    A rate for AAVE-GBP will be 50 * 0.75
+    """
+
+    def __init__(self, prices: Dict[str, Decimal]):
+        """
+        :param prices: The dictionary of trading pairs and their prices, not to be modified afterwards
+        """
+        self._prices: Dict[str, Decimal] = prices
+        self._edges: Dict[str, Dict[str, Decimal]] = {}
+        self._rates: Dict[str, Dict[str, Decimal]] = {}
+        for pair, price in prices.items():
+            tokens: List[str] = pair.split("-")
+            if len(tokens) == 2:
+                self._edges.setdefault(tokens[0], {})[tokens[1]] = price
+        # The prices of the pairs themselves take precedence over the inverted prices of the reverse pairs.
+        for pair, price in prices.items():
+            tokens: List[str] = pair.split("-")
+            if len(tokens) == 2 and price != 0:
+                reverse_edges: Dict[str, Decimal] = self._edges.setdefault(tokens[1], {})
+                if tokens[0] not in reverse_edges:
+                    reverse_edges[tokens[0]] = s_decimal_1 / price
+
+    @property
+    def prices(self) -> Dict[str, Decimal]:
+        return self._prices
+
+    def rate(self, pair: str) -> Optional[Decimal]:
+        """
+        :param pair: A trading pair, e.g. BTC-USDT
+        :return: The conversion rate, None if no prices link the tokens of the pair
+        """
+        base, quote = pair.split("-")
+        return self.rates_from(base).get(quote)
+
+    def rates(self, pairs: List[str]) -> Dict[str, Optional[Decimal]]:
+        """
+        :param pairs: A list of trading pairs
+        :return: A dictionary of the trading pairs and their conversion rates (None if not found)
+        """
+        return {pair: self.rate(pair) for pair in pairs}
+
+    def rates_from(self, token: str) -> Dict[str, Decimal]:
+        """
+        :param token: A token symbol, e.g. BTC
+        :return: The conversion rates from the token to every token it can be converted to, not to be modified
+        """
+        rates: Optional[Dict[str, Decimal]] = self._rates.get(token)
+        if rates is None:
+            rates = {token: s_decimal_1}
+            to_visit: Deque[str] = deque([token])
+            while len(to_visit) > 0:
+                current: str = to_visit.popleft()
+                current_rate: Decimal = rates[current]
+                for neighbor, price in self._edges.get(current, {}).items():
+                    if neighbor not in rates:
+                        rates[neighbor] = current_rate * price
+                        to_visit.append(neighbor)
+            self._rates[token] = rates
+        return rates
@@ -18,7 +18,7 @@ from hummingbot.connector.exchange.kucoin.kucoin_utils import convert_from_excha
     kucoin_convert_from_exchange_pair
 from hummingbot.connector.exchange.ascend_ex.ascend_ex_utils import convert_from_exchange_trading_pair as \
     ascend_ex_convert_from_exchange_pair
-from hummingbot.core.rate_oracle.utils import find_rate
+from hummingbot.core.rate_oracle.rate_graph import RateGraph
 from hummingbot.core.utils.async_utils import safe_gather
 from hummingbot.core.utils import async_ttl_cache
 
@@ -37,7 +37,7 @@ class RateOracle(NetworkBase):
     """
     RateOracle provides conversion rates for any given pair token symbols in both async and sync fashions.
     It achieves this by query URL on a given source for prices and store them, either in cache or as an object member.
-    The find_rate is then used on these prices to find a rate on a given pair.
+    A RateGraph built from these prices, each time they are refreshed, is then used to find a rate on a given pair.
     """
     # Set these below class members before query for rates
     source: RateOracleSource = RateOracleSource.binance
@@ -47,6 +47,7 @@ class RateOracle(NetworkBase):
     _logger: Optional[HummingbotLogger] = None
     _shared_instance: "RateOracle" = None
     _shared_client: Optional[aiohttp.ClientSession] = None
+    _fetched_rate_graph: Optional[RateGraph] = None
     _cgecko_supported_vs_tokens: List[str] = []
 
     binance_price_url = "https://api.binance.com/api/v3/ticker/bookTicker"
@@ -74,6 +75,7 @@ class RateOracle(NetworkBase):
         self._check_network_interval = 30.0
         self._ev_loop = asyncio.get_event_loop()
         self._prices: Dict[str, Decimal] = {}
+        self._rate_graph: RateGraph = RateGraph(self._prices)
         self._fetch_price_task: Optional[asyncio.Task] = None
         self._ready_event = asyncio.Event()
 
@@ -117,7 +119,15 @@ class RateOracle(NetworkBase):
         :param pair: A trading pair, e.g. BTC-USDT
         :return A conversion rate
         """
-        return find_rate(self._prices, pair)
+        return self._rate_graph.rate(pair)
+
+    def rates(self, pairs: List[str]) -> Dict[str, Decimal]:
+        """
+        Finds conversion rates for several trading pairs at once.
+        :param pairs: A list of trading pairs, e.g. [BTC-USDT, ETH-USDT]
+        :return A dictionary of the trading pairs and their conversion rates
+        """
+        return self._rate_graph.rates(pairs)
 
     @classmethod
     async def rate_async(cls, pair: str) -> Decimal:
@@ -127,8 +137,8 @@ class RateOracle(NetworkBase):
         :param pair: A trading pair, e.g. BTC-USDT
         :return A conversion rate
         """
-        prices = await cls.get_prices()
-        return find_rate(prices, pair)
+        rate_graph = await cls._get_rate_graph()
+        return rate_graph.rate(pair)
 
     @classmethod
     async def global_rate(cls, token: str) -> Decimal:
@@ -137,9 +147,9 @@ class RateOracle(NetworkBase):
         :param token: A token symbol, e.g. BTC
         :return A conversion rate
         """
-        prices = await cls.get_prices()
+        rate_graph = await cls._get_rate_graph()
         pair = token + "-" + cls.global_token
-        return find_rate(prices, pair)
+        return rate_graph.rate(pair)
 
     @classmethod
     async def global_value(cls, token: str, amount: Decimal) -> Decimal:
@@ -156,7 +166,10 @@ class RateOracle(NetworkBase):
     async def fetch_price_loop(self):
         while True:
             try:
-                self._prices = await self.get_prices()
+                prices = await self.get_prices()
+                if prices is not self._prices:
+                    self._rate_graph = RateGraph(prices)
+                    self._prices = prices
                 if self._prices:
                     self._ready_event.set()
             except asyncio.CancelledError:
@@ -166,6 +179,17 @@ class RateOracle(NetworkBase):
                                       app_warning_msg=f"Couldn't fetch newest prices from {self.source.name}.")
             await asyncio.sleep(1)
 
+    @classmethod
+    async def _get_rate_graph(cls) -> RateGraph:
+        """
+        Builds a rate graph from prices of a specified source, the same graph is reused as long as the prices are
+        cached by their source.
+        """
+        prices = await cls.get_prices()
+        if cls._fetched_rate_graph is None or cls._fetched_rate_graph.prices is not prices:
+            cls._fetched_rate_graph = RateGraph(prices)
+        return cls._fetched_rate_graph
+
     @classmethod
     async def get_prices(cls) -> Dict[str, Decimal]:
         """
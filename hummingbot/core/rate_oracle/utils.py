@@ -1,6 +1,8 @@
 from typing import Dict
 from decimal import Decimal
 
+from hummingbot.core.rate_oracle.rate_graph import RateGraph
+
 
 def find_rate(prices: Dict[str, Decimal], pair: str) -> Decimal:
     '''
@@ -10,6 +12,7 @@ def find_rate(prices: Dict[str, Decimal], pair: str) -> Decimal:
     A rate for HBOT-AAVE will be 100 / 50
     A rate for AAVE-HBOT will be 50 / 100
     A rate for HBOT-GBP will be 100 * 0.75
+    Rates are found through as many prices as needed, use a RateGraph to find several rates from the same prices.
     :param prices: The dictionary of trading pairs and their prices
     :param pair: The trading pair
     '''
@@ -21,12 +24,4 @@ def find_rate(prices: Dict[str, Decimal], pair: str) -> Decimal:
     reverse_pair = f"{quote}-{base}"
     if reverse_pair in prices:
         return Decimal("1") / prices[reverse_pair]
-    base_prices = {k: v for k, v in prices.items() if k.startswith(f"{base}-")}
-    for base_pair, proxy_price in base_prices.items():
-        link_quote = base_pair.split("-")[1]
-        link_pair = f"{link_quote}-{quote}"
-        if link_pair in prices:
-            return proxy_price * prices[link_pair]
-        common_denom_pair = f"{quote}-{link_quote}"
-        if common_denom_pair in prices:
-            return proxy_price / prices[common_denom_pair]
+    return RateGraph(prices).rate(pair)
@@ -16,6 +16,7 @@ def async_ttl_cache(ttl: int = 3600, maxsize: int = 1):
             except KeyError:
                 cache[key] = await fn(*args, **kwargs)
                 return cache[key]
+        memoize.cache_clear = cache.clear
         return memoize
 
     return decorator
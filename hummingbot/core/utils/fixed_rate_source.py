@@ -1,6 +1,11 @@
 from decimal import Decimal
+from typing import (
+    Dict,
+    List,
+    Optional
+)
 
-from hummingbot.core.rate_oracle.utils import find_rate
+from hummingbot.core.rate_oracle.rate_graph import RateGraph
 
 
 class FixedRateSource:
@@ -9,6 +14,7 @@ class FixedRateSource:
         super().__init__()
 
         self._known_rates: dict = {}
+        self._rate_graph: Optional[RateGraph] = None
 
     def __str__(self):
         return "fixed rates"
@@ -19,6 +25,7 @@ class FixedRateSource:
         :param rate: The rate to associate to the token pair
         """
         self._known_rates[token_pair] = rate
+        self._rate_graph = None
 
     def rate(self, pair: str) -> Decimal:
         """
@@ -27,4 +34,17 @@ class FixedRateSource:
         :param pair: A trading pair, e.g. BTC-USDT
         :return A conversion rate
         """
-        return find_rate(self._known_rates, pair)
+        return self._get_rate_graph().rate(pair)
+
+    def rates(self, pairs: List[str]) -> Dict[str, Decimal]:
+        """
+        Finds conversion rates for several trading pairs at once.
+        :param pairs: A list of trading pairs, e.g. [BTC-USDT, ETH-USDT]
+        :return A dictionary of the trading pairs and their conversion rates
+        """
+        return self._get_rate_graph().rates(pairs)
+
+    def _get_rate_graph(self) -> RateGraph:
+        if self._rate_graph is None:
+            self._rate_graph = RateGraph(self._known_rates.copy())
+        return self._rate_graph
@@ -0,0 +1,104 @@
+#!/usr/bin/env python
+
+import asyncio
+import logging
+from typing import (
+    Dict,
+    List,
+    Optional,
+    Tuple
+)
+
+import aiohttp
+from yarl import URL
+
+from hummingbot.logger import HummingbotLogger
+
+
+class HTTPSessionPool:
+    """
+    Hands out long-lived aiohttp sessions, one per host, so consecutive requests to the same host reuse their
+    connections (and skip the TCP and TLS handshakes) instead of opening a new session for every request.
+
+    The connections of every session are kept alive between requests, the DNS lookups are cached, and the number of
+    connections is limited per session and per host. A session is bound to the event loop it was created in; a new
+    one is created when it is requested from another event loop, or after the pool is closed.
+    """
+
+    LIMIT = 100
+    LIMIT_PER_HOST = 20
+    TTL_DNS_CACHE = 300
+    KEEPALIVE_TIMEOUT = 30.0
+
+    _hsp_logger: Optional[HummingbotLogger] = None
+    _shared_instance: Optional["HTTPSessionPool"] = None
+
+    @classmethod
+    def logger(cls) -> HummingbotLogger:
+        if cls._hsp_logger is None:
+            cls._hsp_logger = logging.getLogger(__name__)
+        return cls._hsp_logger
+
+    @classmethod
+    def get_instance(cls) -> "HTTPSessionPool":
+        """
+        The pool shared by the requests not made on behalf of a connector, e.g. the order book data source class
+        methods fetching trading pairs and prices.
+        """
+        if cls._shared_instance is None:
+            cls._shared_instance = HTTPSessionPool()
+        return cls._shared_instance
+
+    def __init__(self,
+                 limit: int = LIMIT,
+                 limit_per_host: int = LIMIT_PER_HOST,
+                 ttl_dns_cache: Optional[int] = TTL_DNS_CACHE,
+                 keepalive_timeout: float = KEEPALIVE_TIMEOUT):
+        """
+        :param limit: the maximum number of simultaneous connections of each session, 0 for no limit
+        :param limit_per_host: the maximum number of simultaneous connections to the same endpoint, 0 for no limit
+        :param ttl_dns_cache: the number of seconds DNS lookups are cached for, None to cache them forever
+        :param keepalive_timeout: the number of seconds idle connections are kept open for
+        """
+        self._limit: int = limit
+        self._limit_per_host: int = limit_per_host
+        self._ttl_dns_cache: Optional[int] = ttl_dns_cache
+        self._keepalive_timeout: float = keepalive_timeout
+        self._sessions: Dict[str, Tuple[asyncio.AbstractEventLoop, aiohttp.ClientSession]] = {}
+
+    @property
+    def sessions_count(self) -> int:
+        return len(self._sessions)
+
+    def get_session(self, url: str) -> aiohttp.ClientSession:
+        """
+        Returns the session of the host of the url. Must be called from a coroutine, and the session must not be
+        closed by the caller.
+        """
+        host: str = str(URL(url).origin())
+        loop: asyncio.AbstractEventLoop = asyncio.get_event_loop()
+        session_loop, session = self._sessions.get(host, (None, None))
+        if session is None or session.closed or session_loop is not loop:
+            connector: aiohttp.TCPConnector = aiohttp.TCPConnector(limit=self._limit,
+                                                                   limit_per_host=self._limit_per_host,
+                                                                   ttl_dns_cache=self._ttl_dns_cache,
+                                                                   use_dns_cache=True,
+                                                                   keepalive_timeout=self._keepalive_timeout)
+            session = aiohttp.ClientSession(connector=connector)
+            self._sessions[host] = (loop, session)
+        return session
+
+    async def close(self):
+        """
+        Closes all the sessions and their connections. Sessions requested afterwards are new ones.
+        """
+        sessions: List[Tuple[asyncio.AbstractEventLoop, aiohttp.ClientSession]] = list(self._sessions.values())
+        self._sessions.clear()
+        loop: asyncio.AbstractEventLoop = asyncio.get_event_loop()
+        for session_loop, session in sessions:
+            # The sessions of other (usually already closed) event loops can't be closed from this one.
+            if session_loop is loop and not session.closed:
+                try:
+                    await session.close()
+                except Exception:
+                    self.logger().error("Unexpected error closing HTTP session.", exc_info=True)
@@ -0,0 +1,104 @@
+#!/usr/bin/env python
+
+import asyncio
+import logging
+import multiprocessing
+import os
+from concurrent.futures import ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+from functools import partial
+from typing import (
+    Any,
+    Callable,
+    Optional,
+    Tuple
+)
+
+from hummingbot.logger import HummingbotLogger
+
+
+def _warm_up():
+    """
+    A no-op job, submitted to every worker once the pool is started, so the workers are spawned (and initialized)
+    before the first signing job is submitted.
+    """
+    return os.getpid()
+
+
+class SigningExecutor:
+    """
+    Runs CPU heavy signing jobs (e.g. the Poseidon hashes and EdDSA signatures of Loopring orders) in a pool of worker
+    processes, so they don't block the event loop, the clock and the websocket consumers while they are computed.
+
+    The jobs must be module level functions taking and returning picklable values. The workers are spawned (not forked,
+    the main process runs several threads) when the executor is started, and the initializer is run once in each of
+    them, e.g. to precompute the parameters every job needs.
+    """
+
+    _se_logger: Optional[HummingbotLogger] = None
+
+    @classmethod
+    def logger(cls) -> HummingbotLogger:
+        if cls._se_logger is None:
+            cls._se_logger = logging.getLogger(__name__)
+        return cls._se_logger
+
+    def __init__(self,
+                 max_workers: Optional[int] = None,
+                 initializer: Optional[Callable[..., Any]] = None,
+                 initargs: Tuple[Any, ...] = ()):
+        """
+        :param max_workers: the number of worker processes, by default one per CPU core but one (for the main process)
+        :param initializer: a module level function run once in each worker process when it is spawned
+        :param initargs: the arguments of the initializer
+        """
+        self._max_workers: int = max_workers or max(1, (os.cpu_count() or 1) - 1)
+        self._initializer: Optional[Callable[..., Any]] = initializer
+        self._initargs: Tuple[Any, ...] = initargs
+        self._pool: Optional[ProcessPoolExecutor] = None
+
+    @property
+    def max_workers(self) -> int:
+        return self._max_workers
+
+    @property
+    def started(self) -> bool:
+        return self._pool is not None
+
+    def _get_pool(self) -> ProcessPoolExecutor:
+        if self._pool is None:
+            self._pool = ProcessPoolExecutor(max_workers=self._max_workers,
+                                             mp_context=multiprocessing.get_context("spawn"),
+                                             initializer=self._initializer,
+                                             initargs=self._initargs)
+        return self._pool
+
+    async def start(self):
+        """
+        Spawns and initializes all the workers, so the first jobs don't wait for them.
+        """
+        pool: ProcessPoolExecutor = self._get_pool()
+        loop: asyncio.AbstractEventLoop = asyncio.get_event_loop()
+        await asyncio.gather(*[loop.run_in_executor(pool, _warm_up) for _ in range(self._max_workers)])
+
+    async def submit(self, fn: Callable[..., Any], *args) -> Any:
+        """
+        Runs the job in a worker process and returns its result. The pool is started if it wasn't already, and
+        restarted once if a worker died (e.g. it was killed) while the job was submitted or computed.
+        """
+        loop: asyncio.AbstractEventLoop = asyncio.get_event_loop()
+        try:
+            return await loop.run_in_executor(self._get_pool(), partial(fn, *args))
+        except BrokenProcessPool:
+            self.logger().warning("A signing worker process terminated abruptly. Restarting the signing workers.")
+            self.shutdown()
+            return await loop.run_in_executor(self._get_pool(), partial(fn, *args))
+
+    def shutdown(self):
+        """
+        Stops the workers once their current jobs are done, without waiting for them. The executor can be started
+        again afterwards.
+        """
+        if self._pool is not None:
+            self._pool.shutdown(wait=False)
+            self._pool = None
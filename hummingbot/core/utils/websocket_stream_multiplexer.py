@@ -0,0 +1,198 @@
+#!/usr/bin/env python
+
+import asyncio
+import logging
+from collections import OrderedDict
+from typing import (
+    Any,
+    AsyncIterable,
+    Dict,
+    List,
+    Optional,
+    Tuple
+)
+
+import ujson
+import websockets
+from websockets.exceptions import ConnectionClosed
+
+from hummingbot.core.utils.async_utils import safe_ensure_future
+from hummingbot.logger import HummingbotLogger
+
+
+class WebSocketStreamMultiplexer:
+    """
+    Shares websocket connections between the listeners of an order book data source.
+
+    Every listener subscribes a channel (e.g. trades or diffs) to the streams it needs and consumes the decoded
+    payloads from the queue it gets back. The multiplexer opens as few connections as the exchange limits allow for
+    the union of all subscribed streams, demultiplexes every incoming message by its stream name into the queue of the
+    channel owning it, and reconnects (resubscribing to the same streams) whenever a connection drops.
+
+    Exchange specific behaviour lives in the subclasses: how a connection URL is built for a set of streams, which
+    messages have to be sent after connecting to subscribe to them, and how to extract the stream name and payload
+    from a raw message.
+    """
+
+    MESSAGE_TIMEOUT = 30.0
+    PING_TIMEOUT = 10.0
+    RECONNECT_DELAY = 5.0
+    # Listeners are usually started together; wait a bit so their streams end up on the same connections.
+    SUBSCRIPTION_DELAY = 0.1
+
+    _wssm_logger: Optional[HummingbotLogger] = None
+
+    @classmethod
+    def logger(cls) -> HummingbotLogger:
+        if cls._wssm_logger is None:
+            cls._wssm_logger = logging.getLogger(__name__)
+        return cls._wssm_logger
+
+    def __init__(self, max_streams_per_connection: int, max_url_length: Optional[int] = None):
+        self._max_streams_per_connection: int = max_streams_per_connection
+        self._max_url_length: Optional[int] = max_url_length
+        self._channel_streams: Dict[str, List[str]] = OrderedDict()
+        self._channel_queues: Dict[str, asyncio.Queue] = {}
+        self._stream_channels: Dict[str, str] = {}
+        self._streams_changed: asyncio.Event = asyncio.Event()
+        self._supervisor_task: Optional[asyncio.Task] = None
+        self._connection_tasks: Dict[Tuple[str, ...], asyncio.Task] = {}
+
+    def connection_url(self, streams: List[str]) -> str:
+        raise NotImplementedError
+
+    def subscription_messages(self, streams: List[str]) -> List[Dict[str, Any]]:
+        """
+        Messages sent right after every (re)connection. Exchanges that encode the streams in the URL need none.
+        """
+        return []
+
+    def parse_message(self, raw_msg: str) -> Optional[Tuple[str, Any]]:
+        """
+        Returns the stream name and the payload of a raw message, or None for messages that are not stream updates
+        (e.g. subscription acknowledgements).
+        """
+        raise NotImplementedError
+
+    @property
+    def streams(self) -> List[str]:
+        return [stream for streams in self._channel_streams.values() for stream in streams]
+
+    @property
+    def shards(self) -> List[List[str]]:
+        return [list(shard) for shard in self._connection_tasks.keys()]
+
+    def subscribe(self, channel: str, streams: List[str]) -> asyncio.Queue:
+        """
+        Routes the messages of the given streams to the returned queue, replacing any previous subscription of the
+        channel. Connections are (re)opened in the background.
+        """
+        self.unsubscribe(channel)
+        for stream in streams:
+            if stream in self._stream_channels:
+                raise ValueError(f"Stream {stream} is already subscribed by channel {self._stream_channels[stream]}.")
+        self._channel_streams[channel] = list(streams)
+        self._channel_queues[channel] = asyncio.Queue()
+        for stream in streams:
+            self._stream_channels[stream] = channel
+        self._streams_changed.set()
+        if self._supervisor_task is None:
+            self._supervisor_task = safe_ensure_future(self._supervise_connections())
+        return self._channel_queues[channel]
+
+    def unsubscribe(self, channel: str):
+        if channel not in self._channel_streams:
+            return
+        for stream in self._channel_streams.pop(channel):
+            del self._stream_channels[stream]
+        del self._channel_queues[channel]
+        if len(self._channel_streams) > 0:
+            self._streams_changed.set()
+        else:
+            self.stop()
+
+    def stop(self):
+        if self._supervisor_task is not None:
+            self._supervisor_task.cancel()
+            self._supervisor_task = None
+        for task in self._connection_tasks.values():
+            task.cancel()
+        self._connection_tasks.clear()
+
+    def shard_streams(self, streams: List[str]) -> List[List[str]]:
+        """
+        Greedily packs the streams into as few connections as the stream count and URL length limits allow.
+        """
+        shards: List[List[str]] = []
+        current: List[str] = []
+        for stream in streams:
+            if len(current) > 0 and (len(current) >= self._max_streams_per_connection or
+                                     (self._max_url_length is not None and
+                                      len(self.connection_url(current + [stream])) > self._max_url_length)):
+                shards.append(current)
+                current = []
+            current.append(stream)
+        if len(current) > 0:
+            shards.append(current)
+        return shards
+
+    async def _supervise_connections(self):
+        while True:
+            await self._streams_changed.wait()
+            await asyncio.sleep(self.SUBSCRIPTION_DELAY)
+            self._streams_changed.clear()
+            shards: List[Tuple[str, ...]] = [tuple(shard) for shard in self.shard_streams(self.streams)]
+            # Connections whose streams did not change are kept open.
+            for shard in list(self._connection_tasks.keys()):
+                if shard not in shards:
+                    self._connection_tasks.pop(shard).cancel()
+            for shard in shards:
+                if shard not in self._connection_tasks:
+                    self._connection_tasks[shard] = safe_ensure_future(self._listen_to_shard(list(shard)))
+
+    async def _inner_messages(self, ws: websockets.WebSocketClientProtocol) -> AsyncIterable[str]:
+        # Terminate the recv() loop as soon as the next message timed out, so the outer loop can reconnect.
+        try:
+            while True:
+                try:
+                    msg: str = await asyncio.wait_for(ws.recv(), timeout=self.MESSAGE_TIMEOUT)
+                    yield msg
+                except asyncio.TimeoutError:
+                    pong_waiter = await ws.ping()
+                    await asyncio.wait_for(pong_waiter, timeout=self.PING_TIMEOUT)
+        except asyncio.TimeoutError:
+            self.logger().warning("WebSocket ping timed out. Going to reconnect...")
+            return
+        except ConnectionClosed:
+            return
+        finally:
+            await ws.close()
+
+    async def _listen_to_shard(self, streams: List[str]):
+        while True:
+            try:
+                ws = await websockets.connect(self.connection_url(streams))
+                for message in self.subscription_messages(streams):
+                    await ws.send(ujson.dumps(message))
+                async for raw_msg in self._inner_messages(ws):
+                    self._dispatch(raw_msg)
+            except asyncio.CancelledError:
+                raise
+            except Exception:
+                self.logger().error(f"Unexpected error with WebSocket connection. "
+                                    f"Retrying after {int(self.RECONNECT_DELAY)} seconds...",
+                                    exc_info=True)
+                await asyncio.sleep(self.RECONNECT_DELAY)
+
+    def _dispatch(self, raw_msg: str):
+        try:
+            parsed: Optional[Tuple[str, Any]] = self.parse_message(raw_msg)
+        except Exception:
+            self.logger().error(f"Unexpected message format received from WebSocket: {raw_msg}", exc_info=True)
+            return
+        if parsed is None:
+            return
+        stream, payload = parsed
+        channel: Optional[str] = self._stream_channels.get(stream)
+        if channel is not None:
+            self._channel_queues[channel].put_nowait(payload)
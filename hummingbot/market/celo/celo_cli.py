@@ -1,7 +1,9 @@
+import asyncio
 import subprocess
 from subprocess import CalledProcessError
 from decimal import Decimal
 from typing import List, Optional, Dict
+from hummingbot.core.utils import async_ttl_cache
 from hummingbot.market.celo.celo_data_types import CeloExchangeRate, CeloBalance
 
 
@@ -11,23 +13,47 @@ CELO_QUOTE = "CUSD"
 CELOCLI_CELO = "CELO"
 CELOCLI_CUSD = "cUSD"
 CELOCLI_LOCKED_CELO = "lockedCELO"
+# The number of seconds the exchange rates and balances fetched by the async methods are cached for.
+EXCHANGE_RATE_TTL = 5
+BALANCES_TTL = 10
+
+
+def output_from_raw_output(raw_output: bytes) -> Optional[str]:
+    output = raw_output.decode("utf-8").strip()
+
+    # ignore lines with "libusb".
+    output = "\n".join([line for line in output.split("\n") if "libusb" not in line])
+
+    if output == "":
+        output = None
+    return output
 
 
 def command(commands: List[str]) -> Optional[str]:
     try:
         output = subprocess.check_output(commands, stderr=subprocess.STDOUT, shell=False)
-        output = output.decode("utf-8").strip()
-
-        # ignore lines with "libusb".
-        output = "\n".join([line for line in output.split("\n") if "libusb" not in line])
-
-        if output == "":
-            output = None
-        return output
+        return output_from_raw_output(output)
     except CalledProcessError as e:
         raise Exception(error_msg_from_output(e.output))
 
 
+async def async_command(commands: List[str]) -> Optional[str]:
+    """
+    Runs the command like command does, but in a subprocess awaited on the event loop instead of blocking it.
+    """
+    process = await asyncio.create_subprocess_exec(*commands, stdout=asyncio.subprocess.PIPE,
+                                                   stderr=asyncio.subprocess.STDOUT)
+    try:
+        output, _ = await process.communicate()
+    except asyncio.CancelledError:
+        if process.returncode is None:
+            process.kill()
+        raise
+    if process.returncode != 0:
+        raise Exception(error_msg_from_output(output))
+    return output_from_raw_output(output)
+
+
 def error_msg_from_output(output):
     lines = output.decode("utf-8").split("\n")
     err_lines = [line for line in lines if "Error" in line]
@@ -39,6 +65,11 @@ def error_msg_from_output(output):
 
 
 class CeloCLI:
+    """
+    Runs the celocli commands. Every command has a blocking version and an async one (suffixed by _async), which
+    doesn't block the event loop while the celocli process runs. The async exchange rates and balances are cached for
+    a few seconds; the balances cache is cleared whenever an exchange transaction is sent.
+    """
     unlocked = False
     address = None
 
@@ -46,6 +77,7 @@ class CeloCLI:
     def unlock_account(cls, address: str, password: str) -> Optional[str]:
         try:
             cls.address = address
+            cls.balances_async.cache_clear()
             command(["celocli", "account:unlock", address, "--password", password])
             cls.unlocked = True
             return None
@@ -53,10 +85,32 @@ class CeloCLI:
             cls.unlocked = False
             return str(e)
 
+    @classmethod
+    async def unlock_account_async(cls, address: str, password: str) -> Optional[str]:
+        try:
+            cls.address = address
+            cls.balances_async.cache_clear()
+            await async_command(["celocli", "account:unlock", address, "--password", password])
+            cls.unlocked = True
+            return None
+        except Exception as e:
+            cls.unlocked = False
+            return str(e)
+
     @classmethod
     def balances(cls) -> Dict[str, CeloBalance]:
-        balances = {}
         output = command(["celocli", "account:balance", cls.address])
+        return cls._balances_from_output(output)
+
+    @classmethod
+    @async_ttl_cache(ttl=BALANCES_TTL, maxsize=1)
+    async def balances_async(cls) -> Dict[str, CeloBalance]:
+        output = await async_command(["celocli", "account:balance", cls.address])
+        return cls._balances_from_output(output)
+
+    @classmethod
+    def _balances_from_output(cls, output: str) -> Dict[str, CeloBalance]:
+        balances = {}
         lines = output.split("\n")
         raw_balances = {}
         data_type = [CELOCLI_CELO, CELOCLI_LOCKED_CELO, CELOCLI_CUSD, "pending"]
@@ -72,6 +126,17 @@ class CeloCLI:
     def exchange_rate(cls, amount: Decimal = Decimal("1")) -> List[CeloExchangeRate]:
         amount *= UNIT_MULTIPLIER
         output = command(["celocli", "exchange:show", "--amount", str(int(amount))])
+        return cls._exchange_rates_from_output(output)
+
+    @classmethod
+    @async_ttl_cache(ttl=EXCHANGE_RATE_TTL, maxsize=10)
+    async def exchange_rate_async(cls, amount: Decimal = Decimal("1")) -> List[CeloExchangeRate]:
+        amount *= UNIT_MULTIPLIER
+        output = await async_command(["celocli", "exchange:show", "--amount", str(int(amount))])
+        return cls._exchange_rates_from_output(output)
+
+    @classmethod
+    def _exchange_rates_from_output(cls, output: str) -> List[CeloExchangeRate]:
         lines = output.split("\n")
         rates = []
         for line in lines:
@@ -88,23 +153,49 @@ class CeloCLI:
 
     @classmethod
     def buy_cgld(cls, cusd_value: Decimal, min_cgld_returned: Decimal = None):
+        output = command(cls._buy_cgld_args(cusd_value, min_cgld_returned))
+        cls.balances_async.cache_clear()
+        return cls._tx_hash_from_exchange_output(output)
+
+    @classmethod
+    async def buy_cgld_async(cls, cusd_value: Decimal, min_cgld_returned: Decimal = None):
+        try:
+            output = await async_command(cls._buy_cgld_args(cusd_value, min_cgld_returned))
+        finally:
+            cls.balances_async.cache_clear()
+        return cls._tx_hash_from_exchange_output(output)
+
+    @classmethod
+    def _buy_cgld_args(cls, cusd_value: Decimal, min_cgld_returned: Decimal = None) -> List[str]:
         cusd_value *= UNIT_MULTIPLIER
         args = ["celocli", "exchange:dollars", "--from", cls.address, "--value", str(int(cusd_value))]
         if min_cgld_returned is not None:
             min_cgld_returned *= UNIT_MULTIPLIER
             args += ["--forAtLeast", str(int(min_cgld_returned))]
-        output = command(args)
-        return cls._tx_hash_from_exchange_output(output)
+        return args
 
     @classmethod
     def sell_cgld(cls, cgld_value: Decimal, min_cusd_returned: Decimal = None):
+        output = command(cls._sell_cgld_args(cgld_value, min_cusd_returned))
+        cls.balances_async.cache_clear()
+        return cls._tx_hash_from_exchange_output(output)
+
+    @classmethod
+    async def sell_cgld_async(cls, cgld_value: Decimal, min_cusd_returned: Decimal = None):
+        try:
+            output = await async_command(cls._sell_cgld_args(cgld_value, min_cusd_returned))
+        finally:
+            cls.balances_async.cache_clear()
+        return cls._tx_hash_from_exchange_output(output)
+
+    @classmethod
+    def _sell_cgld_args(cls, cgld_value: Decimal, min_cusd_returned: Decimal = None) -> List[str]:
         cgld_value *= UNIT_MULTIPLIER
         args = ["celocli", "exchange:gold", "--from", cls.address, "--value", str(int(cgld_value))]
         if min_cusd_returned is not None:
             min_cusd_returned *= UNIT_MULTIPLIER
             args += ["--forAtLeast", str(int(min_cusd_returned))]
-        output = command(args)
-        return cls._tx_hash_from_exchange_output(output)
+        return args
 
     @classmethod
     def _tx_hash_from_exchange_output(cls, output_msg):
@@ -115,6 +206,15 @@ class CeloCLI:
     @classmethod
     def validate_node_synced(cls) -> Optional[str]:
         output = command(["celocli", "node:synced"])
+        return cls._node_synced_error_from_output(output)
+
+    @classmethod
+    async def validate_node_synced_async(cls) -> Optional[str]:
+        output = await async_command(["celocli", "node:synced"])
+        return cls._node_synced_error_from_output(output)
+
+    @classmethod
+    def _node_synced_error_from_output(cls, output: str) -> Optional[str]:
         lines = output.split("\n")
         if "true" not in [line.strip().lower() for line in lines]:
             return lines[0]
@@ -150,6 +150,12 @@ class SQLConnectionManager:
     def get_shared_session(self) -> Session:
         return self._shared_session
 
+    def create_session(self, **kwargs) -> Session:
+        """
+        Creates a new session, e.g. for a thread other than the main one, which must not use the shared session.
+        """
+        return self._session_cls(**kwargs)
+
     def get_local_db_version(self):
         query: Query = (self._shared_session.query(LocalMetadata)
                         .filter(LocalMetadata.key == self.LOCAL_DB_VERSION_KEY))
@@ -0,0 +1,199 @@
+#!/usr/bin/env python
+
+import logging
+import queue
+import threading
+import time
+from typing import (
+    Callable,
+    List,
+    Optional
+)
+
+from sqlalchemy.orm import Session
+
+from hummingbot.logger import HummingbotLogger
+from hummingbot.model.sql_connection_manager import SQLConnectionManager
+
+# A write job adds or updates records through the session it is given. It may return a callable that is run once the
+# job is committed, e.g. to export the committed records.
+SQLWriteJob = Callable[[Session], Optional[Callable[[], None]]]
+
+# Queue items telling the writer thread to commit the current batch right away, and to stop after committing it.
+_FLUSH = object()
+_STOP = object()
+
+
+class SQLWriteQueueMetrics:
+    """
+    Statistics of the writes going through an SQLWriteQueue.
+    """
+
+    def __init__(self):
+        self.queue_depth: int = 0
+        self.max_queue_depth: int = 0
+        self.commit_latency: float = 0.0
+        self.max_commit_latency: float = 0.0
+        self.jobs_committed: int = 0
+        self.batches_committed: int = 0
+        self.jobs_failed: int = 0
+
+    def record_commit(self, jobs_count: int, commit_latency: float):
+        self.commit_latency = commit_latency
+        self.max_commit_latency = max(self.max_commit_latency, commit_latency)
+        self.jobs_committed += jobs_count
+        self.batches_committed += 1
+
+    def __repr__(self) -> str:
+        return (f"SQLWriteQueueMetrics(queue_depth={self.queue_depth}, max_queue_depth={self.max_queue_depth}, "
+                f"commit_latency={self.commit_latency:.4f}, max_commit_latency={self.max_commit_latency:.4f}, "
+                f"jobs_committed={self.jobs_committed}, batches_committed={self.batches_committed}, "
+                f"jobs_failed={self.jobs_failed})")
+
+
+class SQLWriteQueue:
+    """
+    Write-behind queue applying database writes on a dedicated thread, so they don't block the event loop.
+
+    Jobs are applied in the order they are queued, grouping the ones queued within the flush interval (up to the batch
+    size) into a single transaction. Since batches are committed in order, the database always holds a prefix of the
+    queued writes, even after a crash. If a batch fails, its jobs are retried one transaction each so a single faulty
+    job doesn't discard the others.
+    """
+
+    _swq_logger: Optional[HummingbotLogger] = None
+
+    @classmethod
+    def logger(cls) -> HummingbotLogger:
+        if cls._swq_logger is None:
+            cls._swq_logger = logging.getLogger(__name__)
+        return cls._swq_logger
+
+    def __init__(self,
+                 sql: SQLConnectionManager,
+                 flush_interval: float = 0.5,
+                 batch_size: int = 100,
+                 max_queue_size: int = 10000):
+        self._sql: SQLConnectionManager = sql
+        self._flush_interval: float = flush_interval
+        self._batch_size: int = batch_size
+        self._queue: queue.Queue = queue.Queue(maxsize=max_queue_size)
+        self._metrics: SQLWriteQueueMetrics = SQLWriteQueueMetrics()
+        self._thread: Optional[threading.Thread] = None
+        # Number of jobs queued and done (committed or failed), used to wait for the queue to be flushed.
+        self._jobs_queued: int = 0
+        self._jobs_done: int = 0
+        self._jobs_done_condition: threading.Condition = threading.Condition()
+
+    @property
+    def metrics(self) -> SQLWriteQueueMetrics:
+        self._metrics.queue_depth = self._queue.qsize()
+        return self._metrics
+
+    @property
+    def started(self) -> bool:
+        return self._thread is not None
+
+    def start(self):
+        if self._thread is not None:
+            return
+        self._thread = threading.Thread(target=self._run, name="SQLWriteQueue", daemon=True)
+        self._thread.start()
+
+    def stop(self, timeout: Optional[float] = None):
+        """
+        Commits the queued jobs and stops the writer thread.
+        """
+        if self._thread is None:
+            return
+        self._queue.put(_STOP)
+        self._thread.join(timeout)
+        self._thread = None
+
+    def put(self, job: SQLWriteJob):
+        """
+        Queues a write job. Blocks while the queue is full.
+        """
+        with self._jobs_done_condition:
+            self._jobs_queued += 1
+        if self._queue.full():
+            self.logger().warning(f"Database write queue is full ({self._queue.maxsize} jobs). "
+                                  f"Waiting for pending writes to be committed.")
+        self._queue.put(job)
+        self._metrics.max_queue_depth = max(self._metrics.max_queue_depth, self._queue.qsize())
+
+    def flush(self, timeout: Optional[float] = None) -> bool:
+        """
+        Waits until every job queued so far is committed.
+        :return: False if the timeout expired before that
+        """
+        with self._jobs_done_condition:
+            jobs_queued: int = self._jobs_queued
+            if self._thread is None or self._jobs_done >= jobs_queued:
+                return self._jobs_done >= jobs_queued
+        self._queue.put(_FLUSH)
+        with self._jobs_done_condition:
+            return self._jobs_done_condition.wait_for(lambda: self._jobs_done >= jobs_queued, timeout)
+
+    def _run(self):
+        stopping: bool = False
+        while not stopping:
+            item = self._queue.get()
+            batch: List[SQLWriteJob] = []
+            deadline: float = time.perf_counter() + self._flush_interval
+            while True:
+                if item is _STOP:
+                    stopping = True
+                    break
+                if item is _FLUSH:
+                    break
+                batch.append(item)
+                if len(batch) >= self._batch_size:
+                    break
+                try:
+                    item = self._queue.get(timeout=max(0.0, deadline - time.perf_counter()))
+                except queue.Empty:
+                    break
+            if len(batch) > 0:
+                self._commit(batch)
+
+    def _commit(self, batch: List[SQLWriteJob]):
+        start: float = time.perf_counter()
+        try:
+            self._apply(batch)
+        except Exception:
+            self.logger().error(f"Failed to commit {len(batch)} database writes together. Retrying one by one.",
+                                exc_info=True)
+            for job in batch:
+                try:
+                    self._apply([job])
+                except Exception:
+                    self._metrics.jobs_failed += 1
+                    self.logger().error("Failed to commit database write.", exc_info=True)
+        self._metrics.record_commit(len(batch), time.perf_counter() - start)
+        with self._jobs_done_condition:
+            self._jobs_done += len(batch)
+            self._jobs_done_condition.notify_all()
+
+    def _apply(self, jobs: List[SQLWriteJob]):
+        # The callbacks run after the commit, within the same session so they can still load relationships. Committed
+        # records don't need to be reloaded for that.
+        session: Session = self._sql.create_session(expire_on_commit=False)
+        after_commit_callbacks: List[Callable[[], None]] = []
+        try:
+            try:
+                for job in jobs:
+                    callback: Optional[Callable[[], None]] = job(session)
+                    if callback is not None:
+                        after_commit_callbacks.append(callback)
+                session.commit()
+            except Exception:
+                session.rollback()
+                raise
+            for callback in after_commit_callbacks:
+                try:
+                    callback()
+                except Exception:
+                    self.logger().error("Unexpected error after committing database write.", exc_info=True)
+        finally:
+            session.close()
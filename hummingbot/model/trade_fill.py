@@ -1,6 +1,7 @@
 #!/usr/bin/env python
 import numpy
 import pandas as pd
+import ujson
 from typing import (
     Any,
     Dict,
@@ -15,7 +16,8 @@ from sqlalchemy import (
     Index,
     BigInteger,
     Float,
-    JSON
+    JSON,
+    type_coerce
 )
 from sqlalchemy.orm import (
     relationship,
@@ -57,6 +59,10 @@ class TradeFill(HummingbotBase):
     position = Column(Text, nullable=True)
     order = relationship("Order", back_populates="trade_fills")
 
+    # Fields PerformanceMetrics computes the performance of the trades from.
+    PERFORMANCE_COLUMNS: List[str] = ["market", "symbol", "trade_type", "price", "amount", "order_id", "position",
+                                      "trade_fee"]
+
     def __repr__(self) -> str:
         return f"TradeFill(id={self.id}, config_file_path='{self.config_file_path}', strategy='{self.strategy}', " \
             f"market='{self.market}', symbol='{self.symbol}', base_asset='{self.base_asset}', " \
@@ -103,6 +109,38 @@ class TradeFill(HummingbotBase):
                                              .all())
         return trades
 
+    @classmethod
+    def get_performance_dataframe(cls,
+                                  sql_session: Session,
+                                  start_time: Optional[int] = None,
+                                  config_file_path: Optional[str] = None) -> pd.DataFrame:
+        """
+        Loads the fields of the trades needed by PerformanceMetrics, in timestamp order, with a single query and
+        without building the ORM objects.
+        """
+        filters = []
+        if start_time is not None:
+            filters.append(TradeFill.timestamp >= start_time)
+        if config_file_path is not None:
+            filters.append(TradeFill.config_file_path.like(f"%{config_file_path}%"))
+        # The fees are decoded with ujson, which is much faster than the JSON column type decoding them one by one.
+        columns = [getattr(TradeFill, column) if column != "trade_fee" else type_coerce(TradeFill.trade_fee, Text)
+                   for column in cls.PERFORMANCE_COLUMNS]
+        rows = (sql_session
+                .query(*columns)
+                .filter(*filters)
+                .order_by(TradeFill.timestamp.asc())
+                .all())
+        trades: pd.DataFrame = pd.DataFrame.from_records(rows, columns=cls.PERFORMANCE_COLUMNS)
+        trades["trade_fee"] = [ujson.loads(trade_fee) for trade_fee in trades["trade_fee"].tolist()]
+        return trades
+
+    @classmethod
+    def to_performance_dataframe(cls, trades: List["TradeFill"]) -> pd.DataFrame:
+        return pd.DataFrame.from_records([[getattr(trade, column) for column in cls.PERFORMANCE_COLUMNS]
+                                          for trade in trades],
+                                         columns=cls.PERFORMANCE_COLUMNS)
+
     @classmethod
     def to_pandas(cls, trades: List):
         columns: List[str] = ["Index",
@@ -21,12 +21,15 @@ cdef class CeloArbStrategy(StrategyBase):
         int64_t _logging_options
         list _celo_orders
         bint _hb_app_notification
-        object _async_scheduler
         object _main_task
         bint _mock_celo_cli_mode
         object _trade_profits
-        object _ev_loop
+        dict _celo_balances
 
     cdef c_main(self)
-    cdef c_execute_buy_celo_sell_ctp(self, object trade_profit)
-    cdef c_execute_sell_celo_buy_ctp(self, object trade_profit)
+    cdef c_did_check_node_synced(self, str err_msg)
+    cdef list c_get_arb_trades(self)
+    cdef object c_celo_order_args(self, object trade_profit, dict celo_bals)
+    cdef object c_buy_celo_sell_ctp_args(self, object celo_buy_trade, dict celo_bals)
+    cdef object c_sell_celo_buy_ctp_args(self, object celo_sell_trade, dict celo_bals)
+    cdef c_did_send_celo_order(self, object trade_profit, str tx_hash, object celo_amount, object ctp_amount)
@@ -9,13 +9,12 @@ from typing import (
 )
 import pandas as pd
 import asyncio
-from functools import partial
 from hummingbot.core.clock cimport Clock
 from hummingbot.logger import HummingbotLogger
 from hummingbot.core.data_type.limit_order cimport LimitOrder
 from hummingbot.core.data_type.limit_order import LimitOrder
 from hummingbot.core.network_iterator import NetworkStatus
-from hummingbot.core.utils.async_call_scheduler import AsyncCallScheduler, safe_ensure_future
+from hummingbot.core.utils.async_utils import safe_ensure_future, safe_gather
 from hummingbot.connector.exchange_base import ExchangeBase
 from hummingbot.connector.exchange_base cimport ExchangeBase
 from hummingbot.strategy.market_trading_pair_tuple import MarketTradingPairTuple
@@ -26,6 +25,8 @@ from hummingbot.market.celo.celo_cli import (
     CELO_QUOTE,
 )
 from hummingbot.market.celo.celo_data_types import (
+    CeloBalance,
+    CeloExchangeRate,
     CeloOrder,
     CeloArbTradeProfit
 )
@@ -41,10 +42,40 @@ NaN = float("nan")
 s_decimal_zero = Decimal(0)
 ds_logger = None
 NODE_SYNCED_CHECK_INTERVAL = 60.0 * 5.0
+MAIN_PROCESS_TIMEOUT = 30.0
+
+
+def get_celo_buy_amount(market, trading_pair: str, order_amount: Decimal) -> Decimal:
+    # Celo exchange rate show buy result in USD amount
+    query_result = market.get_vwap_for_volume(trading_pair, False, float(order_amount))
+    return Decimal(str(query_result.result_price)) * order_amount
 
 
 def get_trade_profits(market, trading_pair: str, order_amount: Decimal) -> List[CeloArbTradeProfit]:
     order_amount = Decimal(str(order_amount))
+    celo_buy_ex_rates = CeloCLI.exchange_rate(get_celo_buy_amount(market, trading_pair, order_amount))
+    celo_sell_ex_rates = CeloCLI.exchange_rate(order_amount)
+    return calculate_trade_profits(market, trading_pair, order_amount, celo_buy_ex_rates, celo_sell_ex_rates)
+
+
+async def get_trade_profits_async(market, trading_pair: str, order_amount: Decimal) -> List[CeloArbTradeProfit]:
+    order_amount = Decimal(str(order_amount))
+    celo_buy_ex_rates, celo_sell_ex_rates = await safe_gather(
+        CeloCLI.exchange_rate_async(get_celo_buy_amount(market, trading_pair, order_amount)),
+        CeloCLI.exchange_rate_async(order_amount)
+    )
+    return calculate_trade_profits(market, trading_pair, order_amount, celo_buy_ex_rates, celo_sell_ex_rates)
+
+
+def calculate_trade_profits(market,
+                            trading_pair: str,
+                            order_amount: Decimal,
+                            celo_buy_ex_rates: List[CeloExchangeRate],
+                            celo_sell_ex_rates: List[CeloExchangeRate]) -> List[CeloArbTradeProfit]:
+    """
+    :param celo_buy_ex_rates: the Celo exchange rates for the cUSD amount the counter party order amount sells for
+    :param celo_sell_ex_rates: the Celo exchange rates for the order amount
+    """
     results = []
     # Find Celo counter party price for the order_amount
     # volume weighted average price is used for profit calculation.
@@ -58,13 +89,9 @@ def get_trade_profits(market, trading_pair: str, order_amount: Decimal) -> List[
     ctp_vwap_sell = Decimal(str(query_result.result_price))
     query_result = market.get_price_for_volume(trading_pair, False, float(order_amount))
     ctp_sell = Decimal(str(query_result.result_price))
-    # Celo exchange rate show buy result in USD amount
-    celo_buy_amount = ctp_vwap_sell * order_amount
-    celo_ex_rates = CeloCLI.exchange_rate(celo_buy_amount)
-    celo_buy_ex_rate = [r for r in celo_ex_rates if r.to_token == CELO_BASE and r.from_token == CELO_QUOTE][0]
+    celo_buy_ex_rate = [r for r in celo_buy_ex_rates if r.to_token == CELO_BASE and r.from_token == CELO_QUOTE][0]
     celo_buy = celo_buy_ex_rate.from_amount / celo_buy_ex_rate.to_amount
-    celo_ex_rates = CeloCLI.exchange_rate(order_amount)
-    celo_sell_ex_rate = [r for r in celo_ex_rates if r.from_token == CELO_BASE and r.to_token == CELO_QUOTE][0]
+    celo_sell_ex_rate = [r for r in celo_sell_ex_rates if r.from_token == CELO_BASE and r.to_token == CELO_QUOTE][0]
     celo_sell = celo_sell_ex_rate.to_amount / celo_sell_ex_rate.from_amount
     celo_buy_profit = (ctp_vwap_sell - celo_buy) / celo_buy
     results.append(CeloArbTradeProfit(True, ctp_sell, ctp_vwap_sell, celo_buy, celo_buy_profit))
@@ -108,12 +135,11 @@ cdef class CeloArbStrategy(StrategyBase):
         self._mock_celo_cli_mode = mock_celo_cli_mode
         self._last_no_arb_reported = 0
         self._trade_profits = None
+        self._celo_balances = None
         self._celo_orders = []
         self._all_markets_ready = False
         self._logging_options = logging_options
 
-        self._ev_loop = asyncio.get_event_loop()
-        self._async_scheduler = None
         self._main_task = None
         self._last_synced_checked = 0
         self._node_synced = False
@@ -143,6 +169,10 @@ cdef class CeloArbStrategy(StrategyBase):
     def celo_orders(self) -> List[CeloOrder]:
         return self._celo_orders
 
+    @property
+    def celo_balances(self) -> Dict[str, CeloBalance]:
+        return self._celo_balances
+
     @property
     def active_bids(self) -> List[Tuple[ExchangeBase, LimitOrder]]:
         return self._sb_order_tracker.active_bids
@@ -195,7 +225,8 @@ cdef class CeloArbStrategy(StrategyBase):
         warning_lines.extend(self.network_warning([self._market_info]))
 
         assets_df = self.wallet_balance_data_frame([self._market_info])
-        celo_bals = CeloCLI.balances()
+        # The balances fetched by the last main process, the status is displayed without waiting for celocli.
+        celo_bals = self._celo_balances or {}
         series = []
         for token, bal in celo_bals.items():
             series.append(pd.Series(["Celo", token, round(bal.total, 2), round(bal.available(), 2)],
@@ -235,8 +266,6 @@ cdef class CeloArbStrategy(StrategyBase):
             bint should_report_warnings = ((current_tick > last_tick) and
                                            (self._logging_options & self.OPTION_LOG_STATUS_REPORT))
         try:
-            if self._async_scheduler is None:
-                self._async_scheduler = AsyncCallScheduler(call_interval=1)
             if not self._all_markets_ready:
                 self._all_markets_ready = all([market.ready for market in self._sb_markets])
                 if not self._all_markets_ready:
@@ -261,39 +290,116 @@ cdef class CeloArbStrategy(StrategyBase):
         if self._mock_celo_cli_mode:
             self.main_process()
         else:
+            # The tick doesn't wait for celocli, the main process runs in the background (one at a time) and the
+            # tick only reads the trade profits and balances it fetched.
             if self._main_task is None or self._main_task.done():
-                coro = self._async_scheduler.call_async(self.main_process, timeout_seconds=30)
-                self._main_task = safe_ensure_future(coro)
+                self._main_task = safe_ensure_future(self.main_process_async())
 
     def main_process(self):
+        """
+        Runs the main process with the blocking celocli commands, used in mock celo cli mode.
+        """
         if self._last_synced_checked < self._current_timestamp - NODE_SYNCED_CHECK_INTERVAL:
-            err_msg = CeloCLI.validate_node_synced()
-            self._node_synced = err_msg is None
-            self._last_synced_checked = self._current_timestamp
-            check_msg = "synced" if err_msg is None else f"Error: {err_msg}"
-            self.log_with_clock(logging.INFO, f"Node sync check - {check_msg}")
+            self.c_did_check_node_synced(CeloCLI.validate_node_synced())
         if not self._node_synced:
             return
         self._trade_profits = get_trade_profits(self._market_info.market, self._market_info.trading_pair, self._order_amount)
+        self._celo_balances = CeloCLI.balances()
+        for arb_trade in self.c_get_arb_trades():
+            order_args = self.c_celo_order_args(arb_trade, self._celo_balances)
+            if order_args is None:
+                continue
+            celo_amount, celo_value, min_returned, ctp_amount = order_args
+            try:
+                if arb_trade.is_celo_buy:
+                    tx_hash = CeloCLI.buy_cgld(celo_value, min_cgld_returned=min_returned)
+                else:
+                    tx_hash = CeloCLI.sell_cgld(celo_value, min_cusd_returned=min_returned)
+            except Exception as err:
+                self.log_with_clock(logging.INFO, str(err))
+                continue
+            self.c_did_send_celo_order(arb_trade, tx_hash, celo_amount, ctp_amount)
+            self._celo_balances = CeloCLI.balances()
+
+    async def main_process_async(self):
+        """
+        Runs the main process with the async celocli commands, which don't block the event loop. Fetching the node
+        status, exchange rates and balances is bounded by MAIN_PROCESS_TIMEOUT. Sending the Celo exchange
+        transactions and their hedges is not: it is shielded from the timeout and from cancellation, as killing
+        celocli mid send would leave a sent transaction unhedged.
+        """
+        try:
+            await asyncio.wait_for(self.update_trade_profits_async(), timeout=MAIN_PROCESS_TIMEOUT)
+        except asyncio.TimeoutError:
+            self.log_with_clock(logging.WARNING, "Timed out fetching the Celo node status, exchange rates and balances.")
+            return
+        if not self._node_synced:
+            return
+        await asyncio.shield(self.send_arb_orders_async())
+
+    async def update_trade_profits_async(self):
+        """
+        Checks the node is synced, then fetches the exchange rates and the balances concurrently (they are cached by
+        CeloCLI for a few seconds).
+        """
+        if self._last_synced_checked < self._current_timestamp - NODE_SYNCED_CHECK_INTERVAL:
+            self.c_did_check_node_synced(await CeloCLI.validate_node_synced_async())
+        if not self._node_synced:
+            return
+        self._trade_profits, self._celo_balances = await safe_gather(
+            get_trade_profits_async(self._market_info.market, self._market_info.trading_pair, self._order_amount),
+            CeloCLI.balances_async()
+        )
+
+    async def send_arb_orders_async(self):
+        """
+        Sends the Celo exchange transactions of the arbitrage opportunities and hedges each on the CTP market. The
+        transactions are sent one after the other, they are sent from the same account.
+        """
+        for arb_trade in self.c_get_arb_trades():
+            order_args = self.c_celo_order_args(arb_trade, self._celo_balances)
+            if order_args is None:
+                continue
+            celo_amount, celo_value, min_returned, ctp_amount = order_args
+            try:
+                if arb_trade.is_celo_buy:
+                    tx_hash = await CeloCLI.buy_cgld_async(celo_value, min_cgld_returned=min_returned)
+                else:
+                    tx_hash = await CeloCLI.sell_cgld_async(celo_value, min_cusd_returned=min_returned)
+            except Exception as err:
+                self.log_with_clock(logging.INFO, str(err))
+                continue
+            self.c_did_send_celo_order(arb_trade, tx_hash, celo_amount, ctp_amount)
+            self._celo_balances = await CeloCLI.balances_async()
+
+    cdef c_did_check_node_synced(self, str err_msg):
+        self._node_synced = err_msg is None
+        self._last_synced_checked = self._current_timestamp
+        check_msg = "synced" if err_msg is None else f"Error: {err_msg}"
+        self.log_with_clock(logging.INFO, f"Node sync check - {check_msg}")
+
+    cdef list c_get_arb_trades(self):
         arb_trades = [t for t in self._trade_profits if t.profit >= self._min_profitability]
         if len(arb_trades) == 0:
             if self._last_no_arb_reported < self._current_timestamp - 20:
                 self.logger().info(f"No arbitrage opportunity: {self._trade_profits[0]} {self._trade_profits[1]}")
                 self._last_no_arb_reported = self._current_timestamp
-            return
         for arb_trade in arb_trades:
             self.logger().info(f"Found arbitrage opportunity!: {arb_trade}")
-            if arb_trade.is_celo_buy:
-                self.c_execute_buy_celo_sell_ctp(arb_trade)
-            else:
-                self.c_execute_sell_celo_buy_ctp(arb_trade)
+        return arb_trades
 
-    cdef c_execute_buy_celo_sell_ctp(self, object celo_buy_trade):
+    cdef object c_celo_order_args(self, object trade_profit, dict celo_bals):
         """
-        Executes arbitrage trades for the input trade profit tuple.
+        Checks the balances required by the arbitrage trades for the input trade profit tuple.
 
-        :type celo_buy_trade: tuple
+        :return: the Celo order amount, the value and minimum amount returned to send the Celo order with and the
+        counter party order amount, None if the trades can't be made
         """
+        if trade_profit.is_celo_buy:
+            return self.c_buy_celo_sell_ctp_args(trade_profit, celo_bals)
+        return self.c_sell_celo_buy_ctp_args(trade_profit, celo_bals)
+
+    cdef object c_buy_celo_sell_ctp_args(self, object celo_buy_trade, dict celo_bals):
         cdef:
             object quantized_buy_amount
             object quantized_sell_amount
@@ -312,7 +418,6 @@ cdef class CeloArbStrategy(StrategyBase):
                                f"({sell_balance}) is below required sell amount ({quantized_sell_amount}).")
             return
         cusd_required = buy_amount * celo_buy_trade.celo_price
-        celo_bals = CeloCLI.balances()
         if celo_bals[CELO_QUOTE].available() < cusd_required:
             self.logger().info(f"Can't arbitrage, Celo {CELO_QUOTE} available balance "
                                f"({celo_bals[CELO_QUOTE].available()}) is below required buy amount "
@@ -321,34 +426,9 @@ cdef class CeloArbStrategy(StrategyBase):
         self.log_with_clock(logging.INFO,
                             f"Buying {buy_amount} {CELO_BASE} at Celo at {celo_buy_trade.celo_price:.3f} price")
         min_cgld_returned = buy_amount * (Decimal("1") - self._celo_slippage_buffer)
-        try:
-            tx_hash = CeloCLI.buy_cgld(cusd_required, min_cgld_returned=min_cgld_returned)
-        except Exception as err:
-            self.log_with_clock(logging.INFO, str(err))
-            return
-        celo_order = CeloOrder(tx_hash, True, celo_buy_trade.celo_price, buy_amount, self._current_timestamp)
-        self._celo_orders.append(celo_order)
-        self.log_n_notify(f"Bought {celo_order.amount} {CELO_BASE} at Celo at {celo_order.price:.3f} price "
-                          f"and selling {quantized_sell_amount} {self._market_info.base_asset} at "
-                          f"{market.name} ({self._market_info.trading_pair}) "
-                          f"at {celo_buy_trade.ctp_price:.3f} price. "
-                          f"Arb profit: {celo_buy_trade.profit:.2%}")
-        if self._mock_celo_cli_mode:
-            self.sell_with_specific_market(self._market_info, quantized_sell_amount, order_type=OrderType.LIMIT,
-                                           price=celo_buy_trade.ctp_price)
-        else:
-            self._ev_loop.call_soon_threadsafe(partial(self.sell_with_specific_market,
-                                                       self._market_info,
-                                                       quantized_sell_amount,
-                                                       order_type=OrderType.LIMIT,
-                                                       price=celo_buy_trade.ctp_price))
+        return buy_amount, cusd_required, min_cgld_returned, quantized_sell_amount
 
-    cdef c_execute_sell_celo_buy_ctp(self, object celo_sell_trade):
-        """
-        Executes arbitrage trades for the input trade profit tuple.
-
-        :type celo_sell_trade: tuple
-        """
+    cdef object c_sell_celo_buy_ctp_args(self, object celo_sell_trade, dict celo_bals):
         cdef:
             object quantized_buy_amount
             object quantized_sell_amount
@@ -370,7 +450,6 @@ cdef class CeloArbStrategy(StrategyBase):
                                f"{self._market_info.quote_asset} balance "
                                f"({buy_balance}) is below required buy amount ({buy_required}).")
             return
-        celo_bals = CeloCLI.balances()
         if celo_bals[CELO_BASE].available() < sell_amount:
             self.logger().info(f"Can't arbitrage, Celo {CELO_BASE} available balance "
                                f"({celo_bals[CELO_BASE].available()}) is below required sell amount "
@@ -380,27 +459,34 @@ cdef class CeloArbStrategy(StrategyBase):
                             f"Selling {sell_amount} {CELO_BASE} at Celo at {celo_sell_trade.celo_price:.3f}")
         min_cusd_returned = sell_amount * celo_sell_trade.celo_price * (Decimal("1") -
                                                                         self._celo_slippage_buffer)
-        try:
-            tx_hash = CeloCLI.sell_cgld(sell_amount, min_cusd_returned=min_cusd_returned)
-        except Exception as err:
-            self.log_with_clock(logging.INFO, str(err))
-            return
-        celo_order = CeloOrder(tx_hash, False, celo_sell_trade.celo_price, sell_amount, self._current_timestamp)
+        return sell_amount, sell_amount, min_cusd_returned, quantized_buy_amount
+
+    cdef c_did_send_celo_order(self, object trade_profit, str tx_hash, object celo_amount, object ctp_amount):
+        """
+        Records the Celo order sent for the input trade profit tuple, and places the counter party order.
+        """
+        cdef:
+            ExchangeBase market = self._market_info.market
+
+        celo_order = CeloOrder(tx_hash, trade_profit.is_celo_buy, trade_profit.celo_price, celo_amount,
+                               self._current_timestamp)
         self._celo_orders.append(celo_order)
-        self.log_n_notify(f"Sold {celo_order.amount} {CELO_BASE} at Celo at {celo_order.price:.3f} "
-                          f"price and buying {quantized_buy_amount} {self._market_info.base_asset} at "
-                          f"{market.name} ({self._market_info.trading_pair}) "
-                          f"at {celo_sell_trade.ctp_price:.3f} price. "
-                          f"Arb profit: {celo_sell_trade.profit:.2%}")
-        if self._mock_celo_cli_mode:
-            self.buy_with_specific_market(self._market_info, quantized_buy_amount, order_type=OrderType.LIMIT,
-                                          price=celo_sell_trade.ctp_price)
+        if trade_profit.is_celo_buy:
+            self.log_n_notify(f"Bought {celo_order.amount} {CELO_BASE} at Celo at {celo_order.price:.3f} price "
+                              f"and selling {ctp_amount} {self._market_info.base_asset} at "
+                              f"{market.name} ({self._market_info.trading_pair}) "
+                              f"at {trade_profit.ctp_price:.3f} price. "
+                              f"Arb profit: {trade_profit.profit:.2%}")
+            self.sell_with_specific_market(self._market_info, ctp_amount, order_type=OrderType.LIMIT,
+                                           price=trade_profit.ctp_price)
         else:
-            self._ev_loop.call_soon_threadsafe(partial(self.buy_with_specific_market,
-                                                       self._market_info,
-                                                       quantized_buy_amount,
-                                                       order_type=OrderType.LIMIT,
-                                                       price=celo_sell_trade.ctp_price))
+            self.log_n_notify(f"Sold {celo_order.amount} {CELO_BASE} at Celo at {celo_order.price:.3f} "
+                              f"price and buying {ctp_amount} {self._market_info.base_asset} at "
+                              f"{market.name} ({self._market_info.trading_pair}) "
+                              f"at {trade_profit.ctp_price:.3f} price. "
+                              f"Arb profit: {trade_profit.profit:.2%}")
+            self.buy_with_specific_market(self._market_info, ctp_amount, order_type=OrderType.LIMIT,
+                                          price=trade_profit.ctp_price)
 
     def log_n_notify(self, msg: str):
         self.log_with_clock(logging.INFO, msg)
@@ -0,0 +1,134 @@
+#!/usr/bin/env python
+
+"""
+Compares the admission cost of AsyncThrottler against the previous implementation, which kept every task log of the
+throttler in one shared list, summed it for every related limit on every capacity check and flushed it with
+list.remove.
+
+10k requests spread over a few endpoints linked to a shared pool are queued at once. The limits are large enough for
+all of them to be admitted within the time window, so the logs keep growing and the cost of every capacity check shows.
+"""
+
+import asyncio
+import time
+from typing import (
+    List,
+    Tuple
+)
+
+from hummingbot.core.api_throttler.async_throttler import AsyncThrottler
+from hummingbot.core.api_throttler.data_types import (
+    LinkedLimitWeightPair,
+    RateLimit,
+    TaskLog
+)
+
+REQUESTS: int = 10000
+ENDPOINTS: List[str] = [f"/endpoint_{i}" for i in range(5)]
+POOL_ID: str = "REQUEST_WEIGHT"
+RATE_LIMITS: List[RateLimit] = [RateLimit(limit_id=POOL_ID, limit=REQUESTS * 10, time_interval=60)] + [
+    RateLimit(limit_id=endpoint, limit=REQUESTS, time_interval=60, linked_limits=[LinkedLimitWeightPair(POOL_ID, 2)])
+    for endpoint in ENDPOINTS
+]
+
+
+class LegacyRequestContext:
+    """
+    The list based request context AsyncThrottler used before, kept here as the baseline.
+    """
+
+    def __init__(self,
+                 task_logs: List[TaskLog],
+                 rate_limit: RateLimit,
+                 related_limits: List[Tuple[RateLimit, int]],
+                 lock: asyncio.Lock,
+                 safety_margin_pct: float,
+                 retry_interval: float = 0.1):
+        self._task_logs = task_logs
+        self._rate_limit = rate_limit
+        self._related_limits = related_limits
+        self._lock = lock
+        self._safety_margin_pct = safety_margin_pct
+        self._retry_interval = retry_interval
+
+    def flush(self):
+        now: float = time.time()
+        for task in self._task_logs:
+            task_limit: RateLimit = task.rate_limit
+            elapsed: float = now - task.timestamp
+            if elapsed > task_limit.time_interval + (task_limit.time_interval * self._safety_margin_pct):
+                self._task_logs.remove(task)
+
+    def within_capacity(self) -> bool:
+        now: float = time.time()
+        for rate_limit, weight in self._related_limits:
+            capacity_used: int = sum([task.weight
+                                      for task in self._task_logs
+                                      if rate_limit.limit_id == task.rate_limit.limit_id and
+                                      now - task.timestamp - (task.rate_limit.time_interval * self._safety_margin_pct) <= task.rate_limit.time_interval])
+            if capacity_used + weight > rate_limit.limit:
+                return False
+        return True
+
+    async def acquire(self):
+        while True:
+            async with self._lock:
+                self.flush()
+                if self.within_capacity():
+                    break
+            await asyncio.sleep(self._retry_interval)
+        async with self._lock:
+            now = time.time()
+            self._task_logs.append(TaskLog(timestamp=now, rate_limit=self._rate_limit, weight=self._rate_limit.weight))
+            for limit, weight in self._related_limits:
+                self._task_logs.append(TaskLog(timestamp=now, rate_limit=limit, weight=weight))
+
+    async def __aenter__(self):
+        await self.acquire()
+
+    async def __aexit__(self, exc_type, exc, tb):
+        pass
+
+
+class LegacyThrottler(AsyncThrottler):
+
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self._legacy_task_logs: List[TaskLog] = []
+
+    def execute_task(self, limit_id: str) -> LegacyRequestContext:
+        rate_limit, related_rate_limits = self.get_related_limits(limit_id=limit_id)
+        return LegacyRequestContext(
+            task_logs=self._legacy_task_logs,
+            rate_limit=rate_limit,
+            related_limits=related_rate_limits,
+            lock=self._lock,
+            safety_margin_pct=self._safety_margin_pct,
+            retry_interval=self._retry_interval,
+        )
+
+
+async def request(throttler: AsyncThrottler, limit_id: str):
+    async with throttler.execute_task(limit_id=limit_id):
+        pass
+
+
+async def time_requests(throttler: AsyncThrottler) -> float:
+    start: float = time.perf_counter()
+    await asyncio.gather(*[request(throttler, ENDPOINTS[i % len(ENDPOINTS)]) for i in range(REQUESTS)])
+    return time.perf_counter() - start
+
+
+def main():
+    ev_loop: asyncio.AbstractEventLoop = asyncio.get_event_loop()
+    legacy_s: float = ev_loop.run_until_complete(time_requests(LegacyThrottler(RATE_LIMITS)))
+    current_s: float = ev_loop.run_until_complete(time_requests(AsyncThrottler(RATE_LIMITS)))
+    print(f"{REQUESTS} queued requests")
+    print(f"{'implementation':>16} {'total (s)':>10} {'per request (us)':>18}")
+    print(f"{'list (legacy)':>16} {legacy_s:>10.3f} {legacy_s / REQUESTS * 1e6:>18.1f}")
+    print(f"{'per-limit deques':>16} {current_s:>10.3f} {current_s / REQUESTS * 1e6:>18.1f}")
+    print(f"speedup: {legacy_s / current_s:.1f}x")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,91 @@
+#!/usr/bin/env python
+
+"""
+Compares the signing of a ladder of Loopring orders on the event loop, the way LoopringExchange signed them before,
+against the signing of the same orders through a SigningExecutor.
+
+Every order of the ladder is placed at once (the way a strategy places its orders on a tick). Besides the orders signed
+per second, the longest time a heartbeat coroutine waited past its 10 ms interval is reported, which is how long the
+clock and the websocket consumers were stalled.
+"""
+
+import asyncio
+import time
+from typing import (
+    Awaitable,
+    Callable,
+    List,
+    Tuple
+)
+
+from hummingbot.connector.exchange.loopring.loopring_signing import (
+    init_signing_worker,
+    sign_order
+)
+from hummingbot.core.utils.signing_executor import SigningExecutor
+
+ORDERS: int = 40
+PRIVATE_KEY: str = "0x4c388e8b1a7b38aa6d2ac3fb2a5c5c6a3a8a6e6a7c2a4d8f9e2b3c4d5e6f7a8"
+HEARTBEAT_INTERVAL: float = 0.01
+
+
+def serialized_orders() -> List[List[int]]:
+    return [[0x35, 1000 + i, 12345, 0, 1, 10 ** 18 + i, 2 * 10 ** 18, int(time.time()) + 604800, 50, 0, 0]
+            for i in range(ORDERS)]
+
+
+async def timed_with_heartbeat(place_orders: Callable[[], Awaitable]) -> Tuple[float, float]:
+    max_lag: float = 0
+    done: asyncio.Event = asyncio.Event()
+
+    async def heartbeat():
+        nonlocal max_lag
+        while not done.is_set():
+            start: float = time.perf_counter()
+            await asyncio.sleep(HEARTBEAT_INTERVAL)
+            max_lag = max(max_lag, time.perf_counter() - start - HEARTBEAT_INTERVAL)
+
+    heartbeat_task = asyncio.ensure_future(heartbeat())
+    await asyncio.sleep(HEARTBEAT_INTERVAL)
+    start: float = time.perf_counter()
+    await place_orders()
+    elapsed: float = time.perf_counter() - start
+    done.set()
+    await heartbeat_task
+    return elapsed, max_lag
+
+
+async def benchmark():
+    orders: List[List[int]] = serialized_orders()
+
+    async def sign_on_event_loop():
+        # Each order was signed in place_order, before its request was sent.
+        async def place_order(order: List[int]):
+            return sign_order(order, PRIVATE_KEY)
+        return await asyncio.gather(*[place_order(order) for order in orders])
+
+    executor: SigningExecutor = SigningExecutor(initializer=init_signing_worker)
+    await executor.start()
+
+    async def sign_in_executor():
+        return await asyncio.gather(*[executor.submit(sign_order, order, PRIVATE_KEY) for order in orders])
+
+    init_signing_worker()
+    try:
+        inline_s, inline_lag = await timed_with_heartbeat(sign_on_event_loop)
+        executor_s, executor_lag = await timed_with_heartbeat(sign_in_executor)
+    finally:
+        executor.shutdown()
+
+    print(f"{ORDERS} orders, {executor.max_workers} signing workers")
+    print(f"{'signing':>12} {'orders/s':>10} {'max loop stall (ms)':>20}")
+    print(f"{'event loop':>12} {ORDERS / inline_s:>10.1f} {inline_lag * 1e3:>20.1f}")
+    print(f"{'executor':>12} {ORDERS / executor_s:>10.1f} {executor_lag * 1e3:>20.1f}")
+
+
+def main():
+    asyncio.get_event_loop().run_until_complete(benchmark())
+
+
+if __name__ == "__main__":
+    main()
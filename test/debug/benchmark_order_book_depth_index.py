@@ -0,0 +1,68 @@
+#!/usr/bin/env python
+
+"""
+Compares order book depth queries walking the book against the opt-in cumulative depth index.
+
+Every iteration applies one diff (which invalidates the index) and then runs a number of VWAP queries reaching
+halfway into the book, which is what a strategy tick does after an order book update. The index only pays off once
+enough queries share a rebuild, so the output reports the smallest depth at which the indexed book wins for each
+query count.
+"""
+
+import time
+from typing import (
+    List,
+    Optional
+)
+
+import numpy as np
+
+from hummingbot.core.data_type.order_book import OrderBook
+
+DEPTHS: List[int] = [10, 50, 100, 250, 500, 1000, 2500, 5000]
+QUERIES_PER_UPDATE: List[int] = [1, 2, 4, 8, 16]
+ITERATIONS: int = 2000
+
+
+def build_order_book(depth: int, depth_index_enabled: bool) -> OrderBook:
+    order_book: OrderBook = OrderBook()
+    order_book.depth_index_enabled = depth_index_enabled
+    amounts: np.ndarray = np.random.uniform(0.1, 5, depth)
+    bids: np.ndarray = np.column_stack([np.arange(1, depth + 1, dtype=np.float64), amounts, np.ones(depth)])
+    asks: np.ndarray = np.column_stack([np.arange(depth + 1, 2 * depth + 1, dtype=np.float64), amounts, np.ones(depth)])
+    order_book.apply_numpy_snapshot(bids, asks)
+    return order_book
+
+
+def time_queries(order_book: OrderBook, queries_per_update: int, volume: float) -> float:
+    diff: np.ndarray = np.array([[0.5, 1, 2]], dtype=np.float64)
+    no_diff: np.ndarray = np.empty((0, 3), dtype=np.float64)
+    start: float = time.perf_counter()
+    for i in range(ITERATIONS):
+        diff[0, 1] = 1 + i % 2
+        order_book.apply_numpy_diffs(diff, no_diff)
+        for _ in range(queries_per_update):
+            order_book.get_vwap_for_volume(False, volume)
+    return (time.perf_counter() - start) / ITERATIONS * 1e6
+
+
+def main():
+    print(f"{'depth':>8} {'queries':>8} {'walk (us)':>12} {'index (us)':>12} {'speedup':>8}")
+    crossover: dict = {}
+    for queries_per_update in QUERIES_PER_UPDATE:
+        for depth in DEPTHS:
+            volume: float = depth * 2.55 / 2
+            walk_us: float = time_queries(build_order_book(depth, False), queries_per_update, volume)
+            index_us: float = time_queries(build_order_book(depth, True), queries_per_update, volume)
+            print(f"{depth:>8} {queries_per_update:>8} {walk_us:>12.2f} {index_us:>12.2f} {walk_us / index_us:>8.2f}")
+            if index_us < walk_us and queries_per_update not in crossover:
+                crossover[queries_per_update] = depth
+    print()
+    for queries_per_update in QUERIES_PER_UPDATE:
+        depth: Optional[int] = crossover.get(queries_per_update)
+        print(f"{queries_per_update:>3} queries per update: index wins from depth "
+              f"{depth if depth is not None else 'n/a (never within ' + str(DEPTHS[-1]) + ' levels)'}")
+
+
+if __name__ == "__main__":
+    main()
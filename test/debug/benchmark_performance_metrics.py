@@ -0,0 +1,140 @@
+#!/usr/bin/env python
+
+"""
+Compares PerformanceMetrics computed from TradeFill records against the columnar path, for 100k spot fills and 100k
+derivative fills stored in a SQLite database. The record based timing includes loading the ORM objects, the columnar
+one the single query loading their columns, which is what `history --days` goes through.
+
+The pairing of derivative orders used to call position_order until no pair was left, which is quadratic in the number
+of orders. It is timed separately on a smaller set of fills.
+"""
+
+import asyncio
+import os
+import random
+import tempfile
+import time
+from decimal import Decimal
+from typing import (
+    Callable,
+    List
+)
+from unittest.mock import patch
+
+from hummingbot.client.performance import PerformanceMetrics
+from hummingbot.core.event.events import TradeFee
+from hummingbot.model.order import Order  # noqa: F401
+from hummingbot.model.order_status import OrderStatus  # noqa: F401
+from hummingbot.model.sql_connection_manager import (
+    SQLConnectionManager,
+    SQLConnectionType
+)
+from hummingbot.model.trade_fill import TradeFill
+
+FILLS: int = 100000
+LEGACY_PAIRING_FILLS: int = 10000
+TRADING_PAIR: str = "HBOT-USDT"
+BALANCES = {"HBOT": Decimal("100000"), "USDT": Decimal("1000000")}
+
+
+class LegacyPairingPerformanceMetrics(PerformanceMetrics):
+    """
+    Pairs derivative orders the way PerformanceMetrics did before, kept here as the baseline.
+    """
+
+    def _calculate_trade_pnl(self, buys: list, sells: list):
+        self.trade_pnl = self.cur_value - self.hold_value
+        if self._are_derivatives(buys) or self._are_derivatives(sells):
+            buys_copy, sells_copy = self.aggregate_position_order(buys.copy(), sells.copy())
+            long = []
+            short = []
+            while True:
+                lng = self.position_order(buys_copy, sells_copy)
+                if lng is not None:
+                    long.append(lng)
+                sht = self.position_order(sells_copy, buys_copy)
+                if sht is not None:
+                    short.append(sht)
+                if lng is None and sht is None:
+                    break
+            self.trade_pnl = Decimal(str(sum(self.derivative_pnl(long, short))))
+
+
+def generate_fills(count: int, derivatives: bool) -> List[TradeFill]:
+    rng = random.Random(42)
+    fills: List[TradeFill] = []
+    for i in range(count):
+        if derivatives:
+            side, position = rng.choice([("BUY", "OPEN"), ("SELL", "CLOSE"), ("SELL", "OPEN"), ("BUY", "CLOSE")])
+        else:
+            side, position = rng.choice(["BUY", "SELL"]), "NILL"
+        fills.append(TradeFill(config_file_path="benchmark.yml",
+                               strategy="pure_market_making",
+                               market="binance",
+                               symbol=TRADING_PAIR,
+                               base_asset="HBOT",
+                               quote_asset="USDT",
+                               timestamp=i,
+                               order_id=f"{side}-{position}-{i // 3}",
+                               trade_type=side,
+                               order_type="LIMIT",
+                               price=rng.uniform(9, 12),
+                               amount=rng.uniform(0.1, 5),
+                               leverage=1,
+                               trade_fee=TradeFee.to_json(TradeFee(0.001, [("BNB", rng.uniform(0, 0.01))])),
+                               exchange_trade_id=str(i),
+                               position=position))
+    return fills
+
+
+def time_call(ev_loop: asyncio.AbstractEventLoop, fn: Callable) -> float:
+    start: float = time.perf_counter()
+    ev_loop.run_until_complete(fn())
+    return time.perf_counter() - start
+
+
+def benchmark(ev_loop: asyncio.AbstractEventLoop, derivatives: bool):
+    with tempfile.TemporaryDirectory() as temp_dir:
+        sql = SQLConnectionManager(SQLConnectionType.TRADE_FILLS, db_path=os.path.join(temp_dir, "benchmark.sqlite"))
+        session = sql.get_shared_session()
+        session.add_all(generate_fills(FILLS, derivatives))
+        session.commit()
+        session.expunge_all()
+
+        def records():
+            trades: List[TradeFill] = session.query(TradeFill).order_by(TradeFill.timestamp.asc()).all()
+            return PerformanceMetrics.create("binance", TRADING_PAIR, trades, BALANCES)
+
+        def columns():
+            trades = TradeFill.get_performance_dataframe(session, config_file_path="benchmark")
+            return PerformanceMetrics.create_from_dataframe("binance", TRADING_PAIR, trades, BALANCES)
+
+        records_s: float = time_call(ev_loop, records)
+        session.expunge_all()
+        columns_s: float = time_call(ev_loop, columns)
+        session.close()
+        sql.engine.dispose()
+    kind: str = "derivative" if derivatives else "spot"
+    print(f"{kind:>10} {FILLS:>8} {records_s:>12.3f} {columns_s:>12.3f} {records_s / columns_s:>8.1f}x")
+
+
+def benchmark_pairing(ev_loop: asyncio.AbstractEventLoop):
+    fills: List[TradeFill] = generate_fills(LEGACY_PAIRING_FILLS, True)
+    legacy_s: float = time_call(ev_loop, lambda: LegacyPairingPerformanceMetrics.create(
+        "binance", TRADING_PAIR, generate_fills(LEGACY_PAIRING_FILLS, True), BALANCES))
+    current_s: float = time_call(ev_loop, lambda: PerformanceMetrics.create("binance", TRADING_PAIR, fills, BALANCES))
+    print(f"derivative order pairing over {LEGACY_PAIRING_FILLS} fills: "
+          f"position_order loop {legacy_s:.3f}s, single pass {current_s:.3f}s")
+
+
+def main():
+    ev_loop: asyncio.AbstractEventLoop = asyncio.get_event_loop()
+    with patch("hummingbot.client.performance.get_last_price", return_value=None):
+        print(f"{'fills':>10} {'count':>8} {'records (s)':>12} {'columns (s)':>12} {'speedup':>9}")
+        benchmark(ev_loop, False)
+        benchmark(ev_loop, True)
+        benchmark_pairing(ev_loop)
+
+
+if __name__ == "__main__":
+    main()
@@ -1,10 +1,12 @@
 import asyncio
 import unittest
+from decimal import Decimal
 from typing import Awaitable
-from unittest.mock import patch, MagicMock
+from unittest.mock import patch, AsyncMock, MagicMock
 
 from hummingbot.client.config.global_config_map import global_config_map
 from hummingbot.client.hummingbot_application import HummingbotApplication
+from hummingbot.connector.connector_base import ConnectorBase
 from test.mock.mock_cli import CLIMockingAssistant
 
 
@@ -67,3 +69,43 @@ class StatusCommandTest(unittest.TestCase):
                 msg="\nA network error prevented the connection check to complete. See logs for more details."
             )
         )
+
+    @patch("hummingbot.client.command.silly_commands.asyncio")
+    @patch("hummingbot.client.command.status_command.StatusCommand.strategy_status", new_callable=AsyncMock)
+    def test_live_status_displayed_again_only_when_state_changes(self, strategy_status_mock, asyncio_mock):
+        strategy_status_mock.side_effect = [f"status {i}" for i in range(10)]
+        order_book = MagicMock(version=1)
+        market = MagicMock(order_books={"COINALPHA-HBOT": order_book}, limit_orders=[])
+        market.get_all_balances.return_value = {"HBOT": Decimal("1")}
+        self.app.markets = {"binance": market}
+        self.app.strategy = MagicMock()
+
+        waits = []
+
+        # The live status is checked once per wait, the order book is updated during the second one.
+        async def sleep(delay):
+            waits.append(delay)
+            if len(waits) == 2:
+                order_book.version = 2
+            elif len(waits) == 4:
+                self.app.app.live_updates = False
+
+        asyncio_mock.sleep = sleep
+
+        self.async_run_with_timeout(self.app.status_check_all(live=True))
+
+        self.assertEqual(2, strategy_status_mock.call_count)
+        live_status = [text for text in self.cli_mock_assistant._log_calls if text.startswith("status")]
+        self.assertEqual(2, len(live_status))
+        self.assertTrue(live_status[1].startswith("status 1"))
+        self.assertTrue(self.cli_mock_assistant.check_log_called_with(msg="Stopped live status display update."))
+
+    def test_strategy_state_version_with_connector_without_order_books(self):
+        market = ConnectorBase()
+        self.app.markets = {"uniswap": market}
+
+        state = self.app._strategy_state_version()
+        self.assertEqual(state, self.app._strategy_state_version())
+
+        market._account_balances["HBOT"] = Decimal("1")
+        self.assertNotEqual(state, self.app._strategy_state_version())
@@ -1,11 +1,16 @@
 from decimal import Decimal
 from typing import List
+import random
 import unittest
 import asyncio
-from unittest.mock import MagicMock, patch
+from unittest.mock import AsyncMock, MagicMock, patch
 
-from hummingbot.client.performance import PerformanceMetrics
+from hummingbot.client.performance import PerformanceMetrics, PerformanceTracker
 from hummingbot.core.data_type.trade import Trade, TradeType, TradeFee
+from hummingbot.model.order import Order  # noqa: F401
+from hummingbot.model.order_status import OrderStatus  # noqa: F401
+from hummingbot.model.sql_connection_manager import SQLConnectionManager, SQLConnectionType
+from hummingbot.model.trade_fill import TradeFill
 
 trading_pair = "HBOT-USDT"
 base, quote = trading_pair.split("-")
@@ -172,6 +177,141 @@ class PerformanceMetricsUnitTest(unittest.TestCase):
         self.assertEqual(metrics.trade_pnl, Decimal("1000"))
         self.assertEqual(metrics.total_pnl, Decimal("650"))
 
+    @staticmethod
+    def trade_fill(order_id, trade_type, price, amount, position="NILL", fee=None, market="hbot_exchange"):
+        return TradeFill(config_file_path="config.yml",
+                         strategy="strategy",
+                         market=market,
+                         symbol=trading_pair,
+                         base_asset=base,
+                         quote_asset=quote,
+                         timestamp=1,
+                         order_id=order_id,
+                         trade_type=trade_type,
+                         order_type="LIMIT",
+                         price=price,
+                         amount=amount,
+                         leverage=1,
+                         trade_fee=TradeFee.to_json(fee or TradeFee(0)),
+                         exchange_trade_id=f"{order_id}-{random.random()}",
+                         position=position)
+
+    def assert_tracker_matches_batch_computation(self, trades: List[TradeFill], cur_bals):
+        tracker = PerformanceTracker()
+        for trade in trades:
+            tracker.add_trade_fill(trade)
+        ev_loop = asyncio.get_event_loop()
+        # Batch computation aggregates the fills of derivative orders in place, so it gets copies of them.
+        trade_copies: List[TradeFill] = [self.trade_fill(t.order_id, t.trade_type, t.price, t.amount, t.position,
+                                                         TradeFee.from_json(t.trade_fee))
+                                         for t in trades]
+        expected = ev_loop.run_until_complete(PerformanceMetrics.create("hbot_exchange", trading_pair, trade_copies,
+                                                                        cur_bals))
+        tracked = ev_loop.run_until_complete(tracker.performance_metrics("hbot_exchange", trading_pair, cur_bals))
+
+        self.assertEqual([("hbot_exchange", trading_pair)], tracker.market_trading_pairs)
+        self.assertEqual(len(trades), tracker.num_trades)
+        for field in ("num_buys", "num_sells", "num_trades", "b_vol_base", "s_vol_base", "tot_vol_base", "b_vol_quote",
+                      "s_vol_quote", "tot_vol_quote", "avg_b_price", "avg_s_price", "avg_tot_price",
+                      "start_base_bal", "start_quote_bal", "cur_base_bal", "cur_quote_bal", "start_price", "cur_price",
+                      "start_base_ratio_pct", "cur_base_ratio_pct", "hold_value", "cur_value", "trade_pnl", "fees",
+                      "fee_in_quote", "total_pnl", "return_pct"):
+            self.assertEqual(getattr(expected, field), getattr(tracked, field), field)
+
+    @patch("hummingbot.client.performance.get_last_price", new_callable=AsyncMock)
+    def test_performance_tracker_matches_batch_computation(self, get_last_price_mock):
+        get_last_price_mock.side_effect = lambda exchange, pair: Decimal("11") if pair == trading_pair else Decimal("2")
+        rng = random.Random(42)
+        trades: List[TradeFill] = [
+            self.trade_fill(order_id=f"order{i // 3}",
+                            trade_type=rng.choice(["BUY", "SELL"]),
+                            price=rng.uniform(9, 12),
+                            amount=rng.uniform(0.1, 5),
+                            fee=TradeFee(rng.choice([0, 0.001]), [(rng.choice([base, "BNB"]), rng.uniform(0, 0.01))]))
+            for i in range(300)
+        ]
+
+        self.assert_tracker_matches_batch_computation(trades, {base: Decimal("100"), quote: Decimal("1000")})
+
+    @patch("hummingbot.client.performance.get_last_price", new_callable=AsyncMock)
+    def test_performance_tracker_matches_batch_computation_for_derivatives(self, get_last_price_mock):
+        get_last_price_mock.return_value = None
+        rng = random.Random(42)
+        trades: List[TradeFill] = []
+        # Fills of orders opening and closing positions, several fills per order, interleaved with each other.
+        for i in range(200):
+            side, position = rng.choice([("BUY", "OPEN"), ("SELL", "CLOSE"), ("SELL", "OPEN"), ("BUY", "CLOSE")])
+            trades.append(self.trade_fill(order_id=f"{side}-{position}-{i // 4}",
+                                          trade_type=side,
+                                          price=rng.uniform(9, 12),
+                                          amount=rng.uniform(0.1, 5),
+                                          position=position,
+                                          fee=TradeFee(0, [(quote, rng.uniform(0, 0.01))])))
+
+        self.assert_tracker_matches_batch_computation(trades, {quote: Decimal("1000")})
+
+    def assert_columnar_matches_batch_computation(self, trades: List[TradeFill], cur_bals):
+        ev_loop = asyncio.get_event_loop()
+        sql = SQLConnectionManager(SQLConnectionType.TRADE_FILLS, db_path="")
+        session = sql.get_shared_session()
+        for i, trade in enumerate(trades):
+            trade.timestamp = i
+            session.add(trade)
+        session.commit()
+        trades_df = TradeFill.get_performance_dataframe(session, config_file_path="config")
+        # Batch computation aggregates the fills of derivative orders in place, so it gets copies of them.
+        trade_copies: List[TradeFill] = [self.trade_fill(t.order_id, t.trade_type, t.price, t.amount, t.position,
+                                                         TradeFee.from_json(t.trade_fee))
+                                         for t in trades]
+        expected = ev_loop.run_until_complete(PerformanceMetrics.create("hbot_exchange", trading_pair, trade_copies,
+                                                                        cur_bals))
+        columnar = ev_loop.run_until_complete(PerformanceMetrics.create_from_dataframe("hbot_exchange", trading_pair,
+                                                                                       trades_df, cur_bals))
+
+        self.assertEqual(len(trades), len(trades_df))
+        for field in ("num_buys", "num_sells", "num_trades"):
+            self.assertEqual(getattr(expected, field), getattr(columnar, field), field)
+        for field in ("b_vol_base", "s_vol_base", "tot_vol_base", "b_vol_quote", "s_vol_quote", "tot_vol_quote",
+                      "avg_b_price", "avg_s_price", "avg_tot_price", "start_base_bal", "start_quote_bal",
+                      "start_price", "cur_price", "start_base_ratio_pct", "cur_base_ratio_pct", "hold_value",
+                      "cur_value", "trade_pnl", "fee_in_quote", "total_pnl", "return_pct"):
+            self.assertIsInstance(getattr(columnar, field), Decimal, field)
+            self.assertAlmostEqual(float(getattr(expected, field)), float(getattr(columnar, field)), 6, field)
+        self.assertEqual(list(expected.fees.keys()), list(columnar.fees.keys()))
+        for token, amount in expected.fees.items():
+            self.assertAlmostEqual(float(amount), float(columnar.fees[token]), 9)
+
+    @patch("hummingbot.client.performance.get_last_price", new_callable=AsyncMock)
+    def test_columnar_computation_matches_batch_computation(self, get_last_price_mock):
+        get_last_price_mock.side_effect = lambda exchange, pair: Decimal("11") if pair == trading_pair else Decimal("2")
+        rng = random.Random(42)
+        trades: List[TradeFill] = [
+            self.trade_fill(order_id=f"order{i // 3}",
+                            trade_type=rng.choice(["BUY", "SELL"]),
+                            price=rng.uniform(9, 12),
+                            amount=rng.uniform(0.1, 5),
+                            fee=TradeFee(rng.choice([0, 0.001]), [(rng.choice([base, "BNB"]), rng.uniform(0, 0.01))]))
+            for i in range(300)
+        ]
+
+        self.assert_columnar_matches_batch_computation(trades, {base: Decimal("100"), quote: Decimal("1000")})
+
+    @patch("hummingbot.client.performance.get_last_price", new_callable=AsyncMock)
+    def test_columnar_computation_matches_batch_computation_for_derivatives(self, get_last_price_mock):
+        get_last_price_mock.return_value = None
+        rng = random.Random(42)
+        trades: List[TradeFill] = []
+        for i in range(200):
+            side, position = rng.choice([("BUY", "OPEN"), ("SELL", "CLOSE"), ("SELL", "OPEN"), ("BUY", "CLOSE")])
+            trades.append(self.trade_fill(order_id=f"{side}-{position}-{i // 4}",
+                                          trade_type=side,
+                                          price=rng.uniform(9, 12),
+                                          amount=rng.uniform(0.1, 5),
+                                          position=position,
+                                          fee=TradeFee(0, [(quote, rng.uniform(0, 0.01))])))
+
+        self.assert_columnar_matches_batch_computation(trades, {quote: Decimal("1000")})
+
     def test_smart_round(self):
         value = PerformanceMetrics.smart_round(None)
         self.assertIsNone(value)
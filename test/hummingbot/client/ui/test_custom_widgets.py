@@ -0,0 +1,77 @@
+import asyncio
+import threading
+import unittest
+
+from hummingbot.client.ui.custom_widgets import CustomTextArea
+
+
+class CustomTextAreaTest(unittest.TestCase):
+
+    def setUp(self) -> None:
+        super().setUp()
+        self.ev_loop = asyncio.get_event_loop()
+        self.text_area = CustomTextArea(max_line_count=5, initial_text="Header")
+
+    def wait_for_refresh(self):
+        self.ev_loop.run_until_complete(asyncio.sleep(CustomTextArea.LOG_REFRESH_INTERVAL * 2))
+
+    def test_burst_of_logs_rendered_once(self):
+        self.assertEqual("Header", self.text_area.text)
+
+        for i in range(10):
+            self.text_area.log(f"line {i}")
+
+        # The header was just rendered, the burst of logs is rendered once the refresh interval passed.
+        self.assertEqual("Header", self.text_area.text)
+        self.wait_for_refresh()
+        self.assertEqual("\n".join(f"line {i}" for i in range(5, 10)), self.text_area.text)
+        self.assertEqual(len(self.text_area.text), self.text_area.document.cursor_position)
+
+    def test_long_lines_not_split(self):
+        self.wait_for_refresh()
+        line = "x" * 500
+
+        self.text_area.log(f"<b>{line}</b>\nshort line")
+
+        self.assertEqual(["Header", line, "short line"], list(self.text_area.log_lines))
+
+    def test_logs_from_other_threads_rendered_on_event_loop(self):
+        thread = threading.Thread(target=self.text_area.log, args=("from thread",))
+        thread.start()
+        thread.join()
+
+        self.wait_for_refresh()
+
+        self.assertEqual("Header\nfrom thread", self.text_area.text)
+
+    def test_silent_logs_saved_and_replacing_text_not_overwritten(self):
+        self.text_area.log("saved")
+        self.text_area.log("silent", silent=True)
+        self.text_area.log("live update", save_log=False)
+
+        self.wait_for_refresh()
+
+        self.assertEqual("live update", self.text_area.text)
+        self.assertEqual(["Header", "saved", "silent"], list(self.text_area.log_lines))
+
+    def test_new_logs_appended_and_oldest_dropped(self):
+        self.wait_for_refresh()
+        for i in range(3):
+            self.text_area.log(f"line {i}")
+            self.wait_for_refresh()
+        self.assertEqual("Header\nline 0\nline 1\nline 2", self.text_area.text)
+
+        self.text_area.log("line 3\nline 4\nline 5")
+        self.wait_for_refresh()
+
+        self.assertEqual("\n".join(f"line {i}" for i in range(1, 6)), self.text_area.text)
+        self.assertEqual("\n".join(self.text_area.log_lines), self.text_area.text)
+
+    def test_logs_rendered_in_full_after_replacing_text(self):
+        self.wait_for_refresh()
+        self.text_area.log("live update", save_log=False)
+
+        self.text_area.log("saved")
+        self.wait_for_refresh()
+
+        self.assertEqual("Header\nsaved", self.text_area.text)
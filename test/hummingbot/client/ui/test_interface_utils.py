@@ -0,0 +1,59 @@
+import asyncio
+import unittest
+from decimal import Decimal
+from typing import Awaitable
+from unittest.mock import AsyncMock, MagicMock, patch
+
+from hummingbot.client.performance import PerformanceTracker
+from hummingbot.client.ui.interface_utils import start_trade_monitor
+
+
+class InterfaceUtilsTest(unittest.TestCase):
+
+    def setUp(self) -> None:
+        super().setUp()
+        self.ev_loop = asyncio.get_event_loop()
+        self.performance_tracker = PerformanceTracker()
+        self.performance_tracker.reset(1000)
+        self.app = MagicMock()
+        self.app.strategy_task.done.return_value = False
+        self.app.markets = {"binance": MagicMock(ready=True), "kucoin": MagicMock(ready=True)}
+        self.app._session_performance_tracker.return_value = self.performance_tracker
+        self.app.get_current_balances = AsyncMock(return_value={"BTC": Decimal("1"), "USDT": Decimal("100")})
+        self.trade_monitor = MagicMock()
+
+    def async_run_with_timeout(self, coroutine: Awaitable, timeout: float = 1):
+        return self.ev_loop.run_until_complete(asyncio.wait_for(coroutine, timeout))
+
+    def add_fill(self, market: str):
+        self.performance_tracker.add_fill(market, "BTC-USDT", "BUY", 10, 1, "OID1", "NILL", {"percent": 0})
+
+    @patch("hummingbot.client.performance.get_last_price", new_callable=AsyncMock)
+    @patch("hummingbot.client.ui.interface_utils.asyncio.sleep", new_callable=AsyncMock)
+    @patch("hummingbot.client.hummingbot_application.HummingbotApplication.main_application")
+    def test_trade_monitor_only_recomputes_markets_with_new_trades(self, main_app_mock, sleep_mock,
+                                                                   get_last_price_mock):
+        main_app_mock.return_value = self.app
+        get_last_price_mock.return_value = Decimal("11")
+        # Each iteration of the monitor waits once, the fills are recorded in between.
+        fills = [[], ["binance"], ["binance", "kucoin"], [], ["kucoin"]]
+
+        async def sleep(_):
+            if len(fills) == 0:
+                raise asyncio.CancelledError()
+            for market in fills.pop(0):
+                self.add_fill(market)
+
+        sleep_mock.side_effect = sleep
+
+        with self.assertRaises(asyncio.CancelledError):
+            self.async_run_with_timeout(start_trade_monitor(self.trade_monitor))
+
+        self.assertEqual(["binance", "binance", "kucoin", "kucoin"],
+                         [c.args[0] for c in self.app.get_current_balances.call_args_list])
+        logs = [c.args[0] for c in self.trade_monitor.log.call_args_list]
+        self.assertEqual(4, len(logs))
+        self.assertTrue(logs[1].startswith("Trades: 1, Total P&L: "))
+        self.assertTrue(logs[2].startswith("Trades: 3, Total P&L: "))
+        self.assertTrue(logs[3].startswith("Trades: 4, Total P&L: "))
+        self.app._get_trades_from_session.assert_not_called()
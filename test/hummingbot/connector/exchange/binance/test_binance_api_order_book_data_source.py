@@ -49,6 +49,7 @@ class BinanceAPIOrderBookDataSourceUnitTests(unittest.TestCase):
 
     def tearDown(self) -> None:
         self.listening_task and self.listening_task.cancel()
+        self.data_source._stream_multiplexer.stop()
         super().tearDown()
 
     def handle(self, record):
@@ -61,6 +62,9 @@ class BinanceAPIOrderBookDataSourceUnitTests(unittest.TestCase):
     def _raise_exception(self, exception_class):
         raise exception_class
 
+    def _stream_event(self, stream_type: str, data: Dict[str, Any]) -> str:
+        return ujson.dumps({"stream": f"{self.ex_trading_pair.lower()}@{stream_type}", "data": data})
+
     def _trade_update_event(self):
         resp = {
             "e": "trade",
@@ -75,7 +79,7 @@ class BinanceAPIOrderBookDataSourceUnitTests(unittest.TestCase):
             "m": True,
             "M": True
         }
-        return ujson.dumps(resp)
+        return self._stream_event("trade", resp)
 
     def _order_diff_event(self):
         resp = {
@@ -87,7 +91,7 @@ class BinanceAPIOrderBookDataSourceUnitTests(unittest.TestCase):
             "b": [["0.0024", "10"]],
             "a": [["0.0026", "100"]]
         }
-        return ujson.dumps(resp)
+        return self._stream_event("depth", resp)
 
     def _snapshot_response(self):
         resp = {
@@ -107,6 +111,9 @@ class BinanceAPIOrderBookDataSourceUnitTests(unittest.TestCase):
         }
         return resp
 
+    def test_throttler(self):
+        self.assertIs(self.throttler, self.data_source.throttler)
+
     @patch("aiohttp.ClientSession.get", new_callable=AsyncMock)
     def test_get_last_trade_prices(self, mock_api):
         self.mocking_assistant.configure_http_request_mock(mock_api)
@@ -230,57 +237,40 @@ class BinanceAPIOrderBookDataSourceUnitTests(unittest.TestCase):
 
         self.assertEqual(1, result.snapshot_uid)
 
-    @patch("websockets.connect")
-    def test_listen_for_trades_cancelled_when_connecting(self, mock_ws):
-        msg_queue: asyncio.Queue = asyncio.Queue()
-        mock_ws.side_effect = asyncio.CancelledError
-
-        with self.assertRaises(asyncio.CancelledError):
-            self.listening_task = self.ev_loop.create_task(
-                self.data_source.listen_for_trades(self.ev_loop, msg_queue)
-            )
-            self.ev_loop.run_until_complete(self.listening_task)
-
-    @patch("websockets.connect", new_callable=AsyncMock)
-    def test_listen_for_trades_cancelled_when_listening(self, mock_ws):
+    def test_listen_for_trades_cancelled_when_listening(self):
         msg_queue: asyncio.Queue = asyncio.Queue()
-        mock_ws.return_value = self.mocking_assistant.create_websocket_mock()
-        mock_ws.return_value.recv.side_effect = lambda: (
-            self._raise_exception(asyncio.CancelledError)
+        self.listening_task = self.ev_loop.create_task(
+            self.data_source.listen_for_trades(self.ev_loop, msg_queue)
         )
+        self.ev_loop.run_until_complete(asyncio.sleep(0))
+        self.listening_task.cancel()
+
         with self.assertRaises(asyncio.CancelledError):
-            self.listening_task = self.ev_loop.create_task(
-                self.data_source.listen_for_trades(self.ev_loop, msg_queue)
-            )
             self.ev_loop.run_until_complete(self.listening_task)
+        self.assertEqual([], self.data_source._stream_multiplexer.streams)
 
     @patch("websockets.connect", new_callable=AsyncMock)
     def test_listen_for_trades_logs_exception(self, mock_ws):
         msg_queue: asyncio.Queue = asyncio.Queue()
         mock_ws.return_value = self.mocking_assistant.create_websocket_mock()
-        mock_ws.close.return_value = None
 
         incomplete_resp = {
             "m": 1,
             "i": 2,
         }
-        self.mocking_assistant.add_websocket_text_message(mock_ws.return_value, ujson.dumps(incomplete_resp))
+        self.mocking_assistant.add_websocket_text_message(mock_ws.return_value,
+                                                          self._stream_event("trade", incomplete_resp))
         self.listening_task = self.ev_loop.create_task(
             self.data_source.listen_for_trades(self.ev_loop, msg_queue)
         )
+        self.mocking_assistant.run_until_all_text_messages_delivered(mock_ws.return_value)
 
-        with self.assertRaises(asyncio.TimeoutError):
-            self.ev_loop.run_until_complete(
-                asyncio.wait_for(self.listening_task, 1)
-            )
-
-        self.assertTrue(self._is_logged("ERROR", "Unexpected error with WebSocket connection. Retrying after 30 seconds..."))
+        self.assertTrue(self._is_logged("ERROR", "Unexpected error when processing public trade updates from exchange."))
 
     @patch("websockets.connect", new_callable=AsyncMock)
     def test_listen_for_trades_successful(self, mock_ws):
         msg_queue: asyncio.Queue = asyncio.Queue()
         mock_ws.return_value = self.mocking_assistant.create_websocket_mock()
-        mock_ws.close.return_value = None
 
         self.mocking_assistant.add_websocket_text_message(mock_ws.return_value, self._trade_update_event())
         self.listening_task = self.ev_loop.create_task(
@@ -289,59 +279,44 @@ class BinanceAPIOrderBookDataSourceUnitTests(unittest.TestCase):
 
         msg: OrderBookMessage = self.ev_loop.run_until_complete(msg_queue.get())
 
-        self.assertTrue(12345, msg.trade_id)
-
-    @patch("websockets.connect")
-    def test_listen_for_order_book_diffs_cancelled_when_connecting(self, mock_ws):
-        msg_queue: asyncio.Queue = asyncio.Queue()
-        mock_ws.side_effect = asyncio.CancelledError
-
-        with self.assertRaises(asyncio.CancelledError):
-            self.listening_task = self.ev_loop.create_task(
-                self.data_source.listen_for_order_book_diffs(self.ev_loop, msg_queue)
-            )
-            self.ev_loop.run_until_complete(self.listening_task)
+        self.assertEqual(12345, msg.trade_id)
+        mock_ws.assert_called_once_with(
+            f"{CONSTANTS.WSS_COMBINED_STREAM_URL.format(self.domain)}?streams={self.ex_trading_pair.lower()}@trade")
 
-    @patch("websockets.connect", new_callable=AsyncMock)
-    def test_listen_for_order_book_diffs_cancelled_when_listening(self, mock_ws):
+    def test_listen_for_order_book_diffs_cancelled_when_listening(self):
         msg_queue: asyncio.Queue = asyncio.Queue()
-        mock_ws.return_value = self.mocking_assistant.create_websocket_mock()
-        mock_ws.return_value.recv.side_effect = lambda: (
-            self._raise_exception(asyncio.CancelledError)
+        self.listening_task = self.ev_loop.create_task(
+            self.data_source.listen_for_order_book_diffs(self.ev_loop, msg_queue)
         )
+        self.ev_loop.run_until_complete(asyncio.sleep(0))
+        self.listening_task.cancel()
+
         with self.assertRaises(asyncio.CancelledError):
-            self.listening_task = self.ev_loop.create_task(
-                self.data_source.listen_for_order_book_diffs(self.ev_loop, msg_queue)
-            )
             self.ev_loop.run_until_complete(self.listening_task)
+        self.assertEqual([], self.data_source._stream_multiplexer.streams)
 
     @patch("websockets.connect", new_callable=AsyncMock)
     def test_listen_for_order_book_diffs_logs_exception(self, mock_ws):
         msg_queue: asyncio.Queue = asyncio.Queue()
         mock_ws.return_value = self.mocking_assistant.create_websocket_mock()
-        mock_ws.close.return_value = None
 
         incomplete_resp = {
             "m": 1,
             "i": 2,
         }
-        self.mocking_assistant.add_websocket_text_message(mock_ws.return_value, ujson.dumps(incomplete_resp))
+        self.mocking_assistant.add_websocket_text_message(mock_ws.return_value,
+                                                          self._stream_event("depth", incomplete_resp))
         self.listening_task = self.ev_loop.create_task(
             self.data_source.listen_for_order_book_diffs(self.ev_loop, msg_queue)
         )
+        self.mocking_assistant.run_until_all_text_messages_delivered(mock_ws.return_value)
 
-        with self.assertRaises(asyncio.TimeoutError):
-            self.ev_loop.run_until_complete(
-                asyncio.wait_for(self.listening_task, 1)
-            )
-
-        self.assertTrue(self._is_logged("ERROR", "Unexpected error with WebSocket connection. Retrying after 30 seconds..."))
+        self.assertTrue(self._is_logged("ERROR", "Unexpected error when processing public order book updates from exchange."))
 
     @patch("websockets.connect", new_callable=AsyncMock)
     def test_listen_for_order_book_diffs_successful(self, mock_ws):
         msg_queue: asyncio.Queue = asyncio.Queue()
         mock_ws.return_value = self.mocking_assistant.create_websocket_mock()
-        mock_ws.close.return_value = None
 
         self.mocking_assistant.add_websocket_text_message(mock_ws.return_value, self._order_diff_event())
         self.listening_task = self.ev_loop.create_task(
@@ -350,7 +325,33 @@ class BinanceAPIOrderBookDataSourceUnitTests(unittest.TestCase):
 
         msg: OrderBookMessage = self.ev_loop.run_until_complete(msg_queue.get())
 
-        self.assertTrue(12345, msg.update_id)
+        self.assertEqual(160, msg.update_id)
+
+    @patch("websockets.connect", new_callable=AsyncMock)
+    def test_trades_and_diffs_share_one_connection(self, mock_ws):
+        trades_queue: asyncio.Queue = asyncio.Queue()
+        diffs_queue: asyncio.Queue = asyncio.Queue()
+        mock_ws.return_value = self.mocking_assistant.create_websocket_mock()
+
+        self.mocking_assistant.add_websocket_text_message(mock_ws.return_value, self._order_diff_event())
+        self.mocking_assistant.add_websocket_text_message(mock_ws.return_value, self._trade_update_event())
+        trades_task = self.ev_loop.create_task(self.data_source.listen_for_trades(self.ev_loop, trades_queue))
+        self.listening_task = self.ev_loop.create_task(
+            self.data_source.listen_for_order_book_diffs(self.ev_loop, diffs_queue)
+        )
+
+        try:
+            trade_msg: OrderBookMessage = self.ev_loop.run_until_complete(trades_queue.get())
+            diff_msg: OrderBookMessage = self.ev_loop.run_until_complete(diffs_queue.get())
+        finally:
+            trades_task.cancel()
+
+        self.assertEqual(12345, trade_msg.trade_id)
+        self.assertEqual(160, diff_msg.update_id)
+        self.assertEqual(1, mock_ws.call_count)
+        stream_url: str = mock_ws.call_args[0][0]
+        self.assertIn(f"{self.ex_trading_pair.lower()}@trade", stream_url)
+        self.assertIn(f"{self.ex_trading_pair.lower()}@depth", stream_url)
 
     @patch("aiohttp.ClientSession.get")
     def test_listen_for_order_book_snapshots_cancelled_when_fetching_snapshot(self, mock_api):
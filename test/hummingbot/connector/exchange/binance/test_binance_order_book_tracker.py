@@ -234,3 +234,150 @@ class BinanceOrderBookTrackerUnitTests(unittest.TestCase):
 
         self.assertEqual(0, self.tracker.order_books[self.trading_pair].snapshot_uid)
         self.assertEqual(2, self.tracker.order_books[self.trading_pair].last_diff_uid)
+
+    def _diff_message(self, first_update_id: int, update_id: int, bids, asks) -> OrderBookMessage:
+        return OrderBookMessage(
+            message_type=OrderBookMessageType.DIFF,
+            content={
+                "trading_pair": self.trading_pair,
+                "first_update_id": first_update_id,
+                "update_id": update_id,
+                "bids": bids,
+                "asks": asks,
+            },
+            timestamp=time.time()
+        )
+
+    def test_merge_diff_messages_keeps_last_write_per_price(self):
+        bids, asks = BinanceOrderBookTracker.merge_diff_messages([
+            self._diff_message(1, 2, [["1", "10"], ["2", "20"]], [["5", "1"]]),
+            self._diff_message(3, 4, [["1", "0"]], []),
+            self._diff_message(5, 6, [["2", "25"], ["3", "30"]], [["5", "2"], ["6", "3"]]),
+        ])
+
+        self.assertEqual([[1, 0, 4], [2, 25, 6], [3, 30, 6]], sorted(bids.tolist()))
+        self.assertEqual([[5, 2, 6], [6, 3, 6]], sorted(asks.tolist()))
+
+    def test_track_single_book_coalesces_queued_diffs(self):
+        self.tracker.coalesce_diffs = True
+        self.tracker.order_books[self.trading_pair].apply_snapshot([], [], 1)
+        for diff_msg in [self._diff_message(2, 3, [["1", "10"]], [["5", "1"]]),
+                         self._diff_message(4, 5, [["1", "0"], ["2", "20"]], []),
+                         self._diff_message(6, 7, [], [["5", "4"]])]:
+            self._simulate_message_enqueue(self.tracker._tracking_message_queues[self.trading_pair], diff_msg)
+
+        self.tracking_task = self.ev_loop.create_task(
+            self.tracker._track_single_book(self.trading_pair)
+        )
+        self.ev_loop.run_until_complete(asyncio.sleep(0.5))
+
+        order_book = self.tracker.order_books[self.trading_pair]
+        self.assertEqual(7, order_book.last_diff_uid)
+        self.assertEqual([(2.0, 20.0, 5)], [tuple(row) for row in order_book.bid_entries()])
+        self.assertEqual([(5.0, 4.0, 7)], [tuple(row) for row in order_book.ask_entries()])
+        self.assertEqual(3, len(self.tracker._past_diffs_windows[self.trading_pair]))
+
+        metrics = self.tracker.diff_metrics[self.trading_pair]
+        self.assertEqual(1, metrics.batches_applied)
+        self.assertEqual(3, metrics.diffs_applied)
+        self.assertEqual(3, metrics.queue_depth)
+
+    def test_init_order_books_concurrently_and_individually_ready(self):
+        trading_pairs = [self.trading_pair, "ETH-USDT", "BTC-USDT"]
+        tracker = BinanceOrderBookTracker(trading_pairs=trading_pairs, throttler=self.throttler)
+        initialized_pairs = []
+
+        async def get_new_order_book(trading_pair: str):
+            await asyncio.sleep(0.2 if trading_pair == self.trading_pair else 0.05)
+            initialized_pairs.append(trading_pair)
+            return BinanceOrderBook()
+
+        with patch.object(tracker.data_source, "get_new_order_book", side_effect=get_new_order_book):
+            init_task = self.ev_loop.create_task(tracker._init_order_books())
+            self.ev_loop.run_until_complete(asyncio.sleep(0.1))
+
+            self.assertFalse(tracker.ready)
+            self.assertEqual(["ETH-USDT", "BTC-USDT"], tracker.ready_trading_pairs)
+            self.assertFalse(tracker.is_order_book_ready(self.trading_pair))
+
+            self.ev_loop.run_until_complete(init_task)
+
+        self.assertTrue(tracker.ready)
+        self.assertEqual(trading_pairs, tracker.ready_trading_pairs)
+        self.assertEqual(set(trading_pairs), set(tracker.order_book_init_timings.keys()))
+        self.assertLess(tracker.order_book_init_timings["ETH-USDT"], 0.2)
+        tracker.stop()
+
+    @patch("hummingbot.connector.exchange.binance.binance_utils.convert_from_exchange_trading_pair")
+    def test_track_single_book_applies_diffs_saved_during_init(self, mock_utils):
+        mock_utils.return_value = self.trading_pair
+        self.tracker.order_books[self.trading_pair].apply_snapshot([], [], 3)
+        self.tracker._saved_message_queues[self.trading_pair].extend([
+            self._diff_message(1, 2, [["1", "10"]], []),
+            self._diff_message(3, 4, [["2", "20"]], []),
+        ])
+
+        self.tracking_task = self.ev_loop.create_task(
+            self.tracker._track_single_book(self.trading_pair)
+        )
+        self.ev_loop.run_until_complete(asyncio.sleep(0.5))
+
+        order_book = self.tracker.order_books[self.trading_pair]
+        self.assertEqual(4, order_book.last_diff_uid)
+        self.assertEqual([(2.0, 20.0, 4)], [tuple(row) for row in order_book.bid_entries()])
+
+    def test_track_single_book_detects_sequence_gaps(self):
+        self.tracker.gap_detection = True
+        self.tracker.order_books[self.trading_pair].apply_snapshot([], [], 1)
+        for diff_msg in [self._diff_message(2, 3, [["1", "10"]], []),
+                         self._diff_message(4, 5, [["2", "20"]], []),
+                         self._diff_message(8, 9, [["3", "30"]], [])]:
+            self._simulate_message_enqueue(self.tracker._tracking_message_queues[self.trading_pair], diff_msg)
+
+        self.tracking_task = self.ev_loop.create_task(
+            self.tracker._track_single_book(self.trading_pair)
+        )
+        self.ev_loop.run_until_complete(asyncio.sleep(0.5))
+
+        self.assertEqual({self.trading_pair: 1}, self.tracker.sequence_gap_counts)
+        self.assertEqual([self.trading_pair], list(self.tracker._snapshot_refresh_requests.keys()))
+        self.assertEqual(9, self.tracker.order_books[self.trading_pair].last_diff_uid)
+
+    def test_snapshot_refresh_loop_fetches_gaps_first_then_stale_books(self):
+        self.tracker.gap_detection = True
+        self.tracker.SNAPSHOT_REFRESH_INTERVAL = 0
+        self.tracker.snapshot_staleness_window = 60
+        now = time.time()
+        self.tracker._last_snapshot_timestamps.update({self.trading_pair: now, "ETH-USDT": now - 120, "BTC-USDT": now})
+        self.tracker.request_snapshot_refresh("BTC-USDT")
+        fetched_pairs = []
+
+        async def get_snapshot_message(trading_pair: str):
+            fetched_pairs.append(trading_pair)
+            return BinanceOrderBook.snapshot_message_from_exchange(
+                {"lastUpdateId": 10, "bids": [], "asks": []}, time.time(), metadata={"trading_pair": trading_pair})
+
+        with patch.object(self.tracker.data_source, "get_snapshot_message", side_effect=get_snapshot_message):
+            self.tracking_task = self.ev_loop.create_task(self.tracker._snapshot_refresh_loop())
+            self.ev_loop.run_until_complete(asyncio.sleep(0.1))
+
+        self.assertEqual(["BTC-USDT", "ETH-USDT"], fetched_pairs)
+        self.assertEqual(2, self.tracker._order_book_snapshot_stream.qsize())
+        self.assertEqual("BTC-USDT", self.tracker._order_book_snapshot_stream.get_nowait().trading_pair)
+        self.assertGreaterEqual(self.tracker._last_snapshot_timestamps["ETH-USDT"], now)
+
+    def test_track_single_book_snapshot_clears_refresh_request(self):
+        self.tracker.gap_detection = True
+        self.tracker.request_snapshot_refresh(self.trading_pair)
+        snapshot_msg = BinanceOrderBook.snapshot_message_from_exchange(
+            {"lastUpdateId": 10, "bids": [["1", "10"]], "asks": []}, time.time(), metadata={"trading_pair": self.trading_pair})
+        self._simulate_message_enqueue(self.tracker._tracking_message_queues[self.trading_pair], snapshot_msg)
+
+        self.tracking_task = self.ev_loop.create_task(
+            self.tracker._track_single_book(self.trading_pair)
+        )
+        self.ev_loop.run_until_complete(asyncio.sleep(0.5))
+
+        self.assertEqual(10, self.tracker.order_books[self.trading_pair].snapshot_uid)
+        self.assertEqual(0, len(self.tracker._snapshot_refresh_requests))
+        self.assertIn(self.trading_pair, self.tracker._last_snapshot_timestamps)
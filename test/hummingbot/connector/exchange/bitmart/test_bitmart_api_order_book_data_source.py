@@ -153,6 +153,9 @@ class BitmartAPIOrderBookDataSourceUnitTests(unittest.TestCase):
         self.ws_incoming_messages.put_nowait(ujson.dumps(resp))
         return resp
 
+    def test_throttler_is_none_as_snapshots_do_not_use_it(self):
+        self.assertIsNone(self.data_source.throttler)
+
     @patch("aiohttp.ClientSession.get")
     def test_get_last_traded_prices(self, mock_api):
         mock_response: Dict[Any] = {
@@ -396,6 +396,35 @@ class TestGateIoExchange(unittest.TestCase):
         self.assertEqual(self.exchange.available_balances[self.base_asset], Decimal("968.8"))
         self.assertTrue(client_order_id not in self.exchange.in_flight_orders)
 
+    @patch("hummingbot.connector.exchange.gate_io.gate_io_exchange.GateIoExchange.current_timestamp")
+    @aioresponses()
+    def test_update_order_status_fetches_only_orders_no_longer_open(self, current_ts_mock, mock_api):
+        open_client_order_id = f"{CONSTANTS.HBOT_ORDER_ID}-openExchId"
+        self.exchange._in_flight_orders[open_client_order_id] = self.get_in_flight_order(open_client_order_id,
+                                                                                         "openExchId")
+        self.exchange._in_flight_orders["someId"] = self.get_in_flight_order("someId", "someExchId")
+
+        open_orders_url = f"{CONSTANTS.REST_URL}/{CONSTANTS.USER_ORDERS_PATH_URL}"
+        open_orders_resp = self.get_open_order_mock(exchange_order_id="openExchId")
+        open_orders_resp[0]["orders"][0]["update_time_ms"] = 1548000100123
+        mock_api.get(re.compile(f"^{open_orders_url}".replace(".", r"\.").replace("?", r"\?")),
+                     body=json.dumps(open_orders_resp))
+        order_status_url = f"{CONSTANTS.REST_URL}/{CONSTANTS.ORDER_STATUS_PATH_URL}"
+        regex_order_status_url = re.compile(f"^{order_status_url[:-4]}".replace(".", r"\.").replace("?", r"\?"))
+        order_status_resp = self.get_order_create_response_mock(cancelled=True, exchange_order_id="someExchId")
+        requested_urls = []
+        mock_api.get(regex_order_status_url,
+                     body=json.dumps(order_status_resp),
+                     callback=lambda url, **kwargs: requested_urls.append(str(url)))
+
+        current_ts_mock.return_value = time.time()
+        self.async_run_with_timeout(self.exchange._update_order_status())
+
+        self.assertEqual(1, len(requested_urls))
+        self.assertIn("spot/orders/someExchId", requested_urls[0])
+        self.assertNotIn("someId", self.exchange.in_flight_orders)
+        self.assertEqual("open", self.exchange.in_flight_orders[open_client_order_id].last_state)
+
     @aioresponses()
     def test_get_open_orders(self, mock_api):
         url = f"{CONSTANTS.REST_URL}/{CONSTANTS.USER_ORDERS_PATH_URL}"
@@ -1,9 +1,19 @@
 #!/usr/bin/env python
+import copy
 import unittest
 import unittest.mock
 from decimal import Decimal
 from hummingbot.connector.in_flight_order_base import InFlightOrderBase
-from hummingbot.core.event.events import OrderType, TradeType, TradeFee
+from hummingbot.core.event.events import (
+    BuyOrderCreatedEvent,
+    MarketEvent,
+    OrderCancelledEvent,
+    OrderFilledEvent,
+    OrderType,
+    SellOrderCompletedEvent,
+    TradeType,
+    TradeFee,
+)
 from hummingbot.connector.connector_base import ConnectorBase
 
 
@@ -21,6 +31,30 @@ class InFightOrderTest(InFlightOrderBase):
         return False
 
 
+class MutableInFlightOrder(InFlightOrderBase):
+    @property
+    def is_done(self) -> bool:
+        return self.last_state == "done"
+
+    @property
+    def is_cancelled(self) -> bool:
+        return self.last_state == "cancelled"
+
+    @property
+    def is_failure(self) -> bool:
+        return False
+
+
+class InFlightOrdersConnector(ConnectorBase):
+    def __init__(self):
+        super().__init__()
+        self._test_in_flight_orders = {}
+
+    @property
+    def in_flight_orders(self):
+        return self._test_in_flight_orders
+
+
 class ConnectorBaseUnitTest(unittest.TestCase):
     @classmethod
     def setUpClass(cls):
@@ -46,3 +80,94 @@ class ConnectorBaseUnitTest(unittest.TestCase):
         self.assertEqual(Decimal("300"), bals["USDT"])
         self.assertEqual(Decimal("1.5"), bals["HBOT"])
         print(bals)
+
+    @staticmethod
+    def _fill_event(timestamp: float, trade_type: TradeType, amount: Decimal, price: Decimal,
+                    order_id: str = "OID1") -> OrderFilledEvent:
+        return OrderFilledEvent(timestamp=timestamp,
+                                order_id=order_id,
+                                trading_pair="HBOT-USDT",
+                                trade_type=trade_type,
+                                order_type=OrderType.LIMIT,
+                                price=price,
+                                amount=amount,
+                                trade_fee=TradeFee(Decimal("0")))
+
+    def test_order_filled_balances_since_snapshot(self):
+        connector = ConnectorBase()
+        connector.real_time_balance_update = False
+        connector.trigger_event(MarketEvent.OrderFilled, self._fill_event(1, TradeType.BUY, Decimal("2"), Decimal("10")))
+        connector.in_flight_orders_snapshot_timestamp = 1
+        connector.trigger_event(MarketEvent.OrderFilled, self._fill_event(2, TradeType.SELL, Decimal("1"), Decimal("12")))
+        connector.trigger_event(MarketEvent.OrderFilled, self._fill_event(3, TradeType.BUY, Decimal("1"), Decimal("10")))
+
+        self.assertEqual({"HBOT": Decimal("0"), "USDT": Decimal("2")}, connector.order_filled_balances(1))
+        self.assertEqual({"HBOT": Decimal("2"), "USDT": Decimal("-18")}, connector.order_filled_balances())
+        # Only the fills since the last snapshot are kept in the journal.
+        self.assertEqual(2, len(connector._order_fill_journal))
+
+        connector.in_flight_orders_snapshot_timestamp = 3
+        self.assertEqual({}, connector.order_filled_balances(3))
+        self.assertEqual(0, len(connector._order_fill_journal))
+        # Balances since a pruned timestamp are computed from the event logs.
+        self.assertEqual({"HBOT": Decimal("0"), "USDT": Decimal("2")}, connector.order_filled_balances(1))
+
+    def test_event_logs_bounded(self):
+        class BoundedConnector(ConnectorBase):
+            EVENT_LOG_MAX_EVENTS = 2
+
+        connector = BoundedConnector()
+        for timestamp in range(1, 4):
+            connector.trigger_event(MarketEvent.OrderFilled,
+                                    self._fill_event(timestamp, TradeType.BUY, Decimal("1"), Decimal("10")))
+
+        self.assertEqual([2, 3], [event.timestamp for event in connector.event_logs])
+        self.assertEqual({"HBOT": Decimal("3"), "USDT": Decimal("-30")}, connector.order_filled_balances())
+
+    def test_in_flight_locked_balances_with_500_orders(self):
+        connector = InFlightOrdersConnector()
+        orders = connector.in_flight_orders
+        pairs = ["HBOT-USDT", "COINALPHA-USDT", "COINALPHA-HBOT", "ETH-USDT", "HBOT-ETH"]
+        for i in range(500):
+            order_id = f"OID{i}"
+            orders[order_id] = MutableInFlightOrder(order_id, f"EOID{i}", pairs[i % len(pairs)], OrderType.LIMIT,
+                                                    TradeType.BUY if i % 2 == 0 else TradeType.SELL,
+                                                    Decimal("10.5") + i % 3, Decimal(i % 7 + 1), "live")
+            connector.trigger_event(MarketEvent.BuyOrderCreated,
+                                    BuyOrderCreatedEvent(1, OrderType.LIMIT, orders[order_id].trading_pair,
+                                                         orders[order_id].amount, orders[order_id].price, order_id))
+        self.assertEqual(connector.in_flight_asset_balances(orders), connector.in_flight_locked_balances())
+
+        for i in range(0, 500, 5):
+            order = orders[f"OID{i}"]
+            order.executed_amount_base = order.amount / 2
+            order.executed_amount_quote = order.executed_amount_base * order.price
+            connector.trigger_event(MarketEvent.OrderFilled,
+                                    self._fill_event(2, order.trade_type, order.executed_amount_base, order.price,
+                                                     order.client_order_id))
+        for i in range(1, 500, 5):
+            orders[f"OID{i}"].last_state = "cancelled"
+            connector.trigger_event(MarketEvent.OrderCancelled, OrderCancelledEvent(3, f"OID{i}"))
+        for i in range(3, 500, 10):
+            order = orders.pop(f"OID{i}")
+            connector.trigger_event(MarketEvent.SellOrderCompleted,
+                                    SellOrderCompletedEvent(4, order.client_order_id, "HBOT", "USDT", "HBOT",
+                                                            order.amount, order.amount * order.price,
+                                                            Decimal("0"), OrderType.LIMIT))
+        # Orders tracked or dropped without any event are accounted for as well.
+        orders["OID500"] = MutableInFlightOrder("OID500", "EOID500", "HBOT-USDT", OrderType.LIMIT, TradeType.BUY,
+                                                Decimal("10"), Decimal("3"), "live")
+        del orders["OID2"]
+        self.assertEqual(connector.in_flight_asset_balances(orders), connector.in_flight_locked_balances())
+
+        # Balance queries don't go through the in-flight orders again.
+        connector.real_time_balance_update = False
+        connector.in_flight_orders_snapshot = {k: copy.copy(v) for k, v in orders.items()}
+        connector.in_flight_orders_snapshot_timestamp = 4
+        connector._account_available_balances = {"HBOT": Decimal("1000"), "USDT": Decimal("10000")}
+        connector.get_available_balance("USDT")
+        self._url_mock.reset_mock()
+        for _ in range(100):
+            self.assertEqual(Decimal("10000"), connector.get_available_balance("USDT"))
+            self.assertEqual(Decimal("1000"), connector.get_available_balance("HBOT"))
+        self._url_mock.assert_not_called()
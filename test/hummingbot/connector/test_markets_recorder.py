@@ -0,0 +1,196 @@
+import asyncio
+import os
+import tempfile
+import unittest
+from decimal import Decimal
+from typing import List
+from unittest.mock import MagicMock, patch
+
+import pandas as pd
+
+from hummingbot.connector.markets_recorder import MarketsRecorder
+from hummingbot.core.event.events import (
+    BuyOrderCreatedEvent,
+    MarketEvent,
+    OrderCancelledEvent,
+    OrderFilledEvent,
+    OrderType,
+    TradeFee,
+    TradeType,
+)
+from hummingbot.model.market_state import MarketState
+from hummingbot.model.order import Order
+from hummingbot.model.sql_connection_manager import (
+    SQLConnectionManager,
+    SQLConnectionType,
+)
+from hummingbot.model.trade_fill import TradeFill
+
+
+class MarketsRecorderTests(unittest.TestCase):
+
+    def setUp(self) -> None:
+        super().setUp()
+        self.temp_dir = tempfile.TemporaryDirectory()
+        self.data_path_patch = patch("hummingbot.connector.markets_recorder.data_path", return_value=self.temp_dir.name)
+        self.data_path_patch.start()
+        self.sql = SQLConnectionManager(SQLConnectionType.TRADE_FILLS,
+                                        db_path=os.path.join(self.temp_dir.name, "trades.sqlite"))
+        self.market = MagicMock()
+        self.market.display_name = "binance"
+        self.market.tracking_states = {"orders": 1}
+        self.recorder = MarketsRecorder(self.sql, [self.market], "config.yml", "pure_market_making")
+
+    def tearDown(self) -> None:
+        self.recorder.stop()
+        self.sql.get_shared_session().close()
+        self.sql.engine.dispose()
+        self.data_path_patch.stop()
+        self.temp_dir.cleanup()
+        super().tearDown()
+
+    def _create_order(self, order_id: str):
+        self.recorder._did_create_order(MarketEvent.BuyOrderCreated.value,
+                                        self.market,
+                                        BuyOrderCreatedEvent(timestamp=1,
+                                                             type=OrderType.LIMIT,
+                                                             trading_pair="COINALPHA-HBOT",
+                                                             amount=Decimal("1"),
+                                                             price=Decimal("1000"),
+                                                             order_id=order_id,
+                                                             exchange_order_id=f"EX{order_id}"))
+
+    def _fill_order(self, order_id: str):
+        self.recorder._did_fill_order(MarketEvent.OrderFilled.value,
+                                      self.market,
+                                      OrderFilledEvent(timestamp=2,
+                                                       order_id=order_id,
+                                                       trading_pair="COINALPHA-HBOT",
+                                                       trade_type=TradeType.BUY,
+                                                       order_type=OrderType.LIMIT,
+                                                       price=Decimal("1000"),
+                                                       amount=Decimal("1"),
+                                                       trade_fee=TradeFee(Decimal("0")),
+                                                       exchange_trade_id=f"TR{order_id}"))
+
+    def test_events_written_behind_and_visible_to_reads(self):
+        self.recorder.start()
+
+        self._create_order("OID1")
+        self._fill_order("OID1")
+        self.recorder._update_order_status(MarketEvent.OrderCancelled.value,
+                                           self.market,
+                                           OrderCancelledEvent(timestamp=3, order_id="OID1"))
+
+        orders: List[Order] = self.recorder.get_orders_for_config_and_market("config.yml", self.market)
+        trades: List[TradeFill] = self.recorder.get_trades_for_config("config.yml")
+        market_states: MarketState = self.recorder.get_market_states("config.yml", self.market)
+
+        self.assertEqual(["OID1"], [order.id for order in orders])
+        self.assertEqual(MarketEvent.OrderCancelled.name, orders[0].last_status)
+        self.assertEqual(["TROID1"], [trade.exchange_trade_id for trade in trades])
+        self.assertEqual([("binance", "COINALPHA-HBOT")], self.recorder.performance_tracker.market_trading_pairs)
+        self.assertEqual(1, self.recorder.performance_tracker.num_trades)
+        self.assertEqual({"orders": 1}, market_states.saved_state)
+        # The tracking states changed by the three events are saved once.
+        self.assertEqual(4, self.recorder.write_metrics.jobs_committed)
+        self.market.add_exchange_order_ids_from_market_recorder.assert_called_with({"EXOID1": "OID1"})
+        self.assertEqual("TROID1",
+                         list(self.market.add_trade_fills_from_market_recorder.call_args[0][0])[0].exchange_trade_id)
+
+    def test_market_states_saved_once_per_interval(self):
+        self.recorder = MarketsRecorder(self.sql, [self.market], "config.yml", "pure_market_making",
+                                        market_states_save_interval=0.01)
+        self.recorder.start()
+
+        self._create_order("OID1")
+        self.market.tracking_states = {"orders": 2}
+        self._create_order("OID2")
+        asyncio.get_event_loop().run_until_complete(asyncio.sleep(0.05))
+        self.recorder.flush()
+
+        self.assertEqual(3, self.recorder.write_metrics.jobs_committed)
+        self.assertEqual({"orders": 2}, self.sql.get_shared_session().query(MarketState).one().saved_state)
+
+    def test_unchanged_market_states_not_saved_again(self):
+        self.recorder.start()
+
+        self._create_order("OID1")
+        self.recorder.save_pending_market_states()
+        self.recorder._update_order_status(MarketEvent.OrderCancelled.value,
+                                           self.market,
+                                           OrderCancelledEvent(timestamp=3, order_id="OID1"))
+        self.recorder.save_pending_market_states()
+        self.recorder.flush()
+
+        self.assertEqual(3, self.recorder.write_metrics.jobs_committed)
+
+    def test_trade_fill_exported_to_csv_once_committed(self):
+        self.recorder.start()
+
+        # The age of the order is derived from the creation time at the end of the client order id.
+        order_id: str = "B-COINALPHA-HBOT-1640000000000000"
+        self._create_order(order_id)
+        self._fill_order(order_id)
+        self.recorder.stop()
+
+        exported: pd.DataFrame = pd.read_csv(os.path.join(self.temp_dir.name, "trades_config.csv"))
+        self.assertEqual([1], exported["id"].tolist())
+        self.assertEqual([f"TR{order_id}"], exported["exchange_trade_id"].tolist())
+
+    def test_trade_fills_appended_to_csv_with_same_header(self):
+        csv_path: str = os.path.join(self.temp_dir.name, "trades_config.csv")
+        self.recorder.start()
+        order_id: str = "B-COINALPHA-HBOT-1640000000000000"
+        self._fill_order(order_id)
+        self.recorder.stop()
+
+        self.recorder.start()
+        self._fill_order(order_id)
+        self.recorder.stop()
+
+        exported: pd.DataFrame = pd.read_csv(csv_path)
+        self.assertEqual([1, 2], exported["id"].tolist())
+        self.assertEqual(["trades_config.csv"], [f for f in os.listdir(self.temp_dir.name) if f.endswith(".csv")])
+
+    def test_csv_with_other_header_moved_aside(self):
+        csv_path: str = os.path.join(self.temp_dir.name, "trades_config.csv")
+        with open(csv_path, "w") as csv_file:
+            csv_file.write("id,price\n1,1000\n")
+        self.recorder.start()
+
+        self._fill_order("B-COINALPHA-HBOT-1640000000000000")
+        self.recorder.stop()
+
+        csv_files: List[str] = sorted(f for f in os.listdir(self.temp_dir.name) if f.endswith(".csv"))
+        self.assertEqual(2, len(csv_files))
+        self.assertTrue(csv_files[1].startswith("trades_config_old_"))
+        exported: pd.DataFrame = pd.read_csv(csv_path)
+        self.assertEqual(["id", "age"], [exported.columns[0], exported.columns[-1]])
+
+    def test_pending_writes_committed_on_stop(self):
+        self.recorder.start()
+        self._create_order("OID1")
+
+        self.recorder.stop()
+
+        self.assertIsNotNone(self.sql.get_shared_session().query(Order).filter(Order.id == "OID1").one_or_none())
+        self.assertEqual({"orders": 1}, self.sql.get_shared_session().query(MarketState).one().saved_state)
+
+    def test_writes_committed_synchronously_for_in_memory_database(self):
+        sql = SQLConnectionManager(SQLConnectionType.TRADE_FILLS, db_path="")
+        recorder = MarketsRecorder(sql, [self.market], "config.yml", "pure_market_making")
+        recorder.start()
+
+        recorder._did_create_order(MarketEvent.BuyOrderCreated.value,
+                                   self.market,
+                                   BuyOrderCreatedEvent(timestamp=1,
+                                                        type=OrderType.LIMIT,
+                                                        trading_pair="COINALPHA-HBOT",
+                                                        amount=Decimal("1"),
+                                                        price=Decimal("1000"),
+                                                        order_id="OID1"))
+        recorder.stop()
+
+        self.assertIsNone(recorder.write_metrics)
+        self.assertEqual(1, sql.get_shared_session().query(Order).count())
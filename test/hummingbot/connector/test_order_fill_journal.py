@@ -0,0 +1,63 @@
+import unittest
+from decimal import Decimal
+
+from hummingbot.connector.order_fill_journal import OrderFillJournal
+from hummingbot.core.event.events import (
+    OrderFilledEvent,
+    OrderType,
+    TradeFee,
+    TradeType,
+)
+
+
+class OrderFillJournalTests(unittest.TestCase):
+
+    def setUp(self) -> None:
+        super().setUp()
+        self.journal = OrderFillJournal()
+
+    @staticmethod
+    def _fill(timestamp: float, trade_type: TradeType, amount: str, price: str = "10") -> OrderFilledEvent:
+        return OrderFilledEvent(timestamp=timestamp,
+                                order_id=f"OID{timestamp}",
+                                trading_pair="HBOT-USDT",
+                                trade_type=trade_type,
+                                order_type=OrderType.LIMIT,
+                                price=Decimal(price),
+                                amount=Decimal(amount),
+                                trade_fee=TradeFee(Decimal("0")))
+
+    def test_balances_since_timestamp(self):
+        self.journal.add_fill(self._fill(1, TradeType.BUY, "2"))
+        self.journal.add_fill(self._fill(2, TradeType.SELL, "1", "12"))
+        self.journal.add_fill(self._fill(3, TradeType.BUY, "1"))
+
+        self.assertEqual({"HBOT": Decimal("2"), "USDT": Decimal("-18")}, self.journal.balances_since(0))
+        self.assertEqual({"HBOT": Decimal("0"), "USDT": Decimal("2")}, self.journal.balances_since(1))
+        self.assertEqual({}, self.journal.balances_since(3))
+
+    def test_pruned_fills_only_kept_in_total(self):
+        self.journal.add_fill(self._fill(1, TradeType.BUY, "2"))
+        self.journal.add_fill(self._fill(2, TradeType.SELL, "1", "12"))
+        self.journal.add_fill(self._fill(3, TradeType.BUY, "1"))
+
+        self.journal.prune(2)
+        # A late fill from before the pruning timestamp.
+        self.journal.add_fill(self._fill(1.5, TradeType.BUY, "1"))
+
+        self.assertEqual(1, len(self.journal))
+        self.assertEqual({"HBOT": Decimal("3"), "USDT": Decimal("-28")}, self.journal.balances_since(0))
+        self.assertEqual({"HBOT": Decimal("1"), "USDT": Decimal("-10")}, self.journal.balances_since(2))
+        self.assertEqual({}, self.journal.balances_since(3))
+        with self.assertRaises(ValueError):
+            self.journal.balances_since(1)
+
+    def test_fills_out_of_order_kept_sorted(self):
+        self.journal.add_fill(self._fill(1, TradeType.BUY, "1"))
+        self.journal.add_fill(self._fill(4, TradeType.BUY, "4"))
+        self.journal.add_fill(self._fill(2, TradeType.BUY, "2"))
+
+        self.journal.prune(2)
+
+        self.assertEqual({"HBOT": Decimal("4"), "USDT": Decimal("-40")}, self.journal.balances_since(2))
+        self.assertEqual({"HBOT": Decimal("4"), "USDT": Decimal("-40")}, self.journal.balances_since(3))
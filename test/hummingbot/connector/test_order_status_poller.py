@@ -0,0 +1,82 @@
+import asyncio
+import unittest
+from decimal import Decimal
+from typing import (
+    Any,
+    Awaitable,
+    Dict,
+    List,
+)
+from unittest.mock import AsyncMock
+
+from hummingbot.connector.in_flight_order_base import InFlightOrderBase
+from hummingbot.connector.order_status_poller import OrderStatusPoller
+from hummingbot.core.event.events import (
+    OrderType,
+    TradeType,
+)
+
+
+class OrderStatusPollerTests(unittest.TestCase):
+
+    def setUp(self) -> None:
+        super().setUp()
+        self.ev_loop = asyncio.get_event_loop()
+        self.fetch_open_orders = AsyncMock()
+        self.fetch_order = AsyncMock(side_effect=lambda order: {"id": order.client_order_id, "status": "FILLED"})
+        self.poller = OrderStatusPoller(fetch_open_orders=self.fetch_open_orders,
+                                        fetch_order=self.fetch_order,
+                                        client_order_id=lambda order_update: order_update["id"],
+                                        order_fingerprint=lambda order_update: order_update["status"])
+        self.orders: List[InFlightOrderBase] = [
+            InFlightOrderBase(f"OID{i}", f"EOID{i}", "HBOT-USDT", OrderType.LIMIT, TradeType.BUY,
+                              Decimal("10"), Decimal("1"), "NEW")
+            for i in range(3)
+        ]
+
+    def async_run_with_timeout(self, coroutine: Awaitable, timeout: int = 1):
+        return self.ev_loop.run_until_complete(asyncio.wait_for(coroutine, timeout))
+
+    def _poll(self) -> Dict[str, Any]:
+        return {order.client_order_id: update
+                for order, update in self.async_run_with_timeout(self.poller.poll(self.orders))}
+
+    def test_only_orders_no_longer_open_fetched_one_by_one(self):
+        self.fetch_open_orders.return_value = [{"id": "OID0", "status": "NEW"}, {"id": "OID1", "status": "NEW"}]
+
+        updates: Dict[str, Any] = self._poll()
+
+        self.assertEqual({"OID0": {"id": "OID0", "status": "NEW"},
+                          "OID1": {"id": "OID1", "status": "NEW"},
+                          "OID2": {"id": "OID2", "status": "FILLED"}}, updates)
+        self.fetch_order.assert_awaited_once_with(self.orders[2])
+
+    def test_unchanged_open_orders_not_reported_again(self):
+        self.fetch_open_orders.return_value = [{"id": "OID0", "status": "NEW"}, {"id": "OID1", "status": "NEW"}]
+        self._poll()
+        self.orders = self.orders[:2]
+        self.fetch_open_orders.return_value = [{"id": "OID0", "status": "NEW"},
+                                               {"id": "OID1", "status": "PARTIALLY_FILLED"}]
+
+        updates: Dict[str, Any] = self._poll()
+
+        self.assertEqual({"OID1": {"id": "OID1", "status": "PARTIALLY_FILLED"}}, updates)
+
+    def test_orders_fetched_one_by_one_when_open_orders_fail(self):
+        self.fetch_open_orders.side_effect = IOError("Error fetching data")
+        self.fetch_order.side_effect = [{"id": "OID0", "status": "NEW"}, IOError("Order not found"),
+                                        {"id": "OID2", "status": "NEW"}]
+
+        updates: Dict[str, Any] = self._poll()
+
+        self.assertEqual(["OID0", "OID1", "OID2"], list(updates.keys()))
+        self.assertIsInstance(updates["OID1"], IOError)
+        self.assertEqual(3, self.fetch_order.await_count)
+
+    def test_open_orders_not_fetched_for_a_single_order(self):
+        self.orders = self.orders[:1]
+
+        updates: Dict[str, Any] = self._poll()
+
+        self.assertEqual({"OID0": {"id": "OID0", "status": "FILLED"}}, updates)
+        self.fetch_open_orders.assert_not_awaited()
@@ -109,10 +109,8 @@ class AsyncThrottlerUnitTests(unittest.TestCase):
     def test_flush_only_elapsed_tasks_are_flushed(self):
         lock = asyncio.Lock()
         rate_limit = self.rate_limits[0]
-        self.throttler._task_logs = [
-            TaskLog(timestamp=1.0, rate_limit=rate_limit, weight=rate_limit.weight),
-            TaskLog(timestamp=time.time(), rate_limit=rate_limit, weight=rate_limit.weight)
-        ]
+        self.throttler._task_logs.append(TaskLog(timestamp=1.0, rate_limit=rate_limit, weight=rate_limit.weight))
+        self.throttler._task_logs.append(TaskLog(timestamp=time.time(), rate_limit=rate_limit, weight=rate_limit.weight))
 
         self.assertEqual(2, len(self.throttler._task_logs))
         context = AsyncRequestContext(task_logs=self.throttler._task_logs,
@@ -210,7 +208,34 @@ class AsyncThrottlerUnitTests(unittest.TestCase):
                                       lock=asyncio.Lock(),
                                       safety_margin_pct=self.throttler._safety_margin_pct)
         self.ev_loop.run_until_complete(context.acquire())
+        self.assertEqual(1, len(self.throttler._task_logs))
+
+    def test_acquire_logs_each_related_limit_once(self):
+        rate_limit, related_limits = self.throttler.get_related_limits(limit_id=TEST_WEIGHTED_TASK_1_ID)
+        context = AsyncRequestContext(task_logs=self.throttler._task_logs,
+                                      rate_limit=rate_limit,
+                                      related_limits=related_limits,
+                                      lock=asyncio.Lock(),
+                                      safety_margin_pct=self.throttler._safety_margin_pct)
+        self.ev_loop.run_until_complete(context.acquire())
+
+        now = time.time()
+        margin = self.throttler._safety_margin_pct
         self.assertEqual(2, len(self.throttler._task_logs))
+        self.assertEqual(1, self.throttler._task_logs.capacity_used(TEST_WEIGHTED_TASK_1_ID, now, margin))
+        self.assertEqual(5, self.throttler._task_logs.capacity_used(TEST_WEIGHTED_POOL_ID, now, margin))
+
+    def test_flush_removes_all_consecutive_elapsed_tasks(self):
+        rate_limit = self.rate_limits[2]
+        for timestamp in [1.0, 2.0, 3.0, time.time()]:
+            self.throttler._task_logs.append(TaskLog(timestamp=timestamp, rate_limit=rate_limit, weight=2))
+
+        now = time.time()
+        margin = self.throttler._safety_margin_pct
+        self.assertEqual(2, self.throttler._task_logs.capacity_used(TEST_WEIGHTED_POOL_ID, now, margin))
+        self.assertEqual(1, len(self.throttler._task_logs))
+        self.assertEqual(0, self.throttler._task_logs.capacity_used(TEST_WEIGHTED_POOL_ID, now + 10, margin))
+        self.assertEqual(0, len(self.throttler._task_logs))
 
     def test_acquire_awaits_when_exceed_capacity(self):
         rate_limit = self.rate_limits[0]
@@ -224,3 +249,61 @@ class AsyncThrottlerUnitTests(unittest.TestCase):
             self.ev_loop.run_until_complete(
                 asyncio.wait_for(context.acquire(), 1.0)
             )
+
+    def test_time_until_capacity(self):
+        rate_limit = self.rate_limits[2]
+        now = time.time()
+        self.throttler._task_logs.append(TaskLog(timestamp=now - 4, rate_limit=rate_limit, weight=4))
+        self.throttler._task_logs.append(TaskLog(timestamp=now - 1, rate_limit=rate_limit, weight=4))
+        margin = self.throttler._safety_margin_pct
+        window = rate_limit.time_interval * (1 + margin)
+
+        self.assertEqual(0, self.throttler._task_logs.time_until_capacity(rate_limit, 2, now, margin))
+        self.assertAlmostEqual(window - 4, self.throttler._task_logs.time_until_capacity(rate_limit, 5, now, margin))
+        self.assertAlmostEqual(window - 1, self.throttler._task_logs.time_until_capacity(rate_limit, 9, now, margin))
+
+    def test_acquire_wakes_up_when_capacity_frees_up(self):
+        rate_limit = RateLimit(limit_id="FAST", limit=1, time_interval=0.2)
+        throttler = AsyncThrottler(rate_limits=[rate_limit], retry_interval=10.0)
+        self.ev_loop.run_until_complete(throttler.execute_task("FAST").acquire())
+
+        start = time.time()
+        self.ev_loop.run_until_complete(asyncio.wait_for(throttler.execute_task("FAST").acquire(), 1.0))
+
+        self.assertLess(time.time() - start, 0.5)
+        self.assertEqual(0, len(throttler._wait_queues))
+
+    def test_waiting_requests_are_served_by_priority_then_fifo(self):
+        rate_limit = RateLimit(limit_id="FAST", limit=1, time_interval=0.1)
+        throttler = AsyncThrottler(rate_limits=[rate_limit], retry_interval=10.0)
+        self.ev_loop.run_until_complete(throttler.execute_task("FAST").acquire())
+        served = []
+
+        async def request(name: str, priority: int):
+            async with throttler.execute_task("FAST", priority=priority):
+                served.append(name)
+
+        async def queue_requests():
+            tasks = [asyncio.ensure_future(request("poll_1", 0)),
+                     asyncio.ensure_future(request("poll_2", 0))]
+            await asyncio.sleep(0)
+            tasks.append(asyncio.ensure_future(request("order", 10)))
+            await asyncio.gather(*tasks)
+
+        self.ev_loop.run_until_complete(asyncio.wait_for(queue_requests(), 2.0))
+
+        self.assertEqual(["order", "poll_1", "poll_2"], served)
+        self.assertEqual(0, len(throttler._wait_queues))
+
+    def test_cancelled_waiter_leaves_the_queue(self):
+        throttler = AsyncThrottler(rate_limits=self.rate_limits)
+        self.ev_loop.run_until_complete(self.execute_requests(1, TEST_POOL_ID, throttler))
+
+        task = self.ev_loop.create_task(throttler.execute_task(TEST_POOL_ID).acquire())
+        self.ev_loop.run_until_complete(asyncio.sleep(0.01))
+        self.assertEqual(1, len(throttler._wait_queues))
+        task.cancel()
+        with self.assertRaises(asyncio.CancelledError):
+            self.ev_loop.run_until_complete(task)
+
+        self.assertEqual(0, len(throttler._wait_queues))
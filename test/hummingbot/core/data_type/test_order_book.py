@@ -50,6 +50,132 @@ class OrderBookUnitTest(unittest.TestCase):
         self.assertEqual(best_bid, [50., 0.01, 6.])
         self.assertEqual(best_ask, 0)
 
+    def test_depth_queries(self):
+        order_book = OrderBook()
+        bids_array = np.array([[1, 1, 1], [2, 2, 1], [3, 3, 1]], dtype=np.float64)
+        asks_array = np.array([[4, 1, 1], [5, 2, 1], [6, 3, 1]], dtype=np.float64)
+        order_book.apply_numpy_snapshot(bids_array, asks_array)
+
+        self.assertEqual(5, order_book.get_price_for_volume(True, 2).result_price)
+        self.assertEqual(2, order_book.get_price_for_volume(False, 4).result_price)
+        self.assertTrue(np.isnan(order_book.get_price_for_volume(True, 7).result_price))
+        self.assertAlmostEqual((4 * 1 + 5 * 1) / 2, order_book.get_vwap_for_volume(True, 2).result_price)
+        self.assertAlmostEqual((3 * 3 + 2 * 1) / 4, order_book.get_vwap_for_volume(False, 4).result_price)
+        self.assertEqual(10, order_book.get_price_for_quote_volume(False, 10).result_volume)
+        self.assertEqual(2, order_book.get_price_for_quote_volume(False, 10).result_price)
+        self.assertEqual(4 + 5 * 1.5, order_book.get_quote_volume_for_base_amount(True, 2.5).result_volume)
+        self.assertEqual(3, order_book.get_volume_for_price(True, 5).result_volume)
+        self.assertEqual(5, order_book.get_volume_for_price(False, 2).result_volume)
+        self.assertEqual(4 + 10, order_book.get_quote_volume_for_price(True, 5.5).result_volume)
+        self.assertEqual(9 + 4, order_book.get_quote_volume_for_price(False, 2).result_volume)
+
+    def test_get_vwap_for_volumes(self):
+        order_book = OrderBook()
+        bids_array = np.array([[1, 1, 1], [2, 2, 1], [3, 3, 1]], dtype=np.float64)
+        asks_array = np.array([[4, 1, 1], [5, 2, 1], [6, 3, 1]], dtype=np.float64)
+        order_book.apply_numpy_snapshot(bids_array, asks_array)
+
+        volumes = np.array([5, 0.5, 100, 2, 3], dtype=np.float64)
+        for is_buy in (True, False):
+            vwaps = order_book.get_vwap_for_volumes(is_buy, volumes)
+            self.assertEqual(len(volumes), len(vwaps))
+            for volume, vwap in zip(volumes, vwaps):
+                expected = order_book.get_vwap_for_volume(is_buy, volume).result_price
+                if np.isnan(expected):
+                    self.assertTrue(np.isnan(vwap))
+                else:
+                    self.assertAlmostEqual(expected, vwap)
+
+    def test_depth_index_matches_book_walk(self):
+        rng = np.random.RandomState(42)
+        bids_array = np.column_stack([np.arange(1, 201, dtype=np.float64), rng.uniform(0.1, 5, 200), np.ones(200)])
+        asks_array = np.column_stack([np.arange(201, 401, dtype=np.float64), rng.uniform(0.1, 5, 200), np.ones(200)])
+        walked_book = OrderBook()
+        indexed_book = OrderBook()
+        indexed_book.depth_index_enabled = True
+        for order_book in (walked_book, indexed_book):
+            order_book.apply_numpy_snapshot(bids_array, asks_array)
+            order_book.apply_numpy_diffs(np.array([[200, 0, 2], [150.5, 3, 2]]), np.array([[201, 0, 2]], dtype=np.float64))
+
+        queries = [
+            ("get_price_for_volume", [0, 1, 50, 10000]),
+            ("get_vwap_for_volume", [1, 50, 10000]),
+            ("get_price_for_quote_volume", [0, 100, 5000, 1e9]),
+            ("get_quote_volume_for_base_amount", [0, 1, 50, 10000]),
+            ("get_volume_for_price", [0, 150.5, 201, 250, 1000]),
+            ("get_quote_volume_for_price", [0, 150.5, 201, 250, 1000]),
+        ]
+        for method, arguments in queries:
+            for is_buy in (True, False):
+                for argument in arguments:
+                    expected = getattr(walked_book, method)(is_buy, argument)
+                    actual = getattr(indexed_book, method)(is_buy, argument)
+                    for field in ("query_price", "query_volume", "result_price", "result_volume"):
+                        expected_value = getattr(expected, field)
+                        actual_value = getattr(actual, field)
+                        if np.isnan(expected_value):
+                            self.assertTrue(np.isnan(actual_value), f"{method}({is_buy}, {argument}).{field}")
+                        else:
+                            self.assertAlmostEqual(expected_value, actual_value, msg=f"{method}({is_buy}, {argument})")
+
+        volumes = np.array([10, 0.5, 1e6, 300])
+        np.testing.assert_allclose(walked_book.get_vwap_for_volumes(True, volumes),
+                                   indexed_book.get_vwap_for_volumes(True, volumes))
+
+    def test_depth_index_rebuilt_after_diffs(self):
+        order_book = OrderBook()
+        order_book.depth_index_enabled = True
+        order_book.apply_numpy_snapshot(np.array([[1, 1, 1]], dtype=np.float64), np.array([[2, 1, 1]], dtype=np.float64))
+        self.assertEqual(1, order_book.get_volume_for_price(True, 3).result_volume)
+        order_book.apply_numpy_diffs(np.empty((0, 3)), np.array([[2.5, 4, 2]], dtype=np.float64))
+        self.assertEqual(5, order_book.get_volume_for_price(True, 3).result_volume)
+
+    def test_to_numpy(self):
+        order_book = OrderBook()
+        bids_array = np.array([[1, 1, 1], [2, 2, 2], [3, 3, 3]], dtype=np.float64)
+        asks_array = np.array([[4, 1, 1], [5, 2, 2], [6, 3, 3]], dtype=np.float64)
+        order_book.apply_numpy_snapshot(bids_array, asks_array)
+
+        bids, asks = order_book.to_numpy()
+        np.testing.assert_array_equal(bids_array[::-1], bids)
+        np.testing.assert_array_equal(asks_array, asks)
+
+        bids, asks = order_book.to_numpy(depth=2)
+        np.testing.assert_array_equal(bids_array[:0:-1], bids)
+        np.testing.assert_array_equal(asks_array[:2], asks)
+
+        bids, asks = order_book.to_numpy(depth=10)
+        self.assertEqual((3, 3), bids.shape)
+        self.assertEqual((3, 3), asks.shape)
+
+        bids_df, asks_df = order_book.snapshot
+        self.assertEqual(list(order_book.bid_entries()), [tuple(row) for row in bids_df.itertuples(index=False)])
+        self.assertEqual(list(order_book.ask_entries()), [tuple(row) for row in asks_df.itertuples(index=False)])
+
+        bids_df, asks_df = order_book.snapshot_top(1)
+        self.assertEqual([[3, 3, 3]], bids_df.values.tolist())
+        self.assertEqual([[4, 1, 1]], asks_df.values.tolist())
+
+    def test_to_numpy_empty_book(self):
+        bids, asks = OrderBook().to_numpy()
+        self.assertEqual((0, 3), bids.shape)
+        self.assertEqual((0, 3), asks.shape)
+
+    def test_version_incremented_on_updates(self):
+        order_book = OrderBook()
+        self.assertEqual(0, order_book.version)
+
+        order_book.apply_numpy_snapshot(np.array([[1, 1, 1]], dtype=np.float64),
+                                        np.array([[2, 1, 1]], dtype=np.float64))
+        self.assertEqual(1, order_book.version)
+        order_book.apply_numpy_diffs(np.array([[1.5, 1, 2]], dtype=np.float64), np.empty((0, 3), dtype=np.float64))
+        self.assertEqual(2, order_book.version)
+        order_book.last_trade_price = 1.5
+        self.assertEqual(3, order_book.version)
+        # Reading the book doesn't change it.
+        order_book.snapshot_top(1)
+        self.assertEqual(3, order_book.version)
+
 
 def main():
     logging.basicConfig(level=logging.INFO)
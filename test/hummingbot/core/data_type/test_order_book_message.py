@@ -119,6 +119,52 @@ class OrderBookMessageTest(unittest.TestCase):
         self.assertEqual(6, bids[0].amount)
         self.assertEqual(update_id, bids[0].update_id)
 
+    def test_arrays_with_non_numeric_update_id(self):
+        msg = OrderBookMessage(
+            message_type=OrderBookMessageType.SNAPSHOT,
+            content={
+                "update_id": "someId",
+                "asks": [(1, 2), (3, 4)],
+                "bids": [(5, 6)],
+            },
+            timestamp=time.time(),
+        )
+        self.assertEqual([[1, 2, -1], [3, 4, -1]], msg.asks_array.tolist())
+        self.assertEqual([[5, 6, -1]], msg.bids_array.tolist())
+
+    def test_bids_and_asks_are_parsed_once(self):
+        msg = OrderBookMessage(
+            message_type=OrderBookMessageType.DIFF,
+            content={
+                "update_id": 10,
+                "asks": [["1.5", "2", "ignored"], ["3", "0"]],
+                "bids": [],
+            },
+            timestamp=time.time(),
+        )
+
+        asks_array = msg.asks_array
+        self.assertEqual((2, 3), asks_array.shape)
+        self.assertEqual([[1.5, 2, 10], [3, 0, 10]], asks_array.tolist())
+        self.assertEqual((0, 3), msg.bids_array.shape)
+        self.assertIs(asks_array, msg.asks_array)
+        self.assertIs(msg.asks, msg.asks)
+        self.assertEqual([OrderBookRow(1.5, 2, 10), OrderBookRow(3, 0, 10)], msg.asks)
+        self.assertEqual([], msg.bids)
+
+    def test_arrays_follow_overridden_rows(self):
+        class CustomOrderBookMessage(OrderBookMessage):
+            @property
+            def bids(self):
+                return [OrderBookRow(float(entry["price"]), float(entry["size"]), 7) for entry in self.content["bids"]]
+
+        msg = CustomOrderBookMessage(
+            message_type=OrderBookMessageType.DIFF,
+            content={"update_id": 10, "bids": [{"price": "5", "size": "6"}]},
+            timestamp=time.time(),
+        )
+        self.assertEqual([[5, 6, 7]], msg.bids_array.tolist())
+
     def test_has_update_id(self):
         update_id = "someId"
 
@@ -0,0 +1,58 @@
+import unittest
+from decimal import Decimal
+
+from hummingbot.core.rate_oracle.rate_graph import RateGraph
+
+
+class RateGraphTests(unittest.TestCase):
+
+    def setUp(self) -> None:
+        super().setUp()
+        self.prices = {"HBOT-USDT": Decimal("100"),
+                       "AAVE-USDT": Decimal("50"),
+                       "USDT-GBP": Decimal("0.75"),
+                       "GBP-JPY": Decimal("150"),
+                       "ETH-BTC": Decimal("0.05")}
+        self.graph = RateGraph(self.prices)
+
+    def test_direct_and_inverted_rates(self):
+        self.assertEqual(Decimal("100"), self.graph.rate("HBOT-USDT"))
+        self.assertEqual(Decimal("0.01"), self.graph.rate("USDT-HBOT"))
+        self.assertEqual(Decimal("1"), self.graph.rate("HBOT-HBOT"))
+
+    def test_multi_hop_rates(self):
+        self.assertEqual(Decimal("2"), self.graph.rate("HBOT-AAVE"))
+        self.assertEqual(Decimal("75"), self.graph.rate("HBOT-GBP"))
+        self.assertEqual(Decimal("11250"), self.graph.rate("HBOT-JPY"))
+        self.assertAlmostEqual(Decimal(1) / Decimal("11250"), self.graph.rate("JPY-HBOT"))
+
+    def test_unlinked_tokens_have_no_rate(self):
+        self.assertIsNone(self.graph.rate("HBOT-BTC"))
+        self.assertIsNone(self.graph.rate("ZBOT-USDT"))
+
+    def test_reverse_pair_price_preferred_over_inverted_price(self):
+        graph = RateGraph({"BTC-USDT": Decimal("40000"), "USDT-BTC": Decimal("0.00003")})
+
+        self.assertEqual(Decimal("40000"), graph.rate("BTC-USDT"))
+        self.assertEqual(Decimal("0.00003"), graph.rate("USDT-BTC"))
+
+    def test_shortest_path_used(self):
+        graph = RateGraph({"A-B": Decimal("2"), "B-C": Decimal("3"), "C-D": Decimal("4"), "A-D": Decimal("30")})
+
+        self.assertEqual(Decimal("30"), graph.rate("A-D"))
+        self.assertEqual(Decimal("6"), graph.rate("A-C"))
+
+    def test_rates_from_token_computed_once(self):
+        rates = self.graph.rates_from("HBOT")
+
+        self.assertIs(rates, self.graph.rates_from("HBOT"))
+        self.assertEqual({"HBOT", "USDT", "AAVE", "GBP", "JPY"}, set(rates))
+
+    def test_batched_rates(self):
+        rates = self.graph.rates(["HBOT-AAVE", "AAVE-GBP", "ETH-BTC", "ETH-USDT"])
+
+        self.assertEqual({"HBOT-AAVE": Decimal("2"),
+                          "AAVE-GBP": Decimal("37.5"),
+                          "ETH-BTC": Decimal("0.05"),
+                          "ETH-USDT": None},
+                         rates)
@@ -88,6 +88,7 @@ class RateOracleTest(unittest.TestCase):
         self.assertGreater(rate, 0)
         rate1 = oracle.rate("BTC-USDT")
         self.assertGreater(rate1, 100)
+        self.assertEqual({"SCRT-USDT": rate, "BTC-USDT": rate1}, oracle.rates(["SCRT-USDT", "BTC-USDT"]))
         oracle.stop()
 
     def test_find_rate(self):
@@ -24,3 +24,12 @@ class FixedRateSourceTests(TestCase):
 
     def test_string_representation(self):
         self.assertEqual(str(FixedRateSource()), "fixed rates")
+
+    def test_get_rates_through_other_pairs(self):
+        rate_source = FixedRateSource()
+        rate_source.add_rate("BTC-USDT", Decimal(40000))
+        self.assertIsNone(rate_source.rate("ETH-BTC"))
+        rate_source.add_rate("ETH-USDT", Decimal(2000))
+
+        self.assertEqual({"ETH-BTC": Decimal("0.05"), "BTC-ETH": Decimal(20)},
+                         rate_source.rates(["ETH-BTC", "BTC-ETH"]))
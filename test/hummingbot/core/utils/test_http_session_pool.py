@@ -0,0 +1,72 @@
+import asyncio
+import unittest
+
+import aiohttp
+from aioresponses import aioresponses
+
+from hummingbot.core.utils.http_session_pool import HTTPSessionPool
+
+
+class HTTPSessionPoolTests(unittest.TestCase):
+
+    def setUp(self) -> None:
+        super().setUp()
+        self.ev_loop = asyncio.get_event_loop()
+        self.pool = HTTPSessionPool(limit=10, limit_per_host=5, ttl_dns_cache=60, keepalive_timeout=15)
+
+    def tearDown(self) -> None:
+        self.ev_loop.run_until_complete(self.pool.close())
+        super().tearDown()
+
+    async def _get_session(self, url: str) -> aiohttp.ClientSession:
+        return self.pool.get_session(url)
+
+    def test_sessions_shared_per_host(self):
+        session_1 = self.ev_loop.run_until_complete(self._get_session("https://api.test.com/api/v3/depth"))
+        session_2 = self.ev_loop.run_until_complete(self._get_session("https://api.test.com/api/v3/ticker?symbol=A"))
+        other_session = self.ev_loop.run_until_complete(self._get_session("https://api.other.com/api/v3/depth"))
+
+        self.assertIs(session_1, session_2)
+        self.assertIsNot(session_1, other_session)
+        self.assertEqual(2, self.pool.sessions_count)
+        connector: aiohttp.TCPConnector = session_1.connector
+        self.assertEqual(10, connector.limit)
+        self.assertEqual(5, connector.limit_per_host)
+        self.assertTrue(connector.use_dns_cache)
+
+    @aioresponses()
+    def test_requests_through_shared_session(self, mock_api):
+        url = "https://api.test.com/api/v3/ticker"
+        mock_api.get(url, payload={"price": "1"}, repeat=True)
+
+        async def request():
+            async with self.pool.get_session(url).get(url) as response:
+                return await response.json()
+
+        results = self.ev_loop.run_until_complete(asyncio.gather(*[request() for _ in range(3)]))
+
+        self.assertEqual([{"price": "1"}] * 3, results)
+        self.assertEqual(1, self.pool.sessions_count)
+
+    def test_close_closes_sessions(self):
+        session = self.ev_loop.run_until_complete(self._get_session("https://api.test.com/api/v3/depth"))
+
+        self.ev_loop.run_until_complete(self.pool.close())
+
+        self.assertTrue(session.closed)
+        self.assertEqual(0, self.pool.sessions_count)
+        new_session = self.ev_loop.run_until_complete(self._get_session("https://api.test.com/api/v3/depth"))
+        self.assertIsNot(session, new_session)
+        self.assertFalse(new_session.closed)
+
+    def test_new_session_for_other_event_loop(self):
+        session = self.ev_loop.run_until_complete(self._get_session("https://api.test.com/api/v3/depth"))
+        other_loop = asyncio.new_event_loop()
+        try:
+            other_session = other_loop.run_until_complete(self._get_session("https://api.test.com/api/v3/depth"))
+            other_loop.run_until_complete(other_session.close())
+        finally:
+            other_loop.close()
+
+        self.assertIsNot(session, other_session)
+        self.assertFalse(session.closed)
@@ -0,0 +1,50 @@
+import asyncio
+import os
+import unittest
+from concurrent.futures.process import BrokenProcessPool
+from typing import Awaitable
+
+from hummingbot.core.utils.signing_executor import SigningExecutor
+
+
+class SigningExecutorTests(unittest.TestCase):
+
+    def setUp(self) -> None:
+        super().setUp()
+        self.ev_loop = asyncio.get_event_loop()
+        self.executor = SigningExecutor(max_workers=2)
+
+    def tearDown(self) -> None:
+        self.executor.shutdown()
+        super().tearDown()
+
+    def async_run_with_timeout(self, coroutine: Awaitable, timeout: float = 30):
+        return self.ev_loop.run_until_complete(asyncio.wait_for(coroutine, timeout))
+
+    def test_jobs_run_in_worker_processes(self):
+        self.async_run_with_timeout(self.executor.start())
+
+        self.assertTrue(self.executor.started)
+        self.assertEqual(2, self.executor.max_workers)
+        results = self.async_run_with_timeout(asyncio.gather(*[self.executor.submit(pow, 3, i, 7) for i in range(4)]))
+        self.assertEqual([pow(3, i, 7) for i in range(4)], results)
+        self.assertNotEqual(os.getpid(), self.async_run_with_timeout(self.executor.submit(os.getpid)))
+
+    def test_submit_starts_the_workers(self):
+        self.assertFalse(self.executor.started)
+
+        self.assertEqual(8, self.async_run_with_timeout(self.executor.submit(pow, 2, 3)))
+        self.assertTrue(self.executor.started)
+
+    def test_restarted_after_shutdown(self):
+        worker_pid = self.async_run_with_timeout(self.executor.submit(os.getpid))
+        self.executor.shutdown()
+
+        self.assertFalse(self.executor.started)
+        self.assertNotEqual(worker_pid, self.async_run_with_timeout(self.executor.submit(os.getpid)))
+
+    def test_workers_restarted_when_one_terminates(self):
+        with self.assertRaises(BrokenProcessPool):
+            self.async_run_with_timeout(self.executor.submit(os._exit, 1))
+
+        self.assertEqual(8, self.async_run_with_timeout(self.executor.submit(pow, 2, 3)))
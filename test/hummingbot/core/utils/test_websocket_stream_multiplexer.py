@@ -0,0 +1,162 @@
+import asyncio
+import ujson
+import unittest
+from typing import (
+    Any,
+    Dict,
+    List,
+    Optional,
+    Tuple
+)
+from unittest.mock import AsyncMock, patch
+
+from websockets.exceptions import ConnectionClosed
+
+from hummingbot.core.utils.websocket_stream_multiplexer import WebSocketStreamMultiplexer
+from test.hummingbot.connector.network_mocking_assistant import NetworkMockingAssistant
+
+
+class MockStreamMultiplexer(WebSocketStreamMultiplexer):
+    SUBSCRIPTION_DELAY = 0
+    RECONNECT_DELAY = 0
+
+    def connection_url(self, streams: List[str]) -> str:
+        return f"wss://test.url/stream?streams={'/'.join(streams)}"
+
+    def subscription_messages(self, streams: List[str]) -> List[Dict[str, Any]]:
+        return [{"method": "SUBSCRIBE", "params": streams}]
+
+    def parse_message(self, raw_msg: str) -> Optional[Tuple[str, Any]]:
+        msg: Dict[str, Any] = ujson.loads(raw_msg)
+        if "stream" not in msg:
+            return None
+        return msg["stream"], msg["data"]
+
+
+class WebSocketStreamMultiplexerTests(unittest.TestCase):
+    # logging.Level required to receive logs from the multiplexer logger
+    level = 0
+
+    def setUp(self) -> None:
+        super().setUp()
+        self.ev_loop = asyncio.get_event_loop()
+        self.log_records = []
+        self.mocking_assistant = NetworkMockingAssistant()
+        self.multiplexer = MockStreamMultiplexer(max_streams_per_connection=3)
+        self.multiplexer.logger().setLevel(1)
+        self.multiplexer.logger().addHandler(self)
+
+    def tearDown(self) -> None:
+        self.multiplexer.stop()
+        self.multiplexer.logger().removeHandler(self)
+        super().tearDown()
+
+    def handle(self, record):
+        self.log_records.append(record)
+
+    def _is_logged(self, log_level: str, message: str) -> bool:
+        return any(record.levelname == log_level and record.getMessage() == message
+                   for record in self.log_records)
+
+    def test_shard_streams_by_stream_count(self):
+        streams: List[str] = [f"pair{i}@depth" for i in range(7)]
+
+        shards: List[List[str]] = self.multiplexer.shard_streams(streams)
+
+        self.assertEqual([streams[0:3], streams[3:6], streams[6:7]], shards)
+
+    def test_shard_streams_by_url_length(self):
+        multiplexer = MockStreamMultiplexer(max_streams_per_connection=100,
+                                            max_url_length=len("wss://test.url/stream?streams=pair0@depth/pair1@depth"))
+        streams: List[str] = [f"pair{i}@depth" for i in range(5)]
+
+        shards: List[List[str]] = multiplexer.shard_streams(streams)
+
+        self.assertEqual([streams[0:2], streams[2:4], streams[4:5]], shards)
+
+    def test_subscribe_rejects_streams_of_other_channels(self):
+        self.multiplexer.subscribe("depth", ["pair0@depth"])
+
+        with self.assertRaises(ValueError):
+            self.multiplexer.subscribe("trade", ["pair0@depth"])
+
+    @patch("websockets.connect", new_callable=AsyncMock)
+    def test_messages_routed_to_channel_queues(self, mock_ws):
+        mock_ws.return_value = self.mocking_assistant.create_websocket_mock()
+        trades: asyncio.Queue = self.multiplexer.subscribe("trade", ["pair0@trade"])
+        diffs: asyncio.Queue = self.multiplexer.subscribe("depth", ["pair0@depth"])
+
+        self.mocking_assistant.add_websocket_text_message(mock_ws.return_value, ujson.dumps({"result": None, "id": 1}))
+        self.mocking_assistant.add_websocket_text_message(
+            mock_ws.return_value, ujson.dumps({"stream": "pair1@depth", "data": {"u": 0}}))
+        self.mocking_assistant.add_websocket_text_message(
+            mock_ws.return_value, ujson.dumps({"stream": "pair0@depth", "data": {"u": 1}}))
+        self.mocking_assistant.add_websocket_text_message(
+            mock_ws.return_value, ujson.dumps({"stream": "pair0@trade", "data": {"t": 2}}))
+        self.mocking_assistant.run_until_all_text_messages_delivered(mock_ws.return_value)
+
+        self.assertEqual({"u": 1}, diffs.get_nowait())
+        self.assertEqual({"t": 2}, trades.get_nowait())
+        self.assertTrue(diffs.empty())
+        mock_ws.assert_called_once_with("wss://test.url/stream?streams=pair0@trade/pair0@depth")
+        self.assertEqual([{"method": "SUBSCRIBE", "params": ["pair0@trade", "pair0@depth"]}],
+                         [ujson.loads(msg) for msg in
+                          self.mocking_assistant.text_messages_sent_through_websocket(mock_ws.return_value)])
+
+    @patch("websockets.connect", new_callable=AsyncMock)
+    def test_reconnects_and_resubscribes_when_connection_closes(self, mock_ws):
+        closed_ws = self.mocking_assistant.create_websocket_mock()
+        closed_ws.recv.side_effect = ConnectionClosed(1006, "")
+        ws = self.mocking_assistant.create_websocket_mock()
+        mock_ws.side_effect = [closed_ws, ws]
+        diffs: asyncio.Queue = self.multiplexer.subscribe("depth", ["pair0@depth"])
+
+        self.mocking_assistant.add_websocket_text_message(
+            ws, ujson.dumps({"stream": "pair0@depth", "data": {"u": 1}}))
+        self.mocking_assistant.run_until_all_text_messages_delivered(ws)
+
+        self.assertEqual({"u": 1}, diffs.get_nowait())
+        self.assertEqual(2, mock_ws.call_count)
+        closed_ws.close.assert_awaited()
+        self.assertEqual([{"method": "SUBSCRIBE", "params": ["pair0@depth"]}],
+                         [ujson.loads(msg) for msg in self.mocking_assistant.text_messages_sent_through_websocket(ws)])
+
+    @patch("websockets.connect", new_callable=AsyncMock)
+    def test_connection_errors_logged_and_retried(self, mock_ws):
+        ws = self.mocking_assistant.create_websocket_mock()
+        mock_ws.side_effect = [Exception("Connection refused"), ws]
+        self.multiplexer.subscribe("depth", ["pair0@depth"])
+
+        self.mocking_assistant.run_until_all_text_messages_delivered(ws)
+
+        self.assertEqual(2, mock_ws.call_count)
+        self.assertTrue(self._is_logged("ERROR", "Unexpected error with WebSocket connection. Retrying after 0 seconds..."))
+
+    @patch("websockets.connect", new_callable=AsyncMock)
+    def test_unchanged_shards_keep_their_connection(self, mock_ws):
+        mock_ws.side_effect = lambda url: self.mocking_assistant.create_websocket_mock()
+        self.multiplexer.subscribe("depth", ["pair0@depth", "pair1@depth", "pair2@depth"])
+        self.ev_loop.run_until_complete(asyncio.sleep(0.01))
+        first_shard_task: asyncio.Task = self.multiplexer._connection_tasks[("pair0@depth", "pair1@depth", "pair2@depth")]
+
+        self.multiplexer.subscribe("trade", ["pair0@trade"])
+        self.ev_loop.run_until_complete(asyncio.sleep(0.01))
+
+        self.assertEqual([["pair0@depth", "pair1@depth", "pair2@depth"], ["pair0@trade"]], self.multiplexer.shards)
+        self.assertIs(first_shard_task,
+                      self.multiplexer._connection_tasks[("pair0@depth", "pair1@depth", "pair2@depth")])
+        self.assertFalse(first_shard_task.done())
+        self.assertEqual(2, mock_ws.call_count)
+
+    @patch("websockets.connect", new_callable=AsyncMock)
+    def test_unsubscribing_last_channel_closes_connections(self, mock_ws):
+        mock_ws.return_value = self.mocking_assistant.create_websocket_mock()
+        self.multiplexer.subscribe("depth", ["pair0@depth"])
+        self.ev_loop.run_until_complete(asyncio.sleep(0.01))
+
+        self.multiplexer.unsubscribe("depth")
+        self.ev_loop.run_until_complete(asyncio.sleep(0.01))
+
+        self.assertEqual([], self.multiplexer.streams)
+        self.assertEqual([], self.multiplexer.shards)
+        mock_ws.return_value.close.assert_awaited()
@@ -0,0 +1,64 @@
+import asyncio
+import unittest
+from decimal import Decimal
+from typing import Awaitable
+from unittest.mock import AsyncMock, patch
+
+from hummingbot.market.celo.celo_cli import (
+    CeloCLI,
+    CELO_BASE,
+    CELO_QUOTE,
+    async_command
+)
+from test.connector.fixture_celo import outputs as celo_outputs, TEST_ADDRESS
+
+
+class CeloCLIAsyncTests(unittest.TestCase):
+
+    def setUp(self) -> None:
+        super().setUp()
+        self.ev_loop = asyncio.get_event_loop()
+        CeloCLI.address = TEST_ADDRESS
+        CeloCLI.balances_async.cache_clear()
+        CeloCLI.exchange_rate_async.cache_clear()
+
+    def async_run_with_timeout(self, coroutine: Awaitable, timeout: float = 5):
+        return self.ev_loop.run_until_complete(asyncio.wait_for(coroutine, timeout))
+
+    def test_async_command_output(self):
+        output = self.async_run_with_timeout(async_command(["sh", "-c", "echo 'libusb warning'; echo true"]))
+
+        self.assertEqual("true", output)
+
+    def test_async_command_error(self):
+        with self.assertRaises(Exception) as context:
+            self.async_run_with_timeout(async_command(["sh", "-c", "echo 'Error: Node not synced'; exit 1"]))
+
+        self.assertEqual("Node not synced", str(context.exception))
+
+    @patch("hummingbot.market.celo.celo_cli.async_command", new_callable=AsyncMock)
+    def test_exchange_rates_cached(self, command_mock):
+        command_mock.side_effect = lambda commands: celo_outputs[tuple(commands)]
+
+        rates = self.async_run_with_timeout(CeloCLI.exchange_rate_async(Decimal("1")))
+        cached_rates = self.async_run_with_timeout(CeloCLI.exchange_rate_async(Decimal("1")))
+
+        self.assertEqual(rates, cached_rates)
+        self.assertEqual(1, command_mock.call_count)
+        sell_rate = [r for r in rates if r.from_token == CELO_BASE][0]
+        self.assertEqual(CELO_QUOTE, sell_rate.to_token)
+        self.assertEqual(Decimal("10.5"), sell_rate.to_amount)
+
+    @patch("hummingbot.market.celo.celo_cli.async_command", new_callable=AsyncMock)
+    def test_balances_cached_until_exchange_transaction(self, command_mock):
+        command_mock.side_effect = lambda commands: celo_outputs[tuple(commands)]
+
+        balances = self.async_run_with_timeout(CeloCLI.balances_async())
+        self.async_run_with_timeout(CeloCLI.balances_async())
+        self.assertEqual(1, command_mock.call_count)
+        self.assertEqual(Decimal("29630453216355095281") / Decimal(1e18), balances[CELO_QUOTE].total)
+
+        tx_hash = self.async_run_with_timeout(CeloCLI.sell_cgld_async(Decimal("1"), Decimal("10.4895")))
+        self.assertTrue(tx_hash.startswith("0x"))
+        self.async_run_with_timeout(CeloCLI.balances_async())
+        self.assertEqual(3, command_mock.call_count)
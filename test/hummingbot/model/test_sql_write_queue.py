@@ -0,0 +1,119 @@
+import os
+import tempfile
+import unittest
+from typing import List
+from unittest.mock import MagicMock
+
+from sqlalchemy.orm import Session
+
+from hummingbot.model.market_state import MarketState
+from hummingbot.model.sql_connection_manager import (
+    SQLConnectionManager,
+    SQLConnectionType,
+)
+from hummingbot.model.sql_write_queue import (
+    SQLWriteJob,
+    SQLWriteQueue,
+)
+
+
+class SQLWriteQueueTests(unittest.TestCase):
+    # logging.Level required to receive logs from the queue logger
+    level = 0
+
+    def setUp(self) -> None:
+        super().setUp()
+        self.log_records = []
+        self.temp_dir = tempfile.TemporaryDirectory()
+        self.sql = SQLConnectionManager(SQLConnectionType.TRADE_FILLS,
+                                        db_path=os.path.join(self.temp_dir.name, "trades.sqlite"))
+        self.write_queue = SQLWriteQueue(self.sql, flush_interval=10, batch_size=3)
+        self.write_queue.logger().setLevel(1)
+        self.write_queue.logger().addHandler(self)
+
+    def tearDown(self) -> None:
+        self.write_queue.stop()
+        self.write_queue.logger().removeHandler(self)
+        self.sql.get_shared_session().close()
+        self.sql.engine.dispose()
+        self.temp_dir.cleanup()
+        super().tearDown()
+
+    def handle(self, record):
+        self.log_records.append(record)
+
+    def _is_logged(self, log_level: str, message: str) -> bool:
+        return any(record.levelname == log_level and record.getMessage() == message
+                   for record in self.log_records)
+
+    @staticmethod
+    def _market_state_job(market: str) -> SQLWriteJob:
+        return lambda session: session.add(MarketState(config_file_path="config.yml",
+                                                       market=market,
+                                                       timestamp=1,
+                                                       saved_state={}))
+
+    def _saved_markets(self) -> List[str]:
+        session: Session = self.sql.create_session()
+        try:
+            return [state.market for state in session.query(MarketState).order_by(MarketState.id)]
+        finally:
+            session.close()
+
+    def test_jobs_committed_in_batches_of_batch_size(self):
+        self.write_queue.start()
+        for i in range(7):
+            self.write_queue.put(self._market_state_job(f"market{i}"))
+
+        self.assertTrue(self.write_queue.flush(timeout=5))
+
+        self.assertEqual([f"market{i}" for i in range(7)], self._saved_markets())
+        self.assertEqual(7, self.write_queue.metrics.jobs_committed)
+        # Two full batches, plus the remaining job committed by the flush.
+        self.assertEqual(3, self.write_queue.metrics.batches_committed)
+        self.assertEqual(0, self.write_queue.metrics.queue_depth)
+
+    def test_flush_without_pending_jobs_returns_immediately(self):
+        self.write_queue.start()
+
+        self.assertTrue(self.write_queue.flush(timeout=0))
+        self.assertEqual(0, self.write_queue.metrics.batches_committed)
+
+    def test_stop_commits_queued_jobs(self):
+        self.write_queue.start()
+        self.write_queue.put(self._market_state_job("market0"))
+
+        self.write_queue.stop(timeout=5)
+
+        self.assertFalse(self.write_queue.started)
+        self.assertEqual(["market0"], self._saved_markets())
+
+    def test_failing_job_does_not_discard_the_rest_of_its_batch(self):
+        def failing_job(session: Session):
+            raise ValueError("Invalid record")
+
+        self.write_queue.start()
+        self.write_queue.put(self._market_state_job("market0"))
+        self.write_queue.put(failing_job)
+        self.write_queue.put(self._market_state_job("market1"))
+
+        self.assertTrue(self.write_queue.flush(timeout=5))
+
+        self.assertEqual(["market0", "market1"], self._saved_markets())
+        self.assertEqual(1, self.write_queue.metrics.jobs_failed)
+        self.assertTrue(self._is_logged("ERROR", "Failed to commit 3 database writes together. Retrying one by one."))
+        self.assertTrue(self._is_logged("ERROR", "Failed to commit database write."))
+
+    def test_after_commit_callback_called_with_committed_records(self):
+        callback = MagicMock()
+        state: MarketState = MarketState(config_file_path="config.yml", market="market0", timestamp=1, saved_state={})
+
+        def job(session: Session):
+            session.add(state)
+            return lambda: callback(state.id)
+
+        self.write_queue.start()
+        self.write_queue.put(job)
+        self.assertTrue(self.write_queue.flush(timeout=5))
+
+        callback.assert_called_once_with(1)
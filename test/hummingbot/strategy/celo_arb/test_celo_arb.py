@@ -212,3 +212,5 @@ class CeloArbUnitTest(unittest.TestCase):
         self.clock.backtest_til(self.start_timestamp + 1)
         self.assertEqual(len(self.strategy.market_info_to_active_orders), 0)
         self.assertEqual(len(self.strategy.celo_orders), 0)
+        # The Celo balances shown by the status are fetched even when there is no arbitrage.
+        self.assertEqual({"CELO", "CUSD"}, set(self.strategy.celo_balances))